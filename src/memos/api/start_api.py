@@ -345,7 +345,7 @@ async def get_memory(mem_cube_id: str, memory_id: str, user_id: str | None = Non
 async def search_memories(search_req: SearchRequest):
     """Search for memories across MemCubes."""
     mos_instance = get_mos_instance()
-    result = mos_instance.search(
+    result = await mos_instance.asearch(
         query=search_req.query,
         user_id=search_req.user_id,
         install_cube_ids=search_req.install_cube_ids,
@@ -392,7 +392,7 @@ async def delete_all_memories(mem_cube_id: str, user_id: str | None = None):
 async def chat(chat_req: ChatRequest):
     """Chat with the MemOS system."""
     mos_instance = get_mos_instance()
-    response = mos_instance.chat(query=chat_req.query, user_id=chat_req.user_id)
+    response = await mos_instance.achat(query=chat_req.query, user_id=chat_req.user_id)
     if response is None:
         raise ValueError("No response generated")
     return ChatResponse(message="Chat response generated", data=response)
@@ -52,11 +52,48 @@ class UniversalAPIEmbedderConfig(BaseEmbedderConfig):
     )
 
 
+class EmbedderCacheConfig(BaseConfig):
+    """Configuration for the embedding cache wrapped around an embedder backend."""
+
+    max_bytes: int = Field(
+        default=64 * 1024 * 1024,
+        description="Upper bound of the in-process LRU cache size in bytes",
+    )
+    ttl: float | None = Field(
+        default=None,
+        description="Seconds after which a cached embedding expires (None means never)",
+    )
+    persist_path: str | None = Field(
+        default=None,
+        description="Optional sqlite file used as a persistent second-level cache",
+    )
+
+
+class EmbedderBatchingConfig(BaseConfig):
+    """Configuration for coalescing concurrent embed requests into batched calls."""
+
+    max_batch_size: int = Field(
+        default=64, description="Maximum number of texts sent to the backend in one call"
+    )
+    max_wait_ms: float = Field(
+        default=5.0,
+        description="How long to wait for more requests before flushing a partial batch",
+    )
+
+
 class EmbedderConfigFactory(BaseConfig):
     """Factory class for creating embedder configurations."""
 
     backend: str = Field(..., description="Backend for embedding model")
     config: dict[str, Any] = Field(..., description="Configuration for the embedding model backend")
+    cache: EmbedderCacheConfig | None = Field(
+        default=None,
+        description="Enable embedding caching (LRU / TTL / optional disk store) when set",
+    )
+    batching: EmbedderBatchingConfig | None = Field(
+        default=None,
+        description="Enable micro-batching of concurrent embed requests when set",
+    )
 
     backend_to_class: ClassVar[dict[str, Any]] = {
         "ollama": OllamaEmbedderConfig,
@@ -14,6 +14,20 @@ class BaseGraphDBConfig(BaseConfig):
     password: str
 
 
+class NodeCacheConfig(BaseConfig):
+    """Configuration for the in-process cache of frequently read graph nodes."""
+
+    max_entries: int = Field(default=10000, description="Maximum number of cached nodes")
+    ttl: float | None = Field(
+        default=300.0,
+        description="Seconds after which a cached node expires (None means never)",
+    )
+    include_embedding: bool = Field(
+        default=True,
+        description="Keep node embeddings in the cache; disable to save memory",
+    )
+
+
 class Neo4jGraphDBConfig(BaseGraphDBConfig):
     """
     Neo4j-specific configuration.
@@ -70,6 +84,32 @@ class Neo4jGraphDBConfig(BaseGraphDBConfig):
 
     embedding_dimension: int = Field(default=768, description="Dimension of vector embedding")
 
+    vector_search_overfetch: int = Field(
+        default=4,
+        description=(
+            "Initial multiple of top_k fetched from the vector index when results are "
+            "filtered (e.g. by user_name); grown adaptively while too few hits pass"
+        ),
+    )
+    vector_search_max_k: int = Field(
+        default=4096,
+        description="Upper bound on the number of candidates fetched from the vector index",
+    )
+
+    node_cache: NodeCacheConfig | None = Field(
+        default=None,
+        description="Enable an in-process cache for get_node / get_nodes when set",
+    )
+
+    tag_index: bool = Field(
+        default=False,
+        description=(
+            "Materialize memory tags as (:Tag) nodes linked by TAGGED relationships and "
+            "serve tag lookups from them; run rebuild_tag_index() once when enabling it "
+            "on an existing database"
+        ),
+    )
+
     @model_validator(mode="after")
     def validate_config(self):
         """Validate logical constraints to avoid misconfiguration."""
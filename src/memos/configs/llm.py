@@ -68,6 +68,18 @@ class OllamaLLMConfig(BaseLLMConfig):
     )
 
 
+class HFBatchingConfig(BaseConfig):
+    """Configuration for merging concurrent local-model requests into batched decodes."""
+
+    max_batch_size: int = Field(
+        default=8, description="Maximum number of requests decoded together in one batch"
+    )
+    max_wait_ms: float = Field(
+        default=10.0,
+        description="How long to wait for more requests before starting a partial batch",
+    )
+
+
 class HFLLMConfig(BaseLLMConfig):
     do_sample: bool = Field(
         default=False,
@@ -77,6 +89,14 @@ class HFLLMConfig(BaseLLMConfig):
         default=True,
         description="Apply generation template for the conversation",
     )
+    stop_strings: list[str] | None = Field(
+        default=None,
+        description="Strings that end generation as soon as they are produced",
+    )
+    batching: HFBatchingConfig | None = Field(
+        default=None,
+        description="Batch concurrent generate / generate_stream calls on the shared model when set",
+    )
 
 
 class VLLMLLMConfig(BaseLLMConfig):
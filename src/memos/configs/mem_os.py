@@ -46,6 +46,16 @@ class MOSConfig(BaseConfig):
         default=5,
         description="Maximum number of memories to retrieve for each query",
     )
+    search_timeout: float | None = Field(
+        default=None,
+        description="Deadline in seconds for searching all cubes; cubes that miss it are "
+        "reported in `timed_out_cubes` instead of failing the search (None waits for all)",
+    )
+    merge_search_results: bool = Field(
+        default=False,
+        description="Also return the memories of all searched cubes merged and ranked by "
+        "relativity under `merged_text_mem`",
+    )
     enable_textual_memory: bool = Field(
         default=True,
         description="Enable textual memory for the MemChat",
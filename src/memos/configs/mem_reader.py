@@ -37,9 +37,43 @@ class BaseMemReaderConfig(BaseConfig):
     )
 
 
+class DocIngestConfig(BaseConfig):
+    """Configuration for the streaming document ingestion pipeline."""
+
+    llm_concurrency: int = Field(
+        default=16, description="Maximum in-flight LLM extraction calls per document"
+    )
+    embed_batch_size: int = Field(
+        default=32, description="Number of extracted memories embedded per embedder call"
+    )
+    checkpoint_dir: str | None = Field(
+        default=None,
+        description="Directory for per-document progress checkpoints (enables resuming)",
+    )
+
+
+class ChatBatchingConfig(BaseConfig):
+    """Configuration for packing several short chat scenes into one extraction call."""
+
+    max_tokens: int = Field(
+        default=2048,
+        description="Estimated token budget of the conversations packed into one LLM call",
+    )
+    max_scenes: int = Field(default=8, description="Maximum number of scenes per LLM call")
+
+
 class SimpleStructMemReaderConfig(BaseMemReaderConfig):
     """SimpleStruct MemReader configuration class."""
 
+    doc_ingest: DocIngestConfig = Field(
+        default_factory=DocIngestConfig,
+        description="Concurrency, batching and checkpointing of document ingestion",
+    )
+    chat_batching: ChatBatchingConfig | None = Field(
+        default=None,
+        description="Pack short chat scenes into shared LLM calls (disabled when None)",
+    )
+
 
 class MemReaderConfigFactory(BaseConfig):
     """Factory class for creating MemReader configurations."""
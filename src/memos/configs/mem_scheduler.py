@@ -34,7 +34,7 @@ class BaseSchedulerConfig(BaseConfig):
         default=DEFAULT_CONSUME_INTERVAL_SECONDS,
         gt=0,
         le=60,
-        description=f"Interval for consuming messages from queue in seconds (default: {DEFAULT_CONSUME_INTERVAL_SECONDS})",
+        description=f"Maximum seconds the consumer blocks on the message queue before re-checking for shutdown (default: {DEFAULT_CONSUME_INTERVAL_SECONDS})",
     )
     auth_config_path: str | None = Field(
         default=None,
@@ -57,6 +57,10 @@ class GeneralSchedulerConfig(BaseSchedulerConfig):
     enable_activation_memory: bool = Field(
         default=False, description="Whether to enable automatic activation memory updates"
     )
+    incremental_act_mem_update: bool = Field(
+        default=True,
+        description="Reuse the KV cache of the unchanged memory prefix when updating activation memory",
+    )
     working_mem_monitor_capacity: int = Field(
         default=30, description="Capacity of the working memory monitor"
     )
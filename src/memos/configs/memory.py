@@ -134,6 +134,72 @@ class GeneralTextMemoryConfig(BaseTextMemoryConfig):
     )
 
 
+class SearchCacheConfig(BaseConfig):
+    """Configuration for caching tree memory search results."""
+
+    max_entries: int = Field(default=1024, description="Maximum number of cached search results")
+    ttl: float | None = Field(
+        default=60.0,
+        description="Seconds after which a cached result expires (None means never)",
+    )
+
+
+class IncrementalClusteringConfig(BaseConfig):
+    """Configuration for incrementally maintaining topic clusters in tree memory."""
+
+    assign_threshold: float = Field(
+        default=0.75,
+        description="Minimum cosine similarity to a cluster centroid for a new memory to join it",
+    )
+    max_cluster_size: int = Field(
+        default=20,
+        description="Clusters growing beyond this many members are split into sub-topics",
+    )
+
+
+class NodeDedupConfig(BaseConfig):
+    """Configuration for detecting duplicate and conflicting memories on insert."""
+
+    threshold: float = Field(
+        default=0.80,
+        description="Minimum embedding similarity for an existing memory to be compared at all",
+    )
+    merged_threshold: float | None = Field(
+        default=0.92,
+        description=(
+            "Embedding similarity at or above which memories are merged without asking the LLM "
+            "(None always asks)"
+        ),
+    )
+    simhash_max_distance: int | None = Field(
+        default=None,
+        description=(
+            "Maximum SimHash bit distance for memories to count as lexical duplicates "
+            "(None disables the check)"
+        ),
+    )
+
+
+class RelationDetectionConfig(BaseConfig):
+    """Configuration for batching LLM relation judgements in tree memory."""
+
+    batch_max_tokens: int = Field(
+        default=2048,
+        description="Approximate token budget of the candidate memories judged in one LLM call",
+    )
+    cache_size: int = Field(
+        default=10000,
+        description="Maximum number of judged memory pairs remembered across passes (0 disables)",
+    )
+    detect_pairwise: bool = Field(
+        default=False,
+        description=(
+            "Judge CAUSE/CONDITION/RELATE/CONFLICT relations between each reorganized memory "
+            "and its tag neighbors (one LLM call per batch of neighbors)"
+        ),
+    )
+
+
 class TreeTextMemoryConfig(BaseTextMemoryConfig):
     """Tree text memory configuration class."""
 
@@ -179,6 +245,35 @@ class TreeTextMemoryConfig(BaseTextMemoryConfig):
         ),
     )
 
+    search_cache: SearchCacheConfig | None = Field(
+        default=None,
+        description=(
+            "Cache search results until the memory is written to or the entry expires "
+            "(optional, disabled when unset)"
+        ),
+    )
+
+    dedup: NodeDedupConfig | None = Field(
+        default=None,
+        description="Thresholds for detecting duplicate memories on insert (optional)",
+    )
+
+    relation_detection: RelationDetectionConfig | None = Field(
+        default=None,
+        description=(
+            "Judge a memory against all its candidates in one LLM call instead of one call "
+            "per pair (optional, disabled when unset)"
+        ),
+    )
+
+    incremental_clustering: IncrementalClusteringConfig | None = Field(
+        default=None,
+        description=(
+            "Assign new memories to existing topic clusters online instead of re-clustering "
+            "all candidates on every reorganization (optional, disabled when unset)"
+        ),
+    )
+
 
 # ─── 3. Global Memory Config Factory ──────────────────────────────────────────
 
@@ -9,7 +9,7 @@ from pydantic import BaseModel, Field
 class RerankerConfigFactory(BaseModel):
     """
     {
-      "backend": "http_bge" | "cosine_local" | "noop",
+      "backend": "http_bge" | "cross_encoder" | "cosine_local" | "noop",
       "config": { ... backend-specific ... }
     }
     """
@@ -0,0 +1,113 @@
+import queue
+import threading
+import time
+
+from concurrent.futures import Future
+
+from memos.configs.embedder import EmbedderBatchingConfig
+from memos.embedders.base import BaseEmbedder
+from memos.log import get_logger
+
+
+logger = get_logger(__name__)
+
+
+class BatchingEmbedder(BaseEmbedder):
+    """
+    Embedder decorator that coalesces concurrent small `embed()` calls.
+
+    Requests from many threads are collected for up to `max_wait_ms` (or until
+    `max_batch_size` texts are pending), sent to the wrapped embedder in a single
+    call, and the results are fanned back out to the callers.
+    """
+
+    def __init__(self, config: EmbedderBatchingConfig, embedder: BaseEmbedder):
+        self.config = config
+        self.embedder = embedder
+        self._queue: queue.Queue[tuple[list[str], Future] | None] = queue.Queue()
+        self._worker: threading.Thread | None = None
+        self._worker_lock = threading.Lock()
+        self._closed = False
+
+    def embed(self, texts: list[str]) -> list[list[float]]:
+        """
+        Generate embeddings for the given texts.
+
+        Args:
+            texts: List of texts to embed.
+
+        Returns:
+            List of embeddings, each represented as a list of floats.
+        """
+        if not texts:
+            return []
+        # Large requests are already batched; send them straight through.
+        if len(texts) >= self.config.max_batch_size or self._closed:
+            return self.embedder.embed(texts)
+
+        self._ensure_worker()
+        future: Future = Future()
+        self._queue.put((list(texts), future))
+        return future.result()
+
+    def close(self) -> None:
+        """Stop the background dispatcher; later calls go directly to the backend."""
+        self._closed = True
+        with self._worker_lock:
+            if self._worker is not None:
+                self._queue.put(None)
+                self._worker.join(timeout=5)
+                self._worker = None
+
+    def _ensure_worker(self) -> None:
+        if self._worker is not None:
+            return
+        with self._worker_lock:
+            if self._worker is None:
+                self._worker = threading.Thread(
+                    target=self._run, name="memos-embed-batcher", daemon=True
+                )
+                self._worker.start()
+
+    def _run(self) -> None:
+        max_wait = self.config.max_wait_ms / 1000
+        while True:
+            first = self._queue.get()
+            if first is None:
+                return
+            batch = [first]
+            pending = len(first[0])
+            deadline = time.monotonic() + max_wait
+            stop = False
+            while pending < self.config.max_batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is None:
+                    stop = True
+                    break
+                batch.append(item)
+                pending += len(item[0])
+
+            self._dispatch(batch)
+            if stop:
+                return
+
+    def _dispatch(self, batch: list[tuple[list[str], Future]]) -> None:
+        texts = [text for request_texts, _ in batch for text in request_texts]
+        try:
+            embeddings = self.embedder.embed(texts)
+        except Exception as e:
+            logger.warning(f"[BatchingEmbedder] Batched embed of {len(texts)} texts failed: {e}")
+            for _, future in batch:
+                future.set_exception(e)
+            return
+
+        offset = 0
+        for request_texts, future in batch:
+            future.set_result(embeddings[offset : offset + len(request_texts)])
+            offset += len(request_texts)
@@ -0,0 +1,169 @@
+import hashlib
+import sqlite3
+import threading
+import time
+
+from collections import OrderedDict
+
+import numpy as np
+
+from memos.configs.embedder import EmbedderCacheConfig
+from memos.embedders.base import BaseEmbedder
+from memos.log import get_logger
+
+
+logger = get_logger(__name__)
+
+
+class CachedEmbedder(BaseEmbedder):
+    """
+    Embedder decorator that caches embeddings of another embedder.
+
+    Embeddings are kept as compact float32 arrays in an in-process LRU bounded by
+    bytes, optionally expire after a TTL, and can be persisted in a sqlite store
+    keyed by a hash of model identity and text.
+    """
+
+    def __init__(self, config: EmbedderCacheConfig, embedder: BaseEmbedder):
+        self.config = config
+        self.embedder = embedder
+        self._model_id = self._build_model_id(embedder)
+
+        self._lock = threading.Lock()
+        # key -> (vector, stored_at)
+        self._cache: OrderedDict[str, tuple[np.ndarray, float]] = OrderedDict()
+        self._cached_bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+        self._db: sqlite3.Connection | None = None
+        if config.persist_path:
+            self._db = sqlite3.connect(config.persist_path, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings "
+                "(key TEXT PRIMARY KEY, vector BLOB NOT NULL, stored_at REAL NOT NULL)"
+            )
+            self._db.commit()
+
+    def embed(self, texts: list[str]) -> list[list[float]]:
+        """
+        Generate embeddings for the given texts, serving repeated texts from cache.
+
+        Args:
+            texts: List of texts to embed.
+
+        Returns:
+            List of embeddings, each represented as a list of floats.
+        """
+        keys = [self._key(text) for text in texts]
+        vectors: dict[str, np.ndarray] = {}
+        with self._lock:
+            for key in keys:
+                if key not in vectors:
+                    vector = self._get_locked(key)
+                    if vector is not None:
+                        vectors[key] = vector
+
+        missing: dict[str, str] = {}
+        for key, text in zip(keys, texts, strict=False):
+            if key not in vectors:
+                missing.setdefault(key, text)
+
+        with self._lock:
+            self.hits += len(texts) - sum(1 for key in keys if key in missing)
+            self.misses += len(missing)
+
+        if missing:
+            embeddings = self.embedder.embed(list(missing.values()))
+            now = time.time()
+            with self._lock:
+                for key, embedding in zip(missing.keys(), embeddings, strict=False):
+                    vector = np.asarray(embedding, dtype=np.float32)
+                    vectors[key] = vector
+                    self._put_locked(key, vector, now)
+                self._persist_locked(
+                    [(key, vectors[key].tobytes(), now) for key in missing if key in vectors]
+                )
+
+        return [vectors[key].tolist() for key in keys]
+
+    def stats(self) -> dict[str, int]:
+        """Return hit/miss counters and current in-memory cache size."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "entries": len(self._cache),
+                "bytes": self._cached_bytes,
+            }
+
+    def clear(self) -> None:
+        """Drop all cached embeddings, including the persistent store."""
+        with self._lock:
+            self._cache.clear()
+            self._cached_bytes = 0
+            if self._db is not None:
+                self._db.execute("DELETE FROM embeddings")
+                self._db.commit()
+
+    @staticmethod
+    def _build_model_id(embedder: BaseEmbedder) -> str:
+        # Unwrap other decorators (e.g. BatchingEmbedder) down to the backend
+        while isinstance(getattr(embedder, "embedder", None), BaseEmbedder):
+            embedder = embedder.embedder
+        config = getattr(embedder, "config", None)
+        model = getattr(config, "model_name_or_path", "")
+        dims = getattr(config, "embedding_dims", None)
+        return f"{type(embedder).__name__}:{model}:{dims}"
+
+    def _key(self, text: str) -> str:
+        return hashlib.sha256(f"{self._model_id}\x00{text}".encode()).hexdigest()
+
+    def _expired(self, stored_at: float) -> bool:
+        return self.config.ttl is not None and time.time() - stored_at > self.config.ttl
+
+    def _get_locked(self, key: str) -> np.ndarray | None:
+        entry = self._cache.get(key)
+        if entry is not None:
+            vector, stored_at = entry
+            if not self._expired(stored_at):
+                self._cache.move_to_end(key)
+                return vector
+            self._evict_locked(key)
+
+        if self._db is None:
+            return None
+        row = self._db.execute(
+            "SELECT vector, stored_at FROM embeddings WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None or self._expired(row[1]):
+            return None
+        vector = np.frombuffer(row[0], dtype=np.float32)
+        self._put_locked(key, vector, row[1])
+        return vector
+
+    def _put_locked(self, key: str, vector: np.ndarray, stored_at: float) -> None:
+        if key in self._cache:
+            self._evict_locked(key)
+        if vector.nbytes > self.config.max_bytes:
+            return
+        self._cache[key] = (vector, stored_at)
+        self._cached_bytes += vector.nbytes
+        while self._cached_bytes > self.config.max_bytes and self._cache:
+            self._evict_locked(next(iter(self._cache)))
+
+    def _evict_locked(self, key: str) -> None:
+        vector, _ = self._cache.pop(key)
+        self._cached_bytes -= vector.nbytes
+
+    def _persist_locked(self, rows: list[tuple[str, bytes, float]]) -> None:
+        if self._db is None or not rows:
+            return
+        try:
+            self._db.executemany(
+                "INSERT OR REPLACE INTO embeddings (key, vector, stored_at) VALUES (?, ?, ?)",
+                rows,
+            )
+            self._db.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"[CachedEmbedder] Failed to persist embeddings: {e}")
@@ -3,6 +3,8 @@ from typing import Any, ClassVar
 from memos.configs.embedder import EmbedderConfigFactory
 from memos.embedders.ark import ArkEmbedder
 from memos.embedders.base import BaseEmbedder
+from memos.embedders.batching import BatchingEmbedder
+from memos.embedders.cached import CachedEmbedder
 from memos.embedders.ollama import OllamaEmbedder
 from memos.embedders.sentence_transformer import SenTranEmbedder
 from memos.embedders.universal_api import UniversalAPIEmbedder
@@ -26,4 +28,9 @@ class EmbedderFactory(BaseEmbedder):
         if backend not in cls.backend_to_class:
             raise ValueError(f"Invalid backend: {backend}")
         embedder_class = cls.backend_to_class[backend]
-        return embedder_class(config_factory.config)
+        embedder = embedder_class(config_factory.config)
+        if config_factory.batching is not None:
+            embedder = BatchingEmbedder(config_factory.batching, embedder)
+        if config_factory.cache is not None:
+            return CachedEmbedder(config_factory.cache, embedder)
+        return embedder
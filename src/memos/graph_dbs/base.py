@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
 from typing import Any, Literal
 
 
@@ -18,6 +19,14 @@ class BaseGraphDB(ABC):
             metadata: Dictionary of metadata (e.g., timestamp, tags, source).
         """
 
+    @abstractmethod
+    def add_nodes(self, nodes: list[dict[str, Any]], **kwargs) -> None:
+        """
+        Add (or merge) many memory nodes in batched round-trips.
+        Args:
+            nodes: List of dicts with 'id', 'memory' and 'metadata' (the `export_graph` node format).
+        """
+
     @abstractmethod
     def update_node(self, id: str, fields: dict[str, Any]) -> None:
         """
@@ -27,6 +36,15 @@ class BaseGraphDB(ABC):
             fields: Dictionary of fields to update.
         """
 
+    @abstractmethod
+    def append_usage(self, ids: list[str], record: str) -> None:
+        """
+        Append a usage record to the `usage` list of each node, inside the store.
+        Args:
+            ids: Identifiers of the nodes that were used.
+            record: Serialized usage record to append.
+        """
+
     @abstractmethod
     def delete_node(self, id: str) -> None:
         """
@@ -46,6 +64,14 @@ class BaseGraphDB(ABC):
             type: Relationship type (e.g., 'FOLLOWS', 'CAUSES', 'PARENT').
         """
 
+    @abstractmethod
+    def add_edges(self, edges: list[dict[str, str]], **kwargs) -> None:
+        """
+        Create many edges in batched round-trips.
+        Args:
+            edges: List of dicts with 'source', 'target' and 'type' (the `export_graph` edge format).
+        """
+
     @abstractmethod
     def delete_edge(self, source_id: str, target_id: str, type: str) -> None:
         """
@@ -159,6 +185,29 @@ class BaseGraphDB(ABC):
             - Commonly used for RAG recall stage to find semantically similar memories.
         """
 
+    @abstractmethod
+    def search_by_embeddings(
+        self,
+        vectors: list[list[float]],
+        top_k: int = 5,
+        scope: str | None = None,
+        search_filter: dict | None = None,
+        **kwargs,
+    ) -> list[dict]:
+        """
+        Retrieve hydrated nodes for several query vectors in a single round-trip.
+
+        Args:
+            vectors (list[list[float]]): Query embedding vectors.
+            top_k (int): Number of top similar nodes to retrieve per vector.
+            scope (str, optional): Memory type filter (e.g., 'LongTermMemory').
+            search_filter (dict, optional): Additional metadata filters.
+
+        Returns:
+            list[dict]: Parsed node records containing 'id', 'memory', and 'metadata',
+            deduplicated by id and ordered by their best similarity score.
+        """
+
     @abstractmethod
     def get_by_metadata(self, filters: list[dict[str, Any]]) -> list[str]:
         """
@@ -238,6 +287,42 @@ class BaseGraphDB(ABC):
             data: A dictionary containing all nodes and edges to be loaded.
         """
 
+    @abstractmethod
+    def iter_nodes(
+        self,
+        batch_size: int = 1000,
+        after_id: str | None = None,
+        include_embedding: bool = True,
+        **kwargs,
+    ) -> Iterator[tuple[list[dict[str, Any]], str]]:
+        """
+        Page through all nodes in id order without materializing the whole graph.
+
+        Args:
+            batch_size: Number of nodes per page.
+            after_id: Cursor; only nodes with an id greater than this are returned.
+            include_embedding: with/without embedding
+
+        Yields:
+            (nodes, cursor): Parsed node records of one page and the id to resume after.
+        """
+
+    @abstractmethod
+    def iter_edges(
+        self, batch_size: int = 1000, after_id: str | None = None, **kwargs
+    ) -> Iterator[tuple[list[dict[str, str]], str]]:
+        """
+        Page through all edges, grouped by source node in id order.
+
+        Args:
+            batch_size: Number of source nodes per page.
+            after_id: Cursor; only edges whose source id is greater than this are returned.
+
+        Yields:
+            (edges, cursor): Edge records ('source', 'target', 'type') of one page and the
+            source id to resume after.
+        """
+
     @abstractmethod
     def get_all_memory_items(self, scope: str, include_embedding: bool = False) -> list[dict]:
         """
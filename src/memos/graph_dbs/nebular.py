@@ -1,6 +1,7 @@
 import json
 import traceback
 
+from collections.abc import Iterator
 from contextlib import suppress
 from datetime import datetime
 from threading import Lock
@@ -444,26 +445,7 @@ class NebulaGraphDB(BaseGraphDB):
         """
         Insert or update a Memory node in NebulaGraph.
         """
-        if not self.config.use_multi_db and self.config.user_name:
-            metadata["user_name"] = self.config.user_name
-
-        now = datetime.utcnow()
-        metadata = metadata.copy()
-        metadata.setdefault("created_at", now)
-        metadata.setdefault("updated_at", now)
-        metadata["node_type"] = metadata.pop("type")
-        metadata["id"] = id
-        metadata["memory"] = memory
-
-        if "embedding" in metadata and isinstance(metadata["embedding"], list):
-            assert len(metadata["embedding"]) == self.embedding_dimension, (
-                f"input embedding dimension must equal to {self.embedding_dimension}"
-            )
-            embedding = metadata.pop("embedding")
-            metadata[self.dim_field] = _normalize(embedding)
-
-        metadata = self._metadata_filter(metadata)
-        properties = ", ".join(f"{k}: {self._format_value(v, k)}" for k, v in metadata.items())
+        properties = self._build_node_properties(id, memory, metadata)
         gql = f"INSERT OR IGNORE (n@Memory {{{properties}}})"
 
         try:
@@ -474,6 +456,39 @@ class NebulaGraphDB(BaseGraphDB):
                 f"Failed to insert vertex {id}: gql: {gql}, {e}\ntrace: {traceback.format_exc()}"
             )
 
+    @timed
+    def add_nodes(self, nodes: list[dict[str, Any]], batch_size: int = 100, **kwargs) -> None:
+        """
+        Insert many Memory nodes using one multi-row INSERT per batch.
+
+        If a batch statement fails, its nodes are retried one by one so that a
+        single bad node does not drop the whole batch.
+        """
+        for start in range(0, len(nodes), batch_size):
+            batch = nodes[start : start + batch_size]
+            patterns = []
+            prepared = []
+            for idx, node in enumerate(batch):
+                try:
+                    properties = self._build_node_properties(*_compose_node(node))
+                except Exception as e:
+                    logger.error(f"Fail to prepare node: {node.get('id')}, error: {e}")
+                    continue
+                patterns.append(f"(n{idx}@Memory {{{properties}}})")
+                prepared.append(node)
+            if not patterns:
+                continue
+
+            gql = f"INSERT OR IGNORE {', '.join(patterns)}"
+            try:
+                self.execute_query(gql)
+            except Exception as e:
+                logger.warning(
+                    f"Bulk insert of {len(patterns)} vertices failed, retrying one by one: {e}"
+                )
+                for node in prepared:
+                    self.add_node(*_compose_node(node))
+
     @timed
     def node_not_exist(self, scope: str) -> int:
         if not self.config.use_multi_db and self.config.user_name:
@@ -516,6 +531,26 @@ class NebulaGraphDB(BaseGraphDB):
         query += f"\nSET {set_clause_str}"
         self.execute_query(query)
 
+    @timed
+    def append_usage(self, ids: list[str], record: str) -> None:
+        """
+        Append `record` to the usage list of each node in a single statement, so concurrent
+        searches never overwrite each other's records.
+        """
+        if not ids:
+            return
+        where_user = ""
+        if not self.config.use_multi_db and self.config.user_name:
+            where_user = f" AND n.user_name = {self._format_value(self.config.user_name)}"
+
+        id_list = ",".join(f'"{_id}"' for _id in ids)
+        query = f"""
+            MATCH (n@Memory)
+            WHERE n.id IN [{id_list}]{where_user}
+            SET n.usage = coalesce(n.usage, []) || [{self._format_value(record)}]
+        """
+        self.execute_query(query)
+
     @timed
     def delete_node(self, id: str) -> None:
         """
@@ -557,6 +592,54 @@ class NebulaGraphDB(BaseGraphDB):
         except Exception as e:
             logger.error(f"Failed to insert edge: {e}", exc_info=True)
 
+    @timed
+    def add_edges(self, edges: list[dict[str, str]], batch_size: int = 100, **kwargs) -> None:
+        """
+        Create many edges, one MATCH ... INSERT statement per batch.
+
+        Endpoints are resolved up front so that a missing node only skips its
+        own edges instead of emptying the whole batch match.
+        """
+        edges = [edge for edge in edges if edge.get("source") and edge.get("target")]
+        props = ""
+        where_user = ""
+        if not self.config.use_multi_db and self.config.user_name:
+            props = f'{{user_name: "{self.config.user_name}"}}'
+            where_user = f' AND n.user_name = "{self.config.user_name}"'
+
+        for start in range(0, len(edges), batch_size):
+            batch = edges[start : start + batch_size]
+            endpoint_ids = {edge["source"] for edge in batch} | {edge["target"] for edge in batch}
+            id_list = ",".join(f'"{_id}"' for _id in endpoint_ids)
+            try:
+                results = self.execute_query(
+                    f"MATCH (n@Memory) WHERE n.id IN [{id_list}]{where_user} RETURN n.id AS id"
+                )
+                existing = {row["id"].value for row in results}
+            except Exception as e:
+                logger.error(f"Failed to resolve edge endpoints: {e}", exc_info=True)
+                continue
+
+            matches = []
+            inserts = []
+            for idx, edge in enumerate(batch):
+                if edge["source"] not in existing or edge["target"] not in existing:
+                    logger.warning(f"Skip edge with missing endpoint: {edge}")
+                    continue
+                matches.append(
+                    f'(a{idx}@Memory {{id: "{edge["source"]}"}}), '
+                    f'(b{idx}@Memory {{id: "{edge["target"]}"}})'
+                )
+                inserts.append(f"(a{idx}) -[e{idx}@{edge['type']} {props}]-> (b{idx})")
+            if not inserts:
+                continue
+
+            gql = f"MATCH {', '.join(matches)}\nINSERT OR IGNORE {', '.join(inserts)}"
+            try:
+                self.execute_query(gql)
+            except Exception as e:
+                logger.error(f"Failed to insert {len(inserts)} edges: {e}", exc_info=True)
+
     @timed
     def delete_edge(self, source_id: str, target_id: str, type: str) -> None:
         """
@@ -827,8 +910,12 @@ class NebulaGraphDB(BaseGraphDB):
         if not self.config.use_multi_db and self.config.user_name:
             where_clauses.append(f'n.user_name = "{self.config.user_name}"')
 
-        where_clause = " AND ".join(where_clauses)
         tag_list_literal = "[" + ", ".join(f'"{_escape_str(t)}"' for t in tags) + "]"
+        # Drop non-overlapping nodes before projecting and sorting
+        where_clauses.append(
+            f"size( filter( n.tags, t -> t IN tag_list ) ) >= {max(int(min_overlap), 1)}"
+        )
+        where_clause = " AND ".join(where_clauses)
 
         return_fields = self._build_return_fields(include_embedding)
         query = f"""
@@ -992,18 +1079,12 @@ class NebulaGraphDB(BaseGraphDB):
         if status:
             where_clauses.append(f'n.status = "{status}"')
         if not self.config.use_multi_db and self.config.user_name:
-            if kwargs.get("cube_name"):
-                where_clauses.append(f'n.user_name = "{kwargs["cube_name"]}"')
-            else:
-                where_clauses.append(f'n.user_name = "{self.config.user_name}"')
-
-                # Add search_filter conditions
-                if search_filter:
-                    for key, value in search_filter.items():
-                        if isinstance(value, str):
-                            where_clauses.append(f'n.{key} = "{value}"')
-                        else:
-                            where_clauses.append(f"n.{key} = {value}")
+            user_name = kwargs.get("cube_name") or self.config.user_name
+            where_clauses.append(f'n.user_name = "{user_name}"')
+        # Filters go into the MATCH so they apply before the approximate top-k
+        if search_filter:
+            for key, value in search_filter.items():
+                where_clauses.append(f"n.{key} = {self._format_value(value)}")
 
         where_clause = f"WHERE {' AND '.join(where_clauses)}" if where_clauses else ""
 
@@ -1037,6 +1118,96 @@ class NebulaGraphDB(BaseGraphDB):
             logger.error(f"[search_by_embedding] Result parse failed: {e}")
             return []
 
+    @timed
+    def search_by_embeddings(
+        self,
+        vectors: list[list[float]],
+        top_k: int = 5,
+        scope: str | None = None,
+        search_filter: dict | None = None,
+        status: str | None = None,
+        threshold: float | None = None,
+        include_embedding: bool = False,
+        **kwargs,
+    ) -> list[dict]:
+        """
+        Retrieve hydrated nodes for several query vectors in a single GQL round-trip.
+
+        Args:
+            vectors (list[list[float]]): Query embedding vectors.
+            top_k (int): Number of top similar nodes to retrieve per vector.
+            scope (str, optional): Memory type filter (e.g., 'WorkingMemory', 'LongTermMemory').
+            search_filter (dict, optional): Additional metadata filters for search results.
+            status (str, optional): Node status filter (e.g., 'activated').
+            threshold (float, optional): Minimum similarity score threshold (0 ~ 1).
+            include_embedding: with/without embedding
+
+        Returns:
+            list[dict]: Parsed node records containing 'id', 'memory', and 'metadata',
+            deduplicated by id and ordered by their best score across all vectors.
+
+        Notes:
+            - One approximate vector search per query vector is combined with `UNION ALL`,
+              and every branch returns the node fields directly (no follow-up get_nodes).
+        """
+        if not vectors:
+            return []
+
+        where_clauses = []
+        if scope:
+            where_clauses.append(f'n.memory_type = "{scope}"')
+        if status:
+            where_clauses.append(f'n.status = "{status}"')
+        if not self.config.use_multi_db and self.config.user_name:
+            user_name = kwargs.get("cube_name") or self.config.user_name
+            where_clauses.append(f'n.user_name = "{user_name}"')
+        if search_filter:
+            for key, value in search_filter.items():
+                where_clauses.append(f"n.{key} = {self._format_value(value)}")
+        where_clause = f"WHERE {' AND '.join(where_clauses)}" if where_clauses else ""
+
+        return_fields = self._build_return_fields(include_embedding)
+        branches = []
+        for vector in vectors:
+            vector = _normalize(vector)
+            vector_str = ",".join(f"{float(x)}" for x in vector)
+            gql_vector = f"VECTOR<{len(vector)}, FLOAT>([{vector_str}])"
+            branches.append(
+                f"""
+                MATCH (n@Memory)
+                {where_clause}
+                ORDER BY inner_product(n.{self.dim_field}, {gql_vector}) DESC
+                APPROXIMATE
+                LIMIT {top_k}
+                OPTIONS {{ METRIC: IP, TYPE: IVF, NPROBE: 8 }}
+                RETURN {return_fields}, inner_product(n.{self.dim_field}, {gql_vector}) AS score
+                """
+            )
+        gql = "\nUNION ALL\n".join(branches)
+
+        try:
+            result = self.execute_query(gql)
+        except Exception as e:
+            logger.error(f"[search_by_embeddings] Query failed: {e}")
+            return []
+
+        best: dict[str, tuple[float, dict[str, Any]]] = {}
+        try:
+            for row in result:
+                props = {k: v.value for k, v in row.items() if k != "score"}
+                score = (row["score"].as_double() + 1) / 2  # align to neo4j
+                if threshold is not None and score < threshold:
+                    continue
+                node = self._parse_node(props)
+                if node["id"] not in best or score > best[node["id"]][0]:
+                    best[node["id"]] = (score, node)
+        except Exception as e:
+            logger.error(f"[search_by_embeddings] Result parse failed: {e}")
+            return []
+
+        ranked = sorted(best.values(), key=lambda pair: pair[0], reverse=True)
+        return [node for _, node in ranked]
+
     @timed
     def get_by_metadata(self, filters: list[dict[str, Any]]) -> list[str]:
         """
@@ -1264,45 +1435,98 @@ class NebulaGraphDB(BaseGraphDB):
 
         return {"nodes": nodes, "edges": edges}
 
-    @timed
-    def import_graph(self, data: dict[str, Any]) -> None:
+    def iter_nodes(
+        self,
+        batch_size: int = 1000,
+        after_id: str | None = None,
+        include_embedding: bool = True,
+        **kwargs,
+    ) -> Iterator[tuple[list[dict[str, Any]], str]]:
         """
-        Import the entire graph from a serialized dictionary.
+        Page through all nodes in id order using a keyset cursor.
 
-        Args:
-            data: A dictionary containing all nodes and edges to be loaded.
+        Yields:
+            (nodes, cursor): Parsed node records of one page and the id to resume after.
         """
-        for node in data.get("nodes", []):
-            try:
-                id, memory, metadata = _compose_node(node)
+        return_fields = self._build_return_fields(include_embedding)
+        for page in self._iter_node_pages(batch_size, after_id, return_fields):
+            nodes = [self._parse_node(props) for props in page]
+            yield nodes, page[-1]["id"]
 
-                if not self.config.use_multi_db and self.config.user_name:
-                    metadata["user_name"] = self.config.user_name
+    def iter_edges(
+        self, batch_size: int = 1000, after_id: str | None = None, **kwargs
+    ) -> Iterator[tuple[list[dict[str, str]], str]]:
+        """
+        Page through all edges, one page of source nodes at a time.
 
-                metadata = self._prepare_node_metadata(metadata)
-                metadata.update({"id": id, "memory": memory})
-                properties = ", ".join(
-                    f"{k}: {self._format_value(v, k)}" for k, v in metadata.items()
-                )
-                node_gql = f"INSERT OR IGNORE (n@Memory {{{properties}}})"
-                self.execute_query(node_gql)
+        Yields:
+            (edges, cursor): Edge records of one page and the source id to resume after.
+        """
+        where_user = ""
+        if not self.config.use_multi_db and self.config.user_name:
+            where_user = f' AND r.user_name = "{self.config.user_name}"'
+
+        for page in self._iter_node_pages(batch_size, after_id, "n.id AS id"):
+            ids = [props["id"] for props in page]
+            id_list = ",".join(f'"{_id}"' for _id in ids)
+            query = f"""
+                MATCH (a@Memory)-[r]->(b@Memory)
+                WHERE a.id IN [{id_list}]{where_user}
+                RETURN a.id AS source, b.id AS target, type(r) AS edge
+            """
+            try:
+                result = self.execute_query(query, timeout=20)
             except Exception as e:
-                logger.error(f"Fail to load node: {node}, error: {e}")
+                raise RuntimeError(f"[ITER EDGES] Exception: {e}") from e
+            edges = [
+                {
+                    "source": row.values()[0].value,
+                    "target": row.values()[1].value,
+                    "type": row.values()[2].value,
+                }
+                for row in result
+            ]
+            yield edges, ids[-1]
+
+    def _iter_node_pages(
+        self, batch_size: int, after_id: str | None, return_fields: str
+    ) -> Iterator[list[dict[str, Any]]]:
+        """Yield raw node property dicts in id order, one keyset-paginated page at a time."""
+        where_user = ""
+        if not self.config.use_multi_db and self.config.user_name:
+            where_user = f' AND n.user_name = "{self.config.user_name}"'
 
-        for edge in data.get("edges", []):
+        cursor = after_id or ""
+        while True:
+            query = f"""
+                MATCH (n@Memory)
+                WHERE n.id > {self._format_value(cursor)}{where_user}
+                RETURN {return_fields}
+                ORDER BY n.id
+                LIMIT {batch_size}
+            """
             try:
-                source_id, target_id = edge["source"], edge["target"]
-                edge_type = edge["type"]
-                props = ""
-                if not self.config.use_multi_db and self.config.user_name:
-                    props = f'{{user_name: "{self.config.user_name}"}}'
-                edge_gql = f'''
-                   MATCH (a@Memory {{id: "{source_id}"}}), (b@Memory {{id: "{target_id}"}})
-                   INSERT OR IGNORE (a) -[e@{edge_type} {props}]-> (b)
-               '''
-                self.execute_query(edge_gql)
+                result = self.execute_query(query, timeout=20)
             except Exception as e:
-                logger.error(f"Fail to load edge: {edge}, error: {e}")
+                raise RuntimeError(f"[ITER NODES] Exception: {e}") from e
+            page = [{k: v.value for k, v in row.items()} for row in result]
+            if not page:
+                return
+            yield page
+            if len(page) < batch_size:
+                return
+            cursor = page[-1]["id"]
+
+    @timed
+    def import_graph(self, data: dict[str, Any]) -> None:
+        """
+        Import the entire graph from a serialized dictionary.
+
+        Args:
+            data: A dictionary containing all nodes and edges to be loaded.
+        """
+        self.add_nodes(data.get("nodes", []))
+        self.add_edges(data.get("edges", []))
 
     @timed
     def get_all_memory_items(self, scope: str, include_embedding: bool = False) -> (list)[dict]:
@@ -1665,29 +1889,6 @@ class NebulaGraphDB(BaseGraphDB):
 
         return {"id": node_id, "memory": memory, "metadata": metadata}
 
-    @timed
-    def _prepare_node_metadata(self, metadata: dict[str, Any]) -> dict[str, Any]:
-        """
-        Ensure metadata has proper datetime fields and normalized types.
-
-        - Fill `created_at` and `updated_at` if missing (in ISO 8601 format).
-        - Convert embedding to list of float if present.
-        """
-        now = datetime.utcnow().isoformat()
-        metadata["node_type"] = metadata.pop("type")
-
-        # Fill timestamps if missing
-        metadata.setdefault("created_at", now)
-        metadata.setdefault("updated_at", now)
-
-        # Normalize embedding type
-        embedding = metadata.get("embedding")
-        if embedding and isinstance(embedding, list):
-            metadata.pop("embedding")
-            metadata[self.dim_field] = _normalize([float(x) for x in embedding])
-
-        return metadata
-
     @timed
     def _format_value(self, val: Any, key: str = "") -> str:
         from nebulagraph_python.py_data_types import NVector
@@ -1730,6 +1931,30 @@ class NebulaGraphDB(BaseGraphDB):
         else:
             return f'"{_escape_str(str(val))}"'
 
+    @timed
+    def _build_node_properties(self, id: str, memory: str, metadata: dict[str, Any]) -> str:
+        """Normalize node metadata against the schema and format it as GQL properties."""
+        metadata = metadata.copy()
+        if not self.config.use_multi_db and self.config.user_name:
+            metadata["user_name"] = self.config.user_name
+
+        now = datetime.utcnow()
+        metadata.setdefault("created_at", now)
+        metadata.setdefault("updated_at", now)
+        metadata["node_type"] = metadata.pop("type")
+        metadata["id"] = id
+        metadata["memory"] = memory
+
+        if "embedding" in metadata and isinstance(metadata["embedding"], list):
+            assert len(metadata["embedding"]) == self.embedding_dimension, (
+                f"input embedding dimension must equal to {self.embedding_dimension}"
+            )
+            embedding = metadata.pop("embedding")
+            metadata[self.dim_field] = _normalize(embedding)
+
+        metadata = self._metadata_filter(metadata)
+        return ", ".join(f"{k}: {self._format_value(v, k)}" for k, v in metadata.items())
+
     @timed
     def _metadata_filter(self, metadata: dict[str, Any]) -> dict[str, Any]:
         """
@@ -1,17 +1,25 @@
 import json
+import threading
 import time
 
+from collections import OrderedDict
+from collections.abc import Iterator
 from datetime import datetime
 from typing import Any, Literal
 
 from memos.configs.graph_db import Neo4jGraphDBConfig
 from memos.dependency import require_python_package
 from memos.graph_dbs.base import BaseGraphDB
+from memos.graph_dbs.node_cache import get_node_cache
 from memos.log import get_logger
+from memos.utils import timed
 
 
 logger = get_logger(__name__)
 
+# Filter shapes whose learned vector over-fetch multiple is kept (least recently used dropped)
+_VECTOR_OVERFETCH_MAX_ENTRIES = 1024
+
 
 def _compose_node(item: dict[str, Any]) -> tuple[str, str, dict[str, Any]]:
     node_id = item["id"]
@@ -73,6 +81,15 @@ class Neo4jGraphDB(BaseGraphDB):
         self.driver = GraphDatabase.driver(config.uri, auth=(config.user, config.password))
         self.db_name = config.db_name
         self.user_name = config.user_name
+        # Shared by all instances on the same database so writes invalidate for everyone
+        self.node_cache = (
+            get_node_cache(f"{config.uri}/{config.db_name}", config.node_cache)
+            if config.node_cache
+            else None
+        )
+        # Over-fetch multiple that last satisfied a filtered vector search, per filter shape
+        self._vector_overfetch: OrderedDict[tuple, int] = OrderedDict()
+        self._vector_overfetch_lock = threading.Lock()
 
         self.system_db_name = "system" if config.use_multi_db else config.db_name
         if config.auto_create:
@@ -134,28 +151,49 @@ class Neo4jGraphDB(BaseGraphDB):
             )
             return result.single() is None
 
-    def remove_oldest_memory(self, memory_type: str, keep_latest: int) -> None:
+    def remove_oldest_memory(
+        self, memory_type: str, keep_latest: int, batch_size: int = 1000
+    ) -> None:
         """
         Remove all WorkingMemory nodes except the latest `keep_latest` entries.
 
+        Only the surplus is touched: the oldest nodes are deleted in batches of
+        `batch_size`, walking the (user_name, memory_type, updated_at) index.
+
         Args:
             memory_type (str): Memory type (e.g., 'WorkingMemory', 'LongTermMemory').
             keep_latest (int): Number of latest WorkingMemory entries to keep.
+            batch_size (int): Maximum number of nodes deleted per transaction.
         """
-        query = f"""
+        surplus = self.get_memory_count(memory_type) - keep_latest
+        if surplus <= 0:
+            return
+
+        query = """
         MATCH (n:Memory)
-        WHERE n.memory_type = '{memory_type}'
+        WHERE n.memory_type = $memory_type
         """
         if not self.config.use_multi_db and self.config.user_name:
-            query += f"\nAND n.user_name = '{self.config.user_name}'"
-
-        query += f"""
-            WITH n ORDER BY n.updated_at DESC
-            SKIP {keep_latest}
-            DETACH DELETE n
+            query += "\nAND n.user_name = $user_name"
+        query += """
+            WITH n ORDER BY n.updated_at ASC
+            LIMIT $limit
         """
+        query += self._detach_delete_clause()
         with self.driver.session(database=self.db_name) as session:
-            session.run(query)
+            while surplus > 0:
+                result = session.run(
+                    query,
+                    memory_type=memory_type,
+                    user_name=self.config.user_name,
+                    limit=min(batch_size, surplus),
+                )
+                removed = result.single()["removed"]
+                if not removed:
+                    break
+                surplus -= removed
+        if self.node_cache:
+            self.node_cache.invalidate_scope(self._cache_scope())
 
     def add_node(self, id: str, memory: str, metadata: dict[str, Any]) -> None:
         if not self.config.use_multi_db and self.config.user_name:
@@ -190,6 +228,33 @@ class Neo4jGraphDB(BaseGraphDB):
                 updated_at=updated_at,
                 metadata=metadata,
             )
+            self._sync_tag_index(session, [id])
+        if self.node_cache:
+            self.node_cache.invalidate(self._cache_scope(), [id])
+
+    def add_nodes(self, nodes: list[dict[str, Any]], batch_size: int = 500, **kwargs) -> None:
+        """
+        Merge many nodes with one UNWIND statement per batch.
+        Args:
+            nodes: List of dicts with 'id', 'memory' and 'metadata'.
+            batch_size: Number of nodes written per statement.
+        """
+        rows = [self._prepare_node_row(*_compose_node(node)) for node in nodes]
+        query = """
+            UNWIND $rows AS row
+            MERGE (n:Memory {id: row.id})
+            SET n.memory = row.memory,
+                n.created_at = datetime(row.created_at),
+                n.updated_at = datetime(row.updated_at),
+                n += row.metadata
+        """
+        with self.driver.session(database=self.db_name) as session:
+            for start in range(0, len(rows), batch_size):
+                batch = rows[start : start + batch_size]
+                session.run(query, rows=batch)
+                self._sync_tag_index(session, [row["id"] for row in batch])
+        if self.node_cache:
+            self.node_cache.invalidate(self._cache_scope(), [row["id"] for row in rows])
 
     def update_node(self, id: str, fields: dict[str, Any]) -> None:
         """
@@ -219,6 +284,32 @@ class Neo4jGraphDB(BaseGraphDB):
 
         with self.driver.session(database=self.db_name) as session:
             session.run(query, **params)
+            if "tags" in fields:
+                self._sync_tag_index(session, [id])
+        if self.node_cache:
+            self.node_cache.invalidate(self._cache_scope(), [id])
+
+    def append_usage(self, ids: list[str], record: str) -> None:
+        """
+        Append `record` to the usage list of each node in a single statement, so concurrent
+        searches never overwrite each other's records.
+        """
+        if not ids:
+            return
+        query = """
+        UNWIND $ids AS id
+        MATCH (n:Memory {id: id})
+        """
+        params = {"ids": ids, "record": record}
+        if not self.config.use_multi_db and self.config.user_name:
+            query += "\nWHERE n.user_name = $user_name"
+            params["user_name"] = self.config.user_name
+        query += "\nSET n.usage = coalesce(n.usage, []) + $record"
+
+        with self.driver.session(database=self.db_name) as session:
+            session.run(query, **params)
+        if self.node_cache:
+            self.node_cache.invalidate(self._cache_scope(), ids)
 
     def delete_node(self, id: str) -> None:
         """
@@ -233,10 +324,12 @@ class Neo4jGraphDB(BaseGraphDB):
             query += " WHERE n.user_name = $user_name"
             params["user_name"] = self.config.user_name
 
-        query += " DETACH DELETE n"
+        query += self._detach_delete_clause()
 
         with self.driver.session(database=self.db_name) as session:
             session.run(query, **params)
+        if self.node_cache:
+            self.node_cache.invalidate(self._cache_scope(), [id])
 
     # Edge (Relationship) Management
     def add_edge(self, source_id: str, target_id: str, type: str) -> None:
@@ -263,6 +356,37 @@ class Neo4jGraphDB(BaseGraphDB):
         with self.driver.session(database=self.db_name) as session:
             session.run(query, params)
 
+    def add_edges(self, edges: list[dict[str, str]], batch_size: int = 500, **kwargs) -> None:
+        """
+        Create many edges with one UNWIND statement per relationship type and batch.
+        Args:
+            edges: List of dicts with 'source', 'target' and 'type'.
+            batch_size: Number of edges written per statement.
+        """
+        edges_by_type: dict[str, list[dict[str, str]]] = {}
+        for edge in edges:
+            edges_by_type.setdefault(edge["type"], []).append(
+                {"source": edge["source"], "target": edge["target"]}
+            )
+
+        where_user = ""
+        params: dict[str, Any] = {}
+        if not self.config.use_multi_db and self.config.user_name:
+            where_user = "WHERE a.user_name = $user_name AND b.user_name = $user_name"
+            params["user_name"] = self.config.user_name
+
+        with self.driver.session(database=self.db_name) as session:
+            for edge_type, rows in edges_by_type.items():
+                query = f"""
+                    UNWIND $rows AS row
+                    MATCH (a:Memory {{id: row.source}})
+                    MATCH (b:Memory {{id: row.target}})
+                    {where_user}
+                    MERGE (a)-[:{edge_type}]->(b)
+                """
+                for start in range(0, len(rows), batch_size):
+                    session.run(query, rows=rows[start : start + batch_size], **params)
+
     def delete_edge(self, source_id: str, target_id: str, type: str) -> None:
         """
         Delete a specific edge between two nodes.
@@ -339,6 +463,13 @@ class Neo4jGraphDB(BaseGraphDB):
             Dictionary of node fields, or None if not found.
         """
 
+        if self.node_cache:
+            cached = self.node_cache.get_many(
+                self._cache_scope(), [id], kwargs.get("include_embedding", True)
+            )
+            if id in cached:
+                return cached[id]
+
         where_user = ""
         params = {"id": id}
         if not self.config.use_multi_db and self.config.user_name:
@@ -349,7 +480,10 @@ class Neo4jGraphDB(BaseGraphDB):
 
         with self.driver.session(database=self.db_name) as session:
             record = session.run(query, params).single()
-            return self._parse_node(dict(record["n"])) if record else None
+            node = self._parse_node(dict(record["n"])) if record else None
+        if node and self.node_cache:
+            self.node_cache.put_many(self._cache_scope(), [node])
+        return node
 
     def get_nodes(self, ids: list[str], **kwargs) -> list[dict[str, Any]]:
         """
@@ -367,6 +501,14 @@ class Neo4jGraphDB(BaseGraphDB):
         if not ids:
             return []
 
+        scope = self._cache_scope(kwargs.get("cube_name"))
+        cached: dict[str, dict[str, Any]] = {}
+        if self.node_cache:
+            cached = self.node_cache.get_many(scope, ids, kwargs.get("include_embedding", True))
+            ids = [node_id for node_id in ids if node_id not in cached]
+            if not ids:
+                return list(cached.values())
+
         where_user = ""
         params = {"ids": ids}
 
@@ -381,7 +523,10 @@ class Neo4jGraphDB(BaseGraphDB):
 
         with self.driver.session(database=self.db_name) as session:
             results = session.run(query, params)
-            return [self._parse_node(dict(record["n"])) for record in results]
+            nodes = [self._parse_node(dict(record["n"])) for record in results]
+        if self.node_cache:
+            self.node_cache.put_many(scope, nodes)
+        return list(cached.values()) + nodes
 
     def get_edges(self, id: str, type: str = "ANY", direction: str = "ANY") -> list[dict[str, str]]:
         """
@@ -481,7 +626,26 @@ class Neo4jGraphDB(BaseGraphDB):
             where_user = "AND n.user_name = $user_name"
             params["user_name"] = self.config.user_name
 
-        query = f"""
+        if self.config.tag_index:
+            # Start from the matching tags and count overlaps over their TAGGED edges
+            params["tag_scope"] = self._cache_scope()
+            query = f"""
+                MATCH (t:Tag)
+                WHERE t.scope = $tag_scope AND t.name IN $tags
+                MATCH (n:Memory)-[:TAGGED]->(t)
+                WHERE NOT n.id IN $exclude_ids
+                  AND n.status = 'activated'
+                  AND n.type <> 'reasoning'
+                  AND n.memory_type <> 'WorkingMemory'
+                  {where_user}
+                WITH n, count(DISTINCT t) AS overlap_count
+                WHERE overlap_count >= $min_overlap
+                RETURN n, overlap_count
+                ORDER BY overlap_count DESC
+                LIMIT $top_k
+            """
+        else:
+            query = f"""
                 MATCH (n:Memory)
                 WHERE NOT n.id IN $exclude_ids
                   AND n.status = 'activated'
@@ -556,13 +720,22 @@ class Neo4jGraphDB(BaseGraphDB):
                 center_user_clause = " AND center.user_name = $user_name"
                 neighbor_user_clause = " WHERE neighbor.user_name = $user_name"
                 params["user_name"] = self.config.user_name
+            rel_pattern = f"r*1..{depth}"
+            if self.config.tag_index:
+                # Expand only over memory relationships so paths never enter (:Tag) nodes
+                edge_types = self._memory_edge_types(session)
+                if edge_types:
+                    rel_pattern = f"r:{'|'.join(edge_types)}*1..{depth}"
+                else:
+                    # Only TAGGED relationships exist, so no memory has neighbors
+                    neighbor_user_clause = " WHERE false"
             status_clause = f" AND center.status = '{center_status}'" if center_status else ""
 
             query = f"""
                 MATCH (center:Memory)
                 WHERE center.id = $center_id{status_clause}{center_user_clause}
 
-                OPTIONAL MATCH (center)-[r*1..{depth}]-(neighbor:Memory)
+                OPTIONAL MATCH (center)-[{rel_pattern}]-(neighbor:Memory)
                 {neighbor_user_clause}
 
                 WITH collect(DISTINCT center) AS centers,
@@ -606,6 +779,7 @@ class Neo4jGraphDB(BaseGraphDB):
         raise NotImplementedError
 
     # Search / recall operations
+    @timed
     def search_by_embedding(
         self,
         vector: list[float],
@@ -638,62 +812,68 @@ class Neo4jGraphDB(BaseGraphDB):
             - If 'status' is provided, only nodes with the matching status will be returned.
             - If threshold is provided, only results with score >= threshold will be returned.
             - If search_filter is provided, additional WHERE clauses will be added for metadata filtering.
+            - Filters are applied to index hits, so the index is over-fetched (and
+              re-queried with a larger k) until `top_k` hits pass or it is exhausted.
             - Typical use case: restrict to 'status = activated' to avoid
             matching archived or merged nodes.
         """
-        # Build WHERE clause dynamically
-        where_clauses = []
-        if scope:
-            where_clauses.append("node.memory_type = $scope")
-        if status:
-            where_clauses.append("node.status = $status")
-        if not self.config.use_multi_db and self.config.user_name:
-            where_clauses.append("node.user_name = $user_name")
+        conditions, parameters = self._build_vector_search_conditions(
+            scope, status, search_filter, kwargs.get("cube_name"), alias="hit.node"
+        )
+        [hits] = self._filtered_vector_search(
+            [vector], top_k, conditions, parameters, threshold, projection="hit.node.id"
+        )
+        return [{"id": hit["node"], "score": hit["score"]} for hit in hits]
 
-        # Add search_filter conditions
-        if search_filter:
-            for key, _ in search_filter.items():
-                param_name = f"filter_{key}"
-                where_clauses.append(f"node.{key} = ${param_name}")
-
-        where_clause = ""
-        if where_clauses:
-            where_clause = "WHERE " + " AND ".join(where_clauses)
-
-        query = f"""
-            CALL db.index.vector.queryNodes('memory_vector_index', $k, $embedding)
-            YIELD node, score
-            {where_clause}
-            RETURN node.id AS id, score
+    @timed
+    def search_by_embeddings(
+        self,
+        vectors: list[list[float]],
+        top_k: int = 5,
+        scope: str | None = None,
+        search_filter: dict | None = None,
+        status: str | None = None,
+        threshold: float | None = None,
+        **kwargs,
+    ) -> list[dict]:
         """
+        Retrieve hydrated nodes for several query vectors in a single Cypher round-trip.
 
-        parameters = {"embedding": vector, "k": top_k}
-
-        if scope:
-            parameters["scope"] = scope
-        if status:
-            parameters["status"] = status
-        if not self.config.use_multi_db and self.config.user_name:
-            if kwargs.get("cube_name"):
-                parameters["user_name"] = kwargs["cube_name"]
-            else:
-                parameters["user_name"] = self.config.user_name
-
-        # Add search_filter parameters
-        if search_filter:
-            for key, value in search_filter.items():
-                param_name = f"filter_{key}"
-                parameters[param_name] = value
+        Args:
+            vectors (list[list[float]]): Query embedding vectors.
+            top_k (int): Number of top similar nodes to retrieve per vector.
+            scope (str, optional): Memory type filter (e.g., 'WorkingMemory', 'LongTermMemory').
+            search_filter (dict, optional): Additional metadata filters for search results.
+            status (str, optional): Node status filter (e.g., 'activated').
+            threshold (float, optional): Minimum similarity score threshold (0 ~ 1).
 
-        with self.driver.session(database=self.db_name) as session:
-            result = session.run(query, parameters)
-            records = [{"id": record["id"], "score": record["score"]} for record in result]
+        Returns:
+            list[dict]: Parsed node records containing 'id', 'memory', and 'metadata',
+            deduplicated by id and ordered by their best score across all vectors.
 
-        # Threshold filtering after retrieval
-        if threshold is not None:
-            records = [r for r in records if r["score"] >= threshold]
+        Notes:
+            - All vectors are fanned out server-side with `UNWIND` over
+              `db.index.vector.queryNodes`, so the whole batch costs one query
+              (plus retries for vectors whose filtered hits came up short).
+        """
+        if not vectors:
+            return []
 
-        return records
+        conditions, parameters = self._build_vector_search_conditions(
+            scope, status, search_filter, kwargs.get("cube_name"), alias="hit.node"
+        )
+        per_vector = self._filtered_vector_search(
+            vectors, top_k, conditions, parameters, threshold, projection="hit.node"
+        )
+
+        best: dict[str, tuple[float, Any]] = {}
+        for hits in per_vector:
+            for hit in hits:
+                node_id = hit["node"]["id"]
+                if node_id not in best or hit["score"] > best[node_id][0]:
+                    best[node_id] = (hit["score"], hit["node"])
+        ranked = sorted(best.values(), key=lambda pair: pair[0], reverse=True)
+        return [self._parse_node(dict(node)) for _, node in ranked]
 
     def get_by_metadata(self, filters: list[dict[str, Any]]) -> list[str]:
         """
@@ -722,6 +902,7 @@ class Neo4jGraphDB(BaseGraphDB):
         """
         where_clauses = []
         params = {}
+        match_tags = ""
 
         for i, f in enumerate(filters):
             field = f["field"]
@@ -730,7 +911,15 @@ class Neo4jGraphDB(BaseGraphDB):
             param_key = f"val{i}"
 
             # Build WHERE clause
-            if op == "=":
+            if field == "tags" and op == "contains" and self.config.tag_index and not match_tags:
+                # Drive the lookup from the tag index instead of scanning every node
+                match_tags = (
+                    f"MATCH (t:Tag) WHERE t.scope = $tag_scope AND t.name IN ${param_key} "
+                    "MATCH (n:Memory)-[:TAGGED]->(t) "
+                )
+                params[param_key] = [value] if isinstance(value, str) else value
+                params["tag_scope"] = self._cache_scope()
+            elif op == "=":
                 where_clauses.append(f"n.{field} = ${param_key}")
                 params[param_key] = value
             elif op == "in":
@@ -756,7 +945,11 @@ class Neo4jGraphDB(BaseGraphDB):
             params["user_name"] = self.config.user_name
 
         where_str = " AND ".join(where_clauses)
-        query = f"MATCH (n:Memory) WHERE {where_str} RETURN n.id AS id"
+        if match_tags:
+            where_part = f"WHERE {where_str} " if where_str else ""
+            query = f"{match_tags}{where_part}RETURN DISTINCT n.id AS id"
+        else:
+            query = f"MATCH (n:Memory) WHERE {where_str} RETURN n.id AS id"
 
         with self.driver.session(database=self.db_name) as session:
             result = session.run(query, params)
@@ -856,12 +1049,67 @@ class Neo4jGraphDB(BaseGraphDB):
             # Step 2: Clear the graph in that database
             with self.driver.session(database=self.db_name) as session:
                 session.run(query, params)
+                if self.config.tag_index and params:
+                    session.run("MATCH (t:Tag) WHERE t.scope = $user_name DETACH DELETE t", params)
                 logger.info(f"Cleared all nodes from database '{self.db_name}'.")
+            if self.node_cache:
+                self.node_cache.invalidate_scope(params.get("user_name"))
 
         except Exception as e:
             logger.error(f"[ERROR] Failed to clear database '{self.db_name}': {e}")
             raise
 
+    def iter_nodes(
+        self,
+        batch_size: int = 1000,
+        after_id: str | None = None,
+        include_embedding: bool = True,
+        **kwargs,
+    ) -> Iterator[tuple[list[dict[str, Any]], str]]:
+        """
+        Page through all nodes in id order using a keyset cursor.
+
+        Yields:
+            (nodes, cursor): Parsed node records of one page and the id to resume after.
+        """
+        for page in self._iter_node_pages(batch_size, after_id):
+            nodes = [self._parse_node(node) for node in page]
+            if not include_embedding:
+                for node in nodes:
+                    node["metadata"].pop("embedding", None)
+            yield nodes, page[-1]["id"]
+
+    def iter_edges(
+        self, batch_size: int = 1000, after_id: str | None = None, **kwargs
+    ) -> Iterator[tuple[list[dict[str, str]], str]]:
+        """
+        Page through all edges, one page of source nodes at a time.
+
+        Yields:
+            (edges, cursor): Edge records of one page and the source id to resume after.
+        """
+        where_user = ""
+        params: dict[str, Any] = {}
+        if not self.config.use_multi_db and self.config.user_name:
+            where_user = " AND a.user_name = $user_name AND b.user_name = $user_name"
+            params["user_name"] = self.config.user_name
+
+        edge_query = f"""
+            MATCH (a:Memory)-[r]->(b:Memory)
+            WHERE a.id IN $ids{where_user}
+            RETURN a.id AS source, b.id AS target, type(r) AS type
+            ORDER BY source
+        """
+        for page in self._iter_node_pages(batch_size, after_id, ids_only=True):
+            ids = [node["id"] for node in page]
+            with self.driver.session(database=self.db_name) as session:
+                result = session.run(edge_query, ids=ids, **params)
+                edges = [
+                    {"source": record["source"], "target": record["target"], "type": record["type"]}
+                    for record in result
+                ]
+            yield edges, ids[-1]
+
     def export_graph(self, **kwargs) -> dict[str, Any]:
         """
         Export all graph nodes and edges in a structured form.
@@ -904,44 +1152,8 @@ class Neo4jGraphDB(BaseGraphDB):
         Args:
             data: A dictionary containing all nodes and edges to be loaded.
         """
-        with self.driver.session(database=self.db_name) as session:
-            for node in data.get("nodes", []):
-                id, memory, metadata = _compose_node(node)
-
-                if not self.config.use_multi_db and self.config.user_name:
-                    metadata["user_name"] = self.config.user_name
-
-                metadata = _prepare_node_metadata(metadata)
-
-                # Merge node and set metadata
-                created_at = metadata.pop("created_at")
-                updated_at = metadata.pop("updated_at")
-
-                session.run(
-                    """
-                    MERGE (n:Memory {id: $id})
-                    SET n.memory = $memory,
-                        n.created_at = datetime($created_at),
-                        n.updated_at = datetime($updated_at),
-                        n += $metadata
-                    """,
-                    id=id,
-                    memory=memory,
-                    created_at=created_at,
-                    updated_at=updated_at,
-                    metadata=metadata,
-                )
-
-            for edge in data.get("edges", []):
-                session.run(
-                    f"""
-                    MATCH (a:Memory {{id: $source_id}})
-                    MATCH (b:Memory {{id: $target_id}})
-                    MERGE (a)-[:{edge["type"]}]->(b)
-                    """,
-                    source_id=edge["source"],
-                    target_id=edge["target"],
-                )
+        self.add_nodes(data.get("nodes", []))
+        self.add_edges(data.get("edges", []))
 
     def get_all_memory_items(self, scope: str, **kwargs) -> list[dict]:
         """
@@ -1004,6 +1216,31 @@ class Neo4jGraphDB(BaseGraphDB):
                 self._parse_node({"id": record["id"], **dict(record["node"])}) for record in results
             ]
 
+    def rebuild_tag_index(self, batch_size: int = 500) -> None:
+        """
+        Link every memory of this scope to its (:Tag) nodes.
+
+        Needed once when `tag_index` is enabled on a database that already has memories.
+        Args:
+            batch_size: Number of nodes re-linked per statement.
+        """
+        if not self.config.tag_index:
+            raise ValueError("rebuild_tag_index requires tag_index to be enabled")
+
+        where_user = ""
+        params = {}
+        if not self.config.use_multi_db and self.config.user_name:
+            where_user = "WHERE n.user_name = $user_name"
+            params["user_name"] = self.config.user_name
+
+        with self.driver.session(database=self.db_name) as session:
+            self._create_tag_index(session)
+            result = session.run(f"MATCH (n:Memory) {where_user} RETURN n.id AS id", params)
+            ids = [record["id"] for record in result]
+            for start in range(0, len(ids), batch_size):
+                self._sync_tag_index(session, ids[start : start + batch_size])
+        logger.info(f"[TagIndex] Rebuilt tag links of {len(ids)} nodes in '{self.db_name}'.")
+
     def drop_database(self) -> None:
         """
         Permanently delete the entire database this instance is using.
@@ -1016,6 +1253,8 @@ class Neo4jGraphDB(BaseGraphDB):
             with self.driver.session(database=self.system_db_name) as session:
                 session.run(f"DROP DATABASE {self.db_name} IF EXISTS")
                 print(f"Database '{self.db_name}' has been dropped.")
+            if self.node_cache:
+                self.node_cache.invalidate_scope()
         else:
             raise ValueError(
                 f"Refusing to drop protected database: {self.db_name} in "
@@ -1111,9 +1350,110 @@ class Neo4jGraphDB(BaseGraphDB):
                         """
                     )
                 logger.debug("Index 'memory_user_name_index' ensured.")
+
+                self._create_retention_index(session)
+                self._create_tag_index(session)
         except Exception as e:
             logger.warning(f"Failed to create basic property indexes: {e}")
 
+    def _create_retention_index(self, session) -> None:
+        """
+        Create the composite index used to find the oldest nodes of a memory scope.
+        """
+        if not self.config.use_multi_db and self.config.user_name:
+            session.run("""
+                CREATE INDEX memory_retention_index IF NOT EXISTS
+                FOR (n:Memory) ON (n.user_name, n.memory_type, n.updated_at)
+            """)
+        else:
+            session.run("""
+                CREATE INDEX memory_retention_index IF NOT EXISTS
+                FOR (n:Memory) ON (n.memory_type, n.updated_at)
+            """)
+        logger.debug("Index 'memory_retention_index' ensured.")
+
+    def _create_tag_index(self, session) -> None:
+        """
+        Create the index used to look up (:Tag) nodes when the tag index is enabled.
+        """
+        if not self.config.tag_index:
+            return
+        session.run("""
+            CREATE INDEX tag_scope_name_index IF NOT EXISTS
+            FOR (t:Tag) ON (t.scope, t.name)
+        """)
+        logger.debug("Index 'tag_scope_name_index' ensured.")
+
+    def _sync_tag_index(self, session, ids: list[str]) -> None:
+        """
+        Re-link the given nodes to the (:Tag) nodes of their current tags, deleting
+        tags left without any TAGGED edge in the same statement.
+        """
+        if not self.config.tag_index or not ids:
+            return
+        session.run(
+            """
+            UNWIND $ids AS id
+            MATCH (n:Memory {id: id})
+            OPTIONAL MATCH (n)-[old:TAGGED]->(old_tag:Tag)
+            DELETE old
+            WITH n, collect(old_tag) AS old_tags
+            FOREACH (tag IN coalesce(n.tags, []) |
+                MERGE (t:Tag {scope: $scope, name: tag})
+                MERGE (n)-[:TAGGED]->(t)
+            )
+            WITH collect(old_tags) AS old_tag_lists
+            UNWIND old_tag_lists AS old_tags
+            UNWIND old_tags AS old_tag
+            WITH DISTINCT old_tag
+            WHERE NOT (old_tag)<-[:TAGGED]-()
+            DELETE old_tag
+            """,
+            ids=ids,
+            scope=self._cache_scope(),
+        )
+
+    def _detach_delete_clause(self) -> str:
+        """
+        Cypher tail deleting the matched nodes `n` and returning how many were removed.
+
+        With the tag index on, (:Tag) nodes the deletion leaves without any TAGGED
+        edge are deleted in the same statement.
+        """
+        if not self.config.tag_index:
+            return """
+            DETACH DELETE n
+            RETURN count(*) AS removed
+            """
+        return """
+            OPTIONAL MATCH (n)-[:TAGGED]->(tag:Tag)
+            WITH n, collect(tag) AS tags
+            DETACH DELETE n
+            WITH count(*) AS removed, collect(tags) AS tag_lists
+            CALL {
+                WITH tag_lists
+                UNWIND tag_lists AS tags
+                UNWIND tags AS tag
+                WITH DISTINCT tag
+                WHERE NOT (tag)<-[:TAGGED]-()
+                DELETE tag
+            }
+            RETURN removed
+            """
+
+    def _memory_edge_types(self, session) -> list[str]:
+        """
+        Quoted relationship types that connect memories, i.e. all types but TAGGED.
+        """
+        result = session.run(
+            "CALL db.relationshipTypes() YIELD relationshipType RETURN relationshipType"
+        )
+        return [
+            "`" + record["relationshipType"].replace("`", "``") + "`"
+            for record in result
+            if record["relationshipType"] != "TAGGED"
+        ]
+
     def _index_exists(self, index_name: str) -> bool:
         """
         Check if an index with the given name exists.
@@ -1126,6 +1466,188 @@ class Neo4jGraphDB(BaseGraphDB):
                     return True
         return False
 
+    def _build_vector_search_conditions(
+        self,
+        scope: str | None = None,
+        status: str | None = None,
+        search_filter: dict | None = None,
+        cube_name: str | None = None,
+        alias: str = "node",
+    ) -> tuple[list[str], dict[str, Any]]:
+        """
+        Build the conditions and parameters applied to `queryNodes` hits bound to `alias`.
+        """
+        conditions = []
+        parameters = {}
+        if scope:
+            conditions.append(f"{alias}.memory_type = $scope")
+            parameters["scope"] = scope
+        if status:
+            conditions.append(f"{alias}.status = $status")
+            parameters["status"] = status
+        if not self.config.use_multi_db and self.config.user_name:
+            conditions.append(f"{alias}.user_name = $user_name")
+            parameters["user_name"] = cube_name or self.config.user_name
+
+        # Add search_filter conditions
+        if search_filter:
+            for key, value in search_filter.items():
+                param_name = f"filter_{key}"
+                conditions.append(f"{alias}.{key} = ${param_name}")
+                parameters[param_name] = value
+        return conditions, parameters
+
+    def _filtered_vector_search(
+        self,
+        vectors: list[list[float]],
+        top_k: int,
+        conditions: list[str],
+        parameters: dict[str, Any],
+        threshold: float | None,
+        projection: str,
+    ) -> list[list[dict[str, Any]]]:
+        """
+        Return, per vector, its best `top_k` index hits that satisfy `conditions`.
+
+        The vector index cannot filter before ranking, so in a shared database the
+        nearest k are mostly other tenants' nodes. Each vector therefore fetches a
+        multiple of `top_k` candidates, and vectors that end up with fewer than
+        `top_k` matches are re-queried with a 4x larger k until the index is
+        exhausted, the threshold is crossed or `vector_search_max_k` is reached. The
+        multiple that was finally needed is remembered for the next search with the
+        same filter shape, and halved again (down to `vector_search_overfetch`) whenever
+        the first round already satisfies every vector.
+
+        Returns:
+            One list of {"node": <projection>, "score": float} per input vector,
+            ordered by descending score.
+        """
+        if top_k <= 0:
+            return [[] for _ in vectors]
+        if threshold is not None:
+            conditions = [*conditions, "hit.score >= $threshold"]
+            parameters = {**parameters, "threshold": threshold}
+        filter_key = (tuple(conditions), parameters.get("user_name"), parameters.get("scope"))
+        max_k = max(self.config.vector_search_max_k, top_k)
+        multiple = 1
+        if conditions:
+            with self._vector_overfetch_lock:
+                multiple = self._vector_overfetch.get(
+                    filter_key, self.config.vector_search_overfetch
+                )
+        k = min(top_k * multiple, max_k)
+
+        match = f"hit IN hits WHERE {' AND '.join(conditions)}" if conditions else "hit IN hits"
+        query = f"""
+            UNWIND range(0, size($embeddings) - 1) AS i
+            CALL db.index.vector.queryNodes('memory_vector_index', $k, $embeddings[i])
+            YIELD node, score
+            WITH i, collect({{node: node, score: score}}) AS hits
+            RETURN i, size(hits) AS fetched, hits[-1].score AS min_score,
+                   [{match} | {{node: {projection}, score: hit.score}}][..$top_k] AS matches
+        """
+
+        results: list[list[dict[str, Any]]] = [[] for _ in vectors]
+        pending = list(range(len(vectors)))
+        rounds = 0
+        with self.driver.session(database=self.db_name) as session:
+            while pending:
+                params = {
+                    **parameters,
+                    "embeddings": [vectors[i] for i in pending],
+                    "k": k,
+                    "top_k": top_k,
+                }
+                short = []
+                rounds += 1
+                for record in session.run(query, params):
+                    index = pending[record["i"]]
+                    results[index] = record["matches"]
+                    exhausted = record["fetched"] < k or (
+                        threshold is not None and record["min_score"] < threshold
+                    )
+                    if len(record["matches"]) < top_k and not exhausted:
+                        short.append(index)
+                if not short or k >= max_k:
+                    break
+                pending = short
+                k = min(k * 4, max_k)
+
+        if conditions:
+            if rounds > 1:
+                learned = max(1, k // top_k)
+            elif not short:
+                # Over-fetching was enough from the start: try a smaller multiple next time
+                learned = max(self.config.vector_search_overfetch, multiple // 2)
+            else:
+                learned = multiple
+            with self._vector_overfetch_lock:
+                self._vector_overfetch[filter_key] = learned
+                self._vector_overfetch.move_to_end(filter_key)
+                while len(self._vector_overfetch) > _VECTOR_OVERFETCH_MAX_ENTRIES:
+                    self._vector_overfetch.popitem(last=False)
+        return results
+
+    def _iter_node_pages(
+        self, batch_size: int, after_id: str | None = None, ids_only: bool = False
+    ) -> Iterator[list[dict[str, Any]]]:
+        """Yield raw node property dicts in id order, one keyset-paginated page at a time."""
+        where_user = ""
+        params: dict[str, Any] = {"limit": batch_size}
+        if not self.config.use_multi_db and self.config.user_name:
+            where_user = " AND n.user_name = $user_name"
+            params["user_name"] = self.config.user_name
+        return_clause = "RETURN n.id AS id" if ids_only else "RETURN n"
+        query = f"""
+            MATCH (n:Memory)
+            WHERE n.id > $after_id{where_user}
+            {return_clause}
+            ORDER BY n.id
+            LIMIT $limit
+        """
+
+        cursor = after_id or ""
+        while True:
+            with self.driver.session(database=self.db_name) as session:
+                result = session.run(query, after_id=cursor, **params)
+                if ids_only:
+                    page = [{"id": record["id"]} for record in result]
+                else:
+                    page = [dict(record["n"]) for record in result]
+            if not page:
+                return
+            yield page
+            if len(page) < batch_size:
+                return
+            cursor = page[-1]["id"]
+
+    def _prepare_node_row(self, id: str, memory: str, metadata: dict[str, Any]) -> dict[str, Any]:
+        """Build the UNWIND row for one node, normalizing metadata like `add_node`."""
+        metadata = dict(metadata)
+        if not self.config.use_multi_db and self.config.user_name:
+            metadata["user_name"] = self.config.user_name
+        metadata = _prepare_node_metadata(metadata)
+        created_at = metadata.pop("created_at")
+        updated_at = metadata.pop("updated_at")
+        if metadata.get("sources"):
+            metadata["sources"] = [
+                source if isinstance(source, str) else json.dumps(source)
+                for source in metadata["sources"]
+            ]
+        return {
+            "id": id,
+            "memory": memory,
+            "created_at": created_at,
+            "updated_at": updated_at,
+            "metadata": metadata,
+        }
+
+    def _cache_scope(self, user_name: str | None = None) -> str:
+        """Node cache scope (tenant) for queries run by this instance."""
+        if self.config.use_multi_db:
+            return ""
+        return user_name or self.config.user_name or ""
+
     def _parse_node(self, node_data: dict[str, Any]) -> dict[str, Any]:
         node = node_data.copy()
 
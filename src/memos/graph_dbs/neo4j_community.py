@@ -1,9 +1,12 @@
 import json
+
+from collections.abc import Iterator
 from typing import Any
 
 from memos.configs.graph_db import Neo4jGraphDBConfig
-from memos.graph_dbs.neo4j import Neo4jGraphDB, _prepare_node_metadata
+from memos.graph_dbs.neo4j import Neo4jGraphDB, _compose_node, _prepare_node_metadata
 from memos.log import get_logger
+from memos.utils import timed
 from memos.vec_dbs.factory import VecDBFactory
 from memos.vec_dbs.item import VecDBItem
 
@@ -140,6 +143,118 @@ class Neo4jCommunityGraphDB(Neo4jGraphDB):
                 updated_at=updated_at,
                 metadata=neo4j_metadata,
             )
+            self._sync_tag_index(session, [id])
+        if self.node_cache:
+            self.node_cache.invalidate(self._cache_scope(), [id])
+
+    def update_node(self, id: str, fields: dict[str, Any]) -> None:
+        """
+        Update node fields in Neo4j and keep the vector DB point in sync: a new
+        `embedding` replaces the stored vector, and the other fields (except the
+        timestamps) are merged into its payload so filtered searches see them.
+        """
+        fields = dict(fields)
+        embedding = fields.pop("embedding", None)
+        payload = {k: v for k, v in fields.items() if k not in ("created_at", "updated_at")}
+        if embedding is not None or payload:
+            try:
+                if embedding is not None:
+                    # Writing a vector replaces the whole point, so carry its payload over
+                    current = self.vec_db.get_by_id(id)
+                    payload = {**((current.payload or {}) if current else {}), **payload}
+                    self.vec_db.update(id, VecDBItem(id=id, vector=embedding, payload=payload))
+                else:
+                    self.vec_db.update(id, VecDBItem(id=id, payload=payload))
+            except Exception as e:
+                logger.warning(f"[VecDB] Vector update failed for node {id}: {e}")
+                fields["vector_sync"] = "failed"
+        super().update_node(id, fields)
+
+    def add_nodes(self, nodes: list[dict[str, Any]], batch_size: int = 500, **kwargs) -> None:
+        """
+        Upsert vectors for many nodes in one vector DB call, then merge the
+        nodes into Neo4j with one UNWIND statement per batch.
+        """
+        items = []
+        rows = []
+        for node in nodes:
+            id, memory, metadata = _compose_node(node)
+            metadata = dict(metadata)
+            if not self.config.use_multi_db and self.config.user_name:
+                metadata["user_name"] = self.config.user_name
+            metadata = _prepare_node_metadata(metadata)
+
+            embedding = metadata.pop("embedding", None)
+            if embedding is None:
+                raise ValueError(f"Missing 'embedding' in metadata for node {id}")
+            created_at = metadata.pop("created_at")
+            updated_at = metadata.pop("updated_at")
+
+            items.append(
+                VecDBItem(
+                    id=id,
+                    vector=embedding,
+                    payload={"memory": memory, "vector_sync": "success", **metadata},
+                )
+            )
+            rows.append(
+                {
+                    "id": id,
+                    "memory": memory,
+                    "created_at": created_at,
+                    "updated_at": updated_at,
+                    "metadata": metadata,
+                }
+            )
+
+        vector_sync_status = "success"
+        try:
+            if items:
+                self.vec_db.add(items)
+        except Exception as e:
+            logger.warning(f"[VecDB] Bulk vector insert failed for {len(items)} nodes: {e}")
+            vector_sync_status = "failed"
+
+        for row in rows:
+            row["metadata"]["vector_sync"] = vector_sync_status
+            row["metadata"] = _serialize_complex_metadata(row["metadata"])
+
+        query = """
+            UNWIND $rows AS row
+            MERGE (n:Memory {id: row.id})
+            SET n.memory = row.memory,
+                n.created_at = datetime(row.created_at),
+                n.updated_at = datetime(row.updated_at),
+                n += row.metadata
+        """
+        with self.driver.session(database=self.db_name) as session:
+            for start in range(0, len(rows), batch_size):
+                batch = rows[start : start + batch_size]
+                session.run(query, rows=batch)
+                self._sync_tag_index(session, [row["id"] for row in batch])
+        if self.node_cache:
+            self.node_cache.invalidate(self._cache_scope(), [row["id"] for row in rows])
+
+    def iter_nodes(
+        self,
+        batch_size: int = 1000,
+        after_id: str | None = None,
+        include_embedding: bool = True,
+        **kwargs,
+    ) -> Iterator[tuple[list[dict[str, Any]], str]]:
+        """
+        Page through all nodes in id order, fetching each page's vectors in one call.
+        """
+        for page in self._iter_node_pages(batch_size, after_id):
+            vectors = {}
+            if include_embedding:
+                try:
+                    items = self.vec_db.get_by_ids([node["id"] for node in page])
+                    vectors = {item.id: item.vector for item in items}
+                except Exception as e:
+                    logger.warning(f"[VecDB] Failed to fetch vectors for {len(page)} nodes: {e}")
+            nodes = [self._parse_node(node_data, vectors=vectors) for node_data in page]
+            yield nodes, page[-1]["id"]
 
     def get_children_with_embeddings(self, id: str) -> list[dict[str, Any]]:
         where_user = ""
@@ -170,6 +285,7 @@ class Neo4jCommunityGraphDB(Neo4jGraphDB):
         return child_nodes
 
     # Search / recall operations
+    @timed
     def search_by_embedding(
         self,
         vector: list[float],
@@ -202,21 +318,7 @@ class Neo4jCommunityGraphDB(Neo4jGraphDB):
             - If 'search_filter' is provided, it applies additional metadata-based filtering.
             - The returned IDs can be used to fetch full node data from Neo4j if needed.
         """
-        # Build VecDB filter
-        vec_filter = {}
-        if scope:
-            vec_filter["memory_type"] = scope
-        if status:
-            vec_filter["status"] = status
-        vec_filter["vector_sync"] = "success"
-        if kwargs.get("cube_name"):
-            vec_filter["user_name"] = kwargs["cube_name"]
-        else:
-            vec_filter["user_name"] = self.config.user_name
-
-        # Add search_filter conditions
-        if search_filter:
-            vec_filter.update(search_filter)
+        vec_filter = self._build_vec_filter(scope, status, search_filter, kwargs.get("cube_name"))
 
         # Perform vector search
         results = self.vec_db.search(query_vector=vector, top_k=top_k, filter=vec_filter)
@@ -228,6 +330,69 @@ class Neo4jCommunityGraphDB(Neo4jGraphDB):
         # Return consistent format
         return [{"id": r.id, "score": r.score} for r in results]
 
+    @timed
+    def search_by_embeddings(
+        self,
+        vectors: list[list[float]],
+        top_k: int = 5,
+        scope: str | None = None,
+        search_filter: dict | None = None,
+        status: str | None = None,
+        threshold: float | None = None,
+        **kwargs,
+    ) -> list[dict]:
+        """
+        Retrieve hydrated nodes for several query vectors using one batched vector DB request.
+
+        Args:
+            vectors (list[list[float]]): Query embedding vectors.
+            top_k (int): Number of top similar nodes to retrieve per vector.
+            scope (str, optional): Memory type filter (e.g., 'WorkingMemory', 'LongTermMemory').
+            search_filter (dict, optional): Additional metadata filters to apply.
+            status (str, optional): Node status filter (e.g., 'activated').
+            threshold (float, optional): Minimum similarity score threshold (0 ~ 1).
+
+        Returns:
+            list[dict]: Parsed node records containing 'id', 'memory', and 'metadata',
+            deduplicated by id and ordered by their best score across all vectors.
+
+        Notes:
+            - Embeddings returned by the vector DB are reused for hydration, so nodes
+              are loaded from Neo4j with a single query and no per-node vector lookups.
+        """
+        if not vectors:
+            return []
+
+        vec_filter = self._build_vec_filter(scope, status, search_filter, kwargs.get("cube_name"))
+        batches = self.vec_db.search_batch(query_vectors=vectors, top_k=top_k, filter=vec_filter)
+
+        best_scores: dict[str, float] = {}
+        vectors_by_id: dict[str, list[float]] = {}
+        for hits in batches:
+            for r in hits:
+                score = r.score if r.score is not None else 0.0
+                if threshold is not None and r.score is not None and r.score < threshold:
+                    continue
+                if r.id not in best_scores or score > best_scores[r.id]:
+                    best_scores[r.id] = score
+                    vectors_by_id[r.id] = r.vector
+        if not best_scores:
+            return []
+
+        params = {
+            "ids": list(best_scores),
+            "user_name": kwargs.get("cube_name") or self.config.user_name,
+        }
+        query = "MATCH (n:Memory) WHERE n.id IN $ids AND n.user_name = $user_name RETURN n"
+        with self.driver.session(database=self.db_name) as session:
+            results = session.run(query, params)
+            nodes = [
+                self._parse_node(dict(record["n"]), vectors=vectors_by_id) for record in results
+            ]
+
+        nodes.sort(key=lambda node: best_scores.get(node["id"], 0.0), reverse=True)
+        return nodes
+
     def get_all_memory_items(self, scope: str, **kwargs) -> list[dict]:
         """
         Retrieve all memory items of a specific memory_type.
@@ -325,6 +490,9 @@ class Neo4jCommunityGraphDB(Neo4jGraphDB):
                         """
                     )
                 logger.debug("Index 'memory_user_name_index' ensured.")
+
+                self._create_retention_index(session)
+                self._create_tag_index(session)
         except Exception as e:
             logger.warning(f"Failed to create basic property indexes: {e}")
 
@@ -337,8 +505,31 @@ class Neo4jCommunityGraphDB(Neo4jGraphDB):
         except Exception as e:
             logger.warning(f"Failed to create VecDB payload indexes: {e}")
 
-    def _parse_node(self, node_data: dict[str, Any]) -> dict[str, Any]:
-        """Parse Neo4j node and optionally fetch embedding from vector DB."""
+    def _build_vec_filter(
+        self,
+        scope: str | None = None,
+        status: str | None = None,
+        search_filter: dict | None = None,
+        cube_name: str | None = None,
+    ) -> dict[str, Any]:
+        """Build the payload filter used for vector DB searches."""
+        vec_filter = {}
+        if scope:
+            vec_filter["memory_type"] = scope
+        if status:
+            vec_filter["status"] = status
+        vec_filter["vector_sync"] = "success"
+        vec_filter["user_name"] = cube_name or self.config.user_name
+
+        # Add search_filter conditions
+        if search_filter:
+            vec_filter.update(search_filter)
+        return vec_filter
+
+    def _parse_node(
+        self, node_data: dict[str, Any], vectors: dict[str, list[float]] | None = None
+    ) -> dict[str, Any]:
+        """Parse Neo4j node and fetch its embedding from `vectors` or the vector DB."""
         node = node_data.copy()
 
         # Convert Neo4j datetime to string
@@ -359,6 +550,11 @@ class Neo4jCommunityGraphDB(Neo4jGraphDB):
                         pass
 
         new_node = {"id": node.pop("id"), "memory": node.pop("memory", ""), "metadata": node}
+        if vectors is not None:
+            # Vectors were prefetched in bulk; never fall back to a per-node lookup
+            if vectors.get(new_node["id"]):
+                new_node["metadata"]["embedding"] = vectors[new_node["id"]]
+            return new_node
         try:
             vec_item = self.vec_db.get_by_id(new_node["id"])
             if vec_item and vec_item.vector:
@@ -0,0 +1,138 @@
+import copy
+import threading
+import time
+
+from collections import OrderedDict
+from typing import Any
+
+from memos.configs.graph_db import NodeCacheConfig
+from memos.log import get_logger
+
+
+logger = get_logger(__name__)
+
+
+class NodeCache:
+    """
+    Bounded in-process LRU of parsed graph nodes, keyed by (user_name, id).
+
+    The cache is shared by every graph store instance pointing at the same
+    database, so a write through any of them invalidates the entry for all.
+    Entries optionally drop their embedding to save memory; such entries only
+    serve lookups that do not need the embedding.
+    """
+
+    def __init__(self, config: NodeCacheConfig):
+        self.config = config
+        self._lock = threading.Lock()
+        # (user_name, id) -> (node, stored_at)
+        self._entries: OrderedDict[tuple[str, str], tuple[dict[str, Any], float]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get_many(
+        self, scope: str, ids: list[str], include_embedding: bool = True
+    ) -> dict[str, dict[str, Any]]:
+        """
+        Look up cached nodes.
+
+        Args:
+            scope: Tenant scope (user_name) the nodes belong to.
+            ids: Node ids to look up.
+            include_embedding: Whether the caller needs `metadata.embedding`.
+
+        Returns:
+            Mapping of id -> copy of the cached node for every hit.
+        """
+        found: dict[str, dict[str, Any]] = {}
+        usable = include_embedding is False or self.config.include_embedding
+        now = time.time()
+        with self._lock:
+            for node_id in ids:
+                key = (scope, node_id)
+                entry = self._entries.get(key) if usable else None
+                if entry is not None and self._expired(entry[1], now):
+                    del self._entries[key]
+                    entry = None
+                if entry is None:
+                    self.misses += 1
+                    continue
+                self._entries.move_to_end(key)
+                found[node_id] = entry[0]
+                self.hits += 1
+
+        nodes = {node_id: copy.deepcopy(node) for node_id, node in found.items()}
+        if not include_embedding:
+            for node in nodes.values():
+                node.get("metadata", {}).pop("embedding", None)
+        return nodes
+
+    def put_many(self, scope: str, nodes: list[dict[str, Any]]) -> None:
+        """Store freshly read nodes."""
+        now = time.time()
+        entries = []
+        for node in nodes:
+            node = copy.deepcopy(node)
+            if not self.config.include_embedding:
+                node.get("metadata", {}).pop("embedding", None)
+            entries.append(((scope, node["id"]), node))
+
+        with self._lock:
+            for key, node in entries:
+                self._entries[key] = (node, now)
+                self._entries.move_to_end(key)
+            while len(self._entries) > self.config.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, scope: str, ids: list[str]) -> None:
+        """Drop the given nodes of a scope."""
+        with self._lock:
+            for node_id in ids:
+                self._entries.pop((scope, node_id), None)
+
+    def invalidate_scope(self, scope: str | None = None) -> None:
+        """Drop every node of a scope, or everything when `scope` is None."""
+        with self._lock:
+            if scope is None:
+                self._entries.clear()
+                return
+            for key in [key for key in self._entries if key[0] == scope]:
+                del self._entries[key]
+
+    def stats(self) -> dict[str, float]:
+        """Return hit-rate metrics and the current size."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+            }
+
+    def _expired(self, stored_at: float, now: float) -> bool:
+        return self.config.ttl is not None and now - stored_at > self.config.ttl
+
+
+_caches: dict[str, NodeCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_node_cache(name: str, config: NodeCacheConfig) -> NodeCache:
+    """
+    Get (or create) the process-wide node cache for a database.
+
+    Args:
+        name: Identifier of the database, e.g. "<uri>/<db_name>".
+        config: Used only when the cache is created.
+    """
+    with _caches_lock:
+        cache = _caches.get(name)
+        if cache is None:
+            cache = NodeCache(config)
+            _caches[name] = cache
+            logger.info(f"[NodeCache] Created node cache '{name}' ({config.max_entries} entries)")
+        return cache
@@ -0,0 +1,221 @@
+"""
+Streaming, constant-memory export / import of graph stores.
+
+The on-disk format is newline-delimited JSON: a header line, one line per node
+and per edge, and periodic checkpoint lines recording the pagination cursor so an
+interrupted export can be resumed. Embeddings are stored as base64-encoded raw
+float32 bytes instead of JSON number lists.
+
+    {"kind": "header", "format": "memos-graph-ndjson", "version": 1}
+    {"kind": "node", "id": ..., "memory": ..., "metadata": {...}, "embedding": "<b64>"}
+    {"kind": "checkpoint", "phase": "nodes", "after": "<last node id>"}
+    {"kind": "edge", "source": ..., "target": ..., "type": ...}
+    {"kind": "checkpoint", "phase": "edges", "after": "<last source id>"}
+    {"kind": "end", "nodes": 42, "edges": 17}
+"""
+
+import base64
+import json
+import os
+
+from typing import Any
+
+import numpy as np
+
+from memos.graph_dbs.base import BaseGraphDB
+from memos.log import get_logger
+
+
+logger = get_logger(__name__)
+
+STREAM_FORMAT = "memos-graph-ndjson"
+STREAM_VERSION = 1
+
+
+def encode_embedding(embedding: list[float]) -> str:
+    """Encode an embedding as base64 of its raw float32 bytes."""
+    return base64.b64encode(np.asarray(embedding, dtype=np.float32).tobytes()).decode("ascii")
+
+
+def decode_embedding(data: str) -> list[float]:
+    """Decode an embedding written by `encode_embedding`."""
+    return np.frombuffer(base64.b64decode(data), dtype=np.float32).tolist()
+
+
+def is_stream_file(path: str) -> bool:
+    """Return True if `path` starts with a streaming-export header line."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            header = json.loads(f.readline())
+    except (OSError, ValueError):
+        return False
+    return isinstance(header, dict) and header.get("format") == STREAM_FORMAT
+
+
+def export_graph_stream(
+    graph_store: BaseGraphDB,
+    path: str,
+    batch_size: int = 1000,
+    include_embedding: bool = True,
+    resume: bool = False,
+) -> dict[str, int]:
+    """
+    Export all nodes and edges of `graph_store` to `path`, one page at a time.
+
+    Args:
+        graph_store: Graph store implementing `iter_nodes` / `iter_edges`.
+        path: Output file.
+        batch_size: Page size used when reading from the graph store.
+        include_embedding: Whether to export node embeddings.
+        resume: Continue a previously interrupted export of `path` from its last
+            checkpoint instead of starting over.
+
+    Returns:
+        {"nodes": <count>, "edges": <count>}
+    """
+    state = _load_checkpoint(path) if resume and os.path.exists(path) else None
+    if state is not None and state["phase"] == "end":
+        logger.info(f"[STREAM EXPORT] {path} is already complete, nothing to resume.")
+        return {"nodes": state["nodes"], "edges": state["edges"]}
+
+    counts = {"nodes": 0, "edges": 0}
+    phase, cursor = "nodes", None
+    if state is None:
+        f = open(path, "wb")  # noqa: SIM115
+        _write(f, {"kind": "header", "format": STREAM_FORMAT, "version": STREAM_VERSION})
+    else:
+        f = open(path, "r+b")  # noqa: SIM115
+        f.truncate(state["offset"])
+        f.seek(state["offset"])
+        phase, cursor = state["phase"], state["after"]
+        counts = {"nodes": state["nodes"], "edges": state["edges"]}
+        logger.info(f"[STREAM EXPORT] Resuming {path} at phase={phase}, after={cursor}")
+
+    with f:
+        if phase == "nodes":
+            pages = graph_store.iter_nodes(
+                batch_size=batch_size, after_id=cursor, include_embedding=include_embedding
+            )
+            for nodes, last_id in pages:
+                for node in nodes:
+                    _write(f, _node_record(node))
+                counts["nodes"] += len(nodes)
+                _write(f, {"kind": "checkpoint", "phase": "nodes", "after": last_id})
+                f.flush()
+            phase, cursor = "edges", None
+            _write(f, {"kind": "checkpoint", "phase": "edges", "after": None})
+
+        for edges, last_id in graph_store.iter_edges(batch_size=batch_size, after_id=cursor):
+            for edge in edges:
+                _write(f, {"kind": "edge", **edge})
+            counts["edges"] += len(edges)
+            _write(f, {"kind": "checkpoint", "phase": "edges", "after": last_id})
+            f.flush()
+
+        _write(f, {"kind": "end", **counts})
+
+    logger.info(f"[STREAM EXPORT] Exported {counts['nodes']} nodes, {counts['edges']} edges")
+    return counts
+
+
+def import_graph_stream(
+    graph_store: BaseGraphDB, path: str, batch_size: int = 500
+) -> dict[str, int]:
+    """
+    Import a file written by `export_graph_stream` using batched bulk writes.
+
+    Args:
+        graph_store: Graph store implementing `add_nodes` / `add_edges`.
+        path: Input file.
+        batch_size: Number of nodes / edges per bulk write.
+
+    Returns:
+        {"nodes": <count>, "edges": <count>}
+    """
+    counts = {"nodes": 0, "edges": 0}
+    nodes: list[dict[str, Any]] = []
+    edges: list[dict[str, Any]] = []
+
+    def flush_nodes() -> None:
+        if nodes:
+            graph_store.add_nodes(list(nodes))
+            counts["nodes"] += len(nodes)
+            nodes.clear()
+
+    def flush_edges() -> None:
+        if edges:
+            graph_store.add_edges(list(edges))
+            counts["edges"] += len(edges)
+            edges.clear()
+
+    with open(path, encoding="utf-8") as f:
+        header = json.loads(f.readline())
+        if header.get("format") != STREAM_FORMAT:
+            raise ValueError(f"{path} is not a {STREAM_FORMAT} file")
+        if header.get("version", 0) > STREAM_VERSION:
+            raise ValueError(f"Unsupported {STREAM_FORMAT} version: {header.get('version')}")
+
+        for line in f:
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            kind = record.pop("kind", None)
+            if kind == "node":
+                embedding = record.pop("embedding", None)
+                if embedding is not None:
+                    record.setdefault("metadata", {})["embedding"] = decode_embedding(embedding)
+                nodes.append(record)
+                if len(nodes) >= batch_size:
+                    flush_nodes()
+            elif kind == "edge":
+                # Edges reference nodes, so every pending node must be written first
+                flush_nodes()
+                edges.append(record)
+                if len(edges) >= batch_size:
+                    flush_edges()
+
+    flush_nodes()
+    flush_edges()
+    logger.info(f"[STREAM IMPORT] Imported {counts['nodes']} nodes, {counts['edges']} edges")
+    return counts
+
+
+def _node_record(node: dict[str, Any]) -> dict[str, Any]:
+    metadata = dict(node.get("metadata") or {})
+    embedding = metadata.pop("embedding", None)
+    record = {"kind": "node", "id": node["id"], "memory": node.get("memory", "")}
+    record["metadata"] = metadata
+    if embedding:
+        record["embedding"] = encode_embedding(embedding)
+    return record
+
+
+def _write(f, record: dict[str, Any]) -> None:
+    f.write(json.dumps(record, ensure_ascii=False, default=str).encode("utf-8") + b"\n")
+
+
+def _load_checkpoint(path: str) -> dict[str, Any] | None:
+    """Find the last complete checkpoint in a partial export file."""
+    state = None
+    counts = {"nodes": 0, "edges": 0}
+    offset = 0
+    with open(path, "rb") as f:
+        for raw in f:
+            if not raw.endswith(b"\n"):
+                break  # torn final line
+            offset += len(raw)
+            try:
+                record = json.loads(raw)
+            except ValueError:
+                break
+            kind = record.get("kind")
+            if kind == "header":
+                if record.get("format") != STREAM_FORMAT:
+                    return None
+            elif kind in ("node", "edge"):
+                counts[f"{kind}s"] += 1
+            elif kind == "checkpoint":
+                state = {**record, **counts, "offset": offset}
+            elif kind == "end":
+                return {"phase": "end", **counts}
+    return state
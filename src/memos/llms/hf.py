@@ -13,6 +13,7 @@ from transformers import (
 
 from memos.configs.llm import HFLLMConfig
 from memos.llms.base import BaseLLM
+from memos.llms.hf_batching import HFBatchScheduler
 from memos.llms.utils import remove_thinking_tags
 from memos.log import get_logger
 from memos.types import MessageList
@@ -54,6 +55,9 @@ class HFLLM(BaseLLM):
             processors.append(TopPLogitsWarper(self.config.top_p))
         self.logits_processors = LogitsProcessorList(processors)
 
+        # Optional scheduler that batches concurrent requests on this model
+        self.batcher = HFBatchScheduler(self, config.batching) if config.batching else None
+
     def generate(self, messages: MessageList, past_key_values: DynamicCache | None = None):
         """
         Generate a response from the model. If past_key_values is provided, use cache-augmented generation.
@@ -63,6 +67,8 @@ class HFLLM(BaseLLM):
         Returns:
             str: Model response.
         """
+        if past_key_values is None and self.batcher is not None:
+            return self.batcher.generate(messages)
         prompt = self.tokenizer.apply_chat_template(
             messages, tokenize=False, add_generation_prompt=self.config.add_generation_prompt
         )
@@ -83,6 +89,9 @@ class HFLLM(BaseLLM):
         Yields:
             str: Streaming model response chunks.
         """
+        if past_key_values is None and self.batcher is not None:
+            yield from self.batcher.generate_stream(messages)
+            return
         prompt = self.tokenizer.apply_chat_template(
             messages, tokenize=False, add_generation_prompt=self.config.add_generation_prompt
         )
@@ -92,6 +101,29 @@ class HFLLM(BaseLLM):
         else:
             yield from self._generate_with_cache_stream(prompt, past_key_values)
 
+    def generate_stream_batch(
+        self, messages_list: list[MessageList]
+    ) -> Generator[list[str], None, None]:
+        """
+        Stream responses for several conversations decoded together in one batch.
+        Args:
+            messages_list (list[MessageList]): One chat message list per stream.
+        Yields:
+            list[str]: New text for every stream at this step ("" if it produced none).
+        """
+        prompts = [
+            self.tokenizer.apply_chat_template(
+                messages, tokenize=False, add_generation_prompt=self.config.add_generation_prompt
+            )
+            for messages in messages_list
+        ]
+        if self.tokenizer.pad_token is None:
+            self.tokenizer.pad_token = self.tokenizer.eos_token
+        inputs = self.tokenizer(prompts, return_tensors="pt", padding=True, padding_side="left").to(
+            self.model.device
+        )
+        yield from self._decode_stream(inputs.input_ids, DynamicCache(), inputs.attention_mask)
+
     def _generate_full(self, prompt: str) -> str:
         """
         Generate output from scratch using the full prompt.
@@ -118,6 +150,7 @@ class HFLLM(BaseLLM):
             for src_ids, out_ids in zip(inputs.input_ids, gen_ids, strict=False)
         ]
         response = self.tokenizer.batch_decode(new_ids, skip_special_tokens=True)[0]
+        response, _ = self._truncate_at_stop(response, self.config.stop_strings or [])
         logger.info(f"Full-gen raw response: {response}")
         return (
             remove_thinking_tags(response)
@@ -128,69 +161,15 @@ class HFLLM(BaseLLM):
     def _generate_full_stream(self, prompt: str) -> Generator[str, None, None]:
         """
         Generate output from scratch using the full prompt with streaming.
+        The prompt is prefilled once into a fresh KV cache and decoded incrementally.
         Args:
             prompt (str): The input prompt string.
         Yields:
             str: Streaming response chunks.
         """
-        import torch
-
         inputs = self.tokenizer([prompt], return_tensors="pt").to(self.model.device)
-
-        # Get generation parameters
-        max_new_tokens = getattr(self.config, "max_tokens", 128)
-        remove_think_prefix = getattr(self.config, "remove_think_prefix", False)
-
-        # Manual streaming generation
-        generated_ids = inputs.input_ids.clone()
-        accumulated_text = ""
-
-        for _ in range(max_new_tokens):
-            # Forward pass
-            with torch.no_grad():
-                outputs = self.model(
-                    input_ids=generated_ids,
-                    use_cache=True,
-                    return_dict=True,
-                )
-
-            # Get next token logits
-            next_token_logits = outputs.logits[:, -1, :]
-
-            # Apply logits processors if sampling
-            if getattr(self.config, "do_sample", True):
-                batch_size, _ = next_token_logits.size()
-                dummy_ids = torch.zeros(
-                    (batch_size, 1), dtype=torch.long, device=next_token_logits.device
-                )
-                filtered_logits = self.logits_processors(dummy_ids, next_token_logits)
-                probs = torch.softmax(filtered_logits, dim=-1)
-                next_token = torch.multinomial(probs, num_samples=1)
-            else:
-                next_token = torch.argmax(next_token_logits, dim=-1, keepdim=True)
-
-            # Check for EOS token
-            if self._should_stop(next_token):
-                break
-
-            # Append new token
-            generated_ids = torch.cat([generated_ids, next_token], dim=-1)
-
-            # Decode and yield the new token
-            new_token_text = self.tokenizer.decode(next_token[0], skip_special_tokens=True)
-            if new_token_text:  # Only yield non-empty tokens
-                accumulated_text += new_token_text
-
-                # Apply thinking tag removal if enabled
-                if remove_think_prefix:
-                    processed_text = remove_thinking_tags(accumulated_text)
-                    # Only yield the difference (new content)
-                    if len(processed_text) > len(accumulated_text) - len(new_token_text):
-                        yield processed_text[len(accumulated_text) - len(new_token_text) :]
-                    else:
-                        yield new_token_text
-                else:
-                    yield new_token_text
+        for chunks in self._decode_stream(inputs.input_ids, DynamicCache()):
+            yield chunks[0]
 
     def _generate_with_cache(self, query: str, kv: DynamicCache) -> str:
         """
@@ -220,6 +199,7 @@ class HFLLM(BaseLLM):
             response = self.tokenizer.decode(concat[0], skip_special_tokens=True)
         else:
             response = ""
+        response, _ = self._truncate_at_stop(response, self.config.stop_strings or [])
         logger.info(f"Cache-gen raw response: {response}")
         return (
             remove_thinking_tags(response)
@@ -241,72 +221,154 @@ class HFLLM(BaseLLM):
         query_ids = self.tokenizer(
             query, return_tensors="pt", add_special_tokens=False
         ).input_ids.to(self.model.device)
+        for chunks in self._decode_stream(query_ids, kv):
+            yield chunks[0]
 
-        max_new_tokens = getattr(self.config, "max_tokens", 128)
-        remove_think_prefix = getattr(self.config, "remove_think_prefix", False)
-
-        # Initial forward pass
-        logits, kv = self._prefill(query_ids, kv)
-        next_token = self._select_next_token(logits)
-
-        # Yield first token
-        first_token_text = self.tokenizer.decode(next_token[0], skip_special_tokens=True)
-        accumulated_text = ""
-        if first_token_text:
-            accumulated_text += first_token_text
-            if remove_think_prefix:
-                processed_text = remove_thinking_tags(accumulated_text)
-                if len(processed_text) > len(accumulated_text) - len(first_token_text):
-                    yield processed_text[len(accumulated_text) - len(first_token_text) :]
-                else:
-                    yield first_token_text
-            else:
-                yield first_token_text
-
-        generated = [next_token]
+    def _decode_stream(
+        self, input_ids: Any, kv: DynamicCache, attention_mask: Any = None
+    ) -> Generator[list[str], None, None]:
+        """
+        Shared streaming decode loop: prefill once, then feed one token per step on the KV cache.
+        Rows stop independently on EOS or a configured stop string.
+        Args:
+            input_ids (torch.Tensor): Prompt token IDs, shape (batch, seq_len).
+            kv (DynamicCache): KV cache to extend (empty for a fresh prompt).
+            attention_mask (torch.Tensor | None): Mask for left-padded batches.
+        Yields:
+            list[str]: New text per row for each step that produced any.
+        """
+        import torch
 
-        # Continue generation
-        for _ in range(max_new_tokens - 1):
-            if self._should_stop(next_token):
-                break
-            logits, kv = self._prefill(next_token, kv)
-            next_token = self._select_next_token(logits)
+        batch_size = input_ids.size(0)
+        max_new_tokens = getattr(self.config, "max_tokens", 128)
+        stop_strings = getattr(self.config, "stop_strings", None) or []
+        # Text that might be the start of a stop string is held back until resolved
+        holdback = max((len(stop) for stop in stop_strings), default=1) - 1
+        eos_id = self.tokenizer.eos_token_id
 
-            # Decode and yield the new token
-            new_token_text = self.tokenizer.decode(next_token[0], skip_special_tokens=True)
-            if new_token_text:
-                accumulated_text += new_token_text
-
-                # Apply thinking tag removal if enabled
-                if remove_think_prefix:
-                    processed_text = remove_thinking_tags(accumulated_text)
-                    # Only yield the difference (new content)
-                    if len(processed_text) > len(accumulated_text) - len(new_token_text):
-                        yield processed_text[len(accumulated_text) - len(new_token_text) :]
-                    else:
-                        yield new_token_text
-                else:
-                    yield new_token_text
+        generated: list[list[int]] = [[] for _ in range(batch_size)]
+        texts = [""] * batch_size
+        # (prefix, read) token offsets for incremental detokenization
+        offsets = [(0, 0)] * batch_size
+        emitted = [""] * batch_size
+        finished = [False] * batch_size
 
-            generated.append(next_token)
+        logits, kv = self._prefill(input_ids, kv, attention_mask)
+        for _ in range(max_new_tokens):
+            next_tokens = self._select_next_token(logits)
+            chunks = [""] * batch_size
+            for row in range(batch_size):
+                if finished[row]:
+                    continue
+                token_id = next_tokens[row].item()
+                if eos_id is not None and token_id == eos_id:
+                    finished[row] = True
+                    continue
+                generated[row].append(token_id)
+                delta, offsets[row] = self._decode_delta(generated[row], *offsets[row])
+                texts[row] += delta
+                text, stopped = self._truncate_at_stop(texts[row], stop_strings)
+                finished[row] = stopped
+                visible = self._visible_stream_text(text)
+                safe = visible if stopped else visible[: len(visible) - holdback]
+                # Don't emit an incomplete multi-byte character
+                safe = safe.rstrip("\ufffd")
+                if len(safe) > len(emitted[row]) and safe.startswith(emitted[row]):
+                    chunks[row] = safe[len(emitted[row]) :]
+                    emitted[row] = safe
+            if any(chunks):
+                yield chunks
+            if all(finished):
+                return
+
+            if attention_mask is not None:
+                step_mask = torch.tensor(
+                    [[0 if done else 1] for done in finished],
+                    dtype=attention_mask.dtype,
+                    device=attention_mask.device,
+                )
+                attention_mask = torch.cat([attention_mask, step_mask], dim=-1)
+            logits, kv = self._prefill(next_tokens, kv, attention_mask)
+
+        # Out of budget: flush text held back for stop-string matching
+        chunks = [""] * batch_size
+        for row in range(batch_size):
+            if finished[row] or not generated[row]:
+                continue
+            text = self.tokenizer.decode(generated[row], skip_special_tokens=True)
+            visible = self._visible_stream_text(text)
+            if len(visible) > len(emitted[row]) and visible.startswith(emitted[row]):
+                chunks[row] = visible[len(emitted[row]) :]
+        if any(chunks):
+            yield chunks
+
+    def _decode_delta(
+        self, ids: list[int], prefix_offset: int, read_offset: int
+    ) -> tuple[str, tuple[int, int]]:
+        """
+        Detokenize only the text added by `ids[read_offset:]`.
+        A few already-read tokens (from `prefix_offset`) are decoded along for context,
+        so each step costs O(1) instead of re-decoding the whole sequence.
+        Returns:
+            tuple[str, tuple[int, int]]: (new text, updated offsets)
+        """
+        prefix_text = self.tokenizer.decode(
+            ids[prefix_offset:read_offset], skip_special_tokens=True
+        )
+        new_text = self.tokenizer.decode(ids[prefix_offset:], skip_special_tokens=True)
+        # Wait for more tokens while the tail is an incomplete multi-byte character
+        if len(new_text) > len(prefix_text) and not new_text.endswith("\ufffd"):
+            return new_text[len(prefix_text) :], (read_offset, len(ids))
+        return "", (prefix_offset, read_offset)
+
+    @staticmethod
+    def _truncate_at_stop(text: str, stop_strings: list[str]) -> tuple[str, bool]:
+        """
+        Cut `text` at the earliest stop string.
+        Returns:
+            tuple[str, bool]: (text before the stop string, whether one was found)
+        """
+        positions = [text.find(stop) for stop in stop_strings if stop in text]
+        if not positions:
+            return text, False
+        return text[: min(positions)], True
 
-    def _prefill(self, input_ids: Any, kv: DynamicCache) -> tuple[Any, DynamicCache]:
+    def _visible_stream_text(self, text: str) -> str:
+        """
+        Return the part of a partial response that may be streamed to the caller.
+        With `remove_think_prefix`, nothing is shown until the think block is closed.
+        """
+        if not getattr(self.config, "remove_think_prefix", False):
+            return text
+        stripped = text.lstrip()
+        if "<think>".startswith(stripped) or (
+            stripped.startswith("<think>") and "</think>" not in stripped
+        ):
+            return ""
+        return remove_thinking_tags(text)
+
+    def _prefill(
+        self, input_ids: Any, kv: DynamicCache, attention_mask: Any = None
+    ) -> tuple[Any, DynamicCache]:
         """
         Forward the model once, returning last-step logits and updated KV cache.
         Args:
             input_ids (torch.Tensor): Input token IDs.
             kv (DynamicCache): Existing KV cache.
+            attention_mask (torch.Tensor | None): Mask over cached + new tokens, for padded batches.
         Returns:
             tuple[torch.Tensor, DynamicCache]: (last-step logits, updated KV cache)
         """
         import torch
 
+        model_kwargs = {} if attention_mask is None else {"attention_mask": attention_mask}
         with torch.no_grad():
             out = self.model(
                 input_ids=input_ids,
                 use_cache=True,
                 past_key_values=kv,
                 return_dict=True,
+                **model_kwargs,
             )
         return out.logits[:, -1, :], out.past_key_values
 
@@ -354,6 +416,56 @@ class HFLLM(BaseLLM):
         """
         import torch
 
+        inputs = self._kv_prompt_inputs(messages)
+        seq_len = inputs["input_ids"].size(-1)
+        kv = DynamicCache()
+        with torch.no_grad():
+            self.model(**inputs, use_cache=True, past_key_values=kv)
+        for i, (k, v) in enumerate(zip(kv.key_cache, kv.value_cache, strict=False)):
+            kv.key_cache[i] = k[:, :, :seq_len, :]
+            kv.value_cache[i] = v[:, :, :seq_len, :]
+        return kv
+
+    def extend_kv_cache(self, kv: DynamicCache, old_messages, messages) -> DynamicCache:
+        """
+        Turn a KV cache built from `old_messages` into one for `messages`, reusing the
+        longest common token prefix and prefilling only the changed tail.
+        The input cache is cropped and extended in place.
+        Args:
+            kv (DynamicCache): Cache previously returned by `build_kv_cache(old_messages)`.
+            old_messages: The input `kv` was built from (same forms as `build_kv_cache`).
+            messages: The new input.
+        Returns:
+            DynamicCache: KV cache for `messages`.
+        """
+        import torch
+
+        old_ids = self._kv_prompt_inputs(old_messages)["input_ids"][0]
+        new_ids = self._kv_prompt_inputs(messages)["input_ids"][0]
+        limit = min(old_ids.size(-1), new_ids.size(-1), kv.get_seq_length())
+        mismatch = (old_ids[:limit] != new_ids[:limit]).nonzero()
+        prefix_len = int(mismatch[0]) if len(mismatch) else limit
+        if prefix_len == 0:
+            return self.build_kv_cache(messages)
+
+        kv.crop(prefix_len)
+        tail = new_ids[prefix_len:].unsqueeze(0)
+        logger.info(
+            f"HFLLM KV cache reuse: kept {prefix_len} prefix tokens, prefilling {tail.size(-1)}"
+        )
+        if tail.size(-1) > 0:
+            with torch.no_grad():
+                self.model(input_ids=tail, use_cache=True, past_key_values=kv)
+        return kv
+
+    def _kv_prompt_inputs(self, messages) -> Any:
+        """
+        Normalize KV-cache input into chat messages and tokenize the resulting prompt.
+        Raises:
+            ValueError: If the resulting prompt is empty after template processing.
+        """
+        import torch
+
         # Accept multiple input types and convert to standard chat messages
         if isinstance(messages, str):
             messages = [
@@ -374,15 +486,8 @@ class HFLLM(BaseLLM):
         )
         inputs = self.tokenizer(prompt, return_tensors="pt")
         inputs["input_ids"] = inputs["input_ids"].to(self.model.device, dtype=torch.long)
-        seq_len = inputs["input_ids"].size(-1)
-        if seq_len == 0:
+        if inputs["input_ids"].size(-1) == 0:
             raise ValueError(
                 "Prompt after chat template is empty, cannot build KV cache. Check your messages input."
             )
-        kv = DynamicCache()
-        with torch.no_grad():
-            self.model(**inputs, use_cache=True, past_key_values=kv)
-        for i, (k, v) in enumerate(zip(kv.key_cache, kv.value_cache, strict=False)):
-            kv.key_cache[i] = k[:, :, :seq_len, :]
-            kv.value_cache[i] = v[:, :, :seq_len, :]
-        return kv
+        return inputs
@@ -0,0 +1,135 @@
+import queue
+import threading
+import time
+
+from collections.abc import Generator
+from typing import TYPE_CHECKING
+
+from memos.configs.llm import HFBatchingConfig
+from memos.log import get_logger
+from memos.types import MessageList
+
+
+if TYPE_CHECKING:
+    from memos.llms.hf import HFLLM
+
+
+logger = get_logger(__name__)
+
+_DONE = object()
+
+
+class _Request:
+    def __init__(self, messages: MessageList):
+        self.messages = messages
+        self.chunks: queue.Queue = queue.Queue()
+        self.cancelled = False
+
+
+class HFBatchScheduler:
+    """
+    Merges concurrent HFLLM requests into padded batches decoded together.
+
+    Requests queue up while the model is busy; once it is free, up to
+    `max_batch_size` of them (waiting at most `max_wait_ms` for stragglers) are
+    decoded as one left-padded batch with their own KV cache. Rows leave the batch
+    as soon as they hit EOS or a stop string, and their text is streamed back to
+    each caller as it is produced.
+    """
+
+    def __init__(self, llm: "HFLLM", config: HFBatchingConfig):
+        self.llm = llm
+        self.config = config
+        self._queue: queue.Queue[_Request | None] = queue.Queue()
+        self._worker: threading.Thread | None = None
+        self._worker_lock = threading.Lock()
+        self._closed = False
+
+    def generate(self, messages: MessageList) -> str:
+        """Generate a full response through the batch scheduler."""
+        return "".join(self.generate_stream(messages))
+
+    def generate_stream(self, messages: MessageList) -> Generator[str, None, None]:
+        """Stream a response through the batch scheduler."""
+        if self._closed:
+            raise RuntimeError("HFBatchScheduler is closed")
+        self._ensure_worker()
+        request = _Request(messages)
+        self._queue.put(request)
+        try:
+            while True:
+                chunk = request.chunks.get()
+                if chunk is _DONE:
+                    return
+                if isinstance(chunk, Exception):
+                    raise chunk
+                yield chunk
+        finally:
+            request.cancelled = True
+
+    def close(self) -> None:
+        """Stop the scheduler thread once the running batch has finished."""
+        self._closed = True
+        with self._worker_lock:
+            if self._worker is not None:
+                self._queue.put(None)
+                self._worker.join(timeout=30)
+                self._worker = None
+
+    def _ensure_worker(self) -> None:
+        if self._worker is not None:
+            return
+        with self._worker_lock:
+            if self._worker is None:
+                self._worker = threading.Thread(
+                    target=self._run, name="memos-hf-batcher", daemon=True
+                )
+                self._worker.start()
+
+    def _run(self) -> None:
+        max_wait = self.config.max_wait_ms / 1000
+        while True:
+            first = self._queue.get()
+            if first is None:
+                return
+            batch = [first]
+            deadline = time.monotonic() + max_wait
+            stop = False
+            while len(batch) < self.config.max_batch_size:
+                remaining = deadline - time.monotonic()
+                try:
+                    # Past the deadline, still take requests that are already waiting
+                    if remaining > 0:
+                        item = self._queue.get(timeout=remaining)
+                    else:
+                        item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is None:
+                    stop = True
+                    break
+                batch.append(item)
+
+            self._decode(batch)
+            if stop:
+                return
+
+    def _decode(self, batch: list[_Request]) -> None:
+        batch = [request for request in batch if not request.cancelled]
+        if not batch:
+            return
+        logger.debug(f"[HFBatchScheduler] Decoding batch of {len(batch)} requests")
+        try:
+            for chunks in self.llm.generate_stream_batch([r.messages for r in batch]):
+                for request, chunk in zip(batch, chunks, strict=False):
+                    if chunk and not request.cancelled:
+                        request.chunks.put(chunk)
+                if all(request.cancelled for request in batch):
+                    break
+        except Exception as e:
+            logger.warning(f"[HFBatchScheduler] Batched generation failed: {e}")
+            for request in batch:
+                request.chunks.put(e)
+            return
+        for request in batch:
+            request.chunks.put(_DONE)
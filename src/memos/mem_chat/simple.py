@@ -92,9 +92,7 @@ class SimpleMemChat(BaseMemChat):
 
             if self.config.enable_activation_memory:
                 past_key_values = None
-                loaded_kv_cache_item = next(
-                    iter(self.mem_cube.act_mem.kv_cache_memories.values()), None
-                )
+                loaded_kv_cache_item = next(iter(self.mem_cube.act_mem.get_all()), None)
                 if loaded_kv_cache_item is not None:
                     # If has loaded kv cache, we move it to device before inferring.
                     # Currently, we move only single kv cache item
@@ -1,3 +1,7 @@
+import asyncio
+import concurrent.futures
+import functools
+import inspect
 import json
 import os
 import time
@@ -24,6 +28,7 @@ from memos.mem_user.user_manager import UserManager, UserRole
 from memos.memories.activation.item import ActivationMemoryItem
 from memos.memories.parametric.item import ParametricMemoryItem
 from memos.memories.textual.item import TextualMemoryItem, TextualMemoryMetadata, TreeNodeTextualMemoryMetadata
+from memos.memos_tools.executor_registry import get_executor
 from memos.memos_tools.thread_safe_dict_segment import OptimizedThreadSafeDict
 from memos.templates.mos_prompts import QUERY_REWRITING_PROMPT
 from memos.types import ChatHistory, MessageList, MOSSearchResult
@@ -352,6 +357,24 @@ class MOSCore:
 
         return response
 
+    async def achat(
+        self, query: str, user_id: str | None = None, base_prompt: str | None = None
+    ) -> str:
+        """
+        Async variant of `chat` for use from an event loop.
+
+        The blocking chat pipeline is offloaded to the shared executor so that
+        the event loop keeps serving other requests meanwhile.
+
+        Returns:
+            str: The response from the MOS.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            get_executor("api"),
+            functools.partial(self.chat, query, user_id=user_id, base_prompt=base_prompt),
+        )
+
     def _build_system_prompt(
         self,
         memories: list[TextualMemoryItem] | list[str] | None = None,
@@ -552,21 +575,237 @@ class MOSCore:
         internet_search: bool = False,
         moscube: bool = False,
         session_id: str | None = None,
+        timeout: float | None = None,
+        merge_results: bool | None = None,
         **kwargs,
     ) -> MOSSearchResult:
         """
         Search for textual memories across all registered MemCubes.
 
+        Cubes are searched concurrently. Cubes that do not finish within the deadline
+        are listed in `timed_out_cubes` and left out of the results; the deadline is
+        also handed to their search, which gives up at its next stage instead of
+        running on in the background.
+
         Args:
             query (str): The search query.
             user_id (str, optional): The identifier of the user to search for.
                 If None, the default user is used.
             install_cube_ids (list[str], optional): The list of MemCube IDs to install.
                 If None, all MemCube for the user is used.
+            timeout (float, optional): Deadline in seconds for the whole search.
+                If None, `config.search_timeout` is used.
+            merge_results (bool, optional): Also return the memories of all cubes merged
+                and ranked under `merged_text_mem`. If None, `config.merge_search_results`
+                is used.
+
+        Returns:
+            MemoryResult: A dictionary containing the search results.
+        """
+        timeout, deadline, merge_results = self._search_options(timeout, merge_results)
+        target_user_id, search_kwargs, tmp_mem_cubes = self._prepare_search(
+            user_id, install_cube_ids, top_k, mode, internet_search, moscube, session_id
+        )
+        if deadline is not None:
+            search_kwargs["deadline"] = deadline
+
+        def search_cube(mem_cube_id: str, mem_cube: GeneralMemCube) -> list[TextualMemoryItem]:
+            time_start = time.time()
+            memories = mem_cube.text_mem.search(query, **search_kwargs)
+            self._log_cube_search(target_user_id, mem_cube_id, memories, time_start)
+            return memories
+
+        if len(tmp_mem_cubes) == 1 and deadline is None:
+            cube_memories = {
+                mem_cube_id: search_cube(mem_cube_id, mem_cube)
+                for mem_cube_id, mem_cube in tmp_mem_cubes.items()
+            }
+            timed_out = []
+        else:
+            executor = get_executor("cube_search")
+            futures = {
+                mem_cube_id: executor.submit(search_cube, mem_cube_id, mem_cube)
+                for mem_cube_id, mem_cube in tmp_mem_cubes.items()
+            }
+            remaining = None if deadline is None else max(deadline - time.monotonic(), 0)
+            _, not_done = concurrent.futures.wait(futures.values(), timeout=remaining)
+            for mem_cube_id, future in futures.items():
+                if future in not_done:
+                    future.add_done_callback(
+                        functools.partial(self._log_late_cube_search, target_user_id, mem_cube_id)
+                    )
+            cube_memories, timed_out = self._split_cube_searches(futures, not_done)
+        return self._search_result(
+            target_user_id, cube_memories, timed_out, timeout, merge_results, search_kwargs["top_k"]
+        )
+
+    async def asearch(
+        self,
+        query: str,
+        user_id: str | None = None,
+        install_cube_ids: list[str] | None = None,
+        top_k: int | None = None,
+        mode: Literal["fast", "fine"] = "fast",
+        internet_search: bool = False,
+        moscube: bool = False,
+        session_id: str | None = None,
+        timeout: float | None = None,
+        merge_results: bool | None = None,
+        **kwargs,
+    ) -> MOSSearchResult:
+        """
+        Async variant of `search` for use from an event loop.
+
+        Cubes are searched concurrently. Textual memories exposing `asearch` run their
+        native async pipeline; others are offloaded to the shared executor so the event
+        loop is never blocked. Deadline handling and merging are the same as in `search`.
 
         Returns:
             MemoryResult: A dictionary containing the search results.
         """
+        timeout, deadline, merge_results = self._search_options(timeout, merge_results)
+        loop = asyncio.get_running_loop()
+        target_user_id, search_kwargs, tmp_mem_cubes = await loop.run_in_executor(
+            get_executor("api"),
+            functools.partial(
+                self._prepare_search,
+                user_id,
+                install_cube_ids,
+                top_k,
+                mode,
+                internet_search,
+                moscube,
+                session_id,
+            ),
+        )
+        if deadline is not None:
+            search_kwargs["deadline"] = deadline
+
+        async def search_cube(mem_cube_id: str, mem_cube: GeneralMemCube):
+            time_start = time.time()
+            if inspect.iscoroutinefunction(getattr(mem_cube.text_mem, "asearch", None)):
+                memories = await mem_cube.text_mem.asearch(query, **search_kwargs)
+            else:
+                memories = await loop.run_in_executor(
+                    get_executor("api"),
+                    functools.partial(mem_cube.text_mem.search, query, **search_kwargs),
+                )
+            self._log_cube_search(target_user_id, mem_cube_id, memories, time_start)
+            return memories
+
+        tasks = {
+            mem_cube_id: asyncio.ensure_future(search_cube(mem_cube_id, mem_cube))
+            for mem_cube_id, mem_cube in tmp_mem_cubes.items()
+        }
+        pending = set()
+        if tasks:
+            remaining = None if deadline is None else max(deadline - time.monotonic(), 0)
+            _, pending = await asyncio.wait(tasks.values(), timeout=remaining)
+            for task in pending:
+                task.cancel()
+        cube_memories, timed_out = self._split_cube_searches(tasks, pending)
+        return self._search_result(
+            target_user_id, cube_memories, timed_out, timeout, merge_results, search_kwargs["top_k"]
+        )
+
+    def _search_options(
+        self, timeout: float | None, merge_results: bool | None
+    ) -> tuple[float | None, float | None, bool]:
+        """Resolve the timeout, its `time.monotonic()` deadline and whether to merge results."""
+        timeout = self.config.search_timeout if timeout is None else timeout
+        deadline = None if timeout is None else time.monotonic() + timeout
+        if merge_results is None:
+            merge_results = self.config.merge_search_results
+        return timeout, deadline, merge_results
+
+    @staticmethod
+    def _split_cube_searches(
+        searches: dict[str, concurrent.futures.Future | asyncio.Future], unfinished: set
+    ) -> tuple[dict[str, list[TextualMemoryItem]], list[str]]:
+        """Split per-cube futures into finished results and the ids of timed-out cubes."""
+        cube_memories: dict[str, list[TextualMemoryItem]] = {}
+        timed_out: list[str] = []
+        for mem_cube_id, search in searches.items():
+            # A search may also give up on the deadline itself just before the wait does
+            if search in unfinished or isinstance(search.exception(), TimeoutError):
+                timed_out.append(mem_cube_id)
+            else:
+                cube_memories[mem_cube_id] = search.result()
+        return cube_memories, timed_out
+
+    def _search_result(
+        self,
+        user_id: str,
+        cube_memories: dict[str, list[TextualMemoryItem]],
+        timed_out: list[str],
+        timeout: float | None,
+        merge_results: bool,
+        top_k: int,
+    ) -> MOSSearchResult:
+        """Assemble the search result shared by `search` and `asearch`."""
+        result: MOSSearchResult = {
+            "text_mem": [
+                {"cube_id": mem_cube_id, "memories": memories}
+                for mem_cube_id, memories in cube_memories.items()
+            ],
+            "act_mem": [],
+            "para_mem": [],
+        }
+        if timed_out:
+            logger.warning(
+                f"Search for user {user_id} missed the {timeout}s deadline on cubes: {timed_out}"
+            )
+            result["timed_out_cubes"] = timed_out
+        if merge_results:
+            result["merged_text_mem"] = self._merge_cube_memories(result["text_mem"], top_k)
+        return result
+
+    @staticmethod
+    def _log_late_cube_search(
+        user_id: str, mem_cube_id: str, future: concurrent.futures.Future
+    ) -> None:
+        """Report how a cube search that missed its deadline ended."""
+        exception = future.exception()
+        if isinstance(exception, TimeoutError):
+            logger.info(f"Search of cube {mem_cube_id} for user {user_id} stopped at the deadline")
+        elif exception is not None:
+            logger.warning(
+                f"Search of cube {mem_cube_id} for user {user_id} failed after the deadline: "
+                f"{exception}"
+            )
+        else:
+            logger.warning(
+                f"Search of cube {mem_cube_id} for user {user_id} finished after the deadline"
+            )
+
+    @staticmethod
+    def _merge_cube_memories(text_mem: list[dict[str, Any]], top_k: int) -> list[TextualMemoryItem]:
+        """Merge per-cube results into one list ranked by relativity, dropping duplicate ids."""
+        best: dict[str, TextualMemoryItem] = {}
+        for cube_result in text_mem:
+            for memory in cube_result["memories"]:
+                score = getattr(memory.metadata, "relativity", None) or 0.0
+                kept = best.get(memory.id)
+                if kept is None or score > (getattr(kept.metadata, "relativity", None) or 0.0):
+                    best[memory.id] = memory
+        ranked = sorted(
+            best.values(),
+            key=lambda m: getattr(m.metadata, "relativity", None) or 0.0,
+            reverse=True,
+        )
+        return ranked[:top_k]
+
+    def _prepare_search(
+        self,
+        user_id: str | None,
+        install_cube_ids: list[str] | None,
+        top_k: int | None,
+        mode: str,
+        internet_search: bool,
+        moscube: bool,
+        session_id: str | None,
+    ) -> tuple[str, dict[str, Any], dict[str, GeneralMemCube]]:
+        """Resolve the target user, textual search arguments and searchable cubes."""
         target_session_id = session_id if session_id is not None else self.session_id
         target_user_id = user_id if user_id is not None else self.user_id
 
@@ -587,52 +826,50 @@ class MOSCore:
         if session_id is not None:
             search_filter = {"session_id": session_id}
 
-        result: MOSSearchResult = {
-            "text_mem": [],
-            "act_mem": [],
-            "para_mem": [],
-        }
         if install_cube_ids is None:
             install_cube_ids = user_cube_ids
         # create exist dict in mem_cubes and avoid  one search slow
         tmp_mem_cubes = {}
         time_start_cube_get = time.time()
         for mem_cube_id in install_cube_ids:
-            if mem_cube_id in self.mem_cubes:
-                tmp_mem_cubes[mem_cube_id] = self.mem_cubes.get(mem_cube_id)
+            mem_cube = self.mem_cubes.get(mem_cube_id)
+            if (
+                mem_cube is not None
+                and mem_cube.text_mem is not None
+                and self.config.enable_textual_memory
+            ):
+                tmp_mem_cubes[mem_cube_id] = mem_cube
         logger.info(
             f"time search: transform cube time user_id: {target_user_id} time is: {time.time() - time_start_cube_get}"
         )
 
-        for mem_cube_id, mem_cube in tmp_mem_cubes.items():
-            if (
-                (mem_cube_id in install_cube_ids)
-                and (mem_cube.text_mem is not None)
-                and self.config.enable_textual_memory
-            ):
-                time_start = time.time()
-                memories = mem_cube.text_mem.search(
-                    query,
-                    top_k=top_k if top_k else self.config.top_k,
-                    mode=mode,
-                    manual_close_internet=not internet_search,
-                    info={
-                        "user_id": target_user_id,
-                        "session_id": target_session_id,
-                        "chat_history": chat_history.chat_history,
-                    },
-                    moscube=moscube,
-                    search_filter=search_filter,
-                )
-                result["text_mem"].append({"cube_id": mem_cube_id, "memories": memories})
-                logger.info(
-                    f"🧠 [Memory] Searched memories from {mem_cube_id}:\n{self._str_memories(memories)}\n"
-                )
-                search_time_end = time.time()
-                logger.info(
-                    f"time search graph: search graph time user_id: {target_user_id} time is: {search_time_end - time_start}"
-                )
-        return result
+        search_kwargs = {
+            "top_k": top_k if top_k else self.config.top_k,
+            "mode": mode,
+            "manual_close_internet": not internet_search,
+            "info": {
+                "user_id": target_user_id,
+                "session_id": target_session_id,
+                "chat_history": chat_history.chat_history,
+            },
+            "moscube": moscube,
+            "search_filter": search_filter,
+        }
+        return target_user_id, search_kwargs, tmp_mem_cubes
+
+    def _log_cube_search(
+        self,
+        user_id: str,
+        mem_cube_id: str,
+        memories: list[TextualMemoryItem],
+        time_start: float,
+    ) -> None:
+        logger.info(
+            f"🧠 [Memory] Searched memories from {mem_cube_id}:\n{self._str_memories(memories)}\n"
+        )
+        logger.info(
+            f"time search graph: search graph time user_id: {user_id} time is: {time.time() - time_start}"
+        )
 
     def add(
         self,
@@ -806,9 +1043,9 @@ class MOSCore:
             and self.mem_cubes[mem_cube_id].text_mem
         ):
             documents = self._get_all_documents(doc_path)
-            doc_memories = self.mem_reader.get_memory(
+            # Each extracted batch is written before the next one is produced
+            doc_memories = self.mem_reader.iter_doc_memory(
                 documents,
-                type="doc",
                 info={"user_id": target_user_id, "session_id": target_session_id},
             )
 
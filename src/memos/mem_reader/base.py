@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from collections.abc import Iterable, Iterator
 from typing import Any
 
 from memos.configs.mem_reader import BaseMemReaderConfig
@@ -22,6 +23,12 @@ class BaseMemReader(ABC):
     ) -> list[list[TextualMemoryItem]]:
         """Various types of memories extracted from scene_data"""
 
+    @abstractmethod
+    def iter_doc_memory(
+        self, documents: Iterable[str], info: dict[str, Any]
+    ) -> Iterator[list[TextualMemoryItem]]:
+        """Stream memories extracted from documents in bounded batches."""
+
     @abstractmethod
     def transform_memreader(self, data: dict) -> list[TextualMemoryItem]:
         """Transform the memory data into a list of TextualMemoryItem objects."""
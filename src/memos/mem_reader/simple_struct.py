@@ -1,27 +1,30 @@
 import concurrent.futures
 import copy
+import hashlib
 import json
 import os
 import re
 
 from abc import ABC
+from collections import deque
+from collections.abc import Iterable, Iterator
 from typing import Any
 
-from tqdm import tqdm
-
 from memos import log
 from memos.chunkers import ChunkerFactory
 from memos.configs.mem_reader import SimpleStructMemReaderConfig
 from memos.configs.parser import ParserConfigFactory
-from memos.context.context import ContextThreadPoolExecutor
 from memos.embedders.factory import EmbedderFactory
 from memos.llms.factory import LLMFactory
 from memos.mem_reader.base import BaseMemReader
 from memos.memories.textual.item import TextualMemoryItem, TreeNodeTextualMemoryMetadata
+from memos.memos_tools.executor_registry import get_executor
 from memos.parsers.factory import ParserFactory
 from memos.templates.mem_reader_prompts import (
     SIMPLE_STRUCT_DOC_READER_PROMPT,
     SIMPLE_STRUCT_DOC_READER_PROMPT_ZH,
+    SIMPLE_STRUCT_MEM_READER_BATCH_NOTE,
+    SIMPLE_STRUCT_MEM_READER_BATCH_NOTE_ZH,
     SIMPLE_STRUCT_MEM_READER_EXAMPLE,
     SIMPLE_STRUCT_MEM_READER_EXAMPLE_ZH,
     SIMPLE_STRUCT_MEM_READER_PROMPT,
@@ -37,6 +40,8 @@ PROMPT_DICT = {
         "zh": SIMPLE_STRUCT_MEM_READER_PROMPT_ZH,
         "en_example": SIMPLE_STRUCT_MEM_READER_EXAMPLE,
         "zh_example": SIMPLE_STRUCT_MEM_READER_EXAMPLE_ZH,
+        "en_batch": SIMPLE_STRUCT_MEM_READER_BATCH_NOTE,
+        "zh_batch": SIMPLE_STRUCT_MEM_READER_BATCH_NOTE_ZH,
     },
     "doc": {"en": SIMPLE_STRUCT_DOC_READER_PROMPT, "zh": SIMPLE_STRUCT_DOC_READER_PROMPT_ZH},
 }
@@ -55,7 +60,8 @@ def detect_lang(text):
         return "en"
 
 
-def _build_node(idx, message, info, scene_file, llm, parse_json_result, embedder):
+def _extract_doc_chunk(message, llm, parse_json_result) -> dict | None:
+    """Run the LLM extraction for one document chunk and validate its JSON result."""
     # generate
     try:
         raw = llm.generate(message)
@@ -76,29 +82,30 @@ def _build_node(idx, message, info, scene_file, llm, parse_json_result, embedder
         logger.error(f"[Parse] Exception during JSON parsing: {e}")
         return None
 
-    try:
-        value = chunk_res.get("value", "").strip()
-        if not value:
-            logger.warning("[BuildNode] value is empty")
-            return None
-
-        tags = chunk_res.get("tags", [])
-        if not isinstance(tags, list):
-            tags = []
-
-        key = chunk_res.get("key", None)
+    value = chunk_res.get("value", "")
+    value = value.strip() if isinstance(value, str) else ""
+    if not value:
+        logger.warning("[BuildNode] value is empty")
+        return None
+    tags = chunk_res.get("tags", [])
+    return {
+        "value": value,
+        "tags": tags if isinstance(tags, list) else [],
+        "key": chunk_res.get("key", None),
+    }
 
-        embedding = embedder.embed([value])[0]
 
+def _build_doc_node(idx, chunk_res, embedding, info, scene_file) -> TextualMemoryItem | None:
+    try:
         return TextualMemoryItem(
-            memory=value,
+            memory=chunk_res["value"],
             metadata=TreeNodeTextualMemoryMetadata(
                 user_id=info.get("user_id", ""),
                 session_id=info.get("session_id", ""),
                 memory_type="LongTermMemory",
                 status="activated",
-                tags=tags,
-                key=key,
+                tags=chunk_res["tags"],
+                key=chunk_res["key"],
                 embedding=embedding,
                 usage=[],
                 sources=[{"type": "doc", "doc_path": f"{scene_file}_{idx}"}],
@@ -129,23 +136,9 @@ class SimpleStructMemReader(BaseMemReader, ABC):
 
     @timed
     def _process_chat_data(self, scene_data_info, info):
-        mem_list = []
-        for item in scene_data_info:
-            if "chat_time" in item:
-                mem = item["role"] + ": " + f"[{item['chat_time']}]: " + item["content"]
-                mem_list.append(mem)
-            else:
-                mem = item["role"] + ":" + item["content"]
-                mem_list.append(mem)
-        lang = detect_lang("\n".join(mem_list))
-        template = PROMPT_DICT["chat"][lang]
-        examples = PROMPT_DICT["chat"][f"{lang}_example"]
-
-        prompt = template.replace("${conversation}", "\n".join(mem_list))
-        if self.config.remove_prompt_example:
-            prompt = prompt.replace(examples, "")
-
-        messages = [{"role": "user", "content": prompt}]
+        conversation = self._chat_conversation(scene_data_info)
+        lang = detect_lang(conversation)
+        messages = [{"role": "user", "content": self._chat_prompt(conversation, lang)}]
 
         try:
             response_text = self.llm.generate(messages)
@@ -155,17 +148,113 @@ class SimpleStructMemReader(BaseMemReader, ABC):
             response_json = {
                 "memory list": [
                     {
-                        "key": "\n".join(mem_list)[:10],
+                        "key": conversation[:10],
                         "memory_type": "UserMemory",
-                        "value": "\n".join(mem_list),
+                        "value": conversation,
                         "tags": [],
                     }
                 ],
-                "summary": "\n".join(mem_list),
+                "summary": conversation,
             }
 
-        chat_read_nodes = []
-        for memory_i_raw in response_json.get("memory list", []):
+        return self._build_chat_nodes([(scene_data_info, response_json)], info)[0]
+
+    @timed
+    def _process_chat_batch(self, scenes: list, info) -> list[list[TextualMemoryItem]]:
+        """
+        Extract memories of several scenes with one LLM call.
+
+        Scenes the model left out of its answer (or every scene, when the answer
+        cannot be parsed) fall back to `_process_chat_data`.
+        """
+        if len(scenes) == 1:
+            return [self._process_chat_data(scenes[0], info)]
+
+        conversations = [self._chat_conversation(scene) for scene in scenes]
+        lang = detect_lang("\n".join(conversations))
+        packed = "\n\n".join(
+            f"### Conversation {i}\n{conversation}"
+            for i, conversation in enumerate(conversations, 1)
+        )
+        note = PROMPT_DICT["chat"][f"{lang}_batch"].replace("${count}", str(len(scenes)))
+        messages = [{"role": "user", "content": self._chat_prompt(f"{packed}\n\n{note}", lang)}]
+
+        by_index = {}
+        try:
+            response_json = self.parse_json_result(self.llm.generate(messages))
+            for result in response_json.get("conversations", []):
+                if isinstance(result, dict) and isinstance(result.get("memory list"), list):
+                    by_index[int(result.get("index", 0))] = result
+        except Exception as e:
+            logger.error(f"[ChatReader] Batched extraction of {len(scenes)} scenes failed: {e}")
+
+        answered = [i for i in range(len(scenes)) if i + 1 in by_index]
+        nodes = self._build_chat_nodes([(scenes[i], by_index[i + 1]) for i in answered], info)
+        results = dict(zip(answered, nodes, strict=True))
+        for i, scene in enumerate(scenes):
+            if i not in results:
+                results[i] = self._process_chat_data(scene, info)
+        return [results[i] for i in range(len(scenes))]
+
+    @staticmethod
+    def _chat_conversation(scene_data_info) -> str:
+        mem_list = []
+        for item in scene_data_info:
+            if "chat_time" in item:
+                mem = item["role"] + ": " + f"[{item['chat_time']}]: " + item["content"]
+                mem_list.append(mem)
+            else:
+                mem = item["role"] + ":" + item["content"]
+                mem_list.append(mem)
+        return "\n".join(mem_list)
+
+    def _chat_prompt(self, conversation: str, lang: str) -> str:
+        prompt = PROMPT_DICT["chat"][lang].replace("${conversation}", conversation)
+        if self.config.remove_prompt_example:
+            prompt = prompt.replace(PROMPT_DICT["chat"][f"{lang}_example"], "")
+        return prompt
+
+    def _pack_chat_scenes(self, list_scene_data_info: list) -> list[list]:
+        """Group consecutive scenes into batches within the `chat_batching` budget."""
+        batching = self.config.chat_batching
+        batches, current, current_tokens = [], [], 0
+        for scene in list_scene_data_info:
+            # Rough token estimate: ~4 bytes of UTF-8 per token
+            tokens = len(self._chat_conversation(scene).encode("utf-8")) // 4 + 1
+            if current and (
+                current_tokens + tokens > batching.max_tokens or len(current) >= batching.max_scenes
+            ):
+                batches.append(current)
+                current, current_tokens = [], 0
+            current.append(scene)
+            current_tokens += tokens
+        if current:
+            batches.append(current)
+        return batches
+
+    def _build_chat_nodes(
+        self, parsed: list[tuple[list, dict]], info
+    ) -> list[list[TextualMemoryItem]]:
+        """
+        Turn parsed extraction results into memory items, one list per scene.
+
+        All memories are embedded with a single embedder request.
+        """
+        entries = []
+        for scene_idx, (scene_data_info, response_json) in enumerate(parsed):
+            for memory_i_raw in response_json.get("memory list", []):
+                if isinstance(memory_i_raw, dict):
+                    entries.append((scene_idx, scene_data_info, response_json, memory_i_raw))
+
+        embeddings = []
+        if entries:
+            try:
+                embeddings = self.embedder.embed([raw.get("value", "") for *_, raw in entries])
+            except Exception as e:
+                logger.error(f"[ChatReader] Error embedding memories: {e}")
+
+        chat_read_nodes = [[] for _ in parsed]
+        for i, (scene_idx, scene_data_info, response_json, memory_i_raw) in enumerate(entries):
             try:
                 memory_type = (
                     memory_i_raw.get("memory_type", "LongTermMemory")
@@ -187,7 +276,7 @@ class SimpleStructMemReader(BaseMemReader, ABC):
                         if type(memory_i_raw.get("tags", [])) is list
                         else [],
                         key=memory_i_raw.get("key", ""),
-                        embedding=self.embedder.embed([memory_i_raw.get("value", "")])[0],
+                        embedding=embeddings[i],
                         usage=[],
                         sources=scene_data_info,
                         background=response_json.get("summary", ""),
@@ -195,7 +284,7 @@ class SimpleStructMemReader(BaseMemReader, ABC):
                         type="fact",
                     ),
                 )
-                chat_read_nodes.append(node_i)
+                chat_read_nodes[scene_idx].append(node_i)
             except Exception as e:
                 logger.error(f"[ChatReader] Error parsing memory item: {e}")
 
@@ -243,6 +332,16 @@ class SimpleStructMemReader(BaseMemReader, ABC):
 
         memory_list = []
 
+        if type == "chat" and self.config.chat_batching is not None:
+            executor = get_executor("reader")
+            futures = [
+                executor.submit(self._process_chat_batch, batch, info)
+                for batch in self._pack_chat_scenes(list_scene_data_info)
+            ]
+            for future in concurrent.futures.as_completed(futures):
+                memory_list.extend(future.result())
+            return memory_list
+
         if type == "chat":
             processing_func = self._process_chat_data
         elif type == "doc":
@@ -251,14 +350,14 @@ class SimpleStructMemReader(BaseMemReader, ABC):
             processing_func = self._process_doc_data
 
         # Process Q&A pairs concurrently with context propagation
-        with ContextThreadPoolExecutor() as executor:
-            futures = [
-                executor.submit(processing_func, scene_data_info, info)
-                for scene_data_info in list_scene_data_info
-            ]
-            for future in concurrent.futures.as_completed(futures):
-                res_memory = future.result()
-                memory_list.append(res_memory)
+        executor = get_executor("reader")
+        futures = [
+            executor.submit(processing_func, scene_data_info, info)
+            for scene_data_info in list_scene_data_info
+        ]
+        for future in concurrent.futures.as_completed(futures):
+            res_memory = future.result()
+            memory_list.append(res_memory)
 
         return memory_list
 
@@ -275,13 +374,6 @@ class SimpleStructMemReader(BaseMemReader, ABC):
             List of strings containing the processed scene data
         """
         results = []
-        parser_config = ParserConfigFactory.model_validate(
-            {
-                "backend": "markitdown",
-                "config": {},
-            }
-        )
-        parser = ParserFactory.from_config(parser_config)
 
         if type == "chat":
             for items in scene_data:
@@ -299,63 +391,163 @@ class SimpleStructMemReader(BaseMemReader, ABC):
                 if result:
                     results.append(result)
         elif type == "doc":
+            parser = self._doc_parser()
             for item in scene_data:
-                try:
-                    if os.path.exists(item):
-                        try:
-                            parsed_text = parser.parse(item)
-                            results.append({"file": item, "text": parsed_text})
-                        except Exception as e:
-                            logger.error(f"[SceneParser] Error parsing {item}: {e}")
-                            continue
-                    else:
-                        parsed_text = item
-                        results.append({"file": "pure_text", "text": parsed_text})
-                except Exception as e:
-                    print(f"Error parsing file {item}: {e!s}")
+                scene_data_info = self._parse_document(parser, item)
+                if scene_data_info is not None:
+                    results.append(scene_data_info)
 
         return results
 
-    def _process_doc_data(self, scene_data_info, info, **kwargs):
-        chunks = self.chunker.chunk(scene_data_info["text"])
-        messages = []
-        for chunk in chunks:
-            lang = detect_lang(chunk.text)
-            template = PROMPT_DICT["doc"][lang]
-            prompt = template.replace("{chunk_text}", chunk.text)
-            message = [{"role": "user", "content": prompt}]
-            messages.append(message)
-
-        doc_nodes = []
-        scene_file = scene_data_info["file"]
-
-        with ContextThreadPoolExecutor(max_workers=50) as executor:
-            futures = {
-                executor.submit(
-                    _build_node,
-                    idx,
-                    msg,
-                    info,
-                    scene_file,
-                    self.llm,
-                    self.parse_json_result,
-                    self.embedder,
-                ): idx
-                for idx, msg in enumerate(messages)
+    def _doc_parser(self):
+        parser_config = ParserConfigFactory.model_validate(
+            {
+                "backend": "markitdown",
+                "config": {},
             }
-            total = len(futures)
+        )
+        return ParserFactory.from_config(parser_config)
 
-            for future in tqdm(
-                concurrent.futures.as_completed(futures), total=total, desc="Processing"
-            ):
+    def _parse_document(self, parser, item: str) -> dict | None:
+        """Parse one document path (or raw text) into {"file", "text"}."""
+        if not os.path.exists(item):
+            return {"file": "pure_text", "text": item}
+        try:
+            return {"file": item, "text": parser.parse(item)}
+        except Exception as e:
+            logger.error(f"[SceneParser] Error parsing {item}: {e}")
+            return None
+
+    def iter_doc_memory(
+        self, documents: Iterable[str], info: dict[str, Any]
+    ) -> Iterator[list[TextualMemoryItem]]:
+        """
+        Stream memories extracted from documents, one embedding batch at a time.
+
+        Documents are parsed lazily, one at a time, and each flows through
+        chunking -> LLM extraction (at most `doc_ingest.llm_concurrency` calls in
+        flight) -> batched embedding. Every embedded batch is yielded before more
+        work is scheduled, so the caller's write is the backpressure and memory
+        stays bounded however many documents there are.
+
+        With `doc_ingest.checkpoint_dir` set, a document's progress is recorded
+        once the caller has consumed each batch, and later runs skip the chunks
+        (and documents) that were already yielded. Chunks whose extraction or
+        embedding failed are recorded as well and retried by the next run.
+
+        Args:
+            documents: Document paths or raw texts.
+            info: Dictionary containing user_id and session_id.
+
+        Yields:
+            Lists of at most `doc_ingest.embed_batch_size` memory items.
+        """
+        parser = self._doc_parser()
+        for item in documents:
+            scene_data_info = self._parse_document(parser, item)
+            if scene_data_info is not None:
+                yield from self._iter_doc_nodes(scene_data_info, info, checkpoint=True)
+
+    def _process_doc_data(self, scene_data_info, info, **kwargs):
+        return [
+            node
+            for batch in self._iter_doc_nodes(scene_data_info, info, checkpoint=False)
+            for node in batch
+        ]
+
+    def _iter_doc_nodes(
+        self, scene_data_info: dict, info: dict[str, Any], checkpoint: bool
+    ) -> Iterator[list[TextualMemoryItem]]:
+        """Pipeline one parsed document; see `iter_doc_memory`."""
+        ingest = self.config.doc_ingest
+        scene_file = scene_data_info["file"]
+        chunks = self.chunker.chunk(scene_data_info["text"])
+        checkpoint_path = self._doc_checkpoint_path(scene_data_info) if checkpoint else None
+        chunks_done, retry = _load_doc_checkpoint(checkpoint_path)
+        todo = [i for i in retry if i < chunks_done] + list(range(chunks_done, len(chunks)))
+        if not todo:
+            return
+
+        executor = get_executor("extract")
+        # Chunks are consumed in order, so a checkpoint is "chunks done" plus the
+        # indices among them that failed and have to be retried
+        window: deque[tuple[int, concurrent.futures.Future]] = deque()
+        extracted: list[tuple[int, dict]] = []
+        failed: list[int] = []
+        pos = 0
+        try:
+            while window or pos < len(todo):
+                while pos < len(todo) and len(window) < ingest.llm_concurrency:
+                    message = self._doc_message(chunks[todo[pos]].text)
+                    future = executor.submit(
+                        _extract_doc_chunk, message, self.llm, self.parse_json_result
+                    )
+                    window.append((todo[pos], future))
+                    pos += 1
+
+                idx, future = window.popleft()
                 try:
-                    node = future.result()
-                    if node:
-                        doc_nodes.append(node)
+                    chunk_res = future.result()
                 except Exception as e:
-                    tqdm.write(f"[ERROR] {e}")
                     logger.error(f"[DocReader] Future task failed: {e}")
-        return doc_nodes
+                    chunk_res = None
+                if chunk_res:
+                    extracted.append((idx, chunk_res))
+                else:
+                    failed.append(idx)
+
+                last = not window and pos >= len(todo)
+                if len(extracted) >= ingest.embed_batch_size or last:
+                    nodes = self._embed_doc_nodes(extracted, info, scene_file)
+                    if extracted and not nodes:
+                        failed.extend(i for i, _ in extracted)
+                    extracted = []
+                    if nodes:
+                        yield nodes
+                    _save_doc_checkpoint(
+                        checkpoint_path,
+                        scene_file,
+                        max(chunks_done, idx + 1),
+                        sorted([*failed, *(i for i in retry if idx < i < chunks_done)]),
+                        len(chunks),
+                    )
+        finally:
+            for _, future in window:
+                future.cancel()
+
+        logger.info(f"[DocReader] Processed {len(chunks)} chunks of {scene_file}")
+
+    def _doc_message(self, chunk_text: str) -> list[dict]:
+        lang = detect_lang(chunk_text)
+        template = PROMPT_DICT["doc"][lang]
+        prompt = template.replace("{chunk_text}", chunk_text)
+        return [{"role": "user", "content": prompt}]
+
+    def _embed_doc_nodes(
+        self, extracted: list[tuple[int, dict]], info: dict[str, Any], scene_file: str
+    ) -> list[TextualMemoryItem]:
+        if not extracted:
+            return []
+        try:
+            embeddings = self.embedder.embed([chunk_res["value"] for _, chunk_res in extracted])
+        except Exception as e:
+            logger.error(f"[DocReader] Embedding {len(extracted)} memories failed: {e}")
+            return []
+        nodes = [
+            _build_doc_node(idx, chunk_res, embeddings[i], info, scene_file)
+            for i, (idx, chunk_res) in enumerate(extracted)
+        ]
+        return [node for node in nodes if node]
+
+    def _doc_checkpoint_path(self, scene_data_info: dict) -> str | None:
+        checkpoint_dir = self.config.doc_ingest.checkpoint_dir
+        if not checkpoint_dir:
+            return None
+        # Keyed by content as well, so an edited document is ingested from scratch
+        digest = hashlib.sha1(
+            f"{scene_data_info['file']}\0{scene_data_info['text']}".encode()
+        ).hexdigest()
+        return os.path.join(checkpoint_dir, f"{digest}.json")
 
     def parse_json_result(self, response_text):
         try:
@@ -374,3 +566,28 @@ class SimpleStructMemReader(BaseMemReader, ABC):
 
     def transform_memreader(self, data: dict) -> list[TextualMemoryItem]:
         pass
+
+
+def _load_doc_checkpoint(path: str | None) -> tuple[int, list[int]]:
+    """Return how many chunks of a document were consumed, and which of those failed."""
+    if not path or not os.path.exists(path):
+        return 0, []
+    try:
+        with open(path, encoding="utf-8") as f:
+            state = json.load(f)
+        return int(state.get("chunks_done", 0)), [int(i) for i in state.get("failed", [])]
+    except (OSError, ValueError, TypeError) as e:
+        logger.warning(f"[DocReader] Ignoring unreadable checkpoint {path}: {e}")
+        return 0, []
+
+
+def _save_doc_checkpoint(
+    path: str | None, file: str, chunks_done: int, failed: list[int], total: int
+) -> None:
+    if not path:
+        return
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump({"file": file, "chunks_done": chunks_done, "failed": failed, "total": total}, f)
+    os.replace(tmp_path, path)
@@ -56,6 +56,7 @@ class BaseScheduler(RabbitMQSchedulerModule, RedisSchedulerModule, SchedulerLogg
         self.top_k = self.config.get("top_k", 10)
         self.context_window_size = self.config.get("context_window_size", 5)
         self.enable_activation_memory = self.config.get("enable_activation_memory", False)
+        self.incremental_act_mem_update = self.config.get("incremental_act_mem_update", True)
         self.act_mem_dump_path = self.config.get("act_mem_dump_path", DEFAULT_ACT_MEM_DUMP_PATH)
         self.search_method = TreeTextMemory_SEARCH_METHOD
         self.enable_parallel_dispatch = self.config.get("enable_parallel_dispatch", False)
@@ -353,6 +354,7 @@ class BaseScheduler(RabbitMQSchedulerModule, RedisSchedulerModule, SchedulerLogg
             # huggingface or vllm kv cache
             original_cache_items: list[VLLMKVCacheItem] = act_mem.get_all()
             original_text_memories = []
+            pre_cache_item = None
             if len(original_cache_items) > 0:
                 pre_cache_item: VLLMKVCacheItem = original_cache_items[-1]
                 original_text_memories = pre_cache_item.records.text_memories
@@ -365,9 +367,17 @@ class BaseScheduler(RabbitMQSchedulerModule, RedisSchedulerModule, SchedulerLogg
                         else new_text_memory,
                     )
                     return
-                act_mem.delete_all()
 
-            cache_item = act_mem.extract(new_text_memory)
+            if (
+                self.incremental_act_mem_update
+                and pre_cache_item is not None
+                and isinstance(act_mem, KVCacheMemory)
+            ):
+                # Only prefill the part of the composition after the unchanged prefix
+                cache_item = act_mem.extract_incremental(new_text_memory, pre_cache_item)
+            else:
+                cache_item = act_mem.extract(new_text_memory)
+            act_mem.delete_all()
             cache_item.records.text_memories = new_text_memories
             cache_item.records.timestamp = datetime.utcnow()
 
@@ -524,35 +534,34 @@ class BaseScheduler(RabbitMQSchedulerModule, RedisSchedulerModule, SchedulerLogg
 
     def _message_consumer(self) -> None:
         """
-        Continuously checks the queue for messages and dispatches them.
+        Continuously waits for messages and dispatches them.
 
-        Runs in a dedicated thread to process messages at regular intervals.
+        Runs in a dedicated thread. It blocks on the queue (waking up at least every
+        `consume_interval_seconds` to check for shutdown) and dispatches everything
+        available as soon as a message arrives.
         """
         while self._running:  # Use a running flag for graceful shutdown
             try:
-                # Get all available messages at once (thread-safe approach)
-                messages = []
+                try:
+                    messages = [self.memos_message_queue.get(timeout=self._consume_interval)]
+                except queue.Empty:
+                    continue
+
+                # Drain whatever else is already waiting (thread-safe approach)
                 while True:
                     try:
-                        # Use get_nowait() directly without empty() check to avoid race conditions
-                        message = self.memos_message_queue.get_nowait()
-                        messages.append(message)
+                        messages.append(self.memos_message_queue.get_nowait())
                     except queue.Empty:
-                        # No more messages available
                         break
 
-                if messages:
-                    try:
-                        self.dispatcher.dispatch(messages)
-                    except Exception as e:
-                        logger.error(f"Error dispatching messages: {e!s}")
-                    finally:
-                        # Mark all messages as processed
-                        for _ in messages:
-                            self.memos_message_queue.task_done()
-
-                # Sleep briefly to prevent busy waiting
-                time.sleep(self._consume_interval)  # Adjust interval as needed
+                try:
+                    self.dispatcher.dispatch(messages)
+                except Exception as e:
+                    logger.error(f"Error dispatching messages: {e!s}")
+                finally:
+                    # Mark all messages as processed
+                    for _ in messages:
+                        self.memos_message_queue.task_done()
 
             except Exception as e:
                 logger.error(f"Unexpected error in message consumer: {e!s}")
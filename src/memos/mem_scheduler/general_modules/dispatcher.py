@@ -1,6 +1,8 @@
 import concurrent
+import threading
+import time
 
-from collections import defaultdict
+from collections import defaultdict, deque
 from collections.abc import Callable
 
 from memos.context.context import ContextThreadPoolExecutor
@@ -12,13 +14,28 @@ from memos.mem_scheduler.schemas.message_schemas import ScheduleMessageItem
 logger = get_logger(__name__)
 
 
+class _DispatchShard:
+    """Ordered queue of handler runs for the (user_id, mem_cube_id) keys hashed to it."""
+
+    def __init__(self):
+        # (label, handler, messages) in arrival order
+        self.pending: deque[tuple[str, Callable, list[ScheduleMessageItem]]] = deque()
+        self.scheduled = False
+        self.handled = 0
+        self.total_latency = 0.0
+        self.max_latency = 0.0
+        self.last_latency = 0.0
+
+
 class SchedulerDispatcher(BaseSchedulerModule):
     """
     Thread pool-based message dispatcher that routes messages to dedicated handlers
     based on their labels.
 
     Features:
-    - Dedicated thread pool per message label
+    - Messages sharded by (user_id, mem_cube_id) onto ordered queues in parallel mode:
+      different users run concurrently while each user's messages keep their order
+    - Per-shard queue depth and handler latency (see `shard_stats`)
     - Batch message processing
     - Graceful shutdown
     - Bulk handler registration
@@ -49,6 +66,11 @@ class SchedulerDispatcher(BaseSchedulerModule):
         # Set to track active futures for monitoring purposes
         self._futures = set()
 
+        # Ordered shards, each drained by at most one task on the dispatcher executor
+        self.num_shards = self.max_workers
+        self._shards = [_DispatchShard() for _ in range(self.num_shards)]
+        self._shard_lock = threading.Lock()
+
     def register_handler(self, label: str, handler: Callable[[list[ScheduleMessageItem]], None]):
         """
         Register a handler function for a specific message label.
@@ -115,7 +137,7 @@ class SchedulerDispatcher(BaseSchedulerModule):
         return {user_id: dict(cube_groups) for user_id, cube_groups in grouped_dict.items()}
 
     def _handle_future_result(self, future):
-        self._futures.remove(future)
+        self._futures.discard(future)
         try:
             future.result()  # this will throw exception
         except Exception as e:
@@ -125,6 +147,9 @@ class SchedulerDispatcher(BaseSchedulerModule):
         """
         Dispatch a list of messages to their respective handlers.
 
+        In parallel mode, the messages of each (user_id, mem_cube_id) are split into
+        consecutive runs of the same label and queued, in order, on that key's shard.
+
         Args:
             msg_list: List of ScheduleMessageItem objects to process
         """
@@ -132,6 +157,22 @@ class SchedulerDispatcher(BaseSchedulerModule):
             logger.debug("Received empty message list, skipping dispatch")
             return
 
+        if self.enable_parallel_dispatch and self.dispatcher_executor is not None:
+            key_groups = defaultdict(list)
+            for message in msg_list:
+                key_groups[(message.user_id, message.mem_cube_id)].append(message)
+
+            for key, msgs in key_groups.items():
+                runs = [[msgs[0]]]
+                for message in msgs[1:]:
+                    if message.label == runs[-1][0].label:
+                        runs[-1].append(message)
+                    else:
+                        runs.append([message])
+                for run in runs:
+                    self._enqueue(self._shard_index(*key), run[0].label, run)
+            return
+
         # Group messages by their labels, and organize messages by label
         label_groups = defaultdict(list)
         for message in msg_list:
@@ -140,17 +181,75 @@ class SchedulerDispatcher(BaseSchedulerModule):
         # Process each label group
         for label, msgs in label_groups.items():
             handler = self.handlers.get(label, self._default_message_handler)
-
-            # dispatch to different handler
             logger.debug(f"Dispatch {len(msgs)} message(s) to {label} handler.")
-            if self.enable_parallel_dispatch and self.dispatcher_executor is not None:
-                # Capture variables in lambda to avoid loop variable issues
-                future = self.dispatcher_executor.submit(handler, msgs)
-                self._futures.add(future)
-                future.add_done_callback(self._handle_future_result)
-                logger.info(f"Dispatched {len(msgs)} message(s) as future task")
-            else:
+            handler(msgs)
+
+    def shard_stats(self) -> list[dict]:
+        """
+        Return queue depth and handler latency (seconds) of every shard.
+
+        `queue_depth` counts handler runs waiting on the shard (excluding the one
+        currently executing) and `pending_messages` the messages they carry.
+        """
+        with self._shard_lock:
+            return [
+                {
+                    "shard": i,
+                    "queue_depth": len(shard.pending),
+                    "pending_messages": sum(len(msgs) for _, _, msgs in shard.pending),
+                    "active": shard.scheduled,
+                    "handled": shard.handled,
+                    "avg_latency": shard.total_latency / shard.handled if shard.handled else 0.0,
+                    "max_latency": shard.max_latency,
+                    "last_latency": shard.last_latency,
+                }
+                for i, shard in enumerate(self._shards)
+            ]
+
+    def _shard_index(self, user_id: str, mem_cube_id: str) -> int:
+        return hash((user_id, mem_cube_id)) % self.num_shards
+
+    def _enqueue(self, index: int, label: str, msgs: list[ScheduleMessageItem]) -> None:
+        handler = self.handlers.get(label, self._default_message_handler)
+        shard = self._shards[index]
+        with self._shard_lock:
+            shard.pending.append((label, handler, msgs))
+            if shard.scheduled:
+                return
+            shard.scheduled = True
+
+        try:
+            future = self.dispatcher_executor.submit(self._drain_shard, index)
+        except Exception:
+            with self._shard_lock:
+                shard.scheduled = False
+            raise
+        self._futures.add(future)
+        future.add_done_callback(self._handle_future_result)
+        logger.debug(f"Dispatched {len(msgs)} {label} message(s) to shard {index}")
+
+    def _drain_shard(self, index: int) -> None:
+        """Run the queued handler runs of a shard one after another until it is empty."""
+        shard = self._shards[index]
+        while True:
+            with self._shard_lock:
+                if not shard.pending:
+                    shard.scheduled = False
+                    return
+                label, handler, msgs = shard.pending.popleft()
+
+            start = time.perf_counter()
+            try:
                 handler(msgs)
+            except Exception as e:
+                logger.error(f"Handler for '{label}' failed on shard {index}: {e!s}", exc_info=True)
+            latency = time.perf_counter() - start
+
+            with self._shard_lock:
+                shard.handled += 1
+                shard.total_latency += latency
+                shard.max_latency = max(shard.max_latency, latency)
+                shard.last_latency = latency
 
     def join(self, timeout: float | None = None) -> bool:
         """Wait for all dispatched tasks to complete.
@@ -165,7 +264,7 @@ class SchedulerDispatcher(BaseSchedulerModule):
             return True  # 串行模式无需等待
 
         done, not_done = concurrent.futures.wait(
-            self._futures, timeout=timeout, return_when=concurrent.futures.ALL_COMPLETED
+            set(self._futures), timeout=timeout, return_when=concurrent.futures.ALL_COMPLETED
         )
 
         # Check for exceptions in completed tasks
@@ -196,6 +295,10 @@ class SchedulerDispatcher(BaseSchedulerModule):
             logger.error(f"Executor shutdown error: {e}", exc_info=True)
         finally:
             self._futures.clear()
+            with self._shard_lock:
+                for shard in self._shards:
+                    shard.pending.clear()
+                    shard.scheduled = False
 
     def __enter__(self):
         self._running = True
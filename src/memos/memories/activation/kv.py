@@ -1,5 +1,7 @@
+import json
 import os
 import pickle
+import shutil
 
 from datetime import datetime
 from importlib.metadata import version
@@ -10,11 +12,17 @@ from transformers import DynamicCache
 from memos.configs.memory import KVCacheMemoryConfig
 from memos.dependency import require_python_package
 from memos.llms.factory import LLMFactory
+from memos.log import get_logger
 from memos.memories.activation.base import BaseActMemory
-from memos.memories.activation.item import KVCacheItem
+from memos.memories.activation.item import KVCacheItem, KVCacheRecords
 from memos.memories.textual.item import TextualMemoryItem
 
 
+logger = get_logger(__name__)
+
+KV_STORE_VERSION = 1
+
+
 class KVCacheMemory(BaseActMemory):
     """
     Key-Value Cache Memory for activation memories.
@@ -30,6 +38,11 @@ class KVCacheMemory(BaseActMemory):
         self.config = config
         self.llm = LLMFactory.from_config(config.extractor_llm)
         self.kv_cache_memories: dict[str, KVCacheItem] = {}
+        # Items listed in a loaded store whose tensors have not been read yet
+        self._lazy_items: dict[str, dict] = {}
+        self._load_order: list[str] = []
+        self._store_dir: str | None = None
+        self._dirty: set[str] = set()
 
     def extract(self, text: str) -> KVCacheItem:
         """Extract memory based on the text.
@@ -53,6 +66,30 @@ class KVCacheMemory(BaseActMemory):
 
         return cache_item
 
+    def extract_incremental(self, text: str, previous: KVCacheItem) -> KVCacheItem:
+        """Extract memory based on the text, reusing the KV cache of a previous extraction.
+
+        Only the part of `text` that differs from `previous`'s source text is
+        prefilled; the cache of the unchanged prefix is kept. Falls back to a full
+        `extract` when the LLM cannot extend caches. `previous.memory` is consumed.
+
+        Args:
+            text: Input text to extract memory from
+            previous: Item previously returned by `extract` / `extract_incremental`
+
+        Returns:
+            Extracted memory item
+        """
+        previous_text = previous.metadata.get("source_text")
+        if previous_text is None or not hasattr(self.llm, "extend_kv_cache"):
+            return self.extract(text)
+
+        kv_cache = self.llm.extend_kv_cache(previous.memory, previous_text, text)
+        return KVCacheItem(
+            memory=kv_cache,
+            metadata={"source_text": text, "extracted_at": datetime.now().isoformat()},
+        )
+
     def add(self, memories: list[KVCacheItem]) -> None:
         """Add memories to the KV cache memory.
 
@@ -60,7 +97,9 @@ class KVCacheMemory(BaseActMemory):
             memories: List of KVCacheItem to add
         """
         for memory in memories:
+            self._lazy_items.pop(memory.id, None)
             self.kv_cache_memories[memory.id] = memory
+            self._dirty.add(memory.id)
 
     def get_cache(self, cache_ids: list[str]) -> DynamicCache | None:
         """Merge multiple KV caches into a single cache.
@@ -71,6 +110,7 @@ class KVCacheMemory(BaseActMemory):
         Returns:
             Merged DynamicCache or None if no caches found
         """
+        self._materialize(cache_ids)
         caches_to_merge = []
         for cache_id in cache_ids:
             cache_item = self.kv_cache_memories.get(cache_id)
@@ -91,6 +131,7 @@ class KVCacheMemory(BaseActMemory):
         Returns:
             Memory dictionary or None if not found
         """
+        self._materialize([memory_id])
         return self.kv_cache_memories.get(memory_id)
 
     def get_by_ids(self, memory_ids: list[str]) -> list[KVCacheItem | None]:
@@ -114,6 +155,7 @@ class KVCacheMemory(BaseActMemory):
         Returns:
             List of all KVCacheItems in the memory
         """
+        self._materialize(list(self._lazy_items))
         return list(self.kv_cache_memories.values())
 
     def delete(self, memory_ids: list[str]) -> None:
@@ -124,10 +166,13 @@ class KVCacheMemory(BaseActMemory):
         """
         for memory_id in memory_ids:
             self.kv_cache_memories.pop(memory_id, None)
+            self._lazy_items.pop(memory_id, None)
 
     def delete_all(self) -> None:
         """Delete all memories."""
         self.kv_cache_memories.clear()
+        self._lazy_items.clear()
+        self._load_order = []
 
     def from_textual_memory(self, mem: TextualMemoryItem) -> KVCacheItem:
         """
@@ -139,14 +184,143 @@ class KVCacheMemory(BaseActMemory):
         return KVCacheItem(memory=kv_cache, metadata=mem.metadata.model_dump())
 
     def load(self, dir: str) -> None:
-        """Load memories from os.path.join(dir, self.config.memory_filename)
+        """Load memories from the tensor store next to os.path.join(dir, self.config.memory_filename)
+
+        Only the JSON index is read here; each item's tensors are memory-mapped from
+        its safetensors file the first time the item is accessed. A legacy pickle
+        file at `memory_filename` is still loaded eagerly when no store exists.
 
         Args:
             dir (str): The directory containing the memory files.
         """
-        import torch
+        self.delete_all()
+        self._dirty.clear()
+        self._store_dir = None
+
+        store_dir = self._get_store_dir(dir)
+        index_path = os.path.join(store_dir, "index.json")
+        if os.path.exists(index_path):
+            try:
+                with open(index_path, encoding="utf-8") as f:
+                    index = json.load(f)
+                self._lazy_items = dict(index.get("items", {}))
+                self._load_order = list(self._lazy_items)
+                self._store_dir = store_dir
+            except (OSError, ValueError) as e:
+                logger.warning(f"Failed to read KV cache store index {index_path}: {e}")
+                self.delete_all()
+            return
+
+        self._load_pickle(os.path.join(dir, self.config.memory_filename))
+
+    def dump(self, dir: str) -> None:
+        """Dump memories to a tensor store next to os.path.join(dir, self.config.memory_filename)
+
+        Every item lives in its own safetensors file (one K and V tensor per layer),
+        written atomically. Items that are unchanged since they were loaded from the
+        same store are not rewritten, and files of deleted items are removed.
 
-        file_path = os.path.join(dir, self.config.memory_filename)
+        Args:
+            dir (str): The directory where the memory files will be saved.
+        """
+        from safetensors.torch import save_file
+
+        store_dir = self._get_store_dir(dir)
+        os.makedirs(store_dir, exist_ok=True)
+        same_store = (
+            self._store_dir is not None
+            and os.path.isdir(self._store_dir)
+            and os.path.samefile(self._store_dir, store_dir)
+        )
+
+        items: dict[str, dict] = {}
+        for item_id in self._ordered_ids():
+            filename = f"{item_id}.safetensors"
+            path = os.path.join(store_dir, filename)
+            if item_id in self._lazy_items:
+                entry = self._lazy_items[item_id]
+                if not same_store:
+                    shutil.copyfile(os.path.join(self._store_dir, entry["file"]), path)
+                items[item_id] = {**entry, "file": filename}
+                continue
+
+            item = self.kv_cache_memories[item_id]
+            if item_id in self._dirty or not same_store or not os.path.exists(path):
+                tensors = {}
+                for layer, (key, value) in enumerate(_cache_layers(item.memory)):
+                    tensors[f"key.{layer}"] = key.detach().contiguous().cpu()
+                    tensors[f"value.{layer}"] = value.detach().contiguous().cpu()
+                tmp_path = f"{path}.tmp"
+                save_file(tensors, tmp_path)
+                os.replace(tmp_path, path)
+            items[item_id] = {
+                "file": filename,
+                "metadata": item.metadata,
+                "records": item.records.model_dump(mode="json"),
+            }
+
+        index_path = os.path.join(store_dir, "index.json")
+        with open(f"{index_path}.tmp", "w", encoding="utf-8") as f:
+            json.dump({"version": KV_STORE_VERSION, "items": items}, f, ensure_ascii=False)
+        os.replace(f"{index_path}.tmp", index_path)
+
+        # Remove files of items that are no longer part of the store
+        keep = {entry["file"] for entry in items.values()} | {"index.json"}
+        for name in os.listdir(store_dir):
+            if name not in keep:
+                os.remove(os.path.join(store_dir, name))
+
+        self._store_dir = store_dir
+        self._dirty.clear()
+
+    def _get_store_dir(self, dir: str) -> str:
+        stem, _ = os.path.splitext(self.config.memory_filename)
+        return os.path.join(dir, f"{stem}.kvstore")
+
+    def _ordered_ids(self) -> list[str]:
+        """All item ids: items from the loaded store first (in stored order), then newer ones."""
+        loaded = [
+            item_id
+            for item_id in self._load_order
+            if item_id in self._lazy_items or item_id in self.kv_cache_memories
+        ]
+        loaded_set = set(loaded)
+        return loaded + [item_id for item_id in self.kv_cache_memories if item_id not in loaded_set]
+
+    def _materialize(self, memory_ids: list[str]) -> None:
+        """Read the tensors of lazily loaded items from the store."""
+        memory_ids = [item_id for item_id in memory_ids if item_id in self._lazy_items]
+        if not memory_ids:
+            return
+        from safetensors import safe_open
+
+        for item_id in memory_ids:
+            entry = self._lazy_items.pop(item_id)
+            path = os.path.join(self._store_dir, entry["file"])
+            layers = []
+            with safe_open(path, framework="pt") as f:
+                num_layers = sum(1 for name in f.keys() if name.startswith("key."))  # noqa: SIM118
+                for layer in range(num_layers):
+                    layers.append((f.get_tensor(f"key.{layer}"), f.get_tensor(f"value.{layer}")))
+            cache = DynamicCache()
+            for layer, (key, value) in enumerate(layers):
+                cache.update(key, value, layer)
+            self.kv_cache_memories[item_id] = KVCacheItem(
+                id=item_id,
+                memory=cache,
+                metadata=entry.get("metadata", {}),
+                records=KVCacheRecords.model_validate(entry.get("records", {})),
+            )
+        # Keep get_all() in stored order regardless of access order
+        self.kv_cache_memories = {
+            item_id: self.kv_cache_memories[item_id]
+            for item_id in self._ordered_ids()
+            if item_id in self.kv_cache_memories
+        }
+
+    def _load_pickle(self, file_path: str) -> None:
+        """Load a legacy pickled KVCacheMemory dump."""
+        import torch
 
         if not os.path.exists(file_path):
             # If file doesn't exist, start with empty memories
@@ -182,23 +356,6 @@ class KVCacheMemory(BaseActMemory):
             # If loading fails, start with empty memories
             self.kv_cache_memories = {}
 
-    def dump(self, dir: str) -> None:
-        """Dump memories to os.path.join(dir, self.config.memory_filename)
-
-        Args:
-            dir (str): The directory where the memory files will be saved.
-        """
-        file_path = os.path.join(dir, self.config.memory_filename)
-
-        # Create directory if it doesn't exist
-        os.makedirs(dir, exist_ok=True)
-
-        # Prepare data to save (only memories)
-        data = {"kv_cache_memories": self.kv_cache_memories}
-
-        with open(file_path, "wb") as f:
-            pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
-
     def _concat_caches(self, caches: list[DynamicCache]) -> DynamicCache:
         """
         Faster concat merge: for each layer, gather all caches' tensors
@@ -235,6 +392,17 @@ class KVCacheMemory(BaseActMemory):
         return merged
 
 
+def _cache_layers(cache: DynamicCache) -> list[tuple]:
+    """Return the (key, value) tensors of every initialized layer of a DynamicCache."""
+    if hasattr(cache, "layers"):
+        return [
+            (layer.keys, layer.values)
+            for layer in cache.layers
+            if getattr(layer, "keys", None) is not None and layer.keys.numel() > 0
+        ]
+    return list(zip(cache.key_cache, cache.value_cache, strict=False))
+
+
 def move_dynamic_cache_htod(dynamic_cache: DynamicCache, device: str) -> DynamicCache:
     """
     In SimpleMemChat.run(), if self.config.enable_activation_memory is enabled,
@@ -12,6 +12,7 @@ from memos.configs.memory import TreeTextMemoryConfig
 from memos.configs.reranker import RerankerConfigFactory
 from memos.embedders.factory import EmbedderFactory, OllamaEmbedder
 from memos.graph_dbs.factory import GraphStoreFactory, Neo4jGraphDB
+from memos.graph_dbs.streaming import export_graph_stream, import_graph_stream, is_stream_file
 from memos.llms.factory import AzureLLM, LLMFactory, OllamaLLM, OpenAILLM
 from memos.log import get_logger
 from memos.memories.textual.base import BaseTextMemory
@@ -20,6 +21,11 @@ from memos.memories.textual.tree_text_memory.organize.manager import MemoryManag
 from memos.memories.textual.tree_text_memory.retrieve.internet_retriever_factory import (
     InternetRetrieverFactory,
 )
+from memos.memories.textual.tree_text_memory.retrieve.search_cache import (
+    SearchResultCache,
+    bump_write_version,
+    graph_scope,
+)
 from memos.memories.textual.tree_text_memory.retrieve.searcher import Searcher
 from memos.reranker.factory import RerankerFactory
 from memos.types import MessageList
@@ -83,8 +89,14 @@ class TreeTextMemory(BaseTextMemory):
                 "UserMemory": 480,
             },
             is_reorganize=self.is_reorganize,
+            incremental_clustering=config.incremental_clustering,
+            relation_detection=config.relation_detection,
+            dedup=config.dedup,
         )
         logger.info(f"time init: memory_manager time is: {time.time() - time_start_mm}")
+        self.search_cache = (
+            SearchResultCache(config.search_cache) if config.search_cache is not None else None
+        )
         time_start_ir = time.time()
         # Create internet retriever if configured
         self.internet_retriever = None
@@ -140,6 +152,7 @@ class TreeTextMemory(BaseTextMemory):
         manual_close_internet: bool = False,
         moscube: bool = False,
         search_filter: dict | None = None,
+        deadline: float | None = None,
     ) -> list[TextualMemoryItem]:
         """Search for memories based on a query.
         User query -> TaskGoalParser -> MemoryPathResolver ->
@@ -160,31 +173,54 @@ class TreeTextMemory(BaseTextMemory):
                 - Values are exact-match conditions.
                 Example: {"user_id": "123", "session_id": "abc"}
                 If None, no additional filtering is applied.
+            deadline (float, optional): `time.monotonic()` time after which the search
+                stops early with TimeoutError.
         Returns:
             list[TextualMemoryItem]: List of matching memories.
         """
+        searcher = self._get_searcher(manual_close_internet, moscube)
+        return searcher.search(
+            query, top_k, info, mode, memory_type, search_filter, deadline=deadline
+        )
+
+    async def asearch(
+        self,
+        query: str,
+        top_k: int,
+        info=None,
+        mode: str = "fast",
+        memory_type: str = "All",
+        manual_close_internet: bool = False,
+        moscube: bool = False,
+        search_filter: dict | None = None,
+        deadline: float | None = None,
+    ) -> list[TextualMemoryItem]:
+        """Async variant of `search` that does not block the running event loop.
+
+        Args and return value are the same as for `search`.
+        """
+        searcher = self._get_searcher(manual_close_internet, moscube)
+        return await searcher.asearch(
+            query, top_k, info, mode, memory_type, search_filter, deadline=deadline
+        )
+
+    def _get_searcher(self, manual_close_internet: bool, moscube: bool) -> Searcher:
         if (self.internet_retriever is not None) and manual_close_internet:
             logger.warning(
                 "Internet retriever is init by config , but  this search set manual_close_internet is True  and will close it"
             )
-            searcher = Searcher(
-                self.dispatcher_llm,
-                self.graph_store,
-                self.embedder,
-                self.reranker,
-                internet_retriever=None,
-                moscube=moscube,
-            )
+            internet_retriever = None
         else:
-            searcher = Searcher(
-                self.dispatcher_llm,
-                self.graph_store,
-                self.embedder,
-                self.reranker,
-                internet_retriever=self.internet_retriever,
-                moscube=moscube,
-            )
-        return searcher.search(query, top_k, info, mode, memory_type, search_filter)
+            internet_retriever = self.internet_retriever
+        return Searcher(
+            self.dispatcher_llm,
+            self.graph_store,
+            self.embedder,
+            self.reranker,
+            internet_retriever=internet_retriever,
+            moscube=moscube,
+            search_cache=self.search_cache,
+        )
 
     def get_relevant_subgraph(
         self, query: str, top_k: int = 5, depth: int = 2, center_status: str = "activated"
@@ -300,23 +336,43 @@ class TreeTextMemory(BaseTextMemory):
         """Delete all memories and their relationships from the graph store."""
         try:
             self.graph_store.clear()
+            self.memory_manager.retention.invalidate()
+            bump_write_version(graph_scope(self.graph_store))
             logger.info("All memories and edges have been deleted from the graph.")
         except Exception as e:
             logger.error(f"An error occurred while deleting all memories: {e}")
             raise
 
     def load(self, dir: str) -> None:
+        """Load memories from the NDJSON stream next to os.path.join(dir, self.config.memory_filename)
+
+        The stream written by `dump` is preferred; a file at `memory_filename` itself
+        (a legacy single-document JSON dump, or a stream from an older build) is
+        still loaded when no stream exists.
+        """
         try:
-            memory_file = os.path.join(dir, self.config.memory_filename)
+            memory_file = self._get_stream_file(dir)
+            if not os.path.exists(memory_file):
+                memory_file = os.path.join(dir, self.config.memory_filename)
 
             if not os.path.exists(memory_file):
                 logger.warning(f"Memory file not found: {memory_file}")
                 return
 
+            if is_stream_file(memory_file):
+                counts = import_graph_stream(self.graph_store, memory_file)
+                bump_write_version(graph_scope(self.graph_store))
+                self.memory_manager.retention.invalidate()
+                logger.info(f"Loaded {counts['nodes']} memories from {memory_file}")
+                return
+
+            # Legacy single-document JSON dump
             with open(memory_file, encoding="utf-8") as f:
                 memories = json.load(f)
 
             self.graph_store.import_graph(memories)
+            bump_write_version(graph_scope(self.graph_store))
+            self.memory_manager.retention.invalidate()
             logger.info(f"Loaded {len(memories)} memories from {memory_file}")
 
         except FileNotFoundError:
@@ -327,21 +383,31 @@ class TreeTextMemory(BaseTextMemory):
             logger.error(f"An error occurred while loading memories: {e}")
 
     def dump(self, dir: str) -> None:
-        """Dump memories to os.path.join(dir, self.config.memory_filename)"""
-        try:
-            json_memories = self.graph_store.export_graph()
+        """Dump memories to an NDJSON stream next to os.path.join(dir, self.config.memory_filename)
 
+        The stream is named after `memory_filename` with an `.ndjson` extension, so
+        readers expecting a single JSON document at `memory_filename` never get it.
+        """
+        try:
             os.makedirs(dir, exist_ok=True)
-            memory_file = os.path.join(dir, self.config.memory_filename)
-            with open(memory_file, "w", encoding="utf-8") as f:
-                json.dump(json_memories, f, indent=4, ensure_ascii=False)
+            memory_file = self._get_stream_file(dir)
+            # Stream into a partial file first so a crash never leaves a truncated dump.
+            # A leftover partial holds an older snapshot of the graph, so it is
+            # overwritten rather than resumed.
+            partial_file = f"{memory_file}.partial"
+            counts = export_graph_stream(self.graph_store, partial_file)
+            os.replace(partial_file, memory_file)
 
-            logger.info(f"Dumped {len(json_memories.get('nodes'))} memories to {memory_file}")
+            logger.info(f"Dumped {counts['nodes']} memories to {memory_file}")
 
         except Exception as e:
             logger.error(f"An error occurred while dumping memories: {e}")
             raise
 
+    def _get_stream_file(self, dir: str) -> str:
+        stem, _ = os.path.splitext(self.config.memory_filename)
+        return os.path.join(dir, f"{stem}.ndjson")
+
     def drop(self, keep_last_n: int = 30) -> None:
         """
         Export all memory data to a versioned backup dir and drop the Neo4j database.
@@ -362,6 +428,8 @@ class TreeTextMemory(BaseTextMemory):
             self._cleanup_old_backups(backup_root, keep_last_n)
 
             self.graph_store.drop_database()
+            bump_write_version(graph_scope(self.graph_store))
+            self.memory_manager.retention.invalidate()
             logger.info(f"Database '{self.graph_store.db_name}' dropped after backup.")
 
         except Exception as e:
@@ -1,3 +1,4 @@
+import hashlib
 import json
 import re
 
@@ -10,7 +11,12 @@ from memos.graph_dbs.neo4j import Neo4jGraphDB
 from memos.llms.base import BaseLLM
 from memos.log import get_logger
 from memos.memories.textual.item import TextualMemoryItem, TreeNodeTextualMemoryMetadata
+from memos.memories.textual.tree_text_memory.organize.relation_reason_detector import (
+    pack_candidates,
+    parse_batch_labels,
+)
 from memos.templates.tree_reorganize_prompts import (
+    MEMORY_RELATION_DETECTOR_BATCH_PROMPT,
     MEMORY_RELATION_DETECTOR_PROMPT,
     MEMORY_RELATION_RESOLVER_PROMPT,
 )
@@ -19,38 +25,111 @@ from memos.templates.tree_reorganize_prompts import (
 logger = get_logger(__name__)
 
 
+def _normalize_text(text: str) -> str:
+    return " ".join(text.lower().split())
+
+
+def content_hash(text: str) -> str:
+    """Hash of a memory's text, insensitive to case and whitespace."""
+    return hashlib.sha256(_normalize_text(text).encode("utf-8")).hexdigest()
+
+
+def simhash(text: str, shingle_size: int = 3) -> int:
+    """
+    64-bit SimHash over character shingles, so it also works for text without spaces (e.g. Chinese).
+    """
+    text = _normalize_text(text)
+    shingles = [text[i : i + shingle_size] for i in range(max(1, len(text) - shingle_size + 1))]
+    weights = [0] * 64
+    for shingle in shingles:
+        h = int.from_bytes(hashlib.blake2b(shingle.encode("utf-8"), digest_size=8).digest(), "big")
+        for bit in range(64):
+            weights[bit] += 1 if h >> bit & 1 else -1
+    return sum(1 << bit for bit, weight in enumerate(weights) if weight > 0)
+
+
 class NodeHandler:
     EMBEDDING_THRESHOLD: float = 0.8  # Threshold for embedding similarity to consider conflict
 
-    def __init__(self, graph_store: Neo4jGraphDB, llm: BaseLLM, embedder: BaseEmbedder):
+    def __init__(
+        self,
+        graph_store: Neo4jGraphDB,
+        llm: BaseLLM,
+        embedder: BaseEmbedder,
+        threshold: float | None = None,
+        merged_threshold: float | None = None,
+        simhash_max_distance: int | None = None,
+        batch_max_tokens: int | None = None,
+    ):
+        """
+        Args:
+            threshold: Candidates less similar than this are never compared.
+            merged_threshold: Candidates at least this similar are treated as redundant
+                without asking the LLM (None always asks).
+            simhash_max_distance: Candidates whose SimHash differs in at most this many
+                bits are treated as duplicates (None disables the lexical check).
+            batch_max_tokens: Judge all remaining candidates in one LLM call, split so
+                each call stays within this many tokens (None judges one pair per call).
+        """
         self.graph_store = graph_store
         self.llm = llm
         self.embedder = embedder
+        self.threshold = self.EMBEDDING_THRESHOLD if threshold is None else threshold
+        self.merged_threshold = merged_threshold
+        self.simhash_max_distance = simhash_max_distance
+        self.batch_max_tokens = batch_max_tokens
 
     def detect(self, memory, top_k: int = 5, scope=None):
+        """
+        Find existing memories that conflict with or duplicate `memory`.
+
+        Candidates come from a vector search above `threshold`. Exact (or, with
+        SimHash enabled, lexical) duplicates and candidates above `merged_threshold`
+        are decided without the LLM; only the band in between is judged by it.
+
+        Returns:
+            A list of [memory, existing memory, relation] triples, where relation is
+            "duplicate", "redundant" or "contradictory".
+        """
         # 1. Search for similar memories based on embedding
         embedding = memory.metadata.embedding
         embedding_candidates_info = self.graph_store.search_by_embedding(
-            embedding, top_k=top_k, scope=scope, threshold=self.EMBEDDING_THRESHOLD
+            embedding, top_k=top_k, scope=scope, status="activated", threshold=self.threshold
         )
         # 2. Filter based on similarity threshold
-        embedding_candidates_ids = [
-            info["id"] for info in embedding_candidates_info if info["id"] != memory.id
-        ]
-        # 3. Judge conflicts using LLM
-        embedding_candidates = self.graph_store.get_nodes(embedding_candidates_ids)
+        scores = {
+            info["id"]: info["score"]
+            for info in embedding_candidates_info
+            if info["id"] != memory.id and info["score"] >= self.threshold
+        }
+        embedding_candidates = self.graph_store.get_nodes(list(scores))
+        candidates = [TextualMemoryItem.from_dict(c) for c in embedding_candidates]
+
+        # 3. Short-circuit exact and near duplicates
+        duplicate = self._find_duplicate(memory, candidates)
+        if duplicate is not None:
+            logger.info(f'detected "{memory.memory}" <==DUPLICATE==> "{duplicate.memory}"')
+            return [[memory, duplicate, "duplicate"]]
+
+        # 4. Judge the ambiguous band using LLM
         detected_relationships = []
-        for embedding_candidate in embedding_candidates:
-            embedding_candidate = TextualMemoryItem.from_dict(embedding_candidate)
-            prompt = [
-                {
-                    "role": "user",
-                    "content": MEMORY_RELATION_DETECTOR_PROMPT.format(
-                        statement_1=memory.memory, statement_2=embedding_candidate.memory
-                    ),
-                }
-            ]
-            result = self.llm.generate(prompt).strip()
+        ambiguous = []
+        for embedding_candidate in candidates:
+            if (
+                self.merged_threshold is not None
+                and scores.get(embedding_candidate.id, 0.0) >= self.merged_threshold
+            ):
+                logger.info(
+                    f'detected "{memory.memory}" <==REDUNDANT==> "{embedding_candidate.memory}" '
+                    f"by similarity"
+                )
+                detected_relationships.append([memory, embedding_candidate, "redundant"])
+            else:
+                ambiguous.append(embedding_candidate)
+
+        for embedding_candidate, result in zip(
+            ambiguous, self._judge(memory, ambiguous), strict=True
+        ):
             if result == "contradictory":
                 logger.info(
                     f'detected "{memory.memory}" <==CONFLICT==> "{embedding_candidate.memory}"'
@@ -67,6 +146,71 @@ class NodeHandler:
                 pass
         return detected_relationships
 
+    def _judge(self, memory: TextualMemoryItem, candidates: list[TextualMemoryItem]) -> list[str]:
+        """LLM relation label of each candidate to `memory`."""
+        if self.batch_max_tokens is None:
+            return [self._judge_pair(memory, candidate) for candidate in candidates]
+        results = []
+        for batch in pack_candidates([c.memory for c in candidates], self.batch_max_tokens):
+            results.extend(self._judge_batch(memory, [candidates[i] for i in batch]))
+        return results
+
+    def _judge_pair(self, memory: TextualMemoryItem, candidate: TextualMemoryItem) -> str:
+        prompt = [
+            {
+                "role": "user",
+                "content": MEMORY_RELATION_DETECTOR_PROMPT.format(
+                    statement_1=memory.memory, statement_2=candidate.memory
+                ),
+            }
+        ]
+        return self.llm.generate(prompt).strip()
+
+    def _judge_batch(
+        self, memory: TextualMemoryItem, candidates: list[TextualMemoryItem]
+    ) -> list[str]:
+        """
+        Judge several candidates in one LLM call, falling back to pairwise calls if the
+        answer cannot be parsed and for any candidate it leaves out.
+        """
+        if len(candidates) == 1:
+            return [self._judge_pair(memory, candidates[0])]
+
+        joined = "\n".join(f'{i}. "{c.memory}"' for i, c in enumerate(candidates))
+        content = MEMORY_RELATION_DETECTOR_BATCH_PROMPT.replace(
+            "{statement}", memory.memory
+        ).replace("{candidates}", joined)
+        response = self.llm.generate([{"role": "user", "content": content}]).strip()
+        try:
+            response_json = json.loads(response[response.find("{") : response.rfind("}") + 1])
+        except json.JSONDecodeError:
+            response_json = None
+        labels = parse_batch_labels(response_json, len(candidates), "label")
+        if labels is None:
+            logger.warning(f"Failed to parse batched relation answer: {response}")
+            return [self._judge_pair(memory, candidate) for candidate in candidates]
+        return [
+            labels[i].strip().lower() if i in labels else self._judge_pair(memory, candidate)
+            for i, candidate in enumerate(candidates)
+        ]
+
+    def _find_duplicate(
+        self, memory: TextualMemoryItem, candidates: list[TextualMemoryItem]
+    ) -> TextualMemoryItem | None:
+        memory_hash = content_hash(memory.memory)
+        for candidate in candidates:
+            if content_hash(candidate.memory) == memory_hash:
+                return candidate
+
+        if self.simhash_max_distance is None:
+            return None
+        memory_simhash = simhash(memory.memory)
+        for candidate in candidates:
+            distance = (memory_simhash ^ simhash(candidate.memory)).bit_count()
+            if distance <= self.simhash_max_distance:
+                return candidate
+        return None
+
     def resolve(self, memory_a: TextualMemoryItem, memory_b: TextualMemoryItem, relation) -> None:
         """
         Resolve detected conflicts between two memory items using LLM fusion.
@@ -77,6 +221,9 @@ class NodeHandler:
         Returns:
             A fused TextualMemoryItem representing the resolved memory.
         """
+        if relation == "duplicate":
+            self._resolve_duplicate(memory_a, memory_b)
+            return
 
         # ———————————— 1. LLM generate fused memory ————————————
         metadata_for_resolve = ["key", "background", "confidence", "updated_at"]
@@ -130,6 +277,22 @@ class NodeHandler:
             f"Delete older memory {older_mem.id}: <{older_mem.memory}> due to conflict with {newer_mem.id}: <{newer_mem.memory}>"
         )
 
+    def _resolve_duplicate(self, duplicate: TextualMemoryItem, original: TextualMemoryItem):
+        """
+        Archive `duplicate` into `original` without fusing their text.
+        """
+        for edge in self.graph_store.get_edges(duplicate.id, type="ANY", direction="ANY"):
+            new_from = original.id if edge["from"] == duplicate.id else edge["from"]
+            new_to = original.id if edge["to"] == duplicate.id else edge["to"]
+            if new_from == new_to:
+                continue
+            if not self.graph_store.edge_exists(new_from, new_to, edge["type"], direction="ANY"):
+                self.graph_store.add_edge(new_from, new_to, edge["type"])
+
+        self.graph_store.update_node(duplicate.id, {"status": "archived"})
+        self.graph_store.add_edge(duplicate.id, original.id, type="MERGED_TO")
+        logger.debug(f"Archive duplicate {duplicate.id} into {original.id}.")
+
     def _resolve_in_graph(
         self,
         conflict_a: TextualMemoryItem,
@@ -0,0 +1,183 @@
+import threading
+
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from memos.configs.memory import IncrementalClusteringConfig
+from memos.graph_dbs.item import GraphDBNode
+from memos.log import get_logger
+
+
+logger = get_logger(__name__)
+
+
+def _unit(vector) -> np.ndarray:
+    v = np.asarray(vector, dtype=np.float32)
+    return v / max(float(np.linalg.norm(v)), 1e-10)
+
+
+@dataclass
+class TopicCluster:
+    """A leaf topic node and the memories linked under it."""
+
+    parent_id: str
+    centroid_sum: np.ndarray
+    member_ids: set[str] = field(default_factory=set)
+    new_ids: list[str] = field(default_factory=list)
+
+    def add(self, node_id: str, unit_embedding: np.ndarray) -> None:
+        self.member_ids.add(node_id)
+        self.centroid_sum = self.centroid_sum + unit_embedding
+        self.new_ids.append(node_id)
+
+
+class IncrementalClusterIndex:
+    """
+    Per-scope (memory_type) index of leaf topic clusters and their centroids.
+
+    Topic nodes written by the reorganizer are the persistent state: a scope is
+    seeded once from its leaf topics and their children, then new memories are
+    assigned to the nearest centroid as they arrive. Clusters that received
+    members are reported as dirty so only they are re-summarized, and memories
+    that fit no cluster collect in a pending pool that is clustered from scratch
+    each time enough new memories have joined it.
+    """
+
+    def __init__(self, config: IncrementalClusteringConfig):
+        self.config = config
+        self._lock = threading.Lock()
+        self._clusters: dict[str, dict[str, TopicCluster]] = {}
+        self._pending: dict[str, dict[str, GraphDBNode]] = {}
+        # Memories that joined the pending pool since it was last handed out
+        self._pending_new: dict[str, int] = {}
+
+    def is_loaded(self, scope: str) -> bool:
+        with self._lock:
+            return scope in self._clusters
+
+    def load(
+        self,
+        scope: str,
+        clusters: list[tuple[str, list[str], list[list[float]]]],
+        pending: list[GraphDBNode],
+    ) -> None:
+        """
+        Seed a scope from the graph.
+
+        Args:
+            scope: Memory type the clusters belong to.
+            clusters: (topic id, child ids, child embeddings) per leaf topic.
+            pending: Memories not linked under any topic yet.
+        """
+        with self._lock:
+            self._clusters[scope] = {
+                parent_id: TopicCluster(
+                    parent_id=parent_id,
+                    centroid_sum=np.sum([_unit(e) for e in embeddings], axis=0),
+                    member_ids=set(member_ids),
+                )
+                for parent_id, member_ids, embeddings in clusters
+                if embeddings
+            }
+            self._pending[scope] = {node.id: node for node in pending}
+            self._pending_new[scope] = len(pending)
+            loaded = len(self._clusters[scope])
+        logger.info(
+            f"[IncrementalCluster] Loaded {loaded} clusters and "
+            f"{len(pending)} pending memories for {scope}"
+        )
+
+    def reset(self, scope: str | None = None) -> None:
+        """Forget the state of `scope` (or all scopes); it is re-seeded on next use."""
+        with self._lock:
+            for state in (self._clusters, self._pending, self._pending_new):
+                if scope is None:
+                    state.clear()
+                else:
+                    state.pop(scope, None)
+
+    def assign(self, scope: str, node: GraphDBNode) -> str | None:
+        """
+        Add a new memory to its nearest cluster, or to the pending pool.
+
+        Returns:
+            The id of the topic the memory was assigned to, or None.
+        """
+        with self._lock:
+            if scope not in self._clusters:
+                # Not seeded yet: the memory is picked up as a candidate on load
+                return None
+            embedding = node.metadata.embedding
+            clusters = list(self._clusters[scope].values())
+            if embedding and clusters:
+                vector = _unit(embedding)
+                centroids = np.stack([_unit(c.centroid_sum) for c in clusters])
+                sims = centroids @ vector
+                best = int(np.argmax(sims))
+                if sims[best] >= self.config.assign_threshold:
+                    clusters[best].add(node.id, vector)
+                    return clusters[best].parent_id
+            self._pending[scope][node.id] = node
+            self._pending_new[scope] += 1
+            return None
+
+    def dirty_clusters(self, scope: str) -> list[tuple[str, list[str], list[str]]]:
+        """(topic id, new member ids, all member ids) of clusters that gained members."""
+        with self._lock:
+            return [
+                (c.parent_id, list(c.new_ids), list(c.member_ids))
+                for c in self._clusters.get(scope, {}).values()
+                if c.new_ids
+            ]
+
+    def mark_clean(self, scope: str, parent_id: str, node_ids: list[str]) -> None:
+        with self._lock:
+            cluster = self._clusters.get(scope, {}).get(parent_id)
+            if cluster is not None:
+                done = set(node_ids)
+                cluster.new_ids = [i for i in cluster.new_ids if i not in done]
+
+    def take_pending(self, scope: str, min_size: int) -> list[GraphDBNode]:
+        """
+        Pending memories to cluster, once at least `min_size` (and at least one) new
+        memories joined the pool since it was last handed out.
+
+        Memories stay pending until `add_cluster` claims them; leftovers that formed no
+        cluster are only re-partitioned after that many more have arrived.
+        """
+        with self._lock:
+            pending = self._pending.get(scope, {})
+            new = self._pending_new.get(scope, 0)
+            if new == 0 or new < min_size or len(pending) < min_size:
+                return []
+            self._pending_new[scope] = 0
+            return list(pending.values())
+
+    def add_cluster(self, scope: str, parent_id: str, nodes: list[GraphDBNode]) -> None:
+        """Track a newly created topic and remove its members from the pending pool."""
+        embeddings = [_unit(n.metadata.embedding) for n in nodes if n.metadata.embedding]
+        with self._lock:
+            pending = self._pending.setdefault(scope, {})
+            for node in nodes:
+                pending.pop(node.id, None)
+            if embeddings:
+                self._clusters.setdefault(scope, {})[parent_id] = TopicCluster(
+                    parent_id=parent_id,
+                    centroid_sum=np.sum(embeddings, axis=0),
+                    member_ids={n.id for n in nodes},
+                )
+
+    def remove_cluster(self, scope: str, parent_id: str) -> None:
+        """Stop tracking a topic, e.g. after it was split into sub-topics."""
+        with self._lock:
+            self._clusters.get(scope, {}).pop(parent_id, None)
+
+    def requeue(self, scope: str, nodes: list[GraphDBNode]) -> None:
+        """Return memories to the pending pool."""
+        with self._lock:
+            if scope not in self._pending:
+                return
+            for node in nodes:
+                self._pending[scope][node.id] = node
+            self._pending_new[scope] += len(nodes)
@@ -1,10 +1,13 @@
-import traceback
 import uuid
 
-from concurrent.futures import as_completed
+from collections import Counter
 from datetime import datetime
 
-from memos.context.context import ContextThreadPoolExecutor
+from memos.configs.memory import (
+    IncrementalClusteringConfig,
+    NodeDedupConfig,
+    RelationDetectionConfig,
+)
 from memos.embedders.factory import OllamaEmbedder
 from memos.graph_dbs.neo4j import Neo4jGraphDB
 from memos.llms.factory import AzureLLM, OllamaLLM, OpenAILLM
@@ -14,6 +17,11 @@ from memos.memories.textual.tree_text_memory.organize.reorganizer import (
     GraphStructureReorganizer,
     QueueMessage,
 )
+from memos.memories.textual.tree_text_memory.organize.retention import MemoryRetention
+from memos.memories.textual.tree_text_memory.retrieve.search_cache import (
+    bump_write_version,
+    graph_scope,
+)
 
 
 logger = get_logger(__name__)
@@ -29,6 +37,9 @@ class MemoryManager:
         threshold: float | None = 0.80,
         merged_threshold: float | None = 0.92,
         is_reorganize: bool = False,
+        incremental_clustering: IncrementalClusteringConfig | None = None,
+        dedup: NodeDedupConfig | None = None,
+        relation_detection: RelationDetectionConfig | None = None,
     ):
         self.graph_store = graph_store
         self.embedder = embedder
@@ -44,146 +55,124 @@ class MemoryManager:
                 "LongTermMemory": 1500,
                 "UserMemory": 480,
             }
+        self.retention = MemoryRetention(graph_store, self.memory_size)
         self._threshold = threshold
         self.is_reorganize = is_reorganize
         self.reorganizer = GraphStructureReorganizer(
-            graph_store, llm, embedder, is_reorganize=is_reorganize
+            graph_store,
+            llm,
+            embedder,
+            is_reorganize=is_reorganize,
+            incremental_clustering=incremental_clustering,
+            dedup=dedup,
+            relation_detection=relation_detection,
+            retention=self.retention,
         )
         self._merged_threshold = merged_threshold
 
     def add(self, memories: list[TextualMemoryItem]) -> list[str]:
         """
-        Add new memories in parallel to different memory types (WorkingMemory, LongTermMemory, UserMemory).
-        """
-        added_ids: list[str] = []
-
-        with ContextThreadPoolExecutor(max_workers=8) as executor:
-            futures = {executor.submit(self._process_memory, m): m for m in memories}
-            for future in as_completed(futures, timeout=60):
-                try:
-                    ids = future.result()
-                    added_ids.extend(ids)
-                except Exception as e:
-                    logger.exception("Memory processing error: ", exc_info=e)
+        Add new memories to different memory types (WorkingMemory, LongTermMemory, UserMemory)
+        with a single bulk write.
 
-        try:
-            self.graph_store.remove_oldest_memory(
-                memory_type="WorkingMemory", keep_latest=self.memory_size["WorkingMemory"]
-            )
-        except Exception:
-            logger.warning(f"Remove WorkingMemory error: {traceback.format_exc()}")
+        If the bulk write fails, the nodes are retried one by one so a single bad node
+        cannot lose the rest; only the nodes actually written are returned and reported.
+        """
+        nodes: list[dict] = []
+        for memory in memories:
+            try:
+                nodes.extend(self._process_memory(memory))
+            except Exception as e:
+                logger.exception("Memory processing error: ", exc_info=e)
 
         try:
-            self.graph_store.remove_oldest_memory(
-                memory_type="LongTermMemory", keep_latest=self.memory_size["LongTermMemory"]
+            self.graph_store.add_nodes(nodes)
+            written = nodes
+        except Exception as e:
+            logger.warning(f"Bulk write of {len(nodes)} memories failed, retrying one by one: {e}")
+            written = self._add_nodes_one_by_one(nodes)
+
+        if written:
+            bump_write_version(graph_scope(self.graph_store))
+            for node in written:
+                if node["metadata"].get("memory_type") in ["LongTermMemory", "UserMemory"]:
+                    self.reorganizer.add_message(QueueMessage(op="add", after_node=[node["id"]]))
+            # Scopes are only pruned once they go over capacity, off the add path
+            self.retention.record_added(
+                Counter(node["metadata"].get("memory_type") for node in written)
             )
-        except Exception:
-            logger.warning(f"Remove LongTermMemory error: {traceback.format_exc()}")
+        return [node["id"] for node in written]
 
-        try:
-            self.graph_store.remove_oldest_memory(
-                memory_type="UserMemory", keep_latest=self.memory_size["UserMemory"]
-            )
-        except Exception:
-            logger.warning(f"Remove UserMemory error: {traceback.format_exc()}")
+    def _add_nodes_one_by_one(self, nodes: list[dict]) -> list[dict]:
+        """
+        Write nodes individually, returning those that were written.
 
-        self._refresh_memory_size()
-        return added_ids
+        Nodes are merged by id, so ones already committed by a partially failed bulk
+        write are simply written again.
+        """
+        written = []
+        for node in nodes:
+            try:
+                self.graph_store.add_node(node["id"], node["memory"], node["metadata"])
+                written.append(node)
+            except Exception as e:
+                logger.exception(f"Memory write error for node {node['id']}: ", exc_info=e)
+        return written
 
     def replace_working_memory(self, memories: list[TextualMemoryItem]) -> None:
         """
         Replace WorkingMemory
         """
         working_memory_top_k = memories[: self.memory_size["WorkingMemory"]]
-        with ContextThreadPoolExecutor(max_workers=8) as executor:
-            futures = [
-                executor.submit(self._add_memory_to_db, memory, "WorkingMemory")
-                for memory in working_memory_top_k
-            ]
-            for future in as_completed(futures, timeout=60):
-                try:
-                    future.result()
-                except Exception as e:
-                    logger.exception("Memory processing error: ", exc_info=e)
-
-        self.graph_store.remove_oldest_memory(
-            memory_type="WorkingMemory", keep_latest=self.memory_size["WorkingMemory"]
-        )
-        self._refresh_memory_size()
+        try:
+            self.graph_store.add_nodes(
+                [self._build_working_memory_node(memory) for memory in working_memory_top_k]
+            )
+        except Exception as e:
+            logger.exception("Memory processing error: ", exc_info=e)
+
+        self.retention.prune("WorkingMemory")
+        bump_write_version(graph_scope(self.graph_store))
 
     def get_current_memory_size(self) -> dict[str, int]:
         """
-        Return the cached memory type counts.
+        Return the tracked memory type counts.
         """
-        self._refresh_memory_size()
+        self.current_memory_size = self.retention.counts()
         return self.current_memory_size
 
-    def _refresh_memory_size(self) -> None:
+    def _process_memory(self, memory: TextualMemoryItem) -> list[dict]:
         """
-        Query the latest counts from the graph store and update internal state.
+        Build the node records for one memory: a WorkingMemory copy, plus a
+        LongTermMemory / UserMemory node when applicable.
         """
-        results = self.graph_store.get_grouped_counts(group_fields=["memory_type"])
-        self.current_memory_size = {record["memory_type"]: record["count"] for record in results}
-        logger.info(f"[MemoryManager] Refreshed memory sizes: {self.current_memory_size}")
+        nodes = [self._build_working_memory_node(memory)]
 
-    def _process_memory(self, memory: TextualMemoryItem):
-        """
-        Process and add memory to different memory types (WorkingMemory, LongTermMemory, UserMemory).
-        This method runs asynchronously to process each memory item.
-        """
-        ids = []
-
-        # Add to WorkingMemory
-        working_id = self._add_memory_to_db(memory, "WorkingMemory")
-        ids.append(working_id)
-
-        # Add to LongTermMemory and UserMemory
         if memory.metadata.memory_type in ["LongTermMemory", "UserMemory"]:
-            added_id = self._add_to_graph_memory(
-                memory=memory,
-                memory_type=memory.metadata.memory_type,
-            )
-            ids.append(added_id)
+            nodes.append(self._build_graph_memory_node(memory))
 
-        return ids
+        return nodes
 
-    def _add_memory_to_db(self, memory: TextualMemoryItem, memory_type: str) -> str:
+    def _build_working_memory_node(self, memory: TextualMemoryItem) -> dict:
         """
-        Add a single memory item to the graph store, with FIFO logic for WorkingMemory.
+        Build a WorkingMemory copy of a memory item as a graph node record.
         """
-        metadata = memory.metadata.model_copy(update={"memory_type": memory_type}).model_dump(
+        metadata = memory.metadata.model_copy(update={"memory_type": "WorkingMemory"}).model_dump(
             exclude_none=True
         )
         metadata["updated_at"] = datetime.now().isoformat()
         working_memory = TextualMemoryItem(memory=memory.memory, metadata=metadata)
+        return {"id": working_memory.id, "memory": working_memory.memory, "metadata": metadata}
 
-        # Insert node into graph
-        self.graph_store.add_node(working_memory.id, working_memory.memory, metadata)
-        return working_memory.id
-
-    def _add_to_graph_memory(self, memory: TextualMemoryItem, memory_type: str):
+    def _build_graph_memory_node(self, memory: TextualMemoryItem) -> dict:
         """
-        Generalized method to add memory to a graph-based memory type (e.g., LongTermMemory, UserMemory).
-
-        Parameters:
-        - memory: memory item to insert
-        - memory_type: "LongTermMemory" | "UserMemory"
-        - similarity_threshold: deduplication threshold
-        - topic_summary_prefix: summary node id prefix if applicable
-        - enable_summary_link: whether to auto-link to a summary node
+        Build a graph-based memory node record (LongTermMemory / UserMemory) with a fresh id.
         """
-        node_id = str(uuid.uuid4())
-        # Step 2: Add new node to graph
-        self.graph_store.add_node(
-            node_id, memory.memory, memory.metadata.model_dump(exclude_none=True)
-        )
-        self.reorganizer.add_message(
-            QueueMessage(
-                op="add",
-                after_node=[node_id],
-            )
-        )
-        return node_id
+        return {
+            "id": str(uuid.uuid4()),
+            "memory": memory.memory,
+            "metadata": memory.metadata.model_dump(exclude_none=True),
+        }
 
     def _inherit_edges(self, from_id: str, to_id: str) -> None:
         """
@@ -274,6 +263,7 @@ class MemoryManager:
 
     def close(self):
         self.wait_reorganizer()
+        self.retention.wait()
         self.reorganizer.stop()
 
     def __del__(self):
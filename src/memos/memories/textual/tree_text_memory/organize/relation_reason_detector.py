@@ -1,6 +1,9 @@
 import json
+import threading
 import traceback
 
+from collections import OrderedDict
+
 from memos.embedders.factory import OllamaEmbedder
 from memos.graph_dbs.item import GraphDBNode
 from memos.graph_dbs.neo4j import Neo4jGraphDB
@@ -10,6 +13,7 @@ from memos.memories.textual.item import TreeNodeTextualMemoryMetadata
 from memos.templates.tree_reorganize_prompts import (
     AGGREGATE_PROMPT,
     INFER_FACT_PROMPT,
+    PAIRWISE_RELATION_BATCH_PROMPT,
     PAIRWISE_RELATION_PROMPT,
 )
 
@@ -17,11 +21,74 @@ from memos.templates.tree_reorganize_prompts import (
 logger = get_logger(__name__)
 
 
+def pack_candidates(texts: list[str], max_tokens: int) -> list[list[int]]:
+    """
+    Group candidate indices into consecutive batches whose text fits `max_tokens`.
+
+    A candidate longer than the budget gets a batch of its own.
+    """
+    batches, current, current_tokens = [], [], 0
+    for i, text in enumerate(texts):
+        # Rough token estimate: ~4 bytes of UTF-8 per token
+        tokens = len(text.encode("utf-8")) // 4 + 1
+        if current and current_tokens + tokens > max_tokens:
+            batches.append(current)
+            current, current_tokens = [], 0
+        current.append(i)
+        current_tokens += tokens
+    if current:
+        batches.append(current)
+    return batches
+
+
+def parse_batch_labels(response_json: dict, count: int, field: str) -> dict[int, str] | None:
+    """
+    Read `{"relations": [{"index": i, field: label}]}` from a batched judgement.
+
+    Returns:
+        Label per candidate index, or None if the response is not in the expected shape.
+    """
+    if not isinstance(response_json, dict) or not isinstance(response_json.get("relations"), list):
+        return None
+    labels = {}
+    for item in response_json["relations"]:
+        if not isinstance(item, dict):
+            continue
+        try:
+            index = int(item.get("index"))
+        except (TypeError, ValueError):
+            continue
+        if 0 <= index < count and isinstance(item.get(field), str):
+            labels[index] = item[field]
+    return labels
+
+
 class RelationAndReasoningDetector:
-    def __init__(self, graph_store: Neo4jGraphDB, llm: BaseLLM, embedder: OllamaEmbedder):
+    def __init__(
+        self,
+        graph_store: Neo4jGraphDB,
+        llm: BaseLLM,
+        embedder: OllamaEmbedder,
+        batch_max_tokens: int | None = None,
+        cache_size: int = 0,
+        detect_pairwise: bool = False,
+    ):
+        """
+        Args:
+            batch_max_tokens: Judge a node against all its candidates in one LLM call,
+                splitting the candidates so each call stays within this many tokens
+                (None judges one pair per call).
+            cache_size: Maximum number of judged pairs remembered across passes; 0 disables.
+            detect_pairwise: Judge pairwise relations with tag neighbors in `process_node`.
+        """
         self.graph_store = graph_store
         self.llm = llm
         self.embedder = embedder
+        self.batch_max_tokens = batch_max_tokens
+        self.cache_size = cache_size
+        self.detect_pairwise = detect_pairwise
+        self._judged: OrderedDict[tuple, str] = OrderedDict()
+        self._judged_lock = threading.Lock()
 
     def process_node(self, node: GraphDBNode, exclude_ids: list[str], top_k: int = 5):
         """
@@ -46,19 +113,18 @@ class RelationAndReasoningDetector:
                     "sequence_links": [],
                     "aggregate_nodes": [],
                 }
-            """
-            nearest = self.graph_store.get_neighbors_by_tag(
-                tags=node.metadata.tags,
-                exclude_ids=exclude_ids,
-                top_k=top_k,
-                min_overlap=2,
-            )
-            nearest = [GraphDBNode(**cand_data) for cand_data in nearest]
+            if self.detect_pairwise:
+                nearest = self.graph_store.get_neighbors_by_tag(
+                    tags=node.metadata.tags,
+                    exclude_ids=exclude_ids,
+                    top_k=top_k,
+                    min_overlap=2,
+                )
+                nearest = [GraphDBNode(**cand_data) for cand_data in nearest]
 
-            # 1) Pairwise relations (including CAUSE/CONDITION/CONFLICT)
-            pairwise = self._detect_pairwise_causal_condition_relations(node, nearest)
-            results["relations"].extend(pairwise["relations"])
-            """
+                # 1) Pairwise relations (including CAUSE/CONDITION/CONFLICT)
+                pairwise = self._detect_pairwise_causal_condition_relations(node, nearest)
+                results["relations"].extend(pairwise["relations"])
 
             """
             # 2) Inferred nodes (from causal/condition)
@@ -94,16 +160,29 @@ class RelationAndReasoningDetector:
         - CONDITION
         - RELATE
         - CONFLICT
+
+        Pairs judged on an earlier pass are served from the cache.
         """
         results = {"relations": []}
 
+        relation_types = {}
+        to_judge = []
         for candidate in nearest_nodes:
-            prompt = PAIRWISE_RELATION_PROMPT.format(
-                node1=node.memory,
-                node2=candidate.memory,
-            )
-            response_text = self._call_llm(prompt)
-            relation_type = self._parse_relation_result(response_text)
+            cached = self._get_judged(node, candidate)
+            if cached is None:
+                to_judge.append(candidate)
+            else:
+                relation_types[candidate.id] = cached
+
+        if self.batch_max_tokens is None:
+            for candidate in to_judge:
+                relation_types[candidate.id] = self._judge_pair(node, candidate)
+        else:
+            for batch in pack_candidates([c.memory for c in to_judge], self.batch_max_tokens):
+                relation_types.update(self._judge_batch(node, [to_judge[i] for i in batch]))
+
+        for candidate in nearest_nodes:
+            relation_type = relation_types.get(candidate.id, "NONE")
             if relation_type != "NONE":
                 results["relations"].append(
                     {
@@ -115,6 +194,70 @@ class RelationAndReasoningDetector:
 
         return results
 
+    def _judge_pair(self, node: GraphDBNode, candidate: GraphDBNode) -> str:
+        prompt = PAIRWISE_RELATION_PROMPT.format(
+            node1=node.memory,
+            node2=candidate.memory,
+        )
+        response_text = self._call_llm(prompt)
+        relation_type = self._parse_relation_result(response_text)
+        if response_text:
+            self._put_judged(node, candidate, relation_type)
+        return relation_type
+
+    def _judge_batch(self, node: GraphDBNode, candidates: list[GraphDBNode]) -> dict[str, str]:
+        """
+        Judge `node` against several candidates in one LLM call.
+
+        Falls back to pairwise calls if the answer cannot be parsed, and for any
+        candidate the answer leaves out.
+        """
+        if len(candidates) == 1:
+            return {candidates[0].id: self._judge_pair(node, candidates[0])}
+
+        joined = "\n".join(f'{i}. "{c.memory}"' for i, c in enumerate(candidates))
+        prompt = PAIRWISE_RELATION_BATCH_PROMPT.replace("{node}", node.memory).replace(
+            "{candidates}", joined
+        )
+        response_json = self._parse_json_result(self._call_llm(prompt))
+        labels = parse_batch_labels(response_json, len(candidates), "relation")
+        if labels is None:
+            logger.warning("[RelationDetector] Unparsable batch answer, judging pairwise.")
+            return {c.id: self._judge_pair(node, c) for c in candidates}
+
+        relation_types = {}
+        for i, candidate in enumerate(candidates):
+            if i not in labels:
+                relation_types[candidate.id] = self._judge_pair(node, candidate)
+                continue
+            relation_type = self._parse_relation_result(labels[i])
+            self._put_judged(node, candidate, relation_type)
+            relation_types[candidate.id] = relation_type
+        return relation_types
+
+    @staticmethod
+    def _pair_key(node: GraphDBNode, candidate: GraphDBNode) -> tuple:
+        # Include the texts so an updated memory is judged again
+        return node.id, candidate.id, hash(node.memory), hash(candidate.memory)
+
+    def _get_judged(self, node: GraphDBNode, candidate: GraphDBNode) -> str | None:
+        if self.cache_size <= 0:
+            return None
+        key = self._pair_key(node, candidate)
+        with self._judged_lock:
+            relation_type = self._judged.get(key)
+            if relation_type is not None:
+                self._judged.move_to_end(key)
+            return relation_type
+
+    def _put_judged(self, node: GraphDBNode, candidate: GraphDBNode, relation_type: str) -> None:
+        if self.cache_size <= 0:
+            return
+        with self._judged_lock:
+            self._judged[self._pair_key(node, candidate)] = relation_type
+            while len(self._judged) > self.cache_size:
+                self._judged.popitem(last=False)
+
     def _infer_fact_nodes_from_relations(self, pairwise_results: dict):
         inferred_nodes = []
         for rel in pairwise_results["relations"]:
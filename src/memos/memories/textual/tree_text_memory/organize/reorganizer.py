@@ -5,11 +5,17 @@ import traceback
 
 from collections import defaultdict
 from concurrent.futures import as_completed
+from datetime import datetime
 from queue import PriorityQueue
 from typing import Literal
 
 import numpy as np
 
+from memos.configs.memory import (
+    IncrementalClusteringConfig,
+    NodeDedupConfig,
+    RelationDetectionConfig,
+)
 from memos.context.context import ContextThreadPoolExecutor
 from memos.dependency import require_python_package
 from memos.embedders.factory import OllamaEmbedder
@@ -19,9 +25,17 @@ from memos.llms.base import BaseLLM
 from memos.log import get_logger
 from memos.memories.textual.item import SourceMessage, TreeNodeTextualMemoryMetadata
 from memos.memories.textual.tree_text_memory.organize.handler import NodeHandler
+from memos.memories.textual.tree_text_memory.organize.incremental_cluster import (
+    IncrementalClusterIndex,
+)
 from memos.memories.textual.tree_text_memory.organize.relation_reason_detector import (
     RelationAndReasoningDetector,
 )
+from memos.memories.textual.tree_text_memory.organize.retention import MemoryRetention
+from memos.memories.textual.tree_text_memory.retrieve.search_cache import (
+    bump_write_version,
+    graph_scope,
+)
 from memos.templates.tree_reorganize_prompts import LOCAL_SUBCLUSTER_PROMPT, REORGANIZE_PROMPT
 
 
@@ -79,16 +93,42 @@ def extract_first_to_last_brace(text: str):
 
 class GraphStructureReorganizer:
     def __init__(
-        self, graph_store: Neo4jGraphDB, llm: BaseLLM, embedder: OllamaEmbedder, is_reorganize: bool
+        self,
+        graph_store: Neo4jGraphDB,
+        llm: BaseLLM,
+        embedder: OllamaEmbedder,
+        is_reorganize: bool,
+        incremental_clustering: IncrementalClusteringConfig | None = None,
+        dedup: NodeDedupConfig | None = None,
+        relation_detection: RelationDetectionConfig | None = None,
+        retention: MemoryRetention | None = None,
     ):
         self.queue = PriorityQueue()  # Min-heap
         self.graph_store = graph_store
+        self.retention = retention
         self.llm = llm
         self.embedder = embedder
+        batch_max_tokens = relation_detection.batch_max_tokens if relation_detection else None
         self.relation_detector = RelationAndReasoningDetector(
-            self.graph_store, self.llm, self.embedder
+            self.graph_store,
+            self.llm,
+            self.embedder,
+            batch_max_tokens=batch_max_tokens,
+            cache_size=relation_detection.cache_size if relation_detection else 0,
+            detect_pairwise=relation_detection.detect_pairwise if relation_detection else False,
+        )
+        self.resolver = NodeHandler(
+            graph_store=graph_store,
+            llm=llm,
+            embedder=embedder,
+            batch_max_tokens=batch_max_tokens,
+            **(dedup.model_dump() if dedup is not None else {}),
+        )
+        self.cluster_index = (
+            IncrementalClusterIndex(incremental_clustering)
+            if incremental_clustering is not None
+            else None
         )
-        self.resolver = NodeHandler(graph_store=graph_store, llm=llm, embedder=embedder)
 
         self.is_reorganize = is_reorganize
         self._reorganize_needed = True
@@ -197,6 +237,13 @@ class GraphStructureReorganizer:
         if detected_relationships:
             for added_node, existing_node, relation in detected_relationships:
                 self.resolver.resolve(added_node, existing_node, relation)
+            bump_write_version(graph_scope(self.graph_store))
+            if self.retention is not None:
+                # Merges add and remove nodes behind the manager's back
+                self.retention.invalidate()
+        elif self.cluster_index is not None:
+            # Merged nodes inherit their sources' PARENT edges; only untouched ones need a topic
+            self.cluster_index.assign(added_node.metadata.memory_type, added_node)
 
         self._reorganize_needed = True
 
@@ -216,6 +263,9 @@ class GraphStructureReorganizer:
         1. Weakly partition nodes into clusters.
         2. Summarize each cluster.
         3. Create parent nodes and build local PARENT trees.
+
+        With incremental clustering enabled, existing topics are kept and only the
+        clusters that changed since the last run are touched (see `_optimize_incremental`).
         """
         # --- Total time watch dog: check functions ---
         start_ts = time.time()
@@ -242,6 +292,11 @@ class GraphStructureReorganizer:
             logger.debug(
                 f"[GraphStructureReorganize] 🔍 Starting structure optimization for scope: {scope}"
             )
+            if self.cluster_index is not None:
+                self._optimize_incremental(
+                    scope, local_tree_threshold, min_cluster_size, min_group_size, _check_deadline
+                )
+                return
 
             logger.debug(
                 f"[GraphStructureReorganize] Num of scope in self.graph_store is"
@@ -296,6 +351,7 @@ class GraphStructureReorganizer:
                         logger.warning(
                             f"[GraphStructureReorganize] Cluster processing failed: {e}, trace: {traceback.format_exc()}"
                         )
+            bump_write_version(graph_scope(self.graph_store))
             logger.info("[GraphStructure Reorganize] Structure optimization finished.")
 
         finally:
@@ -308,9 +364,15 @@ class GraphStructureReorganizer:
         scope: str,
         local_tree_threshold: int,
         min_cluster_size: int,
-    ):
+    ) -> list[tuple[GraphDBNode, list[GraphDBNode]]]:
+        """
+        Summarize a partition into topic nodes and detect relations among its members.
+
+        Returns:
+            The leaf topic nodes created, each with the memories linked under it.
+        """
         if len(cluster_nodes) <= min_cluster_size:
-            return
+            return []
 
         # Large cluster ➜ local sub-clustering
         sub_clusters = self._local_subcluster(cluster_nodes)
@@ -322,18 +384,23 @@ class GraphStructureReorganizer:
             sub_parent_node = self._summarize_cluster(sub_nodes, scope)
             self._create_parent_node(sub_parent_node)
             self._link_cluster_nodes(sub_parent_node, sub_nodes)
-            sub_parents.append(sub_parent_node)
+            sub_parents.append((sub_parent_node, sub_nodes))
 
         if sub_parents and len(sub_parents) >= min_cluster_size:
             cluster_parent_node = self._summarize_cluster(cluster_nodes, scope)
             self._create_parent_node(cluster_parent_node)
-            for sub_parent in sub_parents:
+            for sub_parent, _ in sub_parents:
                 self.graph_store.add_edge(cluster_parent_node.id, sub_parent.id, "PARENT")
 
         logger.info("Adding relations/reasons")
-        nodes_to_check = cluster_nodes
-        exclude_ids = [n.id for n in nodes_to_check]
+        self._detect_relations(cluster_nodes, [n.id for n in cluster_nodes])
+        logger.info("[Reorganizer] Cluster relation/reasoning done.")
+        return sub_parents
 
+    def _detect_relations(self, nodes_to_check: list[GraphDBNode], exclude_ids: list[str]) -> None:
+        """
+        Run relation/reasoning detection for `nodes_to_check` and write the results.
+        """
         with ContextThreadPoolExecutor(max_workers=4) as executor:
             futures = []
             for node in nodes_to_check:
@@ -365,6 +432,7 @@ class GraphStructureReorganizer:
                         inf_node.memory,
                         inf_node.metadata.model_dump(exclude_none=True),
                     )
+                    self._record_created(inf_node)
                     for src_id in inf_node.metadata.sources:
                         self.graph_store.add_edge(src_id, inf_node.id, "INFERS")
 
@@ -380,10 +448,182 @@ class GraphStructureReorganizer:
                         agg_node.memory,
                         agg_node.metadata.model_dump(exclude_none=True),
                     )
+                    self._record_created(agg_node)
                     for child_id in agg_node.metadata.sources:
                         self.graph_store.add_edge(agg_node.id, child_id, "AGGREGATE_TO")
 
-        logger.info("[Reorganizer] Cluster relation/reasoning done.")
+    def _optimize_incremental(
+        self,
+        scope: str,
+        local_tree_threshold: int,
+        min_cluster_size: int,
+        min_group_size: int,
+        check_deadline,
+    ) -> None:
+        """
+        Incremental variant of `optimize_structure`:
+        1. Link memories assigned online to their topic and re-summarize only those topics,
+           splitting the ones that outgrew `max_cluster_size`.
+        2. Cluster the memories that fit no topic, once enough of them have piled up.
+        """
+        index = self.cluster_index
+        if not index.is_loaded(scope):
+            self._load_clusters(scope)
+
+        for parent_id, new_ids, member_ids in index.dirty_clusters(scope):
+            if check_deadline("[GraphStructureReorganize] Refreshing clusters"):
+                return
+            try:
+                self._refresh_cluster(scope, parent_id, new_ids, member_ids)
+                index.mark_clean(scope, parent_id, new_ids)
+            except Exception as e:
+                logger.warning(
+                    f"[GraphStructureReorganize] Refreshing cluster {parent_id} failed: {e}, "
+                    f"trace: {traceback.format_exc()}"
+                )
+
+        pending = index.take_pending(scope, min_group_size)
+        if pending:
+            if check_deadline("[GraphStructureReorganize] Before partition"):
+                return
+            partitioned_groups = self._partition(
+                pending, max_cluster_size=index.config.max_cluster_size
+            )
+            logger.info(
+                f"[GraphStructureReorganize] Partitioned {len(pending)} unclustered nodes into "
+                f"{len(partitioned_groups)} clusters."
+            )
+            with ContextThreadPoolExecutor(max_workers=4) as executor:
+                futures = [
+                    executor.submit(
+                        self._process_cluster_and_write,
+                        cluster_nodes,
+                        scope,
+                        local_tree_threshold,
+                        min_cluster_size,
+                    )
+                    for cluster_nodes in partitioned_groups
+                ]
+                for f in as_completed(futures):
+                    if check_deadline("[GraphStructureReorganize] Waiting clusters..."):
+                        for x in futures:
+                            x.cancel()
+                        return
+                    try:
+                        for parent_node, children in f.result():
+                            index.add_cluster(scope, parent_node.id, children)
+                    except Exception as e:
+                        logger.warning(
+                            f"[GraphStructureReorganize] Cluster processing failed: {e}, trace: {traceback.format_exc()}"
+                        )
+        bump_write_version(graph_scope(self.graph_store))
+
+    def _load_clusters(self, scope: str) -> None:
+        """
+        Seed the cluster index of `scope` from the leaf topic nodes in the graph.
+        """
+        try:
+            topic_ids = self.graph_store.get_by_metadata(
+                [
+                    {"field": "memory_type", "op": "=", "value": scope},
+                    {"field": "type", "op": "=", "value": "topic"},
+                    {"field": "status", "op": "=", "value": "activated"},
+                ]
+            )
+        except Exception as e:
+            logger.warning(f"[GraphStructureReorganize] Loading topics failed: {e}")
+            topic_ids = []
+
+        topic_set = set(topic_ids)
+        clusters = []
+        for topic_id in topic_ids:
+            # An inner topic's sub-topics are clusters of their own; memories left
+            # directly under it (e.g. after a split) still form its cluster
+            children = [
+                c
+                for c in self.graph_store.get_children_with_embeddings(topic_id)
+                if c["id"] not in topic_set and c.get("embedding")
+            ]
+            clusters.append(
+                (topic_id, [c["id"] for c in children], [c["embedding"] for c in children])
+            )
+
+        raw_nodes = self.graph_store.get_structure_optimization_candidates(scope)
+        self.cluster_index.load(scope, clusters, [GraphDBNode(**n) for n in raw_nodes])
+
+    def _refresh_cluster(
+        self, scope: str, parent_id: str, new_ids: list[str], member_ids: list[str]
+    ) -> None:
+        """
+        Link newly assigned members under their topic, then re-summarize or split it.
+        """
+        raw_parent = self.graph_store.get_node(parent_id)
+        new_nodes = [GraphDBNode(**n) for n in self.graph_store.get_nodes(new_ids)]
+        if raw_parent is None:
+            logger.info(f"[GraphStructureReorganize] Topic {parent_id} is gone, requeue members.")
+            self.cluster_index.remove_cluster(scope, parent_id)
+            self.cluster_index.requeue(scope, new_nodes)
+            return
+
+        parent_node = GraphDBNode(**raw_parent)
+        self._link_cluster_nodes(parent_node, new_nodes)
+
+        members = [
+            GraphDBNode(**n)
+            for n in self.graph_store.get_nodes(member_ids)
+            if n.get("metadata", {}).get("status", "activated") == "activated"
+        ]
+        if len(members) > self.cluster_index.config.max_cluster_size:
+            self._split_cluster(scope, parent_node, members)
+        elif members:
+            summary = self._summarize_cluster(members, scope)
+            self.graph_store.update_node(
+                parent_id,
+                {
+                    "memory": summary.memory,
+                    "key": summary.metadata.key,
+                    "tags": summary.metadata.tags,
+                    "background": summary.metadata.background,
+                    "embedding": summary.metadata.embedding,
+                    "updated_at": datetime.now().isoformat(),
+                },
+            )
+
+        self._detect_relations(new_nodes, member_ids)
+
+    def _split_cluster(
+        self, scope: str, parent_node: GraphDBNode, members: list[GraphDBNode]
+    ) -> None:
+        """
+        Split an oversized topic into sub-topics linked under it.
+
+        Members that fall into no sub-topic stay linked under the topic itself, which
+        remains tracked as their cluster.
+        """
+        groups = self._partition(
+            members, min_cluster_size=0, max_cluster_size=self.cluster_index.config.max_cluster_size
+        )
+        groups = [group for group in groups if len(group) >= 2]
+        if len(groups) < 2:
+            logger.info(f"[GraphStructureReorganize] Topic {parent_node.id} could not be split.")
+            return
+
+        self.cluster_index.remove_cluster(scope, parent_node.id)
+        grouped = {node.id for group in groups for node in group}
+        leftovers = [node for node in members if node.id not in grouped]
+        if leftovers:
+            self.cluster_index.add_cluster(scope, parent_node.id, leftovers)
+        for group in groups:
+            sub_parent_node = self._summarize_cluster(group, scope)
+            self._create_parent_node(sub_parent_node)
+            self.graph_store.add_edge(parent_node.id, sub_parent_node.id, "PARENT")
+            for child in group:
+                self.graph_store.delete_edge(parent_node.id, child.id, "PARENT")
+            self._link_cluster_nodes(sub_parent_node, group)
+            self.cluster_index.add_cluster(scope, sub_parent_node.id, group)
+        logger.info(
+            f"[GraphStructureReorganize] Split topic {parent_node.id} into {len(groups)} sub-topics."
+        )
 
     def _local_subcluster(
         self, cluster_nodes: list[GraphDBNode], max_length: int = 15000
@@ -587,6 +827,14 @@ class GraphStructureReorganizer:
             parent_node.memory,
             parent_node.metadata.model_dump(exclude_none=True),
         )
+        self._record_created(parent_node)
+
+    def _record_created(self, node: GraphDBNode) -> None:
+        """
+        Count a node written by the reorganizer towards its scope's retention capacity.
+        """
+        if self.retention is not None:
+            self.retention.record_added({node.metadata.memory_type: 1})
 
     def _link_cluster_nodes(self, parent_node: GraphDBNode, child_nodes: list[GraphDBNode]):
         """
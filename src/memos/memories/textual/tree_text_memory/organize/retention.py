@@ -0,0 +1,119 @@
+import threading
+import time
+
+from typing import TYPE_CHECKING
+
+from memos.graph_dbs.neo4j import Neo4jGraphDB
+from memos.log import get_logger
+from memos.memories.textual.tree_text_memory.retrieve.search_cache import (
+    bump_write_version,
+    graph_scope,
+)
+from memos.memos_tools.executor_registry import get_executor
+
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+
+
+logger = get_logger(__name__)
+
+
+class MemoryRetention:
+    """
+    Keeps per-scope (memory_type) node counts within their capacity.
+
+    Counts are seeded from the graph store and then tracked incrementally as
+    memories are added, so the common add path costs no graph queries at all. A
+    scope is only pruned once its tracked count exceeds its capacity; pruning runs
+    on the shared "retention" executor (at most one job per scope at a time), and
+    the scope's count is re-synced from the graph store afterwards.
+
+    Writes that do not report through `record_added` (other processes, deletes,
+    scheduler moves) are picked up by re-seeding the counts once they are older
+    than `resync_interval` seconds; in-process writers can `invalidate` sooner.
+    """
+
+    def __init__(
+        self, graph_store: Neo4jGraphDB, capacity: dict[str, int], resync_interval: float = 60.0
+    ):
+        self.graph_store = graph_store
+        self.capacity = capacity
+        self.resync_interval = resync_interval
+        self._lock = threading.Lock()
+        self._counts: dict[str, int] | None = None
+        self._loaded_at = 0.0
+        self._pending: dict[str, Future] = {}
+
+    def counts(self) -> dict[str, int]:
+        """Return the tracked node count per memory type."""
+        with self._lock:
+            if self._is_stale():
+                self._reload_counts()
+            return dict(self._counts)
+
+    def record_added(self, added: dict[str, int]) -> None:
+        """
+        Account for newly written nodes and schedule pruning for any scope over capacity.
+
+        Args:
+            added: Number of nodes written per memory type.
+        """
+        with self._lock:
+            if self._is_stale():
+                # A fresh load already includes the nodes just written
+                self._reload_counts()
+            else:
+                for memory_type, n in added.items():
+                    self._counts[memory_type] = self._counts.get(memory_type, 0) + n
+            over = [
+                memory_type
+                for memory_type, limit in self.capacity.items()
+                if self._counts.get(memory_type, 0) > limit and memory_type not in self._pending
+            ]
+            for memory_type in over:
+                self._pending[memory_type] = get_executor("retention").submit(
+                    self._prune, memory_type
+                )
+
+    def prune(self, memory_type: str) -> None:
+        """Synchronously trim `memory_type` down to its capacity."""
+        self.wait()
+        self._prune(memory_type)
+
+    def invalidate(self) -> None:
+        """Forget tracked counts; they are re-seeded from the graph store on next use."""
+        with self._lock:
+            self._counts = None
+
+    def wait(self) -> None:
+        """Block until all scheduled pruning jobs have finished."""
+        with self._lock:
+            futures = list(self._pending.values())
+        for future in futures:
+            future.result()
+
+    def _prune(self, memory_type: str) -> None:
+        try:
+            self.graph_store.remove_oldest_memory(
+                memory_type=memory_type, keep_latest=self.capacity[memory_type]
+            )
+            bump_write_version(graph_scope(self.graph_store))
+            count = self.graph_store.get_memory_count(memory_type)
+            with self._lock:
+                if self._counts is not None:
+                    self._counts[memory_type] = count
+        except Exception as e:
+            logger.warning(f"[MemoryRetention] Pruning {memory_type} failed: {e}")
+        finally:
+            with self._lock:
+                self._pending.pop(memory_type, None)
+
+    def _is_stale(self) -> bool:
+        return self._counts is None or time.monotonic() - self._loaded_at > self.resync_interval
+
+    def _reload_counts(self) -> None:
+        results = self.graph_store.get_grouped_counts(group_fields=["memory_type"])
+        self._counts = {record["memory_type"]: record["count"] for record in results}
+        self._loaded_at = time.monotonic()
+        logger.info(f"[MemoryRetention] Loaded memory sizes: {self._counts}")
@@ -1,11 +1,9 @@
-import concurrent.futures
-
-from memos.context.context import ContextThreadPoolExecutor
 from memos.embedders.factory import OllamaEmbedder
 from memos.graph_dbs.neo4j import Neo4jGraphDB
 from memos.log import get_logger
 from memos.memories.textual.item import TextualMemoryItem
 from memos.memories.textual.tree_text_memory.retrieve.retrieval_mid_structs import ParsedTaskGoal
+from memos.memos_tools.executor_registry import get_executor
 
 
 logger = get_logger(__name__)
@@ -57,20 +55,20 @@ class GraphMemoryRetriever:
             )
             return [TextualMemoryItem.from_dict(record) for record in working_memories]
 
-        with ContextThreadPoolExecutor(max_workers=2) as executor:
-            # Structured graph-based retrieval
-            future_graph = executor.submit(self._graph_recall, parsed_goal, memory_scope)
-            # Vector similarity search
-            future_vector = executor.submit(
-                self._vector_recall,
-                query_embedding or [],
-                memory_scope,
-                top_k,
-                search_filter=search_filter,
-            )
+        executor = get_executor("recall")
+        # Structured graph-based retrieval
+        future_graph = executor.submit(self._graph_recall, parsed_goal, memory_scope)
+        # Vector similarity search
+        future_vector = executor.submit(
+            self._vector_recall,
+            query_embedding or [],
+            memory_scope,
+            top_k,
+            search_filter=search_filter,
+        )
 
-            graph_results = future_graph.result()
-            vector_results = future_vector.result()
+        graph_results = future_graph.result()
+        vector_results = future_vector.result()
 
         # Merge and deduplicate by ID
         combined = {item.id: item for item in graph_results + vector_results}
@@ -202,10 +200,10 @@ class GraphMemoryRetriever:
         if not query_embedding:
             return []
 
-        def search_single(vec, filt=None):
+        def search_batch(filt=None):
             return (
-                self.graph_store.search_by_embedding(
-                    vector=vec,
+                self.graph_store.search_by_embeddings(
+                    vectors=query_embedding[:max_num],
                     top_k=top_k,
                     scope=memory_scope,
                     cube_name=cube_name,
@@ -214,49 +212,18 @@ class GraphMemoryRetriever:
                 or []
             )
 
-        def search_path_a():
-            """Path A: search without filter"""
-            path_a_hits = []
-            with ContextThreadPoolExecutor() as executor:
-                futures = [
-                    executor.submit(search_single, vec, None) for vec in query_embedding[:max_num]
-                ]
-                for f in concurrent.futures.as_completed(futures):
-                    path_a_hits.extend(f.result() or [])
-            return path_a_hits
-
-        def search_path_b():
-            """Path B: search with filter"""
-            if not search_filter:
-                return []
-            path_b_hits = []
-            with ContextThreadPoolExecutor() as executor:
-                futures = [
-                    executor.submit(search_single, vec, search_filter)
-                    for vec in query_embedding[:max_num]
-                ]
-                for f in concurrent.futures.as_completed(futures):
-                    path_b_hits.extend(f.result() or [])
-            return path_b_hits
-
-        # Execute both paths concurrently
-        all_hits = []
-        with ContextThreadPoolExecutor(max_workers=2) as executor:
-            path_a_future = executor.submit(search_path_a)
-            path_b_future = executor.submit(search_path_b)
-
-            all_hits.extend(path_a_future.result())
-            all_hits.extend(path_b_future.result())
-
-        if not all_hits:
+        # Path A: search without filter; Path B: search with filter.
+        # Each path is a single batched round-trip returning hydrated nodes.
+        node_dicts = search_batch()
+        if search_filter:
+            node_dicts = node_dicts + search_batch(search_filter)
+
+        if not node_dicts:
             return []
 
         # merge and deduplicate
-        unique_ids = {r["id"] for r in all_hits if r.get("id")}
-        node_dicts = (
-            self.graph_store.get_nodes(
-                list(unique_ids), include_embedding=False, cube_name=cube_name
-            )
-            or []
-        )
-        return [TextualMemoryItem.from_dict(n) for n in node_dicts]
+        unique_nodes = {}
+        for n in node_dicts:
+            if n.get("id") and n["id"] not in unique_nodes:
+                unique_nodes[n["id"]] = n
+        return [TextualMemoryItem.from_dict(n) for n in unique_nodes.values()]
@@ -0,0 +1,138 @@
+import copy
+import json
+import threading
+import time
+
+from collections import OrderedDict
+from typing import Any
+
+from memos.configs.memory import SearchCacheConfig
+from memos.log import get_logger
+from memos.memories.textual.item import TextualMemoryItem
+
+
+logger = get_logger(__name__)
+
+_write_versions: dict[str, int] = {}
+_write_versions_lock = threading.Lock()
+
+
+def graph_scope(graph_store: Any) -> str:
+    """Identify the memory cube (database + tenant) a graph store reads and writes."""
+    config = getattr(graph_store, "config", None)
+    location = getattr(config, "uri", None) or getattr(config, "hosts", None)
+    database = getattr(config, "db_name", None) or getattr(config, "space", None)
+    return f"{location}/{database}/{getattr(config, 'user_name', None)}"
+
+
+def get_write_version(scope: str) -> int:
+    """Return the current write version of a cube."""
+    with _write_versions_lock:
+        return _write_versions.get(scope, 0)
+
+
+def bump_write_version(scope: str) -> int:
+    """
+    Record a write to a cube, making every search result cached for it stale.
+
+    Returns:
+        The new write version.
+    """
+    with _write_versions_lock:
+        version = _write_versions.get(scope, 0) + 1
+        _write_versions[scope] = version
+        return version
+
+
+class SearchResultCache:
+    """
+    Bounded LRU of final search results.
+
+    Keys include the cube's write version at the time the search started, so any
+    write to the cube (see `bump_write_version`) makes older entries unreachable;
+    they then age out through the size and TTL limits.
+    """
+
+    def __init__(self, config: SearchCacheConfig):
+        self.config = config
+        self._lock = threading.Lock()
+        # key -> (results, stored_at)
+        self._entries: OrderedDict[tuple, tuple[list[TextualMemoryItem], float]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(
+        scope: str,
+        query: str,
+        top_k: int,
+        info: dict | None,
+        mode: str,
+        memory_type: str,
+        search_filter: dict | None,
+        **options: Any,
+    ) -> tuple:
+        """
+        Build the cache key of a search request.
+
+        The query is normalized (case and whitespace) and the chat history only
+        takes part in `fine` mode, where it is used to parse the task.
+        """
+        info = info or {}
+        normalized = " ".join(query.split()).casefold()
+        history = info.get("chat_history") if mode == "fine" else None
+        return (
+            scope,
+            get_write_version(scope),
+            normalized,
+            top_k,
+            info.get("user_id"),
+            mode,
+            memory_type,
+            json.dumps(search_filter, sort_keys=True, default=str),
+            json.dumps(history, sort_keys=True, default=str),
+            tuple(sorted(options.items())),
+        )
+
+    def get(self, key: tuple) -> list[TextualMemoryItem] | None:
+        """Return a copy of the cached results for `key`, or None on a miss."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self._expired(entry[1]):
+                del self._entries[key]
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            results = entry[0]
+        return copy.deepcopy(results)
+
+    def put(self, key: tuple, results: list[TextualMemoryItem]) -> None:
+        """Store the results of a search under `key`."""
+        results = copy.deepcopy(results)
+        with self._lock:
+            self._entries[key] = (results, time.time())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.config.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every cached result."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict[str, float]:
+        """Return hit-rate metrics and the current size."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "entries": len(self._entries),
+            }
+
+    def _expired(self, stored_at: float) -> bool:
+        return self.config.ttl is not None and time.time() - stored_at > self.config.ttl
@@ -1,20 +1,24 @@
+import asyncio
+import functools
 import json
+import time
 import traceback
 
 from datetime import datetime
 
-from memos.context.context import ContextThreadPoolExecutor
 from memos.embedders.factory import OllamaEmbedder
 from memos.graph_dbs.factory import Neo4jGraphDB
 from memos.llms.factory import AzureLLM, OllamaLLM, OpenAILLM
 from memos.log import get_logger
 from memos.memories.textual.item import SearchedTreeNodeTextualMemoryMetadata, TextualMemoryItem
+from memos.memos_tools.executor_registry import get_executor
 from memos.reranker.base import BaseReranker
 from memos.utils import timed
 
 from .internet_retriever_factory import InternetRetrieverFactory
 from .reasoner import MemoryReasoner
 from .recall import GraphMemoryRetriever
+from .search_cache import SearchResultCache, graph_scope
 from .task_goal_parser import TaskGoalParser
 
 
@@ -30,6 +34,7 @@ class Searcher:
         reranker: BaseReranker,
         internet_retriever: InternetRetrieverFactory | None = None,
         moscube: bool = False,
+        search_cache: SearchResultCache | None = None,
     ):
         self.graph_store = graph_store
         self.embedder = embedder
@@ -42,8 +47,7 @@ class Searcher:
         # Create internet retriever from config if provided
         self.internet_retriever = internet_retriever
         self.moscube = moscube
-
-        self._usage_executor = ContextThreadPoolExecutor(max_workers=4, thread_name_prefix="usage")
+        self.search_cache = search_cache
 
     @timed
     def search(
@@ -54,6 +58,7 @@ class Searcher:
         mode="fast",
         memory_type="All",
         search_filter: dict | None = None,
+        deadline: float | None = None,
     ) -> list[TextualMemoryItem]:
         """
         Search for memories based on a query.
@@ -69,9 +74,68 @@ class Searcher:
             memory_type (str): Type restriction for search.
             ['All', 'WorkingMemory', 'LongTermMemory', 'UserMemory']
             search_filter (dict, optional): Optional metadata filters for search results.
+            deadline (float, optional): `time.monotonic()` time after which the search
+                gives up with TimeoutError at its next stage.
         Returns:
             list[TextualMemoryItem]: List of matching memories.
         """
+        info = self._prepare_info(query, top_k, info, mode, memory_type)
+        cache_key, cached = self._lookup_cache(query, top_k, info, mode, memory_type, search_filter)
+        if cached is not None:
+            return cached
+
+        self._check_deadline(deadline, "task parsing")
+        parsed_goal, query_embedding, context, query = self._parse_task(
+            query, info, mode, search_filter=search_filter
+        )
+        self._check_deadline(deadline, "retrieval")
+        results = self._retrieve_paths(
+            query, parsed_goal, query_embedding, info, top_k, mode, memory_type, search_filter
+        )
+        self._check_deadline(deadline, "ranking")
+        return self._finish(results, top_k, info, cache_key)
+
+    async def asearch(
+        self,
+        query: str,
+        top_k: int,
+        info=None,
+        mode="fast",
+        memory_type="All",
+        search_filter: dict | None = None,
+        deadline: float | None = None,
+    ) -> list[TextualMemoryItem]:
+        """
+        Async variant of `search`.
+
+        Runs the same stages as `search`, but awaits the blocking ones (task parsing
+        and the A/B/C retrieval paths) on the shared search executor instead of
+        blocking the event loop.
+        Args and return value are the same as for `search`.
+        """
+        info = self._prepare_info(query, top_k, info, mode, memory_type)
+        cache_key, cached = self._lookup_cache(query, top_k, info, mode, memory_type, search_filter)
+        if cached is not None:
+            return cached
+
+        self._check_deadline(deadline, "task parsing")
+        parsed_goal, query_embedding, context, query = await self._run_blocking(
+            self._parse_task, query, info, mode, search_filter=search_filter
+        )
+        self._check_deadline(deadline, "retrieval")
+        path_calls = self._path_calls(
+            query, parsed_goal, query_embedding, info, top_k, mode, memory_type, search_filter
+        )
+        path_results = await asyncio.gather(
+            *(self._run_blocking(func, *args) for func, args in path_calls)
+        )
+        results = [pair for path_result in path_results for pair in path_result]
+        logger.info(f"[SEARCH] Total raw results: {len(results)}")
+        self._check_deadline(deadline, "ranking")
+        return self._finish(results, top_k, info, cache_key)
+
+    def _prepare_info(self, query, top_k, info, mode, memory_type) -> dict:
+        """Log the request and fill in a placeholder `info` when none was given."""
         logger.info(
             f"[SEARCH] Start query='{query}', top_k={top_k}, mode={mode}, memory_type={memory_type}"
         )
@@ -80,19 +144,23 @@ class Searcher:
                 "Please input 'info' when use tree.search so that "
                 "the database would store the consume history."
             )
-            info = {"user_id": "", "session_id": ""}
-        else:
-            logger.debug(f"[SEARCH] Received info dict: {info}")
-
-        parsed_goal, query_embedding, context, query = self._parse_task(
-            query, info, mode, search_filter=search_filter
-        )
-        results = self._retrieve_paths(
-            query, parsed_goal, query_embedding, info, top_k, mode, memory_type, search_filter
-        )
+            return {"user_id": "", "session_id": ""}
+        logger.debug(f"[SEARCH] Received info dict: {info}")
+        return info
+
+    @staticmethod
+    def _check_deadline(deadline: float | None, stage: str) -> None:
+        """Give up before `stage` once the caller's deadline passed, so no usage is recorded."""
+        if deadline is not None and time.monotonic() > deadline:
+            raise TimeoutError(f"[SEARCH] Deadline passed before {stage}")
+
+    def _finish(self, results, top_k, info, cache_key) -> list[TextualMemoryItem]:
+        """Deduplicate and rank raw results, record their usage and cache them."""
         deduped = self._deduplicate_results(results)
         final_results = self._sort_and_trim(deduped, top_k)
         self._update_usage_history(final_results, info)
+        if cache_key is not None:
+            self.search_cache.put(cache_key, final_results)
 
         logger.info(f"[SEARCH] Done. Total {len(final_results)} results.")
         res_results = ""
@@ -103,6 +171,43 @@ class Searcher:
         logger.info(f"[SEARCH] Results. {res_results}")
         return final_results
 
+    def _lookup_cache(self, query, top_k, info, mode, memory_type, search_filter):
+        """
+        Look a request up in the search cache.
+
+        Returns:
+            (cache key, cached results); the key is None when caching is disabled
+            and the results are None on a miss.
+        """
+        if self.search_cache is None:
+            return None, None
+        cache_key = self.search_cache.make_key(
+            graph_scope(self.graph_store),
+            query,
+            top_k,
+            info,
+            mode,
+            memory_type,
+            search_filter,
+            moscube=self.moscube,
+            internet=self.internet_retriever is not None,
+        )
+        # `get` hands out a deep copy, so recording usage below never touches the
+        # cached entry or items returned to earlier callers
+        cached = self.search_cache.get(cache_key)
+        if cached is not None:
+            self._update_usage_history(cached, info)
+            logger.info(f"[SEARCH] Cache hit. Total {len(cached)} results.")
+        return cache_key, cached
+
+    @staticmethod
+    async def _run_blocking(func, *args, **kwargs):
+        """Run a blocking call on the shared search executor without blocking the loop."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            get_executor("search"), functools.partial(func, *args, **kwargs)
+        )
+
     @timed
     def _parse_task(self, query, info, mode, top_k=5, search_filter: dict | None = None):
         """Parse user query, do embedding search and create context"""
@@ -114,13 +219,10 @@ class Searcher:
             logger.info("[SEARCH] Fine mode: embedding search")
             query_embedding = self.embedder.embed([query])[0]
 
-            # retrieve related nodes by embedding
-            related_nodes = [
-                self.graph_store.get_node(n["id"])
-                for n in self.graph_store.search_by_embedding(
-                    query_embedding, top_k=top_k, search_filter=search_filter
-                )
-            ]
+            # retrieve related (hydrated) nodes by embedding in one round-trip
+            related_nodes = self.graph_store.search_by_embeddings(
+                [query_embedding], top_k=top_k, search_filter=search_filter
+            )
             memories = []
             for node in related_nodes:
                 try:
@@ -170,61 +272,56 @@ class Searcher:
         search_filter: dict | None = None,
     ):
         """Run A/B/C retrieval paths in parallel"""
-        tasks = []
-        with ContextThreadPoolExecutor(max_workers=3) as executor:
-            tasks.append(
-                executor.submit(
-                    self._retrieve_from_working_memory,
-                    query,
-                    parsed_goal,
-                    query_embedding,
-                    top_k,
-                    memory_type,
-                    search_filter,
-                )
-            )
-            tasks.append(
-                executor.submit(
-                    self._retrieve_from_long_term_and_user,
-                    query,
-                    parsed_goal,
-                    query_embedding,
-                    top_k,
-                    memory_type,
-                    search_filter,
-                )
+        executor = get_executor("search")
+        tasks = [
+            executor.submit(func, *args)
+            for func, args in self._path_calls(
+                query, parsed_goal, query_embedding, info, top_k, mode, memory_type, search_filter
             )
-            tasks.append(
-                executor.submit(
-                    self._retrieve_from_internet,
-                    query,
-                    parsed_goal,
-                    query_embedding,
-                    top_k,
-                    info,
-                    mode,
-                    memory_type,
-                )
-            )
-            if self.moscube:
-                tasks.append(
-                    executor.submit(
-                        self._retrieve_from_memcubes,
-                        query,
-                        parsed_goal,
-                        query_embedding,
-                        top_k,
-                        "memos_cube01",
-                    )
-                )
+        ]
 
-            results = []
-            for t in tasks:
-                results.extend(t.result())
+        results = []
+        for t in tasks:
+            results.extend(t.result())
 
         logger.info(f"[SEARCH] Total raw results: {len(results)}")
         return results
 
+    def _path_calls(
+        self,
+        query,
+        parsed_goal,
+        query_embedding,
+        info,
+        top_k,
+        mode,
+        memory_type,
+        search_filter: dict | None = None,
+    ) -> list[tuple]:
+        """(function, args) of every retrieval path this search runs."""
+        calls = [
+            (
+                self._retrieve_from_working_memory,
+                (query, parsed_goal, query_embedding, top_k, memory_type, search_filter),
+            ),
+            (
+                self._retrieve_from_long_term_and_user,
+                (query, parsed_goal, query_embedding, top_k, memory_type, search_filter),
+            ),
+            (
+                self._retrieve_from_internet,
+                (query, parsed_goal, query_embedding, top_k, info, mode, memory_type),
+            ),
+        ]
+        if self.moscube:
+            calls.append(
+                (
+                    self._retrieve_from_memcubes,
+                    (query, parsed_goal, query_embedding, top_k, "memos_cube01"),
+                )
+            )
+        return calls
+
     # --- Path A
     @timed
     def _retrieve_from_working_memory(
@@ -271,35 +368,35 @@ class Searcher:
         results = []
         tasks = []
 
-        with ContextThreadPoolExecutor(max_workers=2) as executor:
-            if memory_type in ["All", "LongTermMemory"]:
-                tasks.append(
-                    executor.submit(
-                        self.graph_retriever.retrieve,
-                        query=query,
-                        parsed_goal=parsed_goal,
-                        query_embedding=query_embedding,
-                        top_k=top_k * 2,
-                        memory_scope="LongTermMemory",
-                        search_filter=search_filter,
-                    )
+        executor = get_executor("retrieval")
+        if memory_type in ["All", "LongTermMemory"]:
+            tasks.append(
+                executor.submit(
+                    self.graph_retriever.retrieve,
+                    query=query,
+                    parsed_goal=parsed_goal,
+                    query_embedding=query_embedding,
+                    top_k=top_k * 2,
+                    memory_scope="LongTermMemory",
+                    search_filter=search_filter,
                 )
-            if memory_type in ["All", "UserMemory"]:
-                tasks.append(
-                    executor.submit(
-                        self.graph_retriever.retrieve,
-                        query=query,
-                        parsed_goal=parsed_goal,
-                        query_embedding=query_embedding,
-                        top_k=top_k * 2,
-                        memory_scope="UserMemory",
-                        search_filter=search_filter,
-                    )
+            )
+        if memory_type in ["All", "UserMemory"]:
+            tasks.append(
+                executor.submit(
+                    self.graph_retriever.retrieve,
+                    query=query,
+                    parsed_goal=parsed_goal,
+                    query_embedding=query_embedding,
+                    top_k=top_k * 2,
+                    memory_scope="UserMemory",
+                    search_filter=search_filter,
                 )
+            )
 
-            # Collect results from all tasks
-            for task in tasks:
-                results.extend(task.result())
+        # Collect results from all tasks
+        for task in tasks:
+            results.extend(task.result())
 
         return self.reranker.rerank(
             query=query,
@@ -386,7 +483,7 @@ class Searcher:
         info_copy = dict(info or {})
         info_copy.pop("chat_history", None)
         usage_record = json.dumps({"time": now_time, "info": info_copy})
-        payload = []
+        item_ids = []
         for it in items:
             try:
                 item_id = getattr(it, "id", None)
@@ -397,16 +494,21 @@ class Searcher:
                     md.usage = []
                 md.usage.append(usage_record)
                 if item_id:
-                    payload.append((item_id, list(md.usage)))
+                    item_ids.append(item_id)
             except Exception:
                 logger.exception("[USAGE] snapshot item failed")
 
-        if payload:
-            self._usage_executor.submit(self._update_usage_history_worker, payload, usage_record)
+        if item_ids:
+            get_executor("usage").submit(self._update_usage_history_worker, item_ids, usage_record)
 
-    def _update_usage_history_worker(self, payload, usage_record: str):
+    def _update_usage_history_worker(self, item_ids: list[str], usage_record: str):
+        """
+        Append `usage_record` to the usage stored for each node.
+
+        The append happens inside the graph store, so it neither re-reads the nodes
+        nor races with records written by concurrent searches.
+        """
         try:
-            for item_id, usage_list in payload:
-                self.graph_store.update_node(item_id, {"usage": usage_list})
+            self.graph_store.append_usage(item_ids, usage_record)
         except Exception:
             logger.exception("[USAGE] update usage failed")
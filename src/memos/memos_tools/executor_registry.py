@@ -0,0 +1,178 @@
+"""
+Process-wide registry of shared, bounded thread pools.
+
+Hot paths (search, recall, usage updates, reading) used to build and tear down a
+fresh ``ContextThreadPoolExecutor`` on every call. This module keeps one long-lived
+executor per subsystem instead, exposes simple queue-depth metrics and shuts the
+pools down gracefully at interpreter exit.
+
+Pool sizes can be set through ``MEMOS_EXECUTOR_<NAME>_WORKERS`` environment
+variables (e.g. ``MEMOS_EXECUTOR_RECALL_WORKERS=64``) or ``configure_executors``.
+
+Note:
+    Tasks running in one pool must never block on futures of the *same* pool,
+    otherwise a saturated pool deadlocks. Nested fan-outs therefore use one pool
+    per level (``api`` -> ``cube_search`` -> ``search`` -> ``retrieval`` -> ``recall``).
+"""
+
+import atexit
+import os
+import threading
+
+from collections.abc import Callable
+from concurrent.futures import Future
+from typing import Any
+
+from memos.context.context import ContextThreadPoolExecutor
+from memos.log import get_logger
+
+
+logger = get_logger(__name__)
+
+DEFAULT_MAX_WORKERS: dict[str, int] = {
+    # Blocking MOS calls offloaded from async API handlers
+    "api": 32,
+    # Per-cube fan-out of a MOS search
+    "cube_search": 32,
+    # Searcher A/B/C path fan-out
+    "search": 32,
+    # Per memory-scope retrieval inside a search path
+    "retrieval": 32,
+    # Graph / vector recall inside a single scope retrieval
+    "recall": 64,
+    # Fire-and-forget usage history updates after a search
+    "usage": 4,
+    # Scene-level fan-out in mem readers
+    "reader": 16,
+    # Per-chunk LLM extraction in the document ingestion pipeline
+    "extract": 32,
+    # Background pruning of memory scopes that went over capacity
+    "retention": 4,
+    # Concurrent chunked requests to remote rerankers
+    "rerank": 8,
+}
+FALLBACK_MAX_WORKERS = 8
+
+
+class ManagedExecutor(ContextThreadPoolExecutor):
+    """
+    ContextThreadPoolExecutor that tracks queued / running task counts.
+    """
+
+    def __init__(self, name: str, max_workers: int):
+        super().__init__(max_workers=max_workers, thread_name_prefix=f"memos-{name}")
+        self.name = name
+        self.max_workers = max_workers
+        self._stats_lock = threading.Lock()
+        self._pending = 0
+        self._running = 0
+        self._completed = 0
+
+    def submit(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Future:
+        def tracked(*a: Any, **kw: Any) -> Any:
+            with self._stats_lock:
+                self._running += 1
+            try:
+                return fn(*a, **kw)
+            finally:
+                with self._stats_lock:
+                    self._running -= 1
+
+        with self._stats_lock:
+            self._pending += 1
+        future = super().submit(tracked, *args, **kwargs)
+        future.add_done_callback(self._on_done)
+        return future
+
+    def _on_done(self, _future: Future) -> None:
+        with self._stats_lock:
+            self._pending -= 1
+            self._completed += 1
+
+    def stats(self) -> dict[str, int]:
+        """Return a snapshot of the executor's load."""
+        with self._stats_lock:
+            return {
+                "max_workers": self.max_workers,
+                "running": self._running,
+                "queued": max(self._pending - self._running, 0),
+                "completed": self._completed,
+            }
+
+
+_executors: dict[str, ManagedExecutor] = {}
+_sizes: dict[str, int] = {}
+_lock = threading.Lock()
+
+
+def _resolve_max_workers(name: str) -> int:
+    if name in _sizes:
+        return _sizes[name]
+    env_value = os.getenv(f"MEMOS_EXECUTOR_{name.upper()}_WORKERS")
+    if env_value:
+        try:
+            return max(1, int(env_value))
+        except ValueError:
+            logger.warning(f"Invalid worker count '{env_value}' for executor '{name}', ignoring")
+    return DEFAULT_MAX_WORKERS.get(name, FALLBACK_MAX_WORKERS)
+
+
+def get_executor(name: str) -> ManagedExecutor:
+    """
+    Get (or lazily create) the shared executor for a subsystem.
+
+    Args:
+        name: Subsystem name, e.g. 'search', 'retrieval', 'recall', 'usage', 'reader'.
+
+    Returns:
+        ManagedExecutor: The process-wide executor registered under `name`.
+    """
+    executor = _executors.get(name)
+    if executor is not None:
+        return executor
+    with _lock:
+        executor = _executors.get(name)
+        if executor is None:
+            executor = ManagedExecutor(name, _resolve_max_workers(name))
+            _executors[name] = executor
+            logger.info(f"[ExecutorRegistry] Created executor '{name}' ({executor.max_workers})")
+        return executor
+
+
+def configure_executors(sizes: dict[str, int]) -> None:
+    """
+    Set pool sizes for subsystems.
+
+    Executors that already exist are replaced; their queued work still completes.
+
+    Args:
+        sizes: Mapping of subsystem name to max worker count.
+    """
+    with _lock:
+        for name, size in sizes.items():
+            _sizes[name] = max(1, int(size))
+            old = _executors.pop(name, None)
+            if old is not None:
+                old.shutdown(wait=False)
+
+
+def executor_stats() -> dict[str, dict[str, int]]:
+    """Return per-executor load metrics keyed by subsystem name."""
+    with _lock:
+        executors = dict(_executors)
+    return {name: executor.stats() for name, executor in executors.items()}
+
+
+def shutdown_executors(wait: bool = True) -> None:
+    """Shut down every registered executor."""
+    with _lock:
+        executors = list(_executors.values())
+        _executors.clear()
+    for executor in executors:
+        try:
+            executor.shutdown(wait=wait)
+        except Exception as e:
+            logger.warning(f"[ExecutorRegistry] Failed to shut down '{executor.name}': {e}")
+
+
+atexit.register(shutdown_executors)
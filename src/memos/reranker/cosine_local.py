@@ -36,12 +36,39 @@ def _cosine_one_to_many(q: list[float], m: list[list[float]]) -> list[float]:
             sims.append(dot(q, v) / (qn * vn))
         return sims
 
-    qv = _np.asarray(q, dtype=float)  # lowercase
-    mv = _np.asarray(m, dtype=float)  # lowercase
-    qn = _np.linalg.norm(qv) or 1e-10
-    mn = _np.linalg.norm(mv, axis=1)  # lowercase
-    dots = mv @ qv
-    return (dots / (mn * qn + 1e-10)).tolist()
+    return _cosine_many_to_many([q], m)[0].tolist()
+
+
+def _unit_rows(m, normalized: bool = False):
+    """Return `m` as a float32 matrix with L2-normalized rows."""
+    mv = _np.asarray(m, dtype=_np.float32)  # lowercase
+    if mv.ndim == 1:
+        mv = mv[None, :]
+    if normalized:
+        return mv
+    norms = _np.sqrt(_np.einsum("ij,ij->i", mv, mv))
+    return mv / _np.maximum(norms, 1e-10)[:, None]
+
+
+def _cosine_many_to_many(qs, m, normalized: bool = False):
+    """
+    Cosine similarity matrix of shape (len(qs), len(m)) computed in float32.
+
+    `normalized` declares the candidate rows are already unit length, skipping
+    their norms. The caller has to guarantee this: no graph store normalizes
+    embeddings on write.
+    """
+    return _unit_rows(qs) @ _unit_rows(m, normalized).T
+
+
+def _top_k_indices(scores, k: int):
+    """Indices of the `k` largest scores, highest first."""
+    if k <= 0:
+        return _np.empty(0, dtype=_np.int64)
+    if k >= len(scores):
+        return _np.argsort(-scores, kind="stable")
+    part = _np.argpartition(-scores, k - 1)[:k]
+    return part[_np.argsort(-scores[part], kind="stable")]
 
 
 class CosineLocalReranker(BaseReranker):
@@ -68,29 +95,76 @@ class CosineLocalReranker(BaseReranker):
         if not query_embedding:
             return [(item, 0.0) for item in graph_results[:top_k]]
 
+        return self.rerank_batch(
+            [query],
+            graph_results,
+            top_k,
+            query_embeddings=[query_embedding],
+            normalized=kwargs.get("normalized", False),
+        )[0]
+
+    def rerank_batch(
+        self,
+        queries: list[str],
+        graph_results: list,
+        top_k: int,
+        query_embeddings: list[list[float]],
+        normalized: bool = False,
+        **kwargs,
+    ) -> list[list[tuple[TextualMemoryItem, float]]]:
+        """
+        Rerank one candidate set against several queries at once.
+
+        The candidate matrix is built and normalized once and scored against all
+        query embeddings in a single matrix product.
+
+        Args:
+            queries: Query texts, one per embedding.
+            graph_results: Candidate memories shared by all queries.
+            top_k: Number of results to return per query.
+            query_embeddings: One embedding per query.
+            normalized: Candidate embeddings are already unit length.
+
+        Returns:
+            One list of top_k (item, score) sorted by score desc per query.
+        """
+        if not graph_results:
+            return [[] for _ in queries]
+
         items_with_emb = [
             it
             for it in graph_results
             if getattr(it, "metadata", None) and getattr(it.metadata, "embedding", None)
         ]
         if not items_with_emb:
-            return [(item, 0.5) for item in graph_results[:top_k]]
-
-        cand_vecs = [it.metadata.embedding for it in items_with_emb]
-        sims = _cosine_one_to_many(query_embedding, cand_vecs)
+            return [[(item, 0.5) for item in graph_results[:top_k]] for _ in queries]
 
         def get_weight(it: TextualMemoryItem) -> float:
             level = getattr(it.metadata, self.level_field, None)
             return self.level_weights.get(level, 1.0)
 
-        weighted = [sim * get_weight(it) for sim, it in zip(sims, items_with_emb, strict=False)]
-        scored_pairs = list(zip(items_with_emb, weighted, strict=False))
-        scored_pairs.sort(key=lambda x: x[1], reverse=True)
-
-        top_items = scored_pairs[:top_k]
-        if len(top_items) < top_k:
-            chosen = {it.id for it, _ in top_items}
-            remain = [(it, -1.0) for it in graph_results if it.id not in chosen]
-            top_items.extend(remain[: top_k - len(top_items)])
-
-        return top_items
+        cand_vecs = [it.metadata.embedding for it in items_with_emb]
+        weights = [get_weight(it) for it in items_with_emb]
+
+        rankings = []
+        if _HAS_NUMPY:
+            sims = _cosine_many_to_many(query_embeddings, cand_vecs, normalized)
+            weighted = sims * _np.asarray(weights, dtype=_np.float32)
+            for row in weighted:
+                top = _top_k_indices(row, top_k)
+                rankings.append([(items_with_emb[i], float(row[i])) for i in top])
+        else:
+            for query_embedding in query_embeddings:
+                sims = _cosine_one_to_many(query_embedding, cand_vecs)
+                scored_pairs = [
+                    (it, sim * w) for it, sim, w in zip(items_with_emb, sims, weights, strict=False)
+                ]
+                scored_pairs.sort(key=lambda x: x[1], reverse=True)
+                rankings.append(scored_pairs[:top_k])
+
+        for top_items in rankings:
+            if len(top_items) < top_k:
+                chosen = {it.id for it, _ in top_items}
+                remain = [(it, -1.0) for it in graph_results if it.id not in chosen]
+                top_items.extend(remain[: top_k - len(top_items)])
+        return rankings
@@ -0,0 +1,210 @@
+# memos/reranker/cross_encoder.py
+from __future__ import annotations
+
+import queue
+import threading
+import time
+
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import TYPE_CHECKING
+
+from memos.dependency import require_python_package
+from memos.log import get_logger
+
+from .base import BaseReranker
+from .concat import concat_original_source
+from .http_bge import _TAG1
+
+
+logger = get_logger(__name__)
+
+
+if TYPE_CHECKING:
+    from memos.memories.textual.item import TextualMemoryItem
+
+
+class CrossEncoderReranker(BaseReranker):
+    """
+    Local cross-encoder reranker (e.g. BGE reranker) running in-process.
+
+    Scores (query, document) pairs with a sentence-transformers `CrossEncoder`,
+    avoiding the network hop of `HTTPBGEReranker`. Concurrent `rerank` calls (the
+    searcher reranks several paths in parallel) are coalesced for up to
+    `max_wait_ms` into one `predict` call, and scores are cached per
+    (query, document) pair so repeated candidates are not scored twice.
+    """
+
+    @require_python_package(
+        import_name="sentence_transformers",
+        install_command="pip install sentence-transformers",
+        install_link="https://www.sbert.net/docs/installation.html",
+    )
+    def __init__(
+        self,
+        model: str = "BAAI/bge-reranker-v2-m3",
+        device: str = "cpu",
+        batch_size: int = 32,
+        max_length: int = 512,
+        max_wait_ms: float = 5.0,
+        cache_size: int = 10000,
+        rerank_source: list[str] | None = None,
+        **kwargs,
+    ):
+        """
+        Parameters
+        ----------
+        model : str
+            Name or path of the cross-encoder model.
+        device : str
+            Torch device to run the model on.
+        batch_size : int
+            Number of pairs per forward pass.
+        max_length : int
+            Maximum token length of a (query, document) pair; longer pairs are truncated.
+        max_wait_ms : float
+            How long to wait for concurrent requests to join a batch.
+        cache_size : int
+            Maximum number of cached (query, document) scores; 0 disables caching.
+        rerank_source : list[str] | None
+            Metadata fields concatenated onto each memory (see `concat_original_source`).
+        """
+        from sentence_transformers import CrossEncoder
+
+        self.model = CrossEncoder(model, device=device, max_length=max_length)
+        self.batch_size = batch_size
+        self.max_wait_ms = max_wait_ms
+        self.cache_size = cache_size
+        self.concat_source = rerank_source
+
+        self._cache: OrderedDict[tuple[str, str], float] = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._queue: queue.Queue[tuple[list[tuple[str, str]], Future] | None] = queue.Queue()
+        self._worker: threading.Thread | None = None
+        self._worker_lock = threading.Lock()
+
+    def rerank(
+        self,
+        query: str,
+        graph_results: list[TextualMemoryItem],
+        top_k: int,
+        **kwargs,
+    ) -> list[tuple[TextualMemoryItem, float]]:
+        if not graph_results:
+            return []
+
+        if self.concat_source:
+            documents = concat_original_source(graph_results, self.concat_source)
+        else:
+            documents = [
+                _TAG1.sub("", m) if isinstance((m := getattr(item, "memory", None)), str) else m
+                for item in graph_results
+            ]
+        candidates = [
+            (item, doc)
+            for item, doc in zip(graph_results, documents, strict=False)
+            if isinstance(doc, str) and doc
+        ]
+        if not candidates:
+            return []
+
+        try:
+            scores = self.score(query, [doc for _, doc in candidates])
+        except Exception as e:
+            logger.error(f"[CrossEncoderReranker] scoring failed: {e}")
+            return [(item, 0.0) for item in graph_results[:top_k]]
+
+        scored_items = [(item, score) for (item, _), score in zip(candidates, scores, strict=True)]
+        scored_items.sort(key=lambda x: x[1], reverse=True)
+        return scored_items[:top_k]
+
+    def score(self, query: str, documents: list[str]) -> list[float]:
+        """Relevance score of each document for `query`, served from the cache when possible."""
+        scores: list[float | None] = [None] * len(documents)
+        missing: dict[str, list[int]] = {}
+        with self._cache_lock:
+            for i, doc in enumerate(documents):
+                cached = self._cache.get((query, doc))
+                if cached is None:
+                    missing.setdefault(doc, []).append(i)
+                else:
+                    self._cache.move_to_end((query, doc))
+                    scores[i] = cached
+
+        if missing:
+            pairs = [(query, doc) for doc in missing]
+            future: Future = Future()
+            self._ensure_worker()
+            self._queue.put((pairs, future))
+            new_scores = future.result()
+            with self._cache_lock:
+                for (_, doc), score in zip(pairs, new_scores, strict=True):
+                    for i in missing[doc]:
+                        scores[i] = score
+                    if self.cache_size > 0:
+                        self._cache[(query, doc)] = score
+                        self._cache.move_to_end((query, doc))
+                while len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+        return scores
+
+    def close(self) -> None:
+        """Stop the background batching thread."""
+        with self._worker_lock:
+            if self._worker is not None:
+                self._queue.put(None)
+                self._worker.join(timeout=5)
+                self._worker = None
+
+    def _ensure_worker(self) -> None:
+        if self._worker is not None:
+            return
+        with self._worker_lock:
+            if self._worker is None:
+                self._worker = threading.Thread(
+                    target=self._run, name="memos-rerank-batcher", daemon=True
+                )
+                self._worker.start()
+
+    def _run(self) -> None:
+        max_wait = self.max_wait_ms / 1000
+        while True:
+            first = self._queue.get()
+            if first is None:
+                return
+            batch = [first]
+            pending = len(first[0])
+            deadline = time.monotonic() + max_wait
+            stop = False
+            while pending < self.batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is None:
+                    stop = True
+                    break
+                batch.append(item)
+                pending += len(item[0])
+
+            self._dispatch(batch)
+            if stop:
+                return
+
+    def _dispatch(self, batch: list[tuple[list[tuple[str, str]], Future]]) -> None:
+        pairs = [pair for request_pairs, _ in batch for pair in request_pairs]
+        try:
+            scores = self.model.predict(pairs, batch_size=self.batch_size, show_progress_bar=False)
+        except Exception as e:
+            for _, future in batch:
+                future.set_exception(e)
+            return
+
+        scores = [float(s) for s in scores]
+        offset = 0
+        for request_pairs, future in batch:
+            future.set_result(scores[offset : offset + len(request_pairs)])
+            offset += len(request_pairs)
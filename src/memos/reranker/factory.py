@@ -7,6 +7,7 @@ from typing import TYPE_CHECKING, Any
 from memos.memos_tools.singleton import singleton_factory
 
 from .cosine_local import CosineLocalReranker
+from .cross_encoder import CrossEncoderReranker
 from .http_bge import HTTPBGEReranker
 from .noop import NoopReranker
 
@@ -34,6 +35,18 @@ class RerankerFactory:
                 timeout=int(c.get("timeout", 10)),
                 headers_extra=c.get("headers_extra"),
                 rerank_source=c.get("rerank_source"),
+                max_documents_per_request=c.get("max_documents_per_request"),
+            )
+
+        if backend in {"cross_encoder", "local_bge"}:
+            return CrossEncoderReranker(
+                model=c.get("model", "BAAI/bge-reranker-v2-m3"),
+                device=c.get("device", "cpu"),
+                batch_size=int(c.get("batch_size", 32)),
+                max_length=int(c.get("max_length", 512)),
+                max_wait_ms=float(c.get("max_wait_ms", 5.0)),
+                cache_size=int(c.get("cache_size", 10000)),
+                rerank_source=c.get("rerank_source"),
             )
 
         if backend in {"cosine_local", "cosine"}:
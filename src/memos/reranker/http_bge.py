@@ -9,6 +9,7 @@ from typing import TYPE_CHECKING, Any
 import requests
 
 from memos.log import get_logger
+from memos.memos_tools.executor_registry import get_executor
 
 from .base import BaseReranker
 from .concat import concat_original_source
@@ -84,6 +85,7 @@ class HTTPBGEReranker(BaseReranker):
         boost_weights: dict[str, float] | None = None,
         boost_default: float = 0.0,
         warn_unknown_filter_keys: bool = True,
+        max_documents_per_request: int | None = None,
         **kwargs,
     ):
         """
@@ -99,6 +101,9 @@ class HTTPBGEReranker(BaseReranker):
             Request timeout (seconds).
         headers_extra : dict | None, optional
             Additional headers to merge into the request headers.
+        max_documents_per_request : int | None, optional
+            Split larger candidate lists into chunks of this size that are sent
+            concurrently. None sends all documents in one request.
         """
         if not reranker_url:
             raise ValueError("reranker_url must not be empty")
@@ -108,6 +113,9 @@ class HTTPBGEReranker(BaseReranker):
         self.timeout = timeout
         self.headers_extra = headers_extra or {}
         self.concat_source = rerank_source
+        self.max_documents_per_request = max_documents_per_request
+        # Reuse connections (and TLS sessions) across searches
+        self._session = requests.Session()
 
         self.boost_weights = (
             DEFAULT_BOOST_WEIGHTS.copy()
@@ -149,9 +157,8 @@ class HTTPBGEReranker(BaseReranker):
         if not graph_results:
             return []
 
-        # Build a mapping from "payload docs index" -> "original graph_results index"
-        # Only include items that have a non-empty string memory. This ensures that
-        # any index returned by the server can be mapped back correctly.
+        # Keep each document's index into graph_results, so scores returned for
+        # the (filtered) documents can be mapped back to the right item.
         if self.concat_source:
             documents = concat_original_source(graph_results, self.concat_source)
         else:
@@ -159,75 +166,88 @@ class HTTPBGEReranker(BaseReranker):
                 (_TAG1.sub("", m) if isinstance((m := getattr(item, "memory", None)), str) else m)
                 for item in graph_results
             ]
-            documents = [d for d in documents if isinstance(d, str) and d]
+        indexed = [(i, d) for i, d in enumerate(documents) if isinstance(d, str) and d]
 
-        logger.info(f"[HTTPBGERerankerSample] query: {query} , documents: {documents[:5]}...")
+        logger.info(
+            f"[HTTPBGERerankerSample] query: {query} , documents: {[d for _, d in indexed[:5]]}..."
+        )
 
-        if not documents:
+        if not indexed:
             return []
 
-        headers = {"Content-Type": "application/json", **self.headers_extra}
-        payload = {"model": self.model, "query": query, "documents": documents}
+        chunk_size = self.max_documents_per_request or len(indexed)
+        chunks = [indexed[i : i + chunk_size] for i in range(0, len(indexed), chunk_size)]
 
         try:
-            # Make the HTTP request to the reranker service
-            resp = requests.post(
-                self.reranker_url, headers=headers, json=payload, timeout=self.timeout
-            )
-            resp.raise_for_status()
-            data = resp.json()
-
-            scored_items: list[tuple[TextualMemoryItem, float]] = []
-
-            if "results" in data:
-                # Format:
-                # dict("results": [{"index": int, "relevance_score": float},
-                # ...])
-                rows = data.get("results", [])
-                for r in rows:
-                    idx = r.get("index")
-                    # The returned index refers to 'documents' (i.e., our 'pairs' order),
-                    # so we must map it back to the original graph_results index.
-                    if isinstance(idx, int) and 0 <= idx < len(graph_results):
-                        raw_score = float(r.get("relevance_score", r.get("score", 0.0)))
-                        item = graph_results[idx]
-                        # generic boost
-                        score = self._apply_boost_generic(item, raw_score, search_filter)
-                        scored_items.append((item, score))
-
-                scored_items.sort(key=lambda x: x[1], reverse=True)
-                return scored_items[: min(top_k, len(scored_items))]
-
-            elif "data" in data:
-                # Format: {"data": [{"score": float}, ...]} aligned by list order
-                rows = data.get("data", [])
-                # Build a list of scores aligned with our 'documents' (pairs)
-                score_list = [float(r.get("score", 0.0)) for r in rows]
-
-                if len(score_list) < len(graph_results):
-                    score_list += [0.0] * (len(graph_results) - len(score_list))
-                elif len(score_list) > len(graph_results):
-                    score_list = score_list[: len(graph_results)]
-
-                scored_items = []
-                for item, raw_score in zip(graph_results, score_list, strict=False):
-                    score = self._apply_boost_generic(item, raw_score, search_filter)
-                    scored_items.append((item, score))
-
-                scored_items.sort(key=lambda x: x[1], reverse=True)
-                return scored_items[: min(top_k, len(scored_items))]
-
+            if len(chunks) == 1:
+                chunk_scores = [self._score_chunk(query, chunks[0])]
             else:
-                # Unexpected response schema: return a 0.0-scored fallback of the first top_k valid docs
-                # Note: we use 'pairs' to keep alignment with valid (string) docs.
-                return [(item, 0.0) for item in graph_results[:top_k]]
-
+                futures = [
+                    get_executor("rerank").submit(self._score_chunk, query, chunk)
+                    for chunk in chunks
+                ]
+                chunk_scores = [future.result() for future in futures]
         except Exception as e:
             # Network error, timeout, JSON decode error, etc.
             # Degrade gracefully by returning first top_k valid docs with 0.0 score.
             logger.error(f"[HTTPBGEReranker] request failed: {e}")
             return [(item, 0.0) for item in graph_results[:top_k]]
 
+        if any(scores is None for scores in chunk_scores):
+            # Unexpected response schema: return a 0.0-scored fallback of the first top_k docs
+            return [(item, 0.0) for item in graph_results[:top_k]]
+
+        scored_items: list[tuple[TextualMemoryItem, float]] = []
+        for scores in chunk_scores:
+            for idx, raw_score in scores:
+                item = graph_results[idx]
+                # generic boost
+                score = self._apply_boost_generic(item, raw_score, search_filter)
+                scored_items.append((item, score))
+
+        scored_items.sort(key=lambda x: x[1], reverse=True)
+        return scored_items[: min(top_k, len(scored_items))]
+
+    def _score_chunk(
+        self, query: str, chunk: list[tuple[int, str]]
+    ) -> list[tuple[int, float]] | None:
+        """
+        Score one request's worth of documents.
+
+        Returns:
+            (graph_results index, raw score) pairs, or None for an unknown response schema.
+        """
+        headers = {"Content-Type": "application/json", **self.headers_extra}
+        payload = {"model": self.model, "query": query, "documents": [d for _, d in chunk]}
+
+        # Make the HTTP request to the reranker service
+        resp = self._session.post(
+            self.reranker_url, headers=headers, json=payload, timeout=self.timeout
+        )
+        resp.raise_for_status()
+        data = resp.json()
+
+        if "results" in data:
+            # Format:
+            # dict("results": [{"index": int, "relevance_score": float},
+            # ...])
+            scores = []
+            for r in data.get("results", []):
+                idx = r.get("index")
+                # The returned index refers to this chunk's documents
+                if isinstance(idx, int) and 0 <= idx < len(chunk):
+                    raw_score = float(r.get("relevance_score", r.get("score", 0.0)))
+                    scores.append((chunk[idx][0], raw_score))
+            return scores
+
+        if "data" in data:
+            # Format: {"data": [{"score": float}, ...]} aligned by list order
+            score_list = [float(r.get("score", 0.0)) for r in data.get("data", [])]
+            score_list += [0.0] * (len(chunk) - len(score_list))
+            return [(idx, score) for (idx, _), score in zip(chunk, score_list, strict=False)]
+
+        return None
+
     def _get_attr_or_key(self, obj: Any, key: str) -> Any:
         """
         Resolve `key` on `obj` with one-level fallback into `obj.metadata`.
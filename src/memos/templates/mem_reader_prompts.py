@@ -256,6 +256,34 @@ ${conversation}
 
 您的输出："""
 
+SIMPLE_STRUCT_MEM_READER_BATCH_NOTE = """IMPORTANT: The input above contains ${count} independent conversations, each introduced by a "### Conversation <index>" header. Process every conversation separately, exactly as instructed for a single conversation, and never mix information between them.
+Instead of a single object, return a valid JSON object with the following structure:
+{
+  "conversations": [
+    {
+      "index": <conversation index>,
+      "memory list": [ ... ],
+      "summary": <summary of this conversation>
+    },
+    ...
+  ]
+}
+Include one entry for every conversation, in order."""
+
+SIMPLE_STRUCT_MEM_READER_BATCH_NOTE_ZH = """重要：以上输入包含 ${count} 段相互独立的对话，每段以 "### Conversation <index>" 标题开头。请按照单段对话的要求分别处理每一段对话，不要在对话之间混用信息。
+请不要返回单个对象，而是返回如下结构的合法 JSON 对象：
+{
+  "conversations": [
+    {
+      "index": <对话编号>,
+      "memory list": [ ... ],
+      "summary": <该段对话的摘要>
+    },
+    ...
+  ]
+}
+请按顺序为每一段对话给出一项结果。"""
+
 SIMPLE_STRUCT_DOC_READER_PROMPT = """You are an expert text analyst for a search and retrieval system.
 Your task is to process a document chunk and generate a single, structured JSON object.
 
@@ -139,6 +139,30 @@ Answer: CONFLICT
 Always respond with ONE word, no matter what language is for the input nodes: [CAUSE | CONDITION | RELATE | CONFLICT | NONE]
 """
 
+PAIRWISE_RELATION_BATCH_PROMPT = """
+You are a reasoning assistant.
+
+Given one memory unit and a numbered list of candidate memory units:
+- Node: "{node}"
+- Candidates:
+{candidates}
+
+Your task, for EACH candidate:
+- Determine its relationship to the Node ONLY if it reveals NEW usable reasoning or retrieval knowledge that is NOT already explicit in either unit.
+- Focus on whether combining them adds new temporal, causal, conditional, or conflict information.
+
+Valid options:
+- CAUSE: One clearly leads to the other.
+- CONDITION: One happens only if the other condition holds.
+- RELATE: They are semantically related by shared people, time, place, or event, but neither causes the other.
+- CONFLICT: They logically contradict each other.
+- NONE: No clear useful connection.
+
+Judge every candidate independently of the others.
+Always respond with a JSON object only, listing every candidate index once, no matter what language is for the input nodes:
+{"relations": [{"index": 0, "relation": "CAUSE | CONDITION | RELATE | CONFLICT | NONE"}]}
+"""
+
 INFER_FACT_PROMPT = """
 You are an inference expert.
 
@@ -208,6 +232,22 @@ Statement 2: {statement_2}
 """
 
 
+MEMORY_RELATION_DETECTOR_BATCH_PROMPT = """You are a memory relationship analyzer.
+You are given a plaintext statement and a numbered list of candidate statements. For EACH candidate, determine its relationship to the statement and classify it into one of the following categories:
+
+contradictory: The two statements describe the same event or related aspects of it but contain factually conflicting details.
+redundant: The two statements describe essentially the same event or information with significant overlap in content and details, conveying the same core information (even if worded differently).
+independent: The two statements are either about different events/topics (unrelated) OR describe different, non-overlapping aspects or perspectives of the same event without conflict (complementary). In both sub-cases, they provide distinct information without contradiction.
+Judge every candidate independently of the others.
+Respond only with a JSON object listing every candidate index once, without explanation or additional text:
+{"relations": [{"index": 0, "label": "contradictory | redundant | independent"}]}
+
+Statement: {statement}
+Candidates:
+{candidates}
+"""
+
+
 MEMORY_RELATION_RESOLVER_PROMPT = """You are a memory fusion expert. You are given two statements and their associated metadata. The statements have been identified as {relation}. Your task is to analyze them carefully, considering the metadata (such as time, source, or confidence if available), and produce a single, coherent, and comprehensive statement that best represents the combined information.
 
 If the statements are redundant, merge them by preserving all unique details and removing duplication, forming a richer, consolidated version.
@@ -8,7 +8,7 @@ from datetime import datetime
 from typing import Literal, TypeAlias
 
 from pydantic import BaseModel
-from typing_extensions import TypedDict
+from typing_extensions import NotRequired, TypedDict
 
 from memos.memories.activation.item import ActivationMemoryItem
 from memos.memories.parametric.item import ParametricMemoryItem
@@ -56,3 +56,7 @@ class MOSSearchResult(TypedDict):
     text_mem: list[dict[str, str | list[TextualMemoryItem]]]
     act_mem: list[dict[str, str | list[ActivationMemoryItem]]]
     para_mem: list[dict[str, str | list[ParametricMemoryItem]]]
+    # Cubes whose search missed the request deadline
+    timed_out_cubes: NotRequired[list[str]]
+    # Memories of all cubes merged and ranked by relativity
+    merged_text_mem: NotRequired[list[TextualMemoryItem]]
@@ -51,6 +51,25 @@ class BaseVecDB(ABC):
             List of search results with distance scores and payloads.
         """
 
+    @abstractmethod
+    def search_batch(
+        self,
+        query_vectors: list[list[float]],
+        top_k: int,
+        filter: dict[str, Any] | None = None,
+    ) -> list[list[VecDBItem]]:
+        """
+        Search for similar items for several query vectors in one request.
+
+        Args:
+            query_vectors: Vectors to search
+            top_k: Number of results to return per vector
+            filter: payload filters shared by every query
+
+        Returns:
+            One list of search results per query vector, in input order.
+        """
+
     @abstractmethod
     def get_by_id(self, id: str) -> VecDBItem | None:
         """Get an item from the vector database."""
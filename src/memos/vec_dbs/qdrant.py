@@ -120,6 +120,56 @@ class QdrantVecDB(BaseVecDB):
             for point in response
         ]
 
+    def search_batch(
+        self,
+        query_vectors: list[list[float]],
+        top_k: int,
+        filter: dict[str, Any] | None = None,
+    ) -> list[list[VecDBItem]]:
+        """
+        Search for similar items for several query vectors in one request.
+
+        Args:
+            query_vectors: Vectors to search
+            top_k: Number of results to return per vector
+            filter: Payload filters shared by every query
+
+        Returns:
+            One list of search results per query vector, in input order.
+        """
+        from qdrant_client.http import models
+
+        if not query_vectors:
+            return []
+
+        qdrant_filter = self._dict_to_filter(filter) if filter else None
+        requests = [
+            models.QueryRequest(
+                query=vector,
+                limit=top_k,
+                filter=qdrant_filter,
+                with_vector=True,
+                with_payload=True,
+            )
+            for vector in query_vectors
+        ]
+        responses = self.client.query_batch_points(
+            collection_name=self.config.collection_name, requests=requests
+        )
+        logger.info(f"Qdrant batch search completed for {len(requests)} queries.")
+        return [
+            [
+                VecDBItem(
+                    id=point.id,
+                    vector=point.vector,
+                    payload=point.payload,
+                    score=point.score,
+                )
+                for point in response.points
+            ]
+            for response in responses
+        ]
+
     def _dict_to_filter(self, filter_dict: dict[str, Any]) -> Any:
         from qdrant_client.http import models
 
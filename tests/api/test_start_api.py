@@ -1,4 +1,4 @@
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
@@ -62,10 +62,12 @@ def mock_mos():
         mock_instance = Mock()
 
         # Set up default return values for methods
-        mock_instance.search.return_value = {"text_mem": [], "act_mem": [], "para_mem": []}
+        mock_instance.asearch = AsyncMock(
+            return_value={"text_mem": [], "act_mem": [], "para_mem": []}
+        )
         mock_instance.get_all.return_value = {"text_mem": [], "act_mem": [], "para_mem": []}
         mock_instance.get.return_value = {"memory": "test memory"}
-        mock_instance.chat.return_value = "test response"
+        mock_instance.achat = AsyncMock(return_value="test response")
         mock_instance.list_users.return_value = []
         mock_instance.get_user_info.return_value = {
             "user_id": "test_user",
@@ -344,7 +346,7 @@ def test_search_memories(mock_mos):
     """Test search memories endpoint."""
     # Mock the search method to return a proper result structure
     mock_results = {"text_mem": [], "act_mem": [], "para_mem": []}
-    mock_mos.search.return_value = mock_results
+    mock_mos.asearch.return_value = mock_results
 
     # Ensure the search request has all required fields
     search_request = {
@@ -360,7 +362,7 @@ def test_search_memories(mock_mos):
         "message": "Search completed successfully",
         "data": mock_results,
     }
-    mock_mos.search.assert_called_once_with(
+    mock_mos.asearch.assert_awaited_once_with(
         query="test query", user_id="test_user", install_cube_ids=["test_cube"]
     )
 
@@ -434,7 +436,7 @@ def test_chat(mock_mos):
         "message": "Chat response generated",
         "data": "test response",
     }
-    mock_mos.chat.assert_called_once_with(query="test chat query", user_id="test_user")
+    mock_mos.achat.assert_awaited_once_with(query="test chat query", user_id="test_user")
 
 
 def test_chat_without_user_id(mock_mos):
@@ -447,7 +449,7 @@ def test_chat_without_user_id(mock_mos):
         "message": "Chat response generated",
         "data": "test response",
     }
-    mock_mos.chat.assert_called_once_with(query="test chat query", user_id=None)
+    mock_mos.achat.assert_awaited_once_with(query="test chat query", user_id=None)
 
 
 def test_home_redirect():
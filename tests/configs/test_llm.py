@@ -111,6 +111,8 @@ def test_hf_llm_config():
             "do_sample",
             "remove_think_prefix",
             "add_generation_prompt",
+            "stop_strings",
+            "batching",
         ],
     )
 
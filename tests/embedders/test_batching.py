@@ -0,0 +1,81 @@
+import threading
+import unittest
+
+from unittest.mock import MagicMock, patch
+
+from memos.configs.embedder import EmbedderBatchingConfig, EmbedderConfigFactory
+from memos.embedders.batching import BatchingEmbedder
+from memos.embedders.cached import CachedEmbedder
+from memos.embedders.factory import EmbedderFactory, OllamaEmbedder
+
+
+def make_inner():
+    inner = MagicMock()
+    inner.embed.side_effect = lambda texts: [[float(len(t))] for t in texts]
+    return inner
+
+
+class TestBatchingEmbedder(unittest.TestCase):
+    def test_concurrent_requests_are_coalesced(self):
+        """Single-text calls from many threads share one backend call."""
+        inner = make_inner()
+        embedder = BatchingEmbedder(
+            EmbedderBatchingConfig(max_batch_size=8, max_wait_ms=200), inner
+        )
+        texts = ["a" * i for i in range(1, 9)]
+        results: dict[str, list[list[float]]] = {}
+        barrier = threading.Barrier(len(texts))
+
+        def worker(text):
+            barrier.wait()
+            results[text] = embedder.embed([text])
+
+        threads = [threading.Thread(target=worker, args=(t,)) for t in texts]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join(timeout=5)
+        embedder.close()
+
+        for text in texts:
+            self.assertEqual(results[text], [[float(len(text))]])
+        self.assertLess(inner.embed.call_count, len(texts))
+        self.assertEqual(sum(len(c.args[0]) for c in inner.embed.call_args_list), len(texts))
+
+    def test_large_request_bypasses_queue(self):
+        """Requests that already fill a batch go straight to the backend."""
+        inner = make_inner()
+        embedder = BatchingEmbedder(EmbedderBatchingConfig(max_batch_size=2), inner)
+
+        self.assertEqual(embedder.embed(["a", "bb"]), [[1.0], [2.0]])
+        inner.embed.assert_called_once_with(["a", "bb"])
+        self.assertIsNone(embedder._worker)
+
+    def test_backend_errors_reach_callers(self):
+        """A failing batched call raises in the waiting caller."""
+        inner = MagicMock()
+        inner.embed.side_effect = RuntimeError("backend down")
+        embedder = BatchingEmbedder(EmbedderBatchingConfig(max_wait_ms=1), inner)
+
+        with self.assertRaises(RuntimeError):
+            embedder.embed(["a"])
+        embedder.close()
+
+    @patch.object(OllamaEmbedder, "embed")
+    def test_factory_composes_batching_and_cache(self, mock_embed):
+        """The cache wraps the batching front-end, which wraps the backend."""
+        mock_embed.return_value = [[0.5, 0.25]]
+        config = EmbedderConfigFactory.model_validate(
+            {
+                "backend": "ollama",
+                "config": {"model_name_or_path": "nomic-embed-text:latest"},
+                "batching": {"max_batch_size": 16, "max_wait_ms": 1},
+                "cache": {},
+            }
+        )
+        embedder = EmbedderFactory.from_config(config)
+
+        self.assertIsInstance(embedder, CachedEmbedder)
+        self.assertIsInstance(embedder.embedder, BatchingEmbedder)
+        self.assertEqual(embedder.embed(["text"]), [[0.5, 0.25]])
+        embedder.embedder.close()
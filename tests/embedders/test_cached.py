@@ -0,0 +1,95 @@
+import os
+import tempfile
+import unittest
+
+from unittest.mock import MagicMock, patch
+
+from memos.configs.embedder import EmbedderCacheConfig, EmbedderConfigFactory
+from memos.embedders.cached import CachedEmbedder
+from memos.embedders.factory import EmbedderFactory, OllamaEmbedder
+
+
+def make_inner():
+    inner = MagicMock()
+    inner.config.model_name_or_path = "test-model"
+    inner.config.embedding_dims = None
+    inner.embed.side_effect = lambda texts: [[float(len(t)), 0.5] for t in texts]
+    return inner
+
+
+class TestCachedEmbedder(unittest.TestCase):
+    def test_repeated_texts_hit_cache(self):
+        """Repeated and duplicate texts are only embedded once."""
+        inner = make_inner()
+        embedder = CachedEmbedder(EmbedderCacheConfig(), inner)
+
+        first = embedder.embed(["a", "bb", "a"])
+        second = embedder.embed(["bb", "ccc"])
+
+        self.assertEqual(first, [[1.0, 0.5], [2.0, 0.5], [1.0, 0.5]])
+        self.assertEqual(second, [[2.0, 0.5], [3.0, 0.5]])
+        self.assertEqual(inner.embed.call_args_list[0].args, (["a", "bb"],))
+        self.assertEqual(inner.embed.call_args_list[1].args, (["ccc"],))
+        stats = embedder.stats()
+        self.assertEqual(stats["misses"], 3)
+        self.assertEqual(stats["hits"], 1)
+        # two float32 values per entry
+        self.assertEqual(stats["bytes"], 3 * 8)
+
+    def test_lru_bounded_by_bytes(self):
+        """Least recently used entries are evicted once the byte budget is exceeded."""
+        inner = make_inner()
+        embedder = CachedEmbedder(EmbedderCacheConfig(max_bytes=16), inner)
+
+        embedder.embed(["a", "bb"])
+        embedder.embed(["a"])  # refresh "a"
+        embedder.embed(["ccc"])  # evicts "bb"
+        inner.embed.reset_mock()
+
+        embedder.embed(["a", "bb"])
+        inner.embed.assert_called_once_with(["bb"])
+        self.assertLessEqual(embedder.stats()["bytes"], 16)
+
+    def test_ttl_expiry(self):
+        """Entries older than the TTL are embedded again."""
+        inner = make_inner()
+        embedder = CachedEmbedder(EmbedderCacheConfig(ttl=10.0), inner)
+
+        with patch("memos.embedders.cached.time.time", return_value=100.0):
+            embedder.embed(["a"])
+        with patch("memos.embedders.cached.time.time", return_value=105.0):
+            embedder.embed(["a"])
+        self.assertEqual(inner.embed.call_count, 1)
+        with patch("memos.embedders.cached.time.time", return_value=111.0):
+            embedder.embed(["a"])
+        self.assertEqual(inner.embed.call_count, 2)
+
+    def test_persistent_store(self):
+        """Embeddings survive across instances through the sqlite store."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            config = EmbedderCacheConfig(persist_path=os.path.join(tmp_dir, "embeddings.db"))
+            CachedEmbedder(config, make_inner()).embed(["hello"])
+
+            inner = make_inner()
+            result = CachedEmbedder(config, inner).embed(["hello"])
+
+            inner.embed.assert_not_called()
+            self.assertEqual(result, [[5.0, 0.5]])
+
+    @patch.object(OllamaEmbedder, "embed")
+    def test_factory_wraps_when_cache_configured(self, mock_embed):
+        """EmbedderFactory returns a CachedEmbedder when a cache config is given."""
+        mock_embed.return_value = [[0.1, 0.2, 0.3]]
+        config = EmbedderConfigFactory.model_validate(
+            {
+                "backend": "ollama",
+                "config": {"model_name_or_path": "nomic-embed-text:latest"},
+                "cache": {"max_bytes": 1024},
+            }
+        )
+        embedder = EmbedderFactory.from_config(config)
+
+        self.assertIsInstance(embedder, CachedEmbedder)
+        embedder.embed(["same text"])
+        embedder.embed(["same text"])
+        mock_embed.assert_called_once_with(["same text"])
@@ -0,0 +1,72 @@
+import uuid
+
+from unittest.mock import patch
+
+import pytest
+
+from memos.configs.graph_db import Neo4jGraphDBConfig
+from memos.graph_dbs.neo4j import Neo4jGraphDB
+
+
+@pytest.fixture
+def graph_db():
+    config = Neo4jGraphDBConfig(
+        uri="bolt://localhost:7687",
+        user="neo4j",
+        password="test",
+        db_name="test_memory_db",
+        auto_create=False,
+        embedding_dimension=3,
+    )
+    with patch("neo4j.GraphDatabase.driver"):
+        db = Neo4jGraphDB(config)
+    _session(db).run.reset_mock()
+    return db
+
+
+def _session(graph_db):
+    return graph_db.driver.session.return_value.__enter__.return_value
+
+
+def _node(node_id, memory):
+    return {"id": node_id, "memory": memory, "sources": []}
+
+
+def test_search_by_embeddings_single_round_trip(graph_db):
+    session = _session(graph_db)
+    first, second = str(uuid.uuid4()), str(uuid.uuid4())
+    session.run.return_value = [
+        {
+            "i": 0,
+            "fetched": 2,
+            "min_score": 0.5,
+            "matches": [
+                {"node": _node(first, "hello"), "score": 0.7},
+                {"node": _node(second, "world"), "score": 0.5},
+            ],
+        },
+        {
+            "i": 1,
+            "fetched": 2,
+            "min_score": 0.6,
+            "matches": [
+                {"node": _node(second, "world"), "score": 0.9},
+                {"node": _node(first, "hello"), "score": 0.6},
+            ],
+        },
+    ]
+
+    nodes = graph_db.search_by_embeddings([[0.1, 0.2, 0.3], [0.3, 0.2, 0.1]], top_k=2)
+
+    session.run.assert_called_once()
+    query, params = session.run.call_args[0]
+    assert "UNWIND range(0, size($embeddings) - 1)" in query
+    assert params["embeddings"] == [[0.1, 0.2, 0.3], [0.3, 0.2, 0.1]]
+    # Deduplicated by id and ordered by each node's best score
+    assert [node["id"] for node in nodes] == [second, first]
+    assert nodes[0]["memory"] == "world"
+
+
+def test_search_by_embeddings_without_vectors_skips_the_query(graph_db):
+    assert graph_db.search_by_embeddings([], top_k=2) == []
+    _session(graph_db).run.assert_not_called()
@@ -0,0 +1,89 @@
+import uuid
+
+from unittest.mock import patch
+
+import pytest
+
+from memos.configs.graph_db import Neo4jGraphDBConfig
+from memos.graph_dbs.neo4j import Neo4jGraphDB
+
+
+@pytest.fixture
+def graph_db():
+    config = Neo4jGraphDBConfig(
+        uri="bolt://localhost:7687",
+        user="neo4j",
+        password="test",
+        db_name="test_memory_db",
+        auto_create=False,
+        embedding_dimension=3,
+    )
+    with patch("neo4j.GraphDatabase.driver"):
+        db = Neo4jGraphDB(config)
+    _session(db).run.reset_mock()
+    return db
+
+
+def _session(graph_db):
+    return graph_db.driver.session.return_value.__enter__.return_value
+
+
+def _nodes(count):
+    return [
+        {"id": str(uuid.uuid4()), "memory": f"memory {i}", "metadata": {"sources": []}}
+        for i in range(count)
+    ]
+
+
+def test_add_nodes_writes_one_unwind_per_batch(graph_db):
+    session = _session(graph_db)
+    nodes = _nodes(3)
+
+    graph_db.add_nodes(nodes, batch_size=2)
+
+    calls = session.run.call_args_list
+    assert len(calls) == 2
+    assert all("UNWIND $rows" in call.args[0] for call in calls)
+    assert [[row["id"] for row in call.kwargs["rows"]] for call in calls] == [
+        [nodes[0]["id"], nodes[1]["id"]],
+        [nodes[2]["id"]],
+    ]
+
+
+def test_add_edges_groups_by_relationship_type(graph_db):
+    session = _session(graph_db)
+    a, b, c = (node["id"] for node in _nodes(3))
+
+    graph_db.add_edges(
+        [
+            {"source": a, "target": b, "type": "PARENT"},
+            {"source": b, "target": c, "type": "PARENT"},
+            {"source": a, "target": c, "type": "RELATE_TO"},
+        ]
+    )
+
+    queries = {call.args[0]: call.kwargs["rows"] for call in session.run.call_args_list}
+    assert len(queries) == 2
+    (parent_rows,) = [rows for q, rows in queries.items() if "MERGE (a)-[:PARENT]->(b)" in q]
+    (relate_rows,) = [rows for q, rows in queries.items() if "MERGE (a)-[:RELATE_TO]->(b)" in q]
+    assert len(parent_rows) == 2
+    assert len(relate_rows) == 1
+
+
+def test_add_nodes_with_nothing_to_write_skips_the_session(graph_db):
+    graph_db.add_nodes([])
+    graph_db.add_edges([])
+    _session(graph_db).run.assert_not_called()
+
+
+def test_append_usage_appends_inside_one_statement(graph_db):
+    session = _session(graph_db)
+    ids = [node["id"] for node in _nodes(2)]
+
+    graph_db.append_usage(ids, "record")
+
+    (call,) = session.run.call_args_list
+    assert "UNWIND $ids" in call.args[0]
+    assert "SET n.usage = coalesce(n.usage, []) + $record" in call.args[0]
+    assert call.kwargs["ids"] == ids
+    assert call.kwargs["record"] == "record"
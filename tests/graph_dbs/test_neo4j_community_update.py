@@ -0,0 +1,64 @@
+import uuid
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from memos.configs.graph_db import Neo4jCommunityGraphDBConfig
+from memos.graph_dbs.neo4j_community import Neo4jCommunityGraphDB
+from memos.vec_dbs.item import VecDBItem
+
+
+@pytest.fixture
+def graph_db():
+    config = Neo4jCommunityGraphDBConfig(
+        uri="bolt://localhost:7687",
+        user="neo4j",
+        password="test",
+        db_name="test_memory_db",
+        auto_create=False,
+        use_multi_db=False,
+        user_name="alice",
+        embedding_dimension=3,
+        vec_config={"backend": "qdrant", "config": {"collection_name": "test"}},
+    )
+    with (
+        patch("neo4j.GraphDatabase.driver"),
+        patch("memos.graph_dbs.neo4j_community.VecDBFactory.from_config", return_value=MagicMock()),
+    ):
+        db = Neo4jCommunityGraphDB(config)
+    _session(db).run.reset_mock()
+    return db
+
+
+def _session(graph_db):
+    return graph_db.driver.session.return_value.__enter__.return_value
+
+
+def test_update_node_moves_embedding_to_vector_db(graph_db):
+    node_id = str(uuid.uuid4())
+    graph_db.vec_db.get_by_id.return_value = VecDBItem(
+        id=node_id,
+        vector=[0.0, 0.0, 1.0],
+        payload={"memory_type": "LongTermMemory", "memory": "old"},
+    )
+
+    graph_db.update_node(node_id, {"memory": "new", "embedding": [1.0, 0.0, 0.0]})
+
+    ((updated_id, item), _) = graph_db.vec_db.update.call_args
+    assert updated_id == node_id
+    assert item.vector == [1.0, 0.0, 0.0]
+    assert item.payload == {"memory_type": "LongTermMemory", "memory": "new"}
+    # The embedding is not written into Neo4j
+    assert _session(graph_db).run.call_args.kwargs["fields"] == {"memory": "new"}
+
+
+def test_update_node_syncs_payload_fields_without_touching_the_vector(graph_db):
+    node_id = str(uuid.uuid4())
+
+    graph_db.update_node(node_id, {"status": "archived", "updated_at": "2025-01-01T00:00:00"})
+
+    ((_, item), _) = graph_db.vec_db.update.call_args
+    assert item.vector is None
+    assert item.payload == {"status": "archived"}
+    graph_db.vec_db.get_by_id.assert_not_called()
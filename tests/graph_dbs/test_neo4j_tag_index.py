@@ -0,0 +1,169 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from memos.configs.graph_db import Neo4jGraphDBConfig
+from memos.graph_dbs.neo4j import Neo4jGraphDB
+
+
+def _make_db(tag_index: bool) -> Neo4jGraphDB:
+    config = Neo4jGraphDBConfig(
+        uri="bolt://localhost:7687",
+        user="neo4j",
+        password="test",
+        db_name="shared_db",
+        auto_create=False,
+        use_multi_db=False,
+        user_name="alice",
+        embedding_dimension=3,
+        tag_index=tag_index,
+    )
+    with patch("neo4j.GraphDatabase.driver"):
+        db = Neo4jGraphDB(config)
+    _session(db).run.reset_mock()
+    return db
+
+
+def _session(graph_db):
+    return graph_db.driver.session.return_value.__enter__.return_value
+
+
+@pytest.fixture
+def graph_db():
+    return _make_db(tag_index=True)
+
+
+def _queries(session):
+    return [call[0][0] for call in session.run.call_args_list]
+
+
+def test_index_created_only_when_enabled():
+    enabled = _make_db(tag_index=True)
+    enabled._create_basic_property_indexes()
+    assert any("tag_scope_name_index" in q for q in _queries(_session(enabled)))
+
+    disabled = _make_db(tag_index=False)
+    disabled._create_basic_property_indexes()
+    assert not any("tag_scope_name_index" in q for q in _queries(_session(disabled)))
+
+
+def test_add_nodes_links_tags(graph_db):
+    session = _session(graph_db)
+    graph_db.add_nodes(
+        [
+            {
+                "id": f"n{i}",
+                "memory": "m",
+                "metadata": {"tags": ["a"], "sources": [], "memory_type": "LongTermMemory"},
+            }
+            for i in range(3)
+        ],
+        batch_size=2,
+    )
+
+    sync_calls = [c for c in session.run.call_args_list if "TAGGED" in c[0][0]]
+    assert [c.kwargs["ids"] for c in sync_calls] == [["n0", "n1"], ["n2"]]
+    assert all(c.kwargs["scope"] == "alice" for c in sync_calls)
+
+
+def test_update_node_relinks_only_when_tags_change(graph_db):
+    session = _session(graph_db)
+    graph_db.update_node("n1", {"status": "archived"})
+    assert not any("TAGGED" in q for q in _queries(session))
+
+    graph_db.update_node("n1", {"tags": ["b"]})
+    assert any("TAGGED" in q for q in _queries(session))
+
+
+def test_get_neighbors_by_tag_uses_index(graph_db):
+    session = _session(graph_db)
+    session.run.return_value = [{"n": {"id": "x", "memory": "m", "sources": []}}]
+
+    neighbors = graph_db.get_neighbors_by_tag(["a", "b"], exclude_ids=["y"], min_overlap=2)
+
+    assert [n["id"] for n in neighbors] == ["x"]
+    query, params = session.run.call_args[0]
+    assert "MATCH (t:Tag)" in query and "count(DISTINCT t)" in query
+    assert "n.tags" not in query
+    assert params["tag_scope"] == "alice" and params["min_overlap"] == 2
+
+
+def test_get_neighbors_by_tag_scans_without_index():
+    graph_db = _make_db(tag_index=False)
+    session = _session(graph_db)
+    session.run.return_value = []
+
+    graph_db.get_neighbors_by_tag(["a"], exclude_ids=[])
+
+    query, _ = session.run.call_args[0]
+    assert ":Tag" not in query
+    assert "[tag IN n.tags WHERE tag IN $tags]" in query
+
+
+def test_get_by_metadata_drives_tag_filter_from_index(graph_db):
+    session = _session(graph_db)
+    session.run.return_value = [{"id": "x"}]
+
+    ids = graph_db.get_by_metadata(
+        [
+            {"field": "tags", "op": "contains", "value": ["a", "b"]},
+            {"field": "memory_type", "op": "=", "value": "LongTermMemory"},
+        ]
+    )
+
+    assert ids == ["x"]
+    query, params = session.run.call_args[0]
+    assert query.startswith("MATCH (t:Tag) WHERE t.scope = $tag_scope AND t.name IN $val0")
+    assert "RETURN DISTINCT n.id" in query
+    assert "n.memory_type = $val1" in query and "n.user_name = $user_name" in query
+    assert params["val0"] == ["a", "b"]
+
+
+def test_rebuild_tag_index_relinks_all_nodes(graph_db):
+    session = _session(graph_db)
+    session.run.side_effect = lambda query, *args, **kwargs: (
+        [{"id": f"n{i}"} for i in range(5)] if "RETURN n.id" in query else []
+    )
+
+    graph_db.rebuild_tag_index(batch_size=2)
+
+    sync_calls = [c for c in session.run.call_args_list if "TAGGED" in c[0][0]]
+    assert [c.kwargs["ids"] for c in sync_calls] == [["n0", "n1"], ["n2", "n3"], ["n4"]]
+
+
+def test_tag_sync_and_deletes_drop_orphan_tags_in_the_same_statement(graph_db):
+    session = _session(graph_db)
+    session.run.return_value.single.return_value = {"removed": 1}
+
+    graph_db.update_node("n1", {"tags": ["b"]})
+    graph_db.delete_node("n1")
+    with patch.object(graph_db, "get_memory_count", return_value=2):
+        graph_db.remove_oldest_memory("WorkingMemory", keep_latest=1)
+
+    queries = _queries(session)
+    sync, delete, prune = queries[1:]
+    assert "MERGE (n)-[:TAGGED]->(t)" in sync
+    assert "DETACH DELETE n" in delete and "DETACH DELETE n" in prune
+    for query in (sync, delete, prune):
+        assert "WHERE NOT (" in query and "<-[:TAGGED]-()" in query
+
+
+def test_deletes_skip_tag_cleanup_without_index():
+    graph_db = _make_db(tag_index=False)
+    graph_db.delete_node("n1")
+    assert ":Tag" not in _queries(_session(graph_db))[0]
+
+
+def test_get_subgraph_expands_only_over_memory_relationships(graph_db):
+    session = _session(graph_db)
+    session.run.side_effect = lambda query, *args, **kwargs: (
+        [{"relationshipType": t} for t in ("PARENT", "TAGGED", "RELATE_TO")]
+        if "db.relationshipTypes" in query
+        else MagicMock(**{"single.return_value": None})
+    )
+
+    graph_db.get_subgraph("n1", depth=2)
+
+    query = _queries(session)[-1]
+    assert "(center)-[r:`PARENT`|`RELATE_TO`*1..2]-(neighbor:Memory)" in query
+    assert "TAGGED" not in query
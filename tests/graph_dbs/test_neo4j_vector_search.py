@@ -0,0 +1,156 @@
+from unittest.mock import patch
+
+import pytest
+
+from memos.configs.graph_db import Neo4jGraphDBConfig
+from memos.graph_dbs.neo4j import Neo4jGraphDB
+
+
+@pytest.fixture
+def graph_db():
+    config = Neo4jGraphDBConfig(
+        uri="bolt://localhost:7687",
+        user="neo4j",
+        password="test",
+        db_name="shared_db",
+        auto_create=False,
+        use_multi_db=False,
+        user_name="alice",
+        embedding_dimension=3,
+        vector_search_overfetch=2,
+        vector_search_max_k=64,
+    )
+    with patch("neo4j.GraphDatabase.driver"):
+        db = Neo4jGraphDB(config)
+    session = db.driver.session.return_value.__enter__.return_value
+    session.run.reset_mock()
+    return db
+
+
+def _session(graph_db):
+    return graph_db.driver.session.return_value.__enter__.return_value
+
+
+def _hits(*ids, score=0.9):
+    return [{"node": node_id, "score": score} for node_id in ids]
+
+
+def test_filtered_search_overfetches_and_pushes_filters(graph_db):
+    session = _session(graph_db)
+    session.run.return_value = [
+        {"i": 0, "fetched": 6, "min_score": 0.5, "matches": _hits("a", "b", "c")}
+    ]
+
+    results = graph_db.search_by_embedding(
+        [0.1, 0.2, 0.3], top_k=3, scope="LongTermMemory", search_filter={"session_id": "s1"}
+    )
+
+    assert [r["id"] for r in results] == ["a", "b", "c"]
+    query, params = session.run.call_args[0]
+    assert params["k"] == 6 and params["top_k"] == 3
+    assert params["user_name"] == "alice"
+    assert params["filter_session_id"] == "s1"
+    assert "hit.node.user_name = $user_name" in query
+    assert "hit.node.session_id = $filter_session_id" in query
+
+
+def test_short_results_are_retried_with_larger_k(graph_db):
+    session = _session(graph_db)
+    session.run.side_effect = [
+        [{"i": 0, "fetched": 10, "min_score": 0.4, "matches": _hits("a")}],
+        [{"i": 0, "fetched": 40, "min_score": 0.2, "matches": _hits("a", "b", "c", "d", "e")}],
+    ]
+
+    results = graph_db.search_by_embedding([0.1, 0.2, 0.3], top_k=5)
+
+    assert len(results) == 5
+    assert [call[0][1]["k"] for call in session.run.call_args_list] == [10, 40]
+
+    # The needed multiple is remembered for the next search with the same filters
+    session.run.side_effect = None
+    session.run.return_value = [
+        {"i": 0, "fetched": 40, "min_score": 0.2, "matches": _hits("a", "b", "c", "d", "e")}
+    ]
+    graph_db.search_by_embedding([0.1, 0.2, 0.3], top_k=5)
+    assert session.run.call_args[0][1]["k"] == 40
+
+
+def test_exhausted_index_or_threshold_stops_retrying(graph_db):
+    session = _session(graph_db)
+    session.run.return_value = [{"i": 0, "fetched": 3, "min_score": 0.9, "matches": _hits("a")}]
+    graph_db.search_by_embedding([0.1, 0.2, 0.3], top_k=5)
+    assert session.run.call_count == 1
+
+    session.run.reset_mock()
+    session.run.return_value = [{"i": 0, "fetched": 10, "min_score": 0.1, "matches": _hits("a")}]
+    graph_db.search_by_embedding([0.1, 0.2, 0.3], top_k=5, threshold=0.5)
+    assert session.run.call_count == 1
+    assert session.run.call_args[0][1]["threshold"] == 0.5
+
+
+def test_batch_search_retries_only_short_vectors(graph_db):
+    session = _session(graph_db)
+    node = lambda node_id: {"id": node_id, "memory": node_id, "sources": []}  # noqa: E731
+    session.run.side_effect = [
+        [
+            {
+                "i": 0,
+                "fetched": 4,
+                "min_score": 0.5,
+                "matches": [{"node": node("a"), "score": 0.9}],
+            },
+            {
+                "i": 1,
+                "fetched": 4,
+                "min_score": 0.5,
+                "matches": [{"node": node("b"), "score": 0.8}, {"node": node("c"), "score": 0.7}],
+            },
+        ],
+        [
+            {
+                "i": 0,
+                "fetched": 16,
+                "min_score": 0.1,
+                "matches": [{"node": node("a"), "score": 0.9}, {"node": node("c"), "score": 0.95}],
+            }
+        ],
+    ]
+
+    nodes = graph_db.search_by_embeddings([[0.1, 0.2, 0.3], [0.3, 0.2, 0.1]], top_k=2)
+
+    assert [n["id"] for n in nodes] == ["c", "a", "b"]
+    second_params = session.run.call_args_list[1][0][1]
+    assert second_params["embeddings"] == [[0.1, 0.2, 0.3]]
+    assert second_params["k"] == 16
+
+
+def test_learned_overfetch_decays_once_first_round_suffices(graph_db):
+    session = _session(graph_db)
+    session.run.side_effect = [
+        [{"i": 0, "fetched": 10, "min_score": 0.4, "matches": _hits("a")}],
+        [{"i": 0, "fetched": 40, "min_score": 0.2, "matches": _hits("a", "b", "c", "d", "e")}],
+    ]
+    graph_db.search_by_embedding([0.1, 0.2, 0.3], top_k=5)
+
+    session.run.side_effect = None
+    session.run.return_value = [
+        {"i": 0, "fetched": 40, "min_score": 0.2, "matches": _hits("a", "b", "c", "d", "e")}
+    ]
+    ks = []
+    for _ in range(4):
+        graph_db.search_by_embedding([0.1, 0.2, 0.3], top_k=5)
+        ks.append(session.run.call_args[0][1]["k"])
+
+    # Halved after each satisfied search, never below the configured multiple
+    assert ks == [40, 20, 10, 10]
+
+
+def test_learned_overfetch_entries_are_capped(graph_db, monkeypatch):
+    monkeypatch.setattr("memos.graph_dbs.neo4j._VECTOR_OVERFETCH_MAX_ENTRIES", 2)
+    session = _session(graph_db)
+    session.run.return_value = [{"i": 0, "fetched": 6, "min_score": 0.5, "matches": _hits("a")}]
+
+    for scope in ["WorkingMemory", "LongTermMemory", "UserMemory"]:
+        graph_db.search_by_embedding([0.1, 0.2, 0.3], top_k=3, scope=scope)
+
+    assert [key[2] for key in graph_db._vector_overfetch] == ["LongTermMemory", "UserMemory"]
@@ -0,0 +1,118 @@
+from unittest.mock import patch
+
+import pytest
+
+from memos.configs.graph_db import Neo4jGraphDBConfig, NodeCacheConfig
+from memos.graph_dbs.neo4j import Neo4jGraphDB
+from memos.graph_dbs.node_cache import NodeCache
+
+
+def _node(node_id, embedding=None):
+    metadata = {"memory_type": "WorkingMemory"}
+    if embedding is not None:
+        metadata["embedding"] = embedding
+    return {"id": node_id, "memory": f"memory {node_id}", "metadata": metadata}
+
+
+def test_lru_eviction_and_stats():
+    cache = NodeCache(NodeCacheConfig(max_entries=2))
+    cache.put_many("alice", [_node("a"), _node("b")])
+    cache.get_many("alice", ["a"])  # "a" becomes most recently used
+    cache.put_many("alice", [_node("c")])
+
+    assert set(cache.get_many("alice", ["a", "b", "c"])) == {"a", "c"}
+    stats = cache.stats()
+    assert stats["evictions"] == 1
+    assert stats["entries"] == 2
+    assert stats["hits"] == 3 and stats["misses"] == 1
+
+
+def test_ttl_expiry():
+    cache = NodeCache(NodeCacheConfig(ttl=10))
+    with patch("memos.graph_dbs.node_cache.time.time", return_value=100.0):
+        cache.put_many("alice", [_node("a")])
+    with patch("memos.graph_dbs.node_cache.time.time", return_value=105.0):
+        assert "a" in cache.get_many("alice", ["a"])
+    with patch("memos.graph_dbs.node_cache.time.time", return_value=111.0):
+        assert cache.get_many("alice", ["a"]) == {}
+    assert cache.stats()["entries"] == 0
+
+
+def test_scopes_and_invalidation():
+    cache = NodeCache(NodeCacheConfig())
+    cache.put_many("alice", [_node("a"), _node("b")])
+    cache.put_many("bob", [_node("a")])
+
+    cache.invalidate("alice", ["a"])
+    assert set(cache.get_many("alice", ["a", "b"])) == {"b"}
+    assert "a" in cache.get_many("bob", ["a"])
+
+    cache.invalidate_scope("alice")
+    assert cache.get_many("alice", ["b"]) == {}
+    cache.invalidate_scope()
+    assert cache.get_many("bob", ["a"]) == {}
+
+
+def test_embedding_exclusion():
+    cache = NodeCache(NodeCacheConfig(include_embedding=False))
+    cache.put_many("alice", [_node("a", embedding=[0.1, 0.2])])
+
+    assert cache.get_many("alice", ["a"], include_embedding=True) == {}
+    hit = cache.get_many("alice", ["a"], include_embedding=False)["a"]
+    assert "embedding" not in hit["metadata"]
+
+
+def test_returned_nodes_are_copies():
+    cache = NodeCache(NodeCacheConfig())
+    cache.put_many("alice", [_node("a", embedding=[0.1])])
+    cache.get_many("alice", ["a"])["a"]["metadata"]["memory_type"] = "changed"
+    stripped = cache.get_many("alice", ["a"], include_embedding=False)["a"]
+    assert "embedding" not in stripped["metadata"]
+
+    node = cache.get_many("alice", ["a"])["a"]
+    assert node["metadata"] == {"memory_type": "WorkingMemory", "embedding": [0.1]}
+
+
+@pytest.fixture
+def graph_db():
+    config = Neo4jGraphDBConfig(
+        uri="bolt://cache-test:7687",
+        user="neo4j",
+        password="test",
+        db_name="shared_db",
+        auto_create=False,
+        use_multi_db=False,
+        user_name="alice",
+        embedding_dimension=3,
+        node_cache=NodeCacheConfig(),
+    )
+    with patch("neo4j.GraphDatabase.driver"):
+        db = Neo4jGraphDB(config)
+    db.node_cache.invalidate_scope()
+    return db
+
+
+def test_get_nodes_only_queries_misses(graph_db):
+    session = graph_db.driver.session.return_value.__enter__.return_value
+    session.run.reset_mock()
+    session.run.return_value = [{"n": {"id": "a", "memory": "x", "sources": []}}]
+    assert [n["id"] for n in graph_db.get_nodes(["a"])] == ["a"]
+
+    session.run.reset_mock()
+    session.run.return_value = [{"n": {"id": "b", "memory": "y", "sources": []}}]
+    nodes = graph_db.get_nodes(["a", "b"])
+
+    assert sorted(n["id"] for n in nodes) == ["a", "b"]
+    assert session.run.call_args[0][1]["ids"] == ["b"]
+
+
+def test_writes_invalidate_cached_nodes(graph_db):
+    session = graph_db.driver.session.return_value.__enter__.return_value
+    session.run.reset_mock()
+    session.run.return_value.single.return_value = {"n": {"id": "a", "memory": "x", "sources": []}}
+    graph_db.get_node("a")
+    graph_db.get_node("a")
+    assert session.run.call_count == 1
+
+    graph_db.update_node("a", {"memory": "new"})
+    assert graph_db.node_cache.get_many("alice", ["a"]) == {}
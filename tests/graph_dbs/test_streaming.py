@@ -0,0 +1,94 @@
+import json
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from memos.graph_dbs.streaming import (
+    STREAM_FORMAT,
+    export_graph_stream,
+    import_graph_stream,
+    is_stream_file,
+)
+
+
+def make_store(node_pages, edge_pages):
+    store = MagicMock()
+
+    def iter_nodes(batch_size=1000, after_id=None, include_embedding=True):
+        for nodes, cursor in node_pages:
+            if after_id is None or cursor > after_id:
+                yield nodes, cursor
+
+    def iter_edges(batch_size=1000, after_id=None):
+        for edges, cursor in edge_pages:
+            if after_id is None or cursor > after_id:
+                yield edges, cursor
+
+    store.iter_nodes.side_effect = iter_nodes
+    store.iter_edges.side_effect = iter_edges
+    return store
+
+
+NODE_PAGES = [
+    ([{"id": "a", "memory": "A", "metadata": {"embedding": [0.5, 0.25], "tags": ["x"]}}], "a"),
+    ([{"id": "b", "memory": "B", "metadata": {"embedding": [1.0, -1.0]}}], "b"),
+]
+EDGE_PAGES = [([{"source": "a", "target": "b", "type": "PARENT"}], "a")]
+
+
+def test_export_then_import_roundtrip(tmp_path):
+    path = str(tmp_path / "graph.ndjson")
+    counts = export_graph_stream(make_store(NODE_PAGES, EDGE_PAGES), path, batch_size=1)
+    assert counts == {"nodes": 2, "edges": 1}
+    assert is_stream_file(path)
+
+    with open(path, encoding="utf-8") as f:
+        lines = [json.loads(line) for line in f]
+    assert lines[0]["format"] == STREAM_FORMAT
+    # embeddings are stored as packed float32 bytes, not number lists
+    assert isinstance(lines[1]["embedding"], str)
+    assert "embedding" not in lines[1]["metadata"]
+    assert lines[-1] == {"kind": "end", "nodes": 2, "edges": 1}
+
+    target = MagicMock()
+    assert import_graph_stream(target, path, batch_size=10) == counts
+    target.add_nodes.assert_called_once_with([node for page, _ in NODE_PAGES for node in page])
+    target.add_edges.assert_called_once_with(EDGE_PAGES[0][0])
+
+
+def test_import_writes_nodes_in_batches(tmp_path):
+    path = str(tmp_path / "graph.ndjson")
+    export_graph_stream(make_store(NODE_PAGES, EDGE_PAGES), path)
+
+    target = MagicMock()
+    import_graph_stream(target, path, batch_size=1)
+    assert target.add_nodes.call_count == 2
+    assert target.add_edges.call_count == 1
+
+
+def test_resume_continues_after_last_checkpoint(tmp_path):
+    path = str(tmp_path / "graph.ndjson")
+    export_graph_stream(make_store(NODE_PAGES, EDGE_PAGES), path)
+    # Simulate a crash while writing the second node page
+    with open(path, encoding="utf-8") as f:
+        lines = f.readlines()
+    with open(path, "w", encoding="utf-8") as f:
+        f.writelines(lines[:3])
+        f.write('{"kind": "node", "id": "b", "mem')
+
+    store = make_store(NODE_PAGES, EDGE_PAGES)
+    counts = export_graph_stream(store, path, resume=True)
+
+    assert counts == {"nodes": 2, "edges": 1}
+    assert store.iter_nodes.call_args.kwargs["after_id"] == "a"
+    with open(path, encoding="utf-8") as f:
+        assert f.readlines() == lines
+
+
+def test_import_rejects_foreign_file(tmp_path):
+    path = tmp_path / "graph.json"
+    path.write_text(json.dumps({"nodes": [], "edges": []}))
+    assert not is_stream_file(str(path))
+    with pytest.raises(ValueError):
+        import_graph_stream(MagicMock(), str(path))
@@ -147,3 +147,129 @@ class TestHFLLM(unittest.TestCase):
         kv_cache = DynamicCache()
         resp = llm.generate([{"role": "user", "content": "Sampling"}], past_key_values=kv_cache)
         self.assertEqual(resp, self.standard_response)
+
+    def _script_tokens(self, rows):
+        """Make the mocked model greedily emit the given token ids, one list per batch row."""
+        steps = iter(zip(*rows, strict=False))
+
+        def forward(**kwargs):
+            logits = torch.zeros(len(rows), 1, 100)
+            for row, token_id in enumerate(next(steps)):
+                logits[row, -1, token_id] = 1.0
+            output = MagicMock()
+            output.logits = logits
+            output.past_key_values = kwargs["past_key_values"]
+            return output
+
+        self.mock_model.side_effect = forward
+        vocab = {5: "Hel", 6: "lo", 7: " wor", 8: "ld", 9: "<|end|>", 10: "!"}
+        self.mock_tokenizer.decode = MagicMock(
+            side_effect=lambda ids, **kw: "".join(vocab.get(int(i), "") for i in ids)
+        )
+
+    def test_full_stream_prefills_once_and_decodes_incrementally(self):
+        config = HFLLMConfig(model_name_or_path="qwen3:0.6b", max_tokens=20, do_sample=False)
+        llm = self._create_llm(config)
+        self._script_tokens([[5, 6, 7, 8, 2]])
+
+        chunks = list(llm.generate_stream([{"role": "user", "content": "Hi"}]))
+
+        self.assertEqual("".join(chunks), "Hello world")
+        calls = self.mock_model.call_args_list
+        self.assertEqual(calls[0][1]["input_ids"].tolist(), [[1, 2, 3]])
+        # every later step feeds only the newest token through the shared cache
+        self.assertTrue(all(call[1]["input_ids"].shape == (1, 1) for call in calls[1:]))
+        self.assertTrue(all(call[1]["past_key_values"] is not None for call in calls))
+
+    def test_stream_stops_at_stop_string(self):
+        config = HFLLMConfig(
+            model_name_or_path="qwen3:0.6b",
+            max_tokens=20,
+            do_sample=False,
+            stop_strings=["<|end|>"],
+        )
+        llm = self._create_llm(config)
+        self._script_tokens([[5, 6, 9, 7, 8, 2]])
+
+        chunks = list(llm.generate_stream([{"role": "user", "content": "Hi"}]))
+
+        self.assertEqual("".join(chunks), "Hello")
+        self.assertEqual(self.mock_model.call_count, 3)
+
+    def test_full_generation_stops_at_stop_string(self):
+        config = HFLLMConfig(
+            model_name_or_path="qwen3:0.6b",
+            max_tokens=20,
+            do_sample=False,
+            stop_strings=["<|end|>"],
+        )
+        llm = self._create_llm(config)
+        self.mock_tokenizer.batch_decode.return_value = ["Hello<|end|> world"]
+
+        resp = llm.generate([{"role": "user", "content": "Hi"}])
+
+        self.assertEqual(resp, "Hello")
+
+    def test_stream_decodes_only_recent_tokens(self):
+        config = HFLLMConfig(model_name_or_path="qwen3:0.6b", max_tokens=40, do_sample=False)
+        llm = self._create_llm(config)
+        self._script_tokens([[5, 6, 7, 8] * 8 + [2]])
+
+        chunks = list(llm.generate_stream([{"role": "user", "content": "Hi"}]))
+
+        self.assertEqual("".join(chunks), "Hello world" * 8)
+        decoded_lengths = [len(call[0][0]) for call in self.mock_tokenizer.decode.call_args_list]
+        self.assertLessEqual(max(decoded_lengths), 2)
+
+    def test_batched_stream_finishes_rows_independently(self):
+        config = HFLLMConfig(model_name_or_path="qwen3:0.6b", max_tokens=20, do_sample=False)
+        llm = self._create_llm(config)
+        self.mock_inputs.input_ids = torch.tensor([[0, 1, 2], [3, 4, 5]])
+        self.mock_inputs.attention_mask = torch.tensor([[0, 1, 1], [1, 1, 1]])
+        self._script_tokens([[5, 6, 2, 2], [7, 8, 10, 2]])
+
+        outputs = ["", ""]
+        for chunks in llm.generate_stream_batch([[{"role": "user", "content": "a"}]] * 2):
+            outputs = [out + chunk for out, chunk in zip(outputs, chunks, strict=False)]
+
+        self.assertEqual(outputs, ["Hello", " world!"])
+        last_mask = self.mock_model.call_args_list[-1][1]["attention_mask"]
+        self.assertEqual(last_mask[0, -1].item(), 0)
+
+    def test_generate_routes_through_batcher_when_configured(self):
+        config = HFLLMConfig(
+            model_name_or_path="qwen3:0.6b",
+            max_tokens=20,
+            do_sample=False,
+            batching={"max_batch_size": 4, "max_wait_ms": 1},
+        )
+        llm = self._create_llm(config)
+        self.mock_inputs.attention_mask = torch.ones(1, 3, dtype=torch.long)
+        self._script_tokens([[5, 6, 2]])
+
+        resp = llm.generate([{"role": "user", "content": "Hi"}])
+
+        self.assertEqual(resp, "Hello")
+        self.mock_model.generate.assert_not_called()
+        llm.batcher.close()
+
+    def test_extend_kv_cache_prefills_only_changed_tail(self):
+        config = HFLLMConfig(model_name_or_path="qwen3:0.6b", max_tokens=10)
+        llm = self._create_llm(config)
+        token_ids = {"old": [[1, 2, 3, 4, 5]], "new": [[1, 2, 3, 7, 8, 9]]}
+        self.mock_tokenizer.apply_chat_template.side_effect = lambda messages, **kw: messages[0][
+            "content"
+        ].split("\n")[-1]
+        self.mock_tokenizer.side_effect = lambda prompt, **kw: {
+            "input_ids": torch.tensor(token_ids[prompt])
+        }
+        kv = MagicMock()
+        kv.get_seq_length.return_value = 5
+
+        result = llm.extend_kv_cache(kv, "old", "new")
+
+        self.assertIs(result, kv)
+        kv.crop.assert_called_once_with(3)
+        forward = self.mock_model.call_args[1]
+        self.assertEqual(forward["input_ids"].tolist(), [[7, 8, 9]])
+        self.assertIs(forward["past_key_values"], kv)
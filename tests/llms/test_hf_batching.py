@@ -0,0 +1,68 @@
+import threading
+import unittest
+
+from unittest.mock import MagicMock
+
+from memos.configs.llm import HFBatchingConfig
+from memos.llms.hf_batching import HFBatchScheduler
+
+
+def make_llm(batch_sizes, started=None, release=None):
+    llm = MagicMock()
+
+    def generate_stream_batch(messages_list):
+        batch_sizes.append(len(messages_list))
+        if started is not None:
+            started.set()
+            release.wait(timeout=5)
+        contents = [messages[-1]["content"] for messages in messages_list]
+        yield [f"echo {content}" for content in contents]
+        # the first row finishes early, the others keep streaming
+        yield ["", *["!" for _ in contents[1:]]]
+
+    llm.generate_stream_batch.side_effect = generate_stream_batch
+    return llm
+
+
+class TestHFBatchScheduler(unittest.TestCase):
+    def test_concurrent_requests_share_a_batch(self):
+        """Requests waiting while the model is busy are decoded together."""
+        batch_sizes = []
+        started, release = threading.Event(), threading.Event()
+        scheduler = HFBatchScheduler(
+            make_llm(batch_sizes, started, release), HFBatchingConfig(max_wait_ms=1)
+        )
+        results = {}
+
+        def call(name):
+            results[name] = scheduler.generate([{"role": "user", "content": name}])
+
+        first = threading.Thread(target=call, args=("a",))
+        first.start()
+        started.wait(timeout=5)
+        others = [threading.Thread(target=call, args=(name,)) for name in ("b", "c", "d")]
+        for thread in others:
+            thread.start()
+        while scheduler._queue.qsize() < 3:
+            pass
+        release.set()
+        for thread in [first, *others]:
+            thread.join(timeout=5)
+        scheduler.close()
+
+        self.assertEqual(batch_sizes, [1, 3])
+        self.assertEqual(results["a"], "echo a")
+        self.assertEqual(results["b"], "echo b")
+        self.assertEqual(results["c"], "echo c!")
+
+    def test_stream_yields_chunks_and_propagates_errors(self):
+        llm = MagicMock()
+        llm.generate_stream_batch.side_effect = RuntimeError("boom")
+        scheduler = HFBatchScheduler(llm, HFBatchingConfig())
+        with self.assertRaises(RuntimeError):
+            list(scheduler.generate_stream([{"role": "user", "content": "x"}]))
+
+        scheduler.llm = make_llm([])
+        chunks = list(scheduler.generate_stream([{"role": "user", "content": "x"}]))
+        self.assertEqual(chunks, ["echo x"])
+        scheduler.close()
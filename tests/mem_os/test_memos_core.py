@@ -1,7 +1,9 @@
+import asyncio
+import threading
 import warnings
 
 from datetime import datetime
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -9,7 +11,11 @@ from memos.configs.mem_os import MOSConfig
 from memos.mem_cube.general import GeneralMemCube
 from memos.mem_os.core import MOSCore
 from memos.mem_user.user_manager import UserRole
-from memos.memories.textual.item import TextualMemoryItem, TextualMemoryMetadata
+from memos.memories.textual.item import (
+    SearchedTreeNodeTextualMemoryMetadata,
+    TextualMemoryItem,
+    TextualMemoryMetadata,
+)
 
 
 warnings.filterwarnings("ignore", category=pytest.PytestConfigWarning)
@@ -339,6 +345,165 @@ class TestMOSMemoryOperations:
         assert call_args[1]["info"]["user_id"] == "test_user"
         assert "session_id" in call_args[1]["info"]
 
+    @patch("memos.mem_os.core.UserManager")
+    @patch("memos.mem_os.core.MemReaderFactory")
+    @patch("memos.mem_os.core.LLMFactory")
+    def test_asearch_memories(
+        self,
+        mock_llm_factory,
+        mock_reader_factory,
+        mock_user_manager_class,
+        mock_config,
+        mock_llm,
+        mock_mem_reader,
+        mock_user_manager,
+        mock_mem_cube,
+    ):
+        """Test async memory search uses the native async path when available."""
+        mock_llm_factory.from_config.return_value = mock_llm
+        mock_reader_factory.from_config.return_value = mock_mem_reader
+        mock_user_manager_class.return_value = mock_user_manager
+
+        mock_mem_cube.text_mem.asearch = AsyncMock(
+            return_value=mock_mem_cube.text_mem.search.return_value
+        )
+        mos = MOSCore(MOSConfig(**mock_config))
+        mos.mem_cubes["test_cube_1"] = mock_mem_cube
+
+        result = asyncio.run(mos.asearch("football"))
+
+        assert len(result["text_mem"]) == 1
+        assert result["text_mem"][0]["cube_id"] == "test_cube_1"
+        mock_mem_cube.text_mem.search.assert_not_called()
+        mock_mem_cube.text_mem.asearch.assert_awaited_once()
+        call_args = mock_mem_cube.text_mem.asearch.call_args
+        assert call_args[0] == ("football",)
+        assert call_args[1]["top_k"] == 5
+        assert call_args[1]["info"]["user_id"] == "test_user"
+
+    @patch("memos.mem_os.core.UserManager")
+    @patch("memos.mem_os.core.MemReaderFactory")
+    @patch("memos.mem_os.core.LLMFactory")
+    def test_search_reports_cubes_missing_deadline(
+        self,
+        mock_llm_factory,
+        mock_reader_factory,
+        mock_user_manager_class,
+        mock_config,
+        mock_llm,
+        mock_mem_reader,
+        mock_user_manager,
+        mock_mem_cube,
+    ):
+        """Cubes are searched concurrently; slow cubes are reported, not fatal."""
+        mock_llm_factory.from_config.return_value = mock_llm
+        mock_reader_factory.from_config.return_value = mock_mem_reader
+        mock_user_manager_class.return_value = mock_user_manager
+
+        release = threading.Event()
+        slow_cube = MagicMock()
+        slow_cube.text_mem.search.side_effect = lambda *args, **kwargs: release.wait(5) and []
+        mos = MOSCore(MOSConfig(**mock_config))
+        mos.mem_cubes["test_cube_1"] = mock_mem_cube
+        mos.mem_cubes["test_cube_2"] = slow_cube
+
+        try:
+            result = mos.search("football", timeout=0.2)
+        finally:
+            release.set()
+
+        assert [r["cube_id"] for r in result["text_mem"]] == ["test_cube_1"]
+        assert result["timed_out_cubes"] == ["test_cube_2"]
+        assert "merged_text_mem" not in result
+
+    @patch("memos.mem_os.core.UserManager")
+    @patch("memos.mem_os.core.MemReaderFactory")
+    @patch("memos.mem_os.core.LLMFactory")
+    def test_search_merges_cube_results(
+        self,
+        mock_llm_factory,
+        mock_reader_factory,
+        mock_user_manager_class,
+        mock_config,
+        mock_llm,
+        mock_mem_reader,
+        mock_user_manager,
+        mock_mem_cube,
+    ):
+        """Merged results are deduplicated and ranked by relativity across cubes."""
+        mock_llm_factory.from_config.return_value = mock_llm
+        mock_reader_factory.from_config.return_value = mock_mem_reader
+        mock_user_manager_class.return_value = mock_user_manager
+
+        def memory(memory_id, relativity):
+            return TextualMemoryItem(
+                id=memory_id,
+                memory=memory_id,
+                metadata=SearchedTreeNodeTextualMemoryMetadata(relativity=relativity),
+            )
+
+        shared_id = "00000000-0000-0000-0000-000000000001"
+        first_id = "00000000-0000-0000-0000-000000000002"
+        second_id = "00000000-0000-0000-0000-000000000003"
+        cube_1, cube_2 = MagicMock(), MagicMock()
+        cube_1.text_mem.search.return_value = [memory(shared_id, 0.4), memory(first_id, 0.9)]
+        cube_2.text_mem.search.return_value = [memory(shared_id, 0.6), memory(second_id, 0.1)]
+        mos = MOSCore(MOSConfig(**mock_config))
+        mos.mem_cubes["test_cube_1"] = cube_1
+        mos.mem_cubes["test_cube_2"] = cube_2
+
+        result = mos.search("football", top_k=2, merge_results=True)
+
+        assert [r["cube_id"] for r in result["text_mem"]] == ["test_cube_1", "test_cube_2"]
+        assert "timed_out_cubes" not in result
+        merged = result["merged_text_mem"]
+        assert [m.id for m in merged] == [first_id, shared_id]
+        assert merged[1].metadata.relativity == 0.6
+
+    @patch("memos.mem_os.core.UserManager")
+    @patch("memos.mem_os.core.MemReaderFactory")
+    @patch("memos.mem_os.core.LLMFactory")
+    def test_asearch_applies_deadline_and_merge_from_config(
+        self,
+        mock_llm_factory,
+        mock_reader_factory,
+        mock_user_manager_class,
+        mock_config,
+        mock_llm,
+        mock_mem_reader,
+        mock_user_manager,
+        mock_mem_cube,
+    ):
+        """The async path honours `search_timeout` and `merge_search_results` too."""
+        mock_llm_factory.from_config.return_value = mock_llm
+        mock_reader_factory.from_config.return_value = mock_mem_reader
+        mock_user_manager_class.return_value = mock_user_manager
+
+        memory = TextualMemoryItem(
+            id="00000000-0000-0000-0000-000000000001",
+            memory="football",
+            metadata=SearchedTreeNodeTextualMemoryMetadata(relativity=0.7),
+        )
+
+        async def slow_search(*args, **kwargs):
+            await asyncio.sleep(5)
+            return []
+
+        fast_cube, slow_cube = MagicMock(), MagicMock()
+        fast_cube.text_mem.asearch = AsyncMock(return_value=[memory])
+        slow_cube.text_mem.asearch = slow_search
+        mos = MOSCore(MOSConfig(**mock_config, search_timeout=0.2, merge_search_results=True))
+        mos.mem_cubes["test_cube_1"] = fast_cube
+        mos.mem_cubes["test_cube_2"] = slow_cube
+
+        result = asyncio.run(mos.asearch("football"))
+
+        assert [r["cube_id"] for r in result["text_mem"]] == ["test_cube_1"]
+        assert result["timed_out_cubes"] == ["test_cube_2"]
+        assert [m.id for m in result["merged_text_mem"]] == [memory.id]
+        # The deadline is handed down so the cube search can stop early
+        assert "deadline" in fast_cube.text_mem.asearch.call_args[1]
+
     @patch("memos.mem_os.core.UserManager")
     @patch("memos.mem_os.core.MemReaderFactory")
     @patch("memos.mem_os.core.LLMFactory")
@@ -1,11 +1,16 @@
 import json
+import tempfile
 import unittest
 
 from unittest.mock import MagicMock, patch
 
 from memos.chunkers import ChunkerFactory
 from memos.chunkers.base import Chunk
-from memos.configs.mem_reader import SimpleStructMemReaderConfig
+from memos.configs.mem_reader import (
+    ChatBatchingConfig,
+    DocIngestConfig,
+    SimpleStructMemReaderConfig,
+)
 from memos.embedders.factory import EmbedderFactory
 from memos.llms.factory import LLMFactory
 from memos.mem_reader.simple_struct import SimpleStructMemReader
@@ -20,6 +25,8 @@ class TestSimpleStructMemReader(unittest.TestCase):
         self.config.embedder = MagicMock()
         self.config.chunker = MagicMock()
         self.config.remove_prompt_example = MagicMock()
+        self.config.doc_ingest = DocIngestConfig()
+        self.config.chat_batching = None
 
         # Mock dependencies
         with (
@@ -69,6 +76,67 @@ class TestSimpleStructMemReader(unittest.TestCase):
         )
         self.assertEqual(result[0].metadata.user_id, "user1")
 
+    def _scene(self, text):
+        return [{"role": "user", "content": text}]
+
+    def _memory_list(self, value):
+        return {"memory list": [{"key": "k", "memory_type": "UserMemory", "value": value}]}
+
+    def test_get_memory_packs_short_scenes_into_one_call(self):
+        """Short scenes share one LLM call and one embedder request."""
+        self.config.chat_batching = ChatBatchingConfig(max_tokens=1000, max_scenes=8)
+        self.reader.llm.generate.return_value = json.dumps(
+            {
+                "conversations": [
+                    {"index": 2, **self._memory_list("second"), "summary": "s2"},
+                    {"index": 1, **self._memory_list("first"), "summary": "s1"},
+                ]
+            }
+        )
+        self.reader.parse_json_result = lambda x: json.loads(x)
+        self.reader.embedder.embed.side_effect = lambda texts: [[0.1] * 3 for _ in texts]
+        info = {"user_id": "user1", "session_id": "session1"}
+
+        result = self.reader.get_memory(
+            [self._scene("first scene"), self._scene("second scene")], type="chat", info=info
+        )
+
+        self.assertEqual(self.reader.llm.generate.call_count, 1)
+        prompt = self.reader.llm.generate.call_args[0][0][0]["content"]
+        self.assertIn("### Conversation 1\nuser:first scene", prompt)
+        self.assertIn("### Conversation 2\nuser:second scene", prompt)
+        self.reader.embedder.embed.assert_called_once_with(["first", "second"])
+        self.assertEqual([[m.memory for m in scene] for scene in result], [["first"], ["second"]])
+        self.assertEqual(result[0][0].metadata.background, "s1")
+        self.assertEqual(result[1][0].metadata.sources[0].content, "second scene")
+
+    def test_pack_chat_scenes_respects_budget(self):
+        """Scenes are split into batches by token budget and scene count."""
+        self.config.chat_batching = ChatBatchingConfig(max_tokens=10, max_scenes=2)
+        scenes = [self._scene("a" * 12), self._scene("b"), self._scene("c"), self._scene("d" * 80)]
+
+        batches = self.reader._pack_chat_scenes(scenes)
+
+        self.assertEqual(batches, [scenes[:2], scenes[2:3], scenes[3:]])
+
+    def test_process_chat_batch_falls_back_for_missing_scenes(self):
+        """Scenes missing from the batched answer are extracted on their own."""
+        self.config.chat_batching = ChatBatchingConfig()
+        self.reader.llm.generate.side_effect = [
+            json.dumps({"conversations": [{"index": 1, **self._memory_list("first")}]}),
+            json.dumps({**self._memory_list("second"), "summary": ""}),
+        ]
+        self.reader.parse_json_result = lambda x: json.loads(x)
+        self.reader.embedder.embed.side_effect = lambda texts: [[0.1] * 3 for _ in texts]
+        info = {"user_id": "user1", "session_id": "session1"}
+
+        result = self.reader._process_chat_batch(
+            [self._scene("first scene"), self._scene("second scene")], info
+        )
+
+        self.assertEqual(self.reader.llm.generate.call_count, 2)
+        self.assertEqual([[m.memory for m in scene] for scene in result], [["first"], ["second"]])
+
     def test_process_doc_data(self):
         """Test processing document chunks into memory items."""
         scene_data_info = {"file": "tests/mem_reader/test.txt", "text": "Parsed document text"}
@@ -90,6 +158,82 @@ class TestSimpleStructMemReader(unittest.TestCase):
         self.assertIsInstance(result[0], TextualMemoryItem)
         self.assertIn("sample document", result[0].memory)
 
+    def _mock_doc_pipeline(self, n_chunks):
+        self.reader.chunker.chunk.return_value = [
+            Chunk(text=f"chunk {i}", token_count=2, sentences=[f"chunk {i}"])
+            for i in range(n_chunks)
+        ]
+
+        def generate(message):
+            chunk_text = message[0]["content"].split("chunk ")[-1].split()[0]
+            return json.dumps({"value": f"memory {chunk_text}", "tags": [], "key": "k"})
+
+        self.reader.llm.generate.side_effect = generate
+        self.reader.parse_json_result = lambda x: json.loads(x)
+        self.reader.embedder.embed.side_effect = lambda texts: [[0.1] * 3 for _ in texts]
+
+    def test_iter_doc_memory_batches_embeddings_in_chunk_order(self):
+        """Documents stream out in embedding batches, in chunk order."""
+        self._mock_doc_pipeline(5)
+        self.config.doc_ingest = DocIngestConfig(llm_concurrency=2, embed_batch_size=2)
+        info = {"user_id": "user1", "session_id": "session1"}
+
+        batches = list(self.reader.iter_doc_memory(["raw document text"], info))
+
+        self.assertEqual([len(batch) for batch in batches], [2, 2, 1])
+        memories = [item.memory for batch in batches for item in batch]
+        self.assertEqual(memories, [f"memory {i}" for i in range(5)])
+        self.assertEqual(self.reader.embedder.embed.call_count, 3)
+
+    def test_iter_doc_memory_resumes_from_checkpoint(self):
+        """Batches already consumed are skipped when ingestion is restarted."""
+        self._mock_doc_pipeline(4)
+        info = {"user_id": "user1", "session_id": "session1"}
+        with tempfile.TemporaryDirectory() as checkpoint_dir:
+            self.config.doc_ingest = DocIngestConfig(
+                llm_concurrency=1, embed_batch_size=2, checkpoint_dir=checkpoint_dir
+            )
+            stream = self.reader.iter_doc_memory(["raw document text"], info)
+            first = next(stream)
+            next(stream)  # the first batch was consumed, so its checkpoint is written
+            stream.close()
+
+            resumed = list(self.reader.iter_doc_memory(["raw document text"], info))
+            finished = list(self.reader.iter_doc_memory(["raw document text"], info))
+
+        self.assertEqual([item.memory for item in first], ["memory 0", "memory 1"])
+        self.assertEqual(
+            [item.memory for batch in resumed for item in batch], ["memory 2", "memory 3"]
+        )
+        self.assertEqual(finished, [])
+
+    def test_iter_doc_memory_retries_failed_chunks_on_resume(self):
+        """Chunks whose extraction failed are not checkpointed as done."""
+        self._mock_doc_pipeline(4)
+        generate = self.reader.llm.generate.side_effect
+        self.reader.llm.generate.side_effect = lambda message: (
+            "" if "chunk 1" in message[0]["content"] else generate(message)
+        )
+        info = {"user_id": "user1", "session_id": "session1"}
+        with tempfile.TemporaryDirectory() as checkpoint_dir:
+            self.config.doc_ingest = DocIngestConfig(
+                llm_concurrency=2, embed_batch_size=2, checkpoint_dir=checkpoint_dir
+            )
+            first = list(self.reader.iter_doc_memory(["raw document text"], info))
+
+            self.reader.llm.generate.side_effect = generate
+            self.reader.llm.generate.reset_mock()
+            resumed = list(self.reader.iter_doc_memory(["raw document text"], info))
+            finished = list(self.reader.iter_doc_memory(["raw document text"], info))
+
+        self.assertEqual(
+            [item.memory for batch in first for item in batch],
+            ["memory 0", "memory 2", "memory 3"],
+        )
+        self.assertEqual([item.memory for batch in resumed for item in batch], ["memory 1"])
+        self.assertEqual(self.reader.llm.generate.call_count, 1)
+        self.assertEqual(finished, [])
+
     def test_get_scene_data_info_with_chat(self):
         """Test extracting chat info from scene data."""
         scene_data = [
@@ -0,0 +1,110 @@
+import threading
+import unittest
+
+from datetime import datetime
+
+from memos.mem_scheduler.general_modules.dispatcher import SchedulerDispatcher
+from memos.mem_scheduler.schemas.message_schemas import ScheduleMessageItem
+
+
+def _message(user_id: str, label: str, content: str) -> ScheduleMessageItem:
+    return ScheduleMessageItem(
+        user_id=user_id,
+        mem_cube_id=f"{user_id}_cube",
+        label=label,
+        mem_cube="mem_cube",
+        content=content,
+        timestamp=datetime.now(),
+    )
+
+
+class TestSchedulerDispatcher(unittest.TestCase):
+    def setUp(self):
+        self.dispatcher = SchedulerDispatcher(max_workers=4, enable_parallel_dispatch=True)
+        self.handled = []
+        self.lock = threading.Lock()
+
+        def record(messages):
+            with self.lock:
+                self.handled.append([(m.user_id, m.label, m.content) for m in messages])
+
+        self.dispatcher.register_handlers({"query": record, "answer": record})
+
+    def tearDown(self):
+        self.dispatcher.shutdown()
+
+    def test_per_user_order_is_kept_across_labels(self):
+        """Each user's messages run in arrival order, split into same-label runs."""
+        self.dispatcher.dispatch(
+            [
+                _message("alice", "query", "q1"),
+                _message("alice", "query", "q2"),
+                _message("bob", "query", "b1"),
+                _message("alice", "answer", "a1"),
+                _message("alice", "query", "q3"),
+            ]
+        )
+        self.assertTrue(self.dispatcher.join(timeout=5))
+
+        alice = [run for run in self.handled if run[0][0] == "alice"]
+        self.assertEqual(
+            alice,
+            [
+                [("alice", "query", "q1"), ("alice", "query", "q2")],
+                [("alice", "answer", "a1")],
+                [("alice", "query", "q3")],
+            ],
+        )
+        self.assertIn([("bob", "query", "b1")], self.handled)
+
+    def test_slow_user_does_not_block_other_users(self):
+        """A blocked handler only holds up its own shard."""
+        release = threading.Event()
+        bob_done = threading.Event()
+
+        def slow(messages):
+            release.wait(timeout=5)
+
+        self.dispatcher.register_handler("slow", slow)
+        self.dispatcher.register_handler("query", lambda messages: bob_done.set())
+        slow_msg = _message("alice", "slow", "x")
+        slow_shard = self.dispatcher._shard_index(slow_msg.user_id, slow_msg.mem_cube_id)
+        bob_msg = next(
+            msg
+            for msg in (_message(f"bob{i}", "query", "y") for i in range(100))
+            if self.dispatcher._shard_index(msg.user_id, msg.mem_cube_id) != slow_shard
+        )
+
+        self.dispatcher.dispatch([slow_msg])
+        self.dispatcher.dispatch([bob_msg])
+
+        self.assertTrue(bob_done.wait(timeout=5))
+        release.set()
+        self.assertTrue(self.dispatcher.join(timeout=5))
+
+    def test_shard_stats_report_depth_and_latency(self):
+        release = threading.Event()
+        started = threading.Event()
+
+        def blocking(messages):
+            started.set()
+            release.wait(timeout=5)
+
+        self.dispatcher.register_handler("query", blocking)
+        first = _message("alice", "query", "q1")
+        self.dispatcher.dispatch([first])
+        self.assertTrue(started.wait(timeout=5))
+        self.dispatcher.dispatch([_message("alice", "answer", "a1")])
+
+        index = self.dispatcher._shard_index(first.user_id, first.mem_cube_id)
+        stats = self.dispatcher.shard_stats()[index]
+        self.assertEqual(stats["queue_depth"], 1)
+        self.assertEqual(stats["pending_messages"], 1)
+        self.assertTrue(stats["active"])
+
+        release.set()
+        self.assertTrue(self.dispatcher.join(timeout=5))
+        stats = self.dispatcher.shard_stats()[index]
+        self.assertEqual(stats["queue_depth"], 0)
+        self.assertEqual(stats["handled"], 2)
+        self.assertGreater(stats["max_latency"], 0.0)
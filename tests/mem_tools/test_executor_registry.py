@@ -0,0 +1,70 @@
+"""
+Test the shared executor registry used on the search / reader hot paths.
+"""
+
+import threading
+
+from memos.memos_tools import executor_registry
+from memos.memos_tools.executor_registry import (
+    configure_executors,
+    executor_stats,
+    get_executor,
+    shutdown_executors,
+)
+
+
+class TestExecutorRegistry:
+    """Test named, shared executors."""
+
+    def teardown_method(self):
+        executor_registry._sizes.pop("unit-test", None)
+        shutdown_executors()
+
+    def test_get_executor_is_shared(self):
+        """The same name always maps to the same executor."""
+        assert get_executor("unit-test") is get_executor("unit-test")
+        assert get_executor("unit-test") is not get_executor("unit-test-other")
+
+    def test_size_from_env_and_configure(self, monkeypatch):
+        """Sizes come from env vars and can be overridden explicitly."""
+        monkeypatch.setenv("MEMOS_EXECUTOR_UNIT-TEST_WORKERS", "3")
+        assert get_executor("unit-test").max_workers == 3
+
+        configure_executors({"unit-test": 5})
+        assert get_executor("unit-test").max_workers == 5
+
+    def test_stats_track_queue_depth(self):
+        """Queued and running counts reflect the executor's load."""
+        configure_executors({"unit-test": 1})
+        executor = get_executor("unit-test")
+        started = threading.Event()
+        release = threading.Event()
+
+        def blocker():
+            started.set()
+            release.wait(timeout=5)
+
+        first = executor.submit(blocker)
+        second = executor.submit(lambda: 42)
+        started.wait(timeout=5)
+
+        stats = executor_stats()["unit-test"]
+        assert stats["running"] == 1
+        assert stats["queued"] == 1
+
+        release.set()
+        first.result(timeout=5)
+        assert second.result(timeout=5) == 42
+
+        stats = executor.stats()
+        assert stats["running"] == 0
+        assert stats["queued"] == 0
+        assert stats["completed"] == 2
+
+    def test_shutdown_recreates_lazily(self):
+        """After shutdown a fresh executor is created on demand."""
+        executor = get_executor("unit-test")
+        shutdown_executors()
+        assert "unit-test" not in executor_stats()
+        assert get_executor("unit-test") is not executor
+        assert get_executor("unit-test").submit(lambda: "ok").result(timeout=5) == "ok"
@@ -84,3 +84,78 @@ def test_from_textual_memory(kv_memory):
     item = kv_memory.from_textual_memory(DummyTextualMemory())
     assert isinstance(item, KVCacheItem)
     assert item.metadata["bar"] == 1
+
+
+def test_extract_incremental_reuses_previous_cache(kv_memory):
+    # The LLM extends the previous cache instead of building a new one
+    extended = DynamicCache()
+    kv_memory.llm.extend_kv_cache = MagicMock(return_value=extended)
+    previous = kv_memory.extract("1. a\n2. b\n")
+
+    item = kv_memory.extract_incremental("1. a\n2. c\n", previous)
+
+    kv_memory.llm.extend_kv_cache.assert_called_once_with(
+        previous.memory, "1. a\n2. b\n", "1. a\n2. c\n"
+    )
+    assert item.memory is extended
+    assert item.metadata["source_text"] == "1. a\n2. c\n"
+
+
+def make_layered_cache(value):
+    cache = DynamicCache()
+    for layer in range(2):
+        cache.update(torch.full((1, 2, 3, 4), value), torch.full((1, 2, 3, 4), -value), layer)
+    return cache
+
+
+def test_dump_and_lazy_load_tensor_store(kv_memory, dummy_config, tmp_path):
+    first = KVCacheItem(memory=make_layered_cache(1.0), metadata={"source_text": "a"})
+    second = KVCacheItem(memory=make_layered_cache(2.0))
+    kv_memory.add([first, second])
+    kv_memory.dump(str(tmp_path))
+
+    store = tmp_path / "test_kv_cache.kvstore"
+    assert sorted(p.name for p in store.iterdir()) == sorted(
+        ["index.json", f"{first.id}.safetensors", f"{second.id}.safetensors"]
+    )
+
+    loaded = KVCacheMemory(dummy_config)
+    loaded.load(str(tmp_path))
+    # only the index is read until an item is requested
+    assert loaded.kv_cache_memories == {}
+
+    cache = loaded.get_cache([second.id])
+    assert list(loaded.kv_cache_memories) == [second.id]
+    assert torch.equal(cache.layers[1].keys, torch.full((1, 2, 3, 4), 2.0))
+
+    items = loaded.get_all()
+    assert [item.id for item in items] == [first.id, second.id]
+    assert items[0].metadata == {"source_text": "a"}
+
+
+def test_dump_only_rewrites_changed_items(kv_memory, dummy_config, tmp_path):
+    kept = KVCacheItem(memory=make_layered_cache(1.0))
+    dropped = KVCacheItem(memory=make_layered_cache(2.0))
+    kv_memory.add([kept, dropped])
+    kv_memory.dump(str(tmp_path))
+
+    kv_memory.load(str(tmp_path))
+    kv_memory.delete([dropped.id])
+    added = KVCacheItem(memory=make_layered_cache(3.0))
+    kv_memory.add([added])
+    with pytest.MonkeyPatch.context() as m:
+        import safetensors.torch
+
+        saved = []
+        real_save = safetensors.torch.save_file
+        m.setattr(
+            safetensors.torch,
+            "save_file",
+            lambda tensors, path: saved.append(path) or real_save(tensors, path),
+        )
+        kv_memory.dump(str(tmp_path))
+
+    assert len(saved) == 1 and added.id in saved[0]
+    store = tmp_path / "test_kv_cache.kvstore"
+    assert not (store / f"{dropped.id}.safetensors").exists()
+    assert [item.id for item in kv_memory.get_all()] == [kept.id, added.id]
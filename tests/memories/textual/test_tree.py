@@ -1,3 +1,4 @@
+import json
 import uuid
 
 from unittest.mock import MagicMock, patch
@@ -7,6 +8,10 @@ import pytest
 from memos.configs.memory import TreeTextMemoryConfig
 from memos.memories.textual.item import TextualMemoryItem, TreeNodeTextualMemoryMetadata
 from memos.memories.textual.tree import TreeTextMemory
+from memos.memories.textual.tree_text_memory.retrieve.search_cache import (
+    get_write_version,
+    graph_scope,
+)
 
 
 @pytest.fixture
@@ -119,25 +124,67 @@ def test_load_file_not_exists(mock_tree_text_memory, tmp_path):
 
 
 def test_dump_and_load_success(tmp_path, mock_tree_text_memory):
-    mock_tree_text_memory.graph_store.export_graph = MagicMock(
-        return_value={"nodes": [{"id": "1"}]}
-    )
+    node = {"id": "1", "memory": "hello", "metadata": {"embedding": [0.5, 0.25]}}
+    mock_tree_text_memory.graph_store.iter_nodes = MagicMock(return_value=iter([([node], "1")]))
+    mock_tree_text_memory.graph_store.iter_edges = MagicMock(return_value=iter([]))
     mock_tree_text_memory.config.memory_filename = "memory.json"
     mock_tree_text_memory.dump(str(tmp_path))
 
-    dumped_file = tmp_path / "memory.json"
+    dumped_file = tmp_path / "memory.ndjson"
     assert dumped_file.exists()
+    assert not (tmp_path / "memory.ndjson.partial").exists()
+    # Readers of the legacy single-document file are not handed NDJSON
+    assert not (tmp_path / "memory.json").exists()
+
+    mock_tree_text_memory.graph_store.add_nodes = MagicMock()
+    mock_tree_text_memory.load(str(tmp_path))
+    mock_tree_text_memory.graph_store.add_nodes.assert_called_once_with([node])
+
+
+def test_dump_ignores_leftover_partial_file(tmp_path, mock_tree_text_memory):
+    def export(nodes):
+        mock_tree_text_memory.graph_store.iter_nodes = MagicMock(
+            return_value=iter([(nodes, nodes[-1]["id"])])
+        )
+        mock_tree_text_memory.graph_store.iter_edges = MagicMock(return_value=iter([]))
+        mock_tree_text_memory.dump(str(tmp_path))
+
+    mock_tree_text_memory.config.memory_filename = "memory.json"
+    stale = {"id": "1", "memory": "stale", "metadata": {}}
+    current = {"id": "2", "memory": "current", "metadata": {}}
+    export([stale])
+    # Simulate a dump that crashed after its first checkpoint
+    (tmp_path / "memory.ndjson").rename(tmp_path / "memory.ndjson.partial")
+    export([current])
+
+    mock_tree_text_memory.graph_store.add_nodes = MagicMock()
+    mock_tree_text_memory.load(str(tmp_path))
+    mock_tree_text_memory.graph_store.add_nodes.assert_called_once_with([current])
+
+
+def test_load_legacy_json_dump(tmp_path, mock_tree_text_memory):
+    mock_tree_text_memory.config.memory_filename = "memory.json"
+    mock_tree_text_memory.graph_store.import_graph = MagicMock()
+    data = {"nodes": [{"id": "1", "memory": "hello", "metadata": {}}], "edges": []}
+    (tmp_path / "memory.json").write_text(json.dumps(data, indent=4))
+
+    mock_tree_text_memory.load(str(tmp_path))
+    mock_tree_text_memory.graph_store.import_graph.assert_called_once_with(data)
 
 
 def test_drop_creates_backup_and_cleans(mock_tree_text_memory):
     mock_tree_text_memory.dump = MagicMock()
     mock_tree_text_memory._cleanup_old_backups = MagicMock()
     mock_tree_text_memory.graph_store.drop_database = MagicMock()
+    scope = graph_scope(mock_tree_text_memory.graph_store)
+    version = get_write_version(scope)
 
     mock_tree_text_memory.drop(keep_last_n=1)
     mock_tree_text_memory.dump.assert_called_once()
     mock_tree_text_memory._cleanup_old_backups.assert_called_once()
     mock_tree_text_memory.graph_store.drop_database.assert_called_once()
+    # Cached searches over the dropped graph must not be served
+    assert get_write_version(scope) > version
 
 
 def test_add_returns_ids(mock_tree_text_memory):
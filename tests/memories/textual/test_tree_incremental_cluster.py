@@ -0,0 +1,192 @@
+import uuid
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from memos.configs.memory import IncrementalClusteringConfig
+from memos.graph_dbs.item import GraphDBNode
+from memos.memories.textual.item import TreeNodeTextualMemoryMetadata
+from memos.memories.textual.tree_text_memory.organize.incremental_cluster import (
+    IncrementalClusterIndex,
+)
+from memos.memories.textual.tree_text_memory.organize.reorganizer import (
+    GraphStructureReorganizer,
+    QueueMessage,
+)
+
+
+SCOPE = "LongTermMemory"
+
+
+def _id(name: str) -> str:
+    return str(uuid.uuid5(uuid.NAMESPACE_OID, name))
+
+
+def _node(name: str, embedding: list[float]) -> GraphDBNode:
+    return GraphDBNode(
+        id=_id(name),
+        memory=f"memory {name}",
+        metadata=TreeNodeTextualMemoryMetadata(memory_type=SCOPE, embedding=embedding),
+    )
+
+
+def _raw(node: GraphDBNode) -> dict:
+    return {"id": node.id, "memory": node.memory, "metadata": node.metadata.model_dump()}
+
+
+@pytest.fixture
+def index():
+    index = IncrementalClusterIndex(IncrementalClusteringConfig(max_cluster_size=3))
+    index.load(SCOPE, [(_id("topic-x"), [_id("a"), _id("b")], [[1.0, 0.0], [0.9, 0.1]])], [])
+    return index
+
+
+def test_assign_joins_nearest_cluster_or_pending(index):
+    assert index.assign(SCOPE, _node("c", [1.0, 0.05])) == _id("topic-x")
+    assert index.assign(SCOPE, _node("d", [0.0, 1.0])) is None
+
+    ((parent_id, new_ids, member_ids),) = index.dirty_clusters(SCOPE)
+    assert (parent_id, new_ids) == (_id("topic-x"), [_id("c")])
+    assert sorted(member_ids) == sorted([_id("a"), _id("b"), _id("c")])
+    assert [n.id for n in index.take_pending(SCOPE, min_size=1)] == [_id("d")]
+    # Unchanged pool is not handed out again
+    assert index.take_pending(SCOPE, min_size=1) == []
+
+
+def test_leftover_pending_waits_for_enough_new_memories(index):
+    for name in ("d", "e"):
+        index.assign(SCOPE, _node(name, [0.0, 1.0]))
+    assert len(index.take_pending(SCOPE, min_size=2)) == 2
+
+    # Nothing was clustered; a single new memory does not re-partition the pool
+    index.assign(SCOPE, _node("f", [0.0, 1.0]))
+    assert index.take_pending(SCOPE, min_size=2) == []
+    index.assign(SCOPE, _node("g", [0.0, 1.0]))
+    assert len(index.take_pending(SCOPE, min_size=2)) == 4
+
+
+def test_unloaded_scope_is_left_to_seeding(index):
+    assert index.assign("UserMemory", _node("c", [1.0, 0.0])) is None
+    assert index.take_pending("UserMemory", min_size=0) == []
+
+
+def test_mark_clean_and_add_cluster(index):
+    index.assign(SCOPE, _node("c", [1.0, 0.0]))
+    index.mark_clean(SCOPE, _id("topic-x"), [_id("c")])
+    assert index.dirty_clusters(SCOPE) == []
+
+    pending = _node("d", [0.0, 1.0])
+    index.assign(SCOPE, pending)
+    index.add_cluster(SCOPE, _id("topic-y"), [pending])
+    assert index.take_pending(SCOPE, min_size=0) == []
+    assert index.assign(SCOPE, _node("e", [0.1, 1.0])) == _id("topic-y")
+
+
+@pytest.fixture
+def reorganizer():
+    graph_store = MagicMock()
+    graph_store.node_not_exist.return_value = False
+    graph_store.get_by_metadata.return_value = [_id("topic-x")]
+    graph_store.get_children_with_embeddings.return_value = [
+        {"id": _id("a"), "embedding": [1.0, 0.0], "memory": "m"},
+        {"id": _id("b"), "embedding": [0.9, 0.1], "memory": "m"},
+    ]
+    graph_store.get_structure_optimization_candidates.return_value = []
+    graph_store.edge_exists.return_value = False
+    reorganizer = GraphStructureReorganizer(
+        graph_store,
+        MagicMock(),
+        MagicMock(),
+        is_reorganize=False,
+        incremental_clustering=IncrementalClusteringConfig(max_cluster_size=3),
+    )
+    reorganizer._is_optimizing = {SCOPE: False}
+    reorganizer.resolver = MagicMock()
+    reorganizer.resolver.detect.return_value = []
+    return reorganizer
+
+
+def test_optimize_only_touches_changed_clusters(reorganizer):
+    graph_store = reorganizer.graph_store
+    reorganizer.optimize_structure(scope=SCOPE)
+    graph_store.get_by_metadata.assert_called_once()
+
+    new_node = _node("c", [1.0, 0.05])
+    reorganizer.handle_add(QueueMessage(op="add", after_node=[new_node]))
+    members = [_node("a", [1.0, 0.0]), _node("b", [0.9, 0.1]), new_node]
+    graph_store.get_node.return_value = _raw(_node("topic-x", [1.0, 0.0]))
+    graph_store.get_nodes.side_effect = lambda ids, **kwargs: [
+        _raw(n) for n in members if n.id in ids
+    ]
+    summary = _node("summary", [1.0, 0.0])
+
+    with (
+        patch.object(reorganizer, "_summarize_cluster", return_value=summary) as summarize,
+        patch.object(reorganizer, "_detect_relations") as detect_relations,
+        patch.object(reorganizer, "_partition") as partition,
+    ):
+        reorganizer.optimize_structure(scope=SCOPE)
+        reorganizer.optimize_structure(scope=SCOPE)
+
+    graph_store.add_edge.assert_called_once_with(_id("topic-x"), _id("c"), "PARENT")
+    summarize.assert_called_once()
+    assert graph_store.update_node.call_args[0][0] == _id("topic-x")
+    assert [n.id for n in detect_relations.call_args[0][0]] == [_id("c")]
+    partition.assert_not_called()
+    # State is seeded from the graph only once
+    graph_store.get_by_metadata.assert_called_once()
+
+
+def test_oversized_cluster_is_split(reorganizer):
+    graph_store = reorganizer.graph_store
+    reorganizer.optimize_structure(scope=SCOPE)
+    members = [_node(name, [1.0, 0.1 * i]) for i, name in enumerate(["a", "b", "c", "d"])]
+    for node in members[2:]:
+        reorganizer.handle_add(QueueMessage(op="add", after_node=[node]))
+    graph_store.get_node.return_value = _raw(_node("topic-x", [1.0, 0.0]))
+    graph_store.get_nodes.side_effect = lambda ids, **kwargs: [
+        _raw(n) for n in members if n.id in ids
+    ]
+    sub_topics = [_node("sub-1", [1.0, 0.0]), _node("sub-2", [1.0, 0.3])]
+
+    with (
+        patch.object(reorganizer, "_partition", return_value=[members[:2], members[2:]]),
+        patch.object(reorganizer, "_summarize_cluster", side_effect=sub_topics),
+        patch.object(reorganizer, "_detect_relations"),
+    ):
+        reorganizer.optimize_structure(scope=SCOPE)
+
+    graph_store.add_edge.assert_any_call(_id("topic-x"), _id("sub-1"), "PARENT")
+    graph_store.add_edge.assert_any_call(_id("sub-2"), _id("d"), "PARENT")
+    graph_store.delete_edge.assert_any_call(_id("topic-x"), _id("a"), "PARENT")
+    graph_store.update_node.assert_not_called()
+    assert reorganizer.cluster_index.assign(SCOPE, _node("e", [1.0, 0.3])) == _id("sub-2")
+
+
+def test_split_keeps_leftover_members_on_the_topic(reorganizer):
+    graph_store = reorganizer.graph_store
+    reorganizer.optimize_structure(scope=SCOPE)
+    embeddings = {"a": [1.0, 0.0], "b": [0.9, 0.1], "c": [1.0, 0.2], "d": [1.0, 0.3]}
+    embeddings["e"] = [1.0, 0.6]
+    members = [_node(name, embedding) for name, embedding in embeddings.items()]
+    for node in members[2:]:
+        reorganizer.handle_add(QueueMessage(op="add", after_node=[node]))
+    graph_store.get_node.return_value = _raw(_node("topic-x", [1.0, 0.0]))
+    graph_store.get_nodes.side_effect = lambda ids, **kwargs: [
+        _raw(n) for n in members if n.id in ids
+    ]
+    sub_topics = [_node("sub-1", [1.0, 0.0]), _node("sub-2", [1.0, 0.25])]
+
+    with (
+        patch.object(
+            reorganizer, "_partition", return_value=[members[:2], members[2:4], members[4:]]
+        ),
+        patch.object(reorganizer, "_summarize_cluster", side_effect=sub_topics),
+        patch.object(reorganizer, "_detect_relations"),
+    ):
+        reorganizer.optimize_structure(scope=SCOPE)
+
+    deleted = {call.args[1] for call in graph_store.delete_edge.call_args_list}
+    assert _id("e") not in deleted
+    assert reorganizer.cluster_index.assign(SCOPE, _node("f", [0.6, 0.8])) == _id("topic-x")
@@ -4,6 +4,7 @@ from unittest.mock import MagicMock
 
 import pytest
 
+from memos.configs.memory import NodeDedupConfig
 from memos.memories.textual.item import TextualMemoryItem, TreeNodeTextualMemoryMetadata
 from memos.memories.textual.tree_text_memory.organize.manager import MemoryManager
 
@@ -58,10 +59,14 @@ def test_add_and_replace_working_memory(memory_manager):
     )
     memory_manager.add([memory])
     memory_manager.replace_working_memory([memory])
-    assert memory_manager.graph_store.add_node.called
+    assert memory_manager.graph_store.add_nodes.call_count == 2
+    memory_manager.graph_store.add_node.assert_not_called()
+    memory_manager.graph_store.remove_oldest_memory.assert_called_once_with(
+        memory_type="WorkingMemory", keep_latest=20
+    )
 
 
-def test_process_memory_adds_nodes(memory_manager):
+def test_process_memory_builds_nodes(memory_manager):
     memory = TextualMemoryItem(
         memory="test",
         metadata=TreeNodeTextualMemoryMetadata(
@@ -72,34 +77,60 @@ def test_process_memory_adds_nodes(memory_manager):
             confidence=80.0,
         ),
     )
-    memory_manager._process_memory(memory)  # Only pass the single memory item
-    assert memory_manager.graph_store.add_node.called
+    nodes = memory_manager._process_memory(memory)  # Only pass the single memory item
+    assert [node["metadata"]["memory_type"] for node in nodes] == ["WorkingMemory", "UserMemory"]
+    assert all(node["memory"] == "test" for node in nodes)
+
+
+def test_add_writes_all_memories_in_one_bulk_call(memory_manager, mock_graph_store):
+    memories = [
+        TextualMemoryItem(
+            memory=f"memory {i}",
+            metadata=TreeNodeTextualMemoryMetadata(
+                embedding=[0.1] * 5, memory_type="LongTermMemory", key="topic"
+            ),
+        )
+        for i in range(3)
+    ]
+    ids = memory_manager.add(memories)
+
+    mock_graph_store.add_nodes.assert_called_once()
+    written = mock_graph_store.add_nodes.call_args[0][0]
+    assert [node["id"] for node in written] == ids
+    assert len(written) == 6  # WorkingMemory copy + LongTermMemory node per memory
+
+
+def test_failed_bulk_write_is_retried_per_node(memory_manager, mock_graph_store):
+    memories = [
+        TextualMemoryItem(
+            memory=f"memory {i}",
+            metadata=TreeNodeTextualMemoryMetadata(
+                embedding=[0.1] * 5, memory_type="LongTermMemory", key="topic"
+            ),
+        )
+        for i in range(2)
+    ]
+    mock_graph_store.add_nodes.side_effect = RuntimeError("bad node in batch")
 
+    def add_node(id, memory, metadata):
+        if memory == "memory 1":
+            raise RuntimeError("bad node")
 
-def test_add_to_graph_memory_merges(memory_manager, mock_graph_store):
-    memory = TextualMemoryItem(
-        memory="to merge",
-        metadata=TreeNodeTextualMemoryMetadata(
-            embedding=[0.1] * 5, memory_type="UserMemory", confidence=80.0
-        ),
-    )
-    memory_manager._add_to_graph_memory(memory, "UserMemory")
-    assert mock_graph_store.add_node.called
+    mock_graph_store.add_node.side_effect = add_node
+    memory_manager.reorganizer.add_message = MagicMock()
+    memory_manager.retention.record_added = MagicMock()
 
+    ids = memory_manager.add(memories)
 
-def test_add_to_graph_memory_creates_new_node(memory_manager, mock_graph_store):
-    mock_graph_store.search_by_embedding.return_value = [{"id": "id1", "score": 0.5}]
-    memory = TextualMemoryItem(
-        memory="new memory",
-        metadata=TreeNodeTextualMemoryMetadata(
-            embedding=[0.1] * 5,
-            memory_type="LongTermMemory",
-            tags=["test"],
-            key="topic",
-        ),
+    assert mock_graph_store.add_node.call_count == 4
+    assert len(ids) == 2  # both nodes of "memory 0", none of "memory 1"
+    notified = [
+        call.args[0].after_node[0] for call in memory_manager.reorganizer.add_message.call_args_list
+    ]
+    assert notified == [ids[1]]
+    memory_manager.retention.record_added.assert_called_once_with(
+        {"WorkingMemory": 1, "LongTermMemory": 1}
     )
-    memory_manager._add_to_graph_memory(memory, "LongTermMemory")
-    assert mock_graph_store.add_node.called
 
 
 def test_inherit_edges(memory_manager, mock_graph_store):
@@ -142,3 +173,19 @@ def test_add_returns_written_node_ids(memory_manager):
     assert isinstance(ids, list)
     assert all(isinstance(i, str) for i in ids)
     assert len(ids) > 0
+
+
+def test_dedup_short_circuits_are_opt_in(mock_graph_store, mock_embedder, mock_llm):
+    default = MemoryManager(mock_graph_store, mock_embedder, mock_llm).reorganizer.resolver
+    assert default.merged_threshold is None
+    assert default.simhash_max_distance is None
+
+    configured = MemoryManager(
+        mock_graph_store,
+        mock_embedder,
+        mock_llm,
+        dedup=NodeDedupConfig(threshold=0.85, simhash_max_distance=3),
+    ).reorganizer.resolver
+    assert configured.threshold == 0.85
+    assert configured.merged_threshold == 0.92
+    assert configured.simhash_max_distance == 3
@@ -0,0 +1,116 @@
+import uuid
+
+from unittest.mock import MagicMock
+
+from memos.memories.textual.item import TextualMemoryItem, TreeNodeTextualMemoryMetadata
+from memos.memories.textual.tree_text_memory.organize.handler import NodeHandler, simhash
+
+
+def _memory(text: str) -> TextualMemoryItem:
+    return TextualMemoryItem(
+        id=str(uuid.uuid4()),
+        memory=text,
+        metadata=TreeNodeTextualMemoryMetadata(memory_type="LongTermMemory", embedding=[0.1] * 3),
+    )
+
+
+def _handler(candidates: list[tuple[TextualMemoryItem, float]], **kwargs) -> NodeHandler:
+    graph_store = MagicMock()
+    graph_store.search_by_embedding.return_value = [
+        {"id": item.id, "score": score} for item, score in candidates
+    ]
+    graph_store.get_nodes.return_value = [item.to_dict() for item, _ in candidates]
+    graph_store.get_edges.return_value = []
+    graph_store.edge_exists.return_value = False
+    llm = MagicMock()
+    llm.generate.return_value = "independent"
+    return NodeHandler(graph_store, llm, MagicMock(), merged_threshold=0.92, **kwargs)
+
+
+def test_exact_duplicate_skips_llm():
+    existing = _memory("The user lives in Paris.")
+    handler = _handler([(existing, 0.85)])
+
+    detected = handler.detect(_memory("  the user lives in   paris. "))
+
+    assert [(d[1].id, d[2]) for d in detected] == [(existing.id, "duplicate")]
+    handler.llm.generate.assert_not_called()
+
+
+def test_similarity_bands():
+    close = _memory("The user lives in Paris, France.")
+    ambiguous = _memory("The user moved to Lyon.")
+    handler = _handler([(close, 0.95), (ambiguous, 0.85)])
+
+    detected = handler.detect(_memory("The user lives in Paris."))
+
+    assert [(d[1].id, d[2]) for d in detected] == [(close.id, "redundant")]
+    handler.llm.generate.assert_called_once()
+    handler.graph_store.search_by_embedding.assert_called_once()
+    assert handler.graph_store.search_by_embedding.call_args.kwargs["threshold"] == 0.8
+
+
+def test_simhash_catches_lexical_near_duplicates():
+    text = "The user prefers window seats on long flights and always books them early."
+    existing = _memory(text)
+    new = _memory(text.replace("always", "usually"))
+    assert (simhash(text) ^ simhash(new.memory)).bit_count() <= 10
+
+    without_simhash = _handler([(existing, 0.85)])
+    assert without_simhash.detect(new) == []
+    without_simhash.llm.generate.assert_called_once()
+
+    with_simhash = _handler([(existing, 0.85)], simhash_max_distance=10)
+    assert [d[2] for d in with_simhash.detect(new)] == ["duplicate"]
+    with_simhash.llm.generate.assert_not_called()
+
+
+def test_resolve_duplicate_archives_without_llm():
+    original, duplicate = _memory("a"), _memory("a")
+    handler = _handler([])
+    handler.graph_store.get_edges.return_value = [
+        {"from": "parent", "to": duplicate.id, "type": "PARENT"}
+    ]
+
+    handler.resolve(duplicate, original, "duplicate")
+
+    handler.llm.generate.assert_not_called()
+    handler.graph_store.add_edge.assert_any_call("parent", original.id, "PARENT")
+    handler.graph_store.update_node.assert_called_once_with(duplicate.id, {"status": "archived"})
+    handler.graph_store.add_edge.assert_any_call(duplicate.id, original.id, type="MERGED_TO")
+
+
+def test_simhash_distance_on_text_without_spaces():
+    base = simhash("用户喜欢在周末去公园跑步，然后和朋友一起吃早餐")
+    near = simhash("用户喜欢在周末去公园跑步，之后和朋友一起吃早餐")
+    far = simhash("今天的会议讨论了下个季度的预算安排")
+    assert (base ^ near).bit_count() < (base ^ far).bit_count()
+    assert simhash("") == simhash("  ")
+
+
+def test_batched_judgement_uses_one_call():
+    conflict, other = _memory("The user lives in Lyon."), _memory("The user likes cheese.")
+    handler = _handler([(conflict, 0.85), (other, 0.82)], batch_max_tokens=2048)
+    handler.llm.generate.return_value = (
+        '```json\n{"relations": [{"index": 0, "label": "contradictory"}, '
+        '{"index": 1, "label": "independent"}]}\n```'
+    )
+
+    detected = handler.detect(_memory("The user lives in Paris."))
+
+    handler.llm.generate.assert_called_once()
+    assert [(d[1].id, d[2]) for d in detected] == [(conflict.id, "contradictory")]
+
+
+def test_candidates_missing_from_batch_answer_are_judged_pairwise():
+    conflict, other = _memory("The user lives in Lyon."), _memory("The user likes cheese.")
+    handler = _handler([(other, 0.82), (conflict, 0.85)], batch_max_tokens=2048)
+    handler.llm.generate.side_effect = [
+        '{"relations": [{"index": 0, "label": "independent"}]}',
+        "contradictory",
+    ]
+
+    detected = handler.detect(_memory("The user lives in Paris."))
+
+    assert handler.llm.generate.call_count == 2
+    assert [(d[1].id, d[2]) for d in detected] == [(conflict.id, "contradictory")]
@@ -0,0 +1,127 @@
+import json
+import uuid
+
+from unittest.mock import MagicMock
+
+from memos.graph_dbs.item import GraphDBNode
+from memos.memories.textual.item import TreeNodeTextualMemoryMetadata
+from memos.memories.textual.tree_text_memory.organize.relation_reason_detector import (
+    RelationAndReasoningDetector,
+    pack_candidates,
+)
+
+
+def _node(text: str) -> GraphDBNode:
+    return GraphDBNode(
+        id=str(uuid.uuid4()),
+        memory=text,
+        metadata=TreeNodeTextualMemoryMetadata(memory_type="LongTermMemory"),
+    )
+
+
+def _detector(**kwargs) -> RelationAndReasoningDetector:
+    llm = MagicMock()
+    llm.generate.return_value = json.dumps(
+        {
+            "relations": [
+                {"index": 0, "relation": "CAUSE"},
+                {"index": 1, "relation": "NONE"},
+                {"index": 2, "relation": "conflict"},
+            ]
+        }
+    )
+    return RelationAndReasoningDetector(MagicMock(), llm, MagicMock(), **kwargs)
+
+
+def _relations(result: dict) -> list[tuple[str, str]]:
+    return [(r["target_id"], r["relation_type"]) for r in result["relations"]]
+
+
+def test_pack_candidates_respects_budget():
+    assert pack_candidates(["a" * 40, "b" * 40, "c" * 40], max_tokens=25) == [[0, 1], [2]]
+    assert pack_candidates(["a" * 400, "b"], max_tokens=25) == [[0], [1]]
+    assert pack_candidates([], max_tokens=25) == []
+
+
+def test_batch_judges_all_neighbors_in_one_call():
+    detector = _detector(batch_max_tokens=2048)
+    node, neighbors = _node("campaign ended"), [_node(f"event {i}") for i in range(3)]
+
+    result = detector._detect_pairwise_causal_condition_relations(node, neighbors)
+
+    detector.llm.generate.assert_called_once()
+    prompt = detector.llm.generate.call_args[0][0][0]["content"]
+    assert '2. "event 2"' in prompt
+    assert _relations(result) == [(neighbors[0].id, "CAUSE"), (neighbors[2].id, "CONFLICT")]
+
+
+def test_unparsable_batch_falls_back_to_pairs():
+    detector = _detector(batch_max_tokens=2048)
+    detector.llm.generate.side_effect = ["not json", "RELATE", "NONE"]
+    node, neighbors = _node("a"), [_node("b"), _node("c")]
+
+    result = detector._detect_pairwise_causal_condition_relations(node, neighbors)
+
+    assert detector.llm.generate.call_count == 3
+    assert _relations(result) == [(neighbors[0].id, "RELATE")]
+
+
+def test_candidates_missing_from_batch_answer_are_judged_pairwise():
+    detector = _detector(batch_max_tokens=2048, cache_size=100)
+    detector.llm.generate.side_effect = [
+        json.dumps({"relations": [{"index": 0, "relation": "CAUSE"}]}),
+        "",  # the pairwise retry fails too
+        "RELATE",
+    ]
+    node, neighbors = _node("a"), [_node("b"), _node("c")]
+
+    first = detector._detect_pairwise_causal_condition_relations(node, neighbors)
+    assert detector.llm.generate.call_count == 2
+    assert _relations(first) == [(neighbors[0].id, "CAUSE")]
+
+    # The unanswered pair was not cached, so it is judged again
+    second = detector._detect_pairwise_causal_condition_relations(node, neighbors)
+    assert detector.llm.generate.call_count == 3
+    assert _relations(second) == [(neighbors[0].id, "CAUSE"), (neighbors[1].id, "RELATE")]
+
+
+def test_process_node_detects_pairwise_relations_only_when_enabled():
+    node, neighbor = _node("a"), _node("b")
+    for enabled in (False, True):
+        detector = _detector(detect_pairwise=enabled)
+        detector.graph_store.get_neighbors_by_tag.return_value = [neighbor.model_dump()]
+        detector.llm.generate.return_value = "RELATE"
+
+        result = detector.process_node(node, exclude_ids=[node.id])
+
+        assert detector.graph_store.get_neighbors_by_tag.called is enabled
+        assert _relations(result) == ([(neighbor.id, "RELATE")] if enabled else [])
+
+
+def test_judged_pairs_are_cached_across_passes():
+    detector = _detector(batch_max_tokens=2048, cache_size=100)
+    node, neighbors = _node("a"), [_node(f"event {i}") for i in range(3)]
+
+    first = detector._detect_pairwise_causal_condition_relations(node, neighbors)
+    second = detector._detect_pairwise_causal_condition_relations(node, neighbors)
+    assert _relations(first) == _relations(second)
+    detector.llm.generate.assert_called_once()
+
+    # An edited memory is judged again
+    neighbors[1].memory = "edited"
+    detector.llm.generate.return_value = "CONDITION"
+    third = detector._detect_pairwise_causal_condition_relations(node, neighbors)
+    assert detector.llm.generate.call_count == 2
+    assert (neighbors[1].id, "CONDITION") in _relations(third)
+
+
+def test_pairwise_mode_is_the_default():
+    detector = _detector()
+    detector.llm.generate.return_value = "RELATE"
+
+    result = detector._detect_pairwise_causal_condition_relations(
+        _node("a"), [_node("b"), _node("c")]
+    )
+
+    assert detector.llm.generate.call_count == 2
+    assert len(result["relations"]) == 2
@@ -0,0 +1,102 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from memos.graph_dbs.item import GraphDBNode
+from memos.memories.textual.item import TreeNodeTextualMemoryMetadata
+from memos.memories.textual.tree_text_memory.organize.reorganizer import GraphStructureReorganizer
+from memos.memories.textual.tree_text_memory.organize.retention import MemoryRetention
+
+
+@pytest.fixture
+def graph_store():
+    store = MagicMock()
+    store.get_grouped_counts.return_value = [
+        {"memory_type": "WorkingMemory", "count": 2},
+        {"memory_type": "LongTermMemory", "count": 5},
+    ]
+    store.get_memory_count.return_value = 3
+    return store
+
+
+@pytest.fixture
+def retention(graph_store):
+    return MemoryRetention(graph_store, {"WorkingMemory": 3, "LongTermMemory": 10})
+
+
+def test_counts_are_tracked_incrementally(retention, graph_store):
+    assert retention.counts() == {"WorkingMemory": 2, "LongTermMemory": 5}
+    retention.record_added({"WorkingMemory": 1, "LongTermMemory": 2})
+    retention.wait()
+
+    assert retention.counts() == {"WorkingMemory": 3, "LongTermMemory": 7}
+    graph_store.get_grouped_counts.assert_called_once()
+    graph_store.remove_oldest_memory.assert_not_called()
+
+
+def test_prunes_only_scopes_over_capacity(retention, graph_store):
+    retention.counts()
+    retention.record_added({"WorkingMemory": 4, "LongTermMemory": 1})
+    retention.wait()
+
+    graph_store.remove_oldest_memory.assert_called_once_with(
+        memory_type="WorkingMemory", keep_latest=3
+    )
+    # re-synced from the graph store after pruning
+    assert retention.counts()["WorkingMemory"] == 3
+
+
+def test_first_record_seeds_without_double_counting(retention, graph_store):
+    retention.record_added({"WorkingMemory": 2})
+    retention.wait()
+
+    assert retention.counts()["WorkingMemory"] == 2
+    graph_store.remove_oldest_memory.assert_not_called()
+
+
+def test_invalidate_reloads_counts(retention, graph_store):
+    retention.counts()
+    retention.invalidate()
+    retention.counts()
+    assert graph_store.get_grouped_counts.call_count == 2
+
+
+def test_writes_bypassing_record_added_are_picked_up_on_resync(graph_store):
+    retention = MemoryRetention(graph_store, {"WorkingMemory": 3}, resync_interval=0)
+    assert retention.counts()["WorkingMemory"] == 2
+
+    # Another writer (reorganizer, scheduler, another process) adds nodes directly
+    graph_store.get_grouped_counts.return_value = [{"memory_type": "WorkingMemory", "count": 5}]
+    assert retention.counts()["WorkingMemory"] == 5
+
+    retention.record_added({"WorkingMemory": 1})
+    retention.wait()
+    graph_store.remove_oldest_memory.assert_called_once_with(
+        memory_type="WorkingMemory", keep_latest=3
+    )
+
+
+def test_counts_are_trusted_within_the_resync_interval(retention, graph_store):
+    retention.counts()
+    graph_store.get_grouped_counts.return_value = [{"memory_type": "WorkingMemory", "count": 9}]
+    assert retention.counts()["WorkingMemory"] == 2
+    graph_store.get_grouped_counts.assert_called_once()
+
+
+def test_reorganizer_topic_nodes_count_towards_capacity(graph_store):
+    retention = MemoryRetention(graph_store, {"LongTermMemory": 5})
+    reorganizer = GraphStructureReorganizer(
+        graph_store, MagicMock(), MagicMock(), is_reorganize=False, retention=retention
+    )
+    retention.counts()
+
+    topic = GraphDBNode(
+        memory="topic", metadata=TreeNodeTextualMemoryMetadata(memory_type="LongTermMemory")
+    )
+    reorganizer._create_parent_node(topic)
+    retention.wait()
+
+    graph_store.add_node.assert_called_once()
+    graph_store.remove_oldest_memory.assert_called_once_with(
+        memory_type="LongTermMemory", keep_latest=5
+    )
@@ -67,17 +67,40 @@ def test_vector_recall_combines_and_dedups(retriever, mock_graph_store):
     n1_id = str(uuid.uuid4())
     n2_id = str(uuid.uuid4())
 
-    vec = [[0.1] * 5]
-    mock_graph_store.search_by_embedding.return_value = [{"id": n1_id}, {"id": n2_id}]
-
-    mock_graph_store.get_nodes.return_value = [
+    vec = [[0.1] * 5, [0.2] * 5]
+    mock_graph_store.search_by_embeddings.return_value = [
         {"id": n1_id, "memory": "m1", "metadata": {}},
         {"id": n2_id, "memory": "m2", "metadata": {}},
+        {"id": n1_id, "memory": "m1", "metadata": {}},
     ]
 
     results = retriever._vector_recall(vec, "LongTermMemory", top_k=5)
     assert len(results) == 2
     assert all(isinstance(r, TextualMemoryItem) for r in results)
+    # One batched call covers every query vector; nodes come back hydrated
+    mock_graph_store.search_by_embeddings.assert_called_once()
+    assert mock_graph_store.search_by_embeddings.call_args.kwargs["vectors"] == vec
+    mock_graph_store.get_nodes.assert_not_called()
+
+
+def test_vector_recall_runs_filtered_path(retriever, mock_graph_store):
+    n1_id = str(uuid.uuid4())
+    n2_id = str(uuid.uuid4())
+    search_filter = {"session_id": "s1"}
+
+    mock_graph_store.search_by_embeddings.side_effect = [
+        [{"id": n1_id, "memory": "m1", "metadata": {}}],
+        [{"id": n2_id, "memory": "m2", "metadata": {}}],
+    ]
+
+    results = retriever._vector_recall(
+        [[0.1] * 5], "LongTermMemory", top_k=5, search_filter=search_filter
+    )
+    assert [r.id for r in results] == [n1_id, n2_id]
+    filters = [
+        c.kwargs["search_filter"] for c in mock_graph_store.search_by_embeddings.call_args_list
+    ]
+    assert filters == [None, search_filter]
 
 
 def test_retrieve_merges_graph_and_vector(retriever, mock_graph_store):
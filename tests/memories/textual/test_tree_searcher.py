@@ -1,8 +1,17 @@
+import asyncio
+import time
+
 from unittest.mock import MagicMock
 
 import pytest
 
+from memos.configs.memory import SearchCacheConfig
 from memos.memories.textual.item import TextualMemoryItem, TreeNodeTextualMemoryMetadata
+from memos.memories.textual.tree_text_memory.retrieve.search_cache import (
+    SearchResultCache,
+    bump_write_version,
+    graph_scope,
+)
 from memos.memories.textual.tree_text_memory.retrieve.searcher import Searcher
 from memos.reranker.base import BaseReranker
 
@@ -69,12 +78,65 @@ def test_searcher_fast_path(mock_searcher):
     assert len(result) <= 2
     assert all(isinstance(item, TextualMemoryItem) for item in result)
 
-    # Should update usage and call update_node
+    # Should update usage and append the same record in the graph store
+    ids, record = mock_searcher.graph_store.append_usage.call_args.args
+    assert ids == [item.id for item in result]
     for item in result:
-        assert len(item.metadata.usage) > 0
-        mock_searcher.graph_store.update_node.assert_any_call(
-            item.id, {"usage": item.metadata.usage}
-        )
+        assert item.metadata.usage == [record]
+
+
+def test_searcher_asearch_runs_all_paths(mock_searcher):
+    parsed_goal = MagicMock()
+    parsed_goal.memories = ["Cats are cute"]
+    parsed_goal.rephrased_query = None
+    mock_searcher.task_goal_parser.parse.return_value = parsed_goal
+    mock_searcher.embedder.embed.return_value = [[0.1] * 5, [0.2] * 5]
+    mock_searcher.graph_retriever.retrieve.return_value = [make_item("wm1", 0.9)[0]]
+    mock_searcher.reranker.rerank.return_value = [make_item("wm1", 0.9), make_item("lt1", 0.8)]
+
+    result = asyncio.run(
+        mock_searcher.asearch(query="Tell me about cats", top_k=2, info={"test": True}, mode="fast")
+    )
+
+    assert [item.memory for item in result] == ["wm1", "lt1"]
+    # working memory + long-term + user memory scopes
+    assert mock_searcher.graph_retriever.retrieve.call_count == 3
+    assert all(item.metadata.usage for item in result)
+
+
+def test_searcher_sync_and_async_share_the_cache(mock_searcher):
+    mock_searcher.search_cache = SearchResultCache(SearchCacheConfig())
+    parsed_goal = MagicMock()
+    parsed_goal.memories = ["Cats"]
+    parsed_goal.rephrased_query = None
+    mock_searcher.task_goal_parser.parse.return_value = parsed_goal
+    mock_searcher.embedder.embed.return_value = [[0.1] * 5]
+    mock_searcher.graph_retriever.retrieve.return_value = [make_item("wm1", 0.9)[0]]
+    mock_searcher.reranker.rerank.return_value = [make_item("wm1", 0.9)]
+    info = {"user_id": "u1", "session_id": "s1"}
+
+    first = asyncio.run(mock_searcher.asearch("Tell me about cats", top_k=1, info=info))
+    second = mock_searcher.search("Tell me about cats", top_k=1, info=info)
+    third = asyncio.run(mock_searcher.asearch("Tell me about cats", top_k=1, info=info))
+
+    assert mock_searcher.task_goal_parser.parse.call_count == 1
+    assert [item.id for item in second] == [item.id for item in third] == [first[0].id]
+
+
+def test_searcher_stops_at_deadline_without_recording_usage(mock_searcher):
+    parsed_goal = MagicMock()
+    parsed_goal.memories = ["Cats"]
+    mock_searcher.task_goal_parser.parse.return_value = parsed_goal
+    mock_searcher.embedder.embed.return_value = [[0.1] * 5]
+    mock_searcher._update_usage_history = MagicMock()
+
+    with pytest.raises(TimeoutError):
+        mock_searcher.search("cats", top_k=1, info={"user_id": "u1"}, deadline=time.monotonic())
+    with pytest.raises(TimeoutError):
+        asyncio.run(mock_searcher.asearch("cats", top_k=1, info={"user_id": "u1"}, deadline=0.0))
+
+    mock_searcher.task_goal_parser.parse.assert_not_called()
+    mock_searcher._update_usage_history.assert_not_called()
 
 
 def test_searcher_fine_mode_triggers_reasoner(mock_searcher):
@@ -116,3 +178,55 @@ def test_searcher_respects_memory_type(mock_searcher):
     )
     # WorkingMemory triggers only once path A
     assert mock_searcher.graph_retriever.retrieve.call_args[1]["memory_scope"] == "WorkingMemory"
+
+
+def test_searcher_caches_results_until_the_cube_is_written(mock_searcher):
+    mock_searcher.search_cache = SearchResultCache(SearchCacheConfig())
+    parsed_goal = MagicMock()
+    parsed_goal.memories = ["Cats"]
+    parsed_goal.rephrased_query = None
+    mock_searcher.task_goal_parser.parse.return_value = parsed_goal
+    mock_searcher.embedder.embed.return_value = [[0.1] * 5]
+    mock_searcher.graph_retriever.retrieve.return_value = [make_item("wm1", 0.9)[0]]
+    mock_searcher.reranker.rerank.return_value = [make_item("wm1", 0.9)]
+    info = {"user_id": "u1", "session_id": "s1"}
+
+    first = mock_searcher.search("Tell me about cats", top_k=1, info=info)
+    second = mock_searcher.search("  tell me   about CATS ", top_k=1, info=info)
+
+    assert mock_searcher.task_goal_parser.parse.call_count == 1
+    assert [item.id for item in second] == [item.id for item in first]
+    # Cache hits still record usage, on top of the earlier record
+    assert len(second[0].metadata.usage) == 2
+    # ...without changing the cached entry
+    third = mock_searcher.search("Tell me about cats", top_k=1, info=info)
+    assert len(third[0].metadata.usage) == 2
+
+    mock_searcher.search("Tell me about cats", top_k=2, info=info)
+    assert mock_searcher.task_goal_parser.parse.call_count == 2
+
+    bump_write_version(graph_scope(mock_searcher.graph_store))
+    mock_searcher.search("Tell me about cats", top_k=1, info=info)
+    assert mock_searcher.task_goal_parser.parse.call_count == 3
+
+
+def test_search_cache_limits():
+    cache = SearchResultCache(SearchCacheConfig(max_entries=1, ttl=None))
+    cache.put(("a",), [make_item("a", 0.1)[0]])
+    cache.put(("b",), [make_item("b", 0.1)[0]])
+    assert cache.get(("a",)) is None
+    assert cache.get(("b",))[0].memory == "b"
+
+    cache.config.ttl = -1
+    assert cache.get(("b",)) is None
+    assert cache.stats()["entries"] == 0
+
+
+def test_usage_is_appended_inside_the_graph_store(mock_searcher):
+    item = make_item("wm1", 0.9)[0]
+
+    mock_searcher._update_usage_history_worker([item.id], "new record")
+
+    mock_searcher.graph_store.append_usage.assert_called_once_with([item.id], "new record")
+    mock_searcher.graph_store.get_nodes.assert_not_called()
+    mock_searcher.graph_store.update_node.assert_not_called()
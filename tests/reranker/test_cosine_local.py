@@ -0,0 +1,54 @@
+import uuid
+
+import numpy as np
+
+from memos.memories.textual.item import TextualMemoryItem, TreeNodeTextualMemoryMetadata
+from memos.reranker.cosine_local import CosineLocalReranker, _cosine_one_to_many
+
+
+def make_item(embedding, level="fact"):
+    return TextualMemoryItem(
+        id=str(uuid.uuid4()),
+        memory="test",
+        metadata=TreeNodeTextualMemoryMetadata(embedding=embedding, background=level),
+    )
+
+
+def test_cosine_one_to_many():
+    sims = _cosine_one_to_many([1, 0], [[2, 0], [0, 3], [1, 1]])
+    np.testing.assert_allclose(sims, [1.0, 0.0, 0.7071], atol=1e-4)
+
+
+def test_rerank_orders_by_weighted_similarity():
+    reranker = CosineLocalReranker(level_weights={"topic": 2.0, "fact": 1.0})
+    items = [make_item([0, 1]), make_item([1, 0], "topic"), make_item([1, 1])]
+
+    result = reranker.rerank("q", items, top_k=2, query_embedding=[1, 0])
+
+    assert [it.id for it, _ in result] == [items[1].id, items[2].id]
+    np.testing.assert_allclose([score for _, score in result], [2.0, 0.7071], atol=1e-4)
+    assert all(isinstance(score, float) for _, score in result)
+
+
+def test_rerank_pads_with_items_without_embedding():
+    reranker = CosineLocalReranker()
+    with_emb = make_item([1, 0])
+    no_emb = make_item(None)
+
+    result = reranker.rerank("q", [no_emb, with_emb], top_k=2, query_embedding=[1, 0])
+
+    assert [it.id for it, _ in result] == [with_emb.id, no_emb.id]
+    assert result[1][1] == -1.0
+
+
+def test_rerank_batch_scores_each_query():
+    reranker = CosineLocalReranker()
+    items = [make_item([1, 0]), make_item([0, 1]), make_item([0.6, 0.8])]
+
+    rankings = reranker.rerank_batch(
+        ["a", "b"], items, top_k=1, query_embeddings=[[1, 0], [0, 1]], normalized=True
+    )
+
+    assert [ranking[0][0].id for ranking in rankings] == [items[0].id, items[1].id]
+    single = reranker.rerank("b", items, top_k=3, query_embedding=[0, 1])
+    assert [it.id for it, _ in single] == [items[1].id, items[2].id, items[0].id]
@@ -0,0 +1,68 @@
+import threading
+import uuid
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from memos.memories.textual.item import TextualMemoryItem, TreeNodeTextualMemoryMetadata
+from memos.reranker.cross_encoder import CrossEncoderReranker
+
+
+def make_item(memory):
+    return TextualMemoryItem(
+        id=str(uuid.uuid4()), memory=memory, metadata=TreeNodeTextualMemoryMetadata()
+    )
+
+
+@pytest.fixture
+def reranker():
+    model = MagicMock()
+    # Score = document length, so longer memories rank higher
+    model.predict.side_effect = lambda pairs, **kwargs: [float(len(doc)) for _, doc in pairs]
+    with patch("sentence_transformers.CrossEncoder", return_value=model):
+        r = CrossEncoderReranker(max_wait_ms=20)
+    yield r
+    r.close()
+
+
+def test_rerank_scores_and_strips_tags(reranker):
+    items = [make_item("[2025-01-01] short"), make_item("a much longer memory"), make_item("")]
+
+    result = reranker.rerank("q", items, top_k=2)
+
+    assert [it.id for it, _ in result] == [items[1].id, items[0].id]
+    assert result[1][1] == float(len("short"))
+
+
+def test_scores_are_cached(reranker):
+    items = [make_item("alpha"), make_item("beta")]
+    reranker.rerank("q", items, top_k=2)
+    reranker.rerank("q", [*items, make_item("gamma")], top_k=3)
+
+    second_pairs = reranker.model.predict.call_args_list[1][0][0]
+    assert second_pairs == [("q", "gamma")]
+
+
+def test_concurrent_requests_share_a_batch(reranker):
+    barrier = threading.Barrier(3)
+    results = {}
+
+    def run(name):
+        barrier.wait()
+        results[name] = reranker.rerank(name, [make_item(f"memory of {name}")], top_k=1)
+
+    threads = [threading.Thread(target=run, args=(f"q{i}",)) for i in range(3)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(results) == 3
+    assert reranker.model.predict.call_count < 3
+
+
+def test_predict_failure_falls_back(reranker):
+    reranker.model.predict.side_effect = RuntimeError("boom")
+    items = [make_item("alpha"), make_item("beta")]
+    assert reranker.rerank("q", items, top_k=1) == [(items[0], 0.0)]
@@ -0,0 +1,44 @@
+import uuid
+
+from unittest.mock import MagicMock
+
+from memos.memories.textual.item import TextualMemoryItem, TreeNodeTextualMemoryMetadata
+from memos.reranker.http_bge import HTTPBGEReranker
+
+
+def make_item(memory):
+    return TextualMemoryItem(
+        id=str(uuid.uuid4()), memory=memory, metadata=TreeNodeTextualMemoryMetadata()
+    )
+
+
+def _response(payload):
+    documents = payload["documents"]
+    resp = MagicMock()
+    resp.json.return_value = {
+        "results": [
+            {"index": i, "relevance_score": len(doc) / 100} for i, doc in enumerate(documents)
+        ]
+    }
+    return resp
+
+
+def test_chunked_requests_reuse_session_and_map_indices():
+    reranker = HTTPBGEReranker("http://reranker", max_documents_per_request=2)
+    reranker._session = MagicMock()
+    reranker._session.post.side_effect = lambda url, headers, json, timeout: _response(json)
+    items = [make_item("aa"), make_item(""), make_item("aaaa"), make_item("a"), make_item("aaa")]
+
+    result = reranker.rerank("q", items, top_k=3)
+
+    assert reranker._session.post.call_count == 2
+    assert [it.id for it, _ in result] == [items[2].id, items[4].id, items[0].id]
+
+
+def test_request_failure_falls_back():
+    reranker = HTTPBGEReranker("http://reranker")
+    reranker._session = MagicMock()
+    reranker._session.post.side_effect = ConnectionError("down")
+    items = [make_item("a"), make_item("b")]
+
+    assert reranker.rerank("q", items, top_k=1) == [(items[0], 0.0)]
@@ -83,6 +83,26 @@ def test_search(vec_db):
     assert results[0].score == 0.9
 
 
+def test_search_batch(vec_db):
+    ids = [str(uuid.uuid4()), str(uuid.uuid4())]
+    vec_db.client.query_batch_points.return_value = [
+        MagicMock(
+            points=[
+                type(
+                    "obj",
+                    (object,),
+                    {"id": _id, "vector": [0.1, 0.2, 0.3], "payload": {}, "score": 0.8},
+                )
+            ]
+        )
+        for _id in ids
+    ]
+    results = vec_db.search_batch([[0.1, 0.2, 0.3], [0.3, 0.2, 0.1]], top_k=1)
+    vec_db.client.query_batch_points.assert_called_once()
+    assert [r[0].id for r in results] == ids
+    assert all(isinstance(r[0], VecDBItem) for r in results)
+
+
 def test_update_vector(vec_db):
     id = str(uuid.uuid4())
     data = {"id": id, "vector": [0.4, 0.5, 0.6], "payload": {"new": "data"}}